@@ -6,6 +6,7 @@ and monitoring.
 """
 
 import os
+import csv
 import logging
 from datetime import datetime, timedelta
 import pandas as pd
@@ -14,9 +15,10 @@ import pandas as pd
 from airflow import DAG
 from airflow.operators.python import PythonOperator
 from airflow.operators.dummy import DummyOperator
+from airflow.models import Variable
 
 # Import custom utility modules
-from .utils.gcp_utils import GCSClient, BigQueryClient
+from .utils.gcp_utils import GCSClient, BigQueryClient, get_object_index
 from .utils.db_utils import execute_query, execute_query_as_df, bulk_load_from_df
 from .utils.alert_utils import configure_dag_alerts, on_failure_callback
 
@@ -36,6 +38,7 @@ logger = logging.getLogger('airflow.data_sync')
 GCS_BUCKET = 'data-sync-bucket'
 SOURCE_OBJECT_PREFIX = 'source/data/'
 TARGET_OBJECT_PREFIX = 'processed/data/'
+BQ_STAGING_PREFIX = 'staging/bigquery/'
 POSTGRES_CONN_ID = 'postgres_default'
 BQ_DATASET = 'data_sync_dataset'
 BQ_TABLE = 'data_sync_table'
@@ -68,17 +71,22 @@ def check_source_data(**kwargs):
         execution_date = kwargs['execution_date']
         date_str = execution_date.strftime('%Y/%m/%d')
         
-        # Initialize GCS client
-        gcs_client = GCSClient()
-        
         # Construct source path with date partitioning
         source_prefix = f"{SOURCE_OBJECT_PREFIX}{date_str}/"
         
-        # List objects in the source prefix
-        source_files = gcs_client.list_files(
-            bucket_name=GCS_BUCKET,
-            prefix=source_prefix
-        )
+        # Resolve against the GCS notification index when enabled, its listener is live
+        # and the prefix was seeded
+        use_notifications = Variable.get('data_sync_use_notifications', default_var='false').lower() == 'true'
+        object_index = get_object_index() if use_notifications else None
+        
+        if object_index is not None and object_index.is_live(bucket_name=GCS_BUCKET, prefix=source_prefix):
+            source_files = object_index.list_objects(GCS_BUCKET, source_prefix)
+        else:
+            # List objects in the source prefix
+            source_files = GCSClient().list_files(
+                bucket_name=GCS_BUCKET,
+                prefix=source_prefix
+            )
         
         num_files = len(source_files)
         logger.info(f"Found {num_files} files in gs://{GCS_BUCKET}/{source_prefix}")
@@ -234,6 +242,20 @@ def transform_data(**kwargs):
         logger.error(f"Error transforming data: {str(e)}")
         raise
 
+def iter_csv_rows(file_path):
+    """
+    Yield the rows of a CSV file as dicts without loading the whole file.
+    
+    Args:
+        file_path: Path to the CSV file
+        
+    Returns:
+        Iterator of dicts keyed by column name
+    """
+    with open(file_path, newline='') as f:
+        for row in csv.DictReader(f):
+            yield row
+
 def load_data_to_bigquery(**kwargs):
     """
     Load transformed data to BigQuery.
@@ -254,22 +276,34 @@ def load_data_to_bigquery(**kwargs):
         # Initialize BigQuery client
         bq_client = BigQueryClient()
         
-        # Read data from CSV
-        df = pd.read_csv(transformed_file)
-        record_count = len(df)
-        
-        # Load DataFrame to BigQuery
-        success = bq_client.load_from_dataframe(
-            dataframe=df,
-            dataset_id=BQ_DATASET,
-            table_id=BQ_TABLE,
-            if_exists='replace'
-        )
-        
-        if success:
-            logger.info(f"Successfully loaded {record_count} records to BigQuery {BQ_DATASET}.{BQ_TABLE}")
+        load_mode = Variable.get('data_sync_bq_load_mode', default_var='batch')
+        
+        if load_mode == 'stream' and bq_client.get_table(BQ_DATASET, BQ_TABLE) is None:
+            # Streaming needs a schema; the batch path creates the table from the data
+            logger.info(f"{BQ_DATASET}.{BQ_TABLE} does not exist yet, creating it with a batch load")
+            load_mode = 'batch'
+        
+        if load_mode == 'stream':
+            # Stream rows through the Storage Write API as they are read, without
+            # a load job. Like the batch load, the table is replaced rather than
+            # appended to, so reruns and retries do not duplicate the day's rows
+            record_count = bq_client.stream_rows(
+                table=f"{BQ_DATASET}.{BQ_TABLE}",
+                row_iter=iter_csv_rows(transformed_file),
+                write_disposition='WRITE_TRUNCATE'
+            )
         else:
-            raise Exception(f"Failed to load data to BigQuery {BQ_DATASET}.{BQ_TABLE}")
+            # Stage the CSV as Parquet in GCS and load it with a BigQuery load job
+            record_count = bq_client.load_from_file(
+                local_file_path=transformed_file,
+                bucket_name=GCS_BUCKET,
+                dataset_id=BQ_DATASET,
+                table_id=BQ_TABLE,
+                staging_prefix=BQ_STAGING_PREFIX,
+                if_exists='replace'
+            )
+        
+        logger.info(f"Successfully loaded {record_count} records to BigQuery {BQ_DATASET}.{BQ_TABLE}")
         
         # Prepare and return load statistics
         load_stats = {
@@ -277,6 +311,7 @@ def load_data_to_bigquery(**kwargs):
             'dataset': BQ_DATASET,
             'table': BQ_TABLE,
             'record_count': record_count,
+            'load_mode': load_mode,
             'status': 'success'
         }
         
@@ -199,7 +199,8 @@ def extract_from_gcs(**kwargs):
         gcs_client.download_file(
             bucket_name=GCS_SOURCE_BUCKET,
             object_name=object_name,
-            local_file_path=local_file_path
+            local_file_path=local_file_path,
+            use_cache=True
         )
         
         # Track downloaded files and size
@@ -417,36 +418,27 @@ def load_to_bigquery(**kwargs):
     if not transformed_file_path or not os.path.exists(transformed_file_path):
         raise ValueError(f"Transformed data file not found: {transformed_file_path}")
     
-    # Read the transformed data
-    df = pd.read_csv(transformed_file_path)
-    
     # Initialize BigQuery client
     bq_client = BigQueryClient(conn_id=BQ_CONN_ID)
     
-    # Ensure dataset exists
-    if not bq_client.create_dataset(dataset_id=BQ_DATASET):
-        raise ValueError(f"Failed to create or verify BigQuery dataset: {BQ_DATASET}")
-    
     # Start upload tracking
     start_time = datetime.datetime.now()
     
-    # Upload data to BigQuery
-    success = bq_client.load_from_dataframe(
-        dataframe=df,
+    # Stage the data as Parquet in GCS and load it with a BigQuery load job;
+    # the dataset is created if needed
+    row_count = bq_client.load_from_file(
+        local_file_path=transformed_file_path,
+        bucket_name=GCS_TARGET_BUCKET,
         dataset_id=BQ_DATASET,
         table_id=BQ_TABLE,
         if_exists='replace'  # Could be 'append' based on requirements
     )
     
-    if not success:
-        raise ValueError(f"Failed to load data to BigQuery table: {BQ_DATASET}.{BQ_TABLE}")
-    
     # End upload tracking
     end_time = datetime.datetime.now()
     execution_time = (end_time - start_time).total_seconds()
     
     # Log load statistics
-    row_count = len(df)
     logger.info(f"Successfully loaded {row_count} rows to BigQuery table {BQ_DATASET}.{BQ_TABLE}")
     logger.info(f"BigQuery load completed in {execution_time:.2f}s")
     
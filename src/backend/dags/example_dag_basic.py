@@ -87,7 +87,8 @@ def download_file_callable(**kwargs):
     downloaded_path = gcs_download_file(
         bucket_name=bucket_name,
         object_name=object_name,
-        local_file_path=local_file_path
+        local_file_path=local_file_path,
+        use_cache=True
     )
     
     logger.info(f"Successfully downloaded file to {downloaded_path}")
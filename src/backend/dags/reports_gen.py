@@ -153,10 +153,12 @@ def extract_report_data(**kwargs) -> pd.DataFrame:
             sql = sql.replace('{{month_start}}', month_start)
             sql = sql.replace('{{month_end}}', month_end)
             
-            # Execute BigQuery
+            # Execute BigQuery, reading the large quarterly result set in
+            # parallel Arrow streams through the Storage Read API
             df = bigquery_execute_query(
                 sql=sql,
-                as_dataframe=True
+                as_dataframe=True,
+                use_storage_api=True
             )
             
             logger.info(f"Successfully extracted {len(df)} rows from BigQuery for {report_type} report")
@@ -11,9 +11,24 @@ migration from Airflow 1.10.15 to Airflow 2.X in Cloud Composer 2.
 """
 
 import os
+import json
+import time
+import fcntl
+import base64
+import hashlib
 import logging
+import re
+import shutil
+import tempfile
+import datetime
+import queue
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Union, Optional, Any, TypeVar, cast
+from typing import List, Dict, Union, Optional, Any, TypeVar, Callable, Iterator, cast
 
 # Google Cloud libraries
 # google-cloud-storage v2.0.0+
@@ -28,6 +43,7 @@ from google.cloud.bigquery import Client as BigQueryClient
 from google.cloud.bigquery import LoadJobConfig, QueryJobConfig
 from google.cloud.bigquery.table import Table, TableReference
 from google.cloud.bigquery.dataset import DatasetReference
+from google.api_core.exceptions import NotFound
 
 # google-cloud-secret-manager v2.0.0+
 import google.cloud.secretmanager
@@ -54,7 +70,58 @@ logger = logging.getLogger('airflow.utils.gcp')
 
 # Global constants
 DEFAULT_GCP_CONN_ID = 'google_cloud_default'
-DEFAULT_CHUNK_SIZE = 104857600  # 100 MB in bytes
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024  # Resumable upload chunks must be multiples of 256 KiB
+MIN_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB
+MAX_UPLOAD_CHUNK_SIZE = 256 * 1024 * 1024  # 256 MB
+TARGET_CHUNK_SECONDS = 10  # Aim for chunks that take about this long to send
+UPLOAD_MAX_RETRIES = 5
+GCS_UPLOAD_URL = 'https://storage.googleapis.com/upload/storage/v1/b/{bucket}/o'
+DEFAULT_READ_STREAMS = 4  # Parallel streams for the BigQuery Storage Read API
+DEFAULT_UPLOAD_STATE_DIR = os.environ.get(
+    'GCS_UPLOAD_STATE_DIR', os.path.join(tempfile.gettempdir(), 'gcs_upload_state')
+)
+DEFAULT_DOWNLOAD_CACHE_DIR = os.environ.get(
+    'GCS_DOWNLOAD_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'gcs_download_cache')
+)
+DEFAULT_DOWNLOAD_CACHE_MAX_BYTES = int(
+    os.environ.get('GCS_DOWNLOAD_CACHE_MAX_BYTES', 10 * 1024 ** 3)  # 10 GB
+)
+
+# Smoothed upload bandwidth (bytes/sec) observed by this process, used to size chunks
+_observed_upload_bandwidth: Dict[str, float] = {}
+
+# Download caches keyed by cache directory, shared by all callers in the process
+_download_caches: Dict[str, 'GCSDownloadCache'] = {}
+
+# Object index fed by GCS notifications; point GCS_OBJECT_INDEX_PATH at storage
+# shared by the listener and the workers
+DEFAULT_OBJECT_INDEX_PATH = os.environ.get(
+    'GCS_OBJECT_INDEX_PATH', os.path.join(tempfile.gettempdir(), 'gcs_object_index.db')
+)
+DEFAULT_INDEX_MAX_LAG = 120  # Seconds without a listener heartbeat before the index is not trusted
+_object_indexes: Dict[str, 'GCSObjectIndex'] = {}
+
+# Secret cache settings; the on-disk cache is only used when both a directory
+# and a Fernet encryption key are configured. The TTL is also the longest a
+# process keeps serving the previous 'latest' value after a rotation made
+# elsewhere, so keep it short.
+DEFAULT_SECRET_CACHE_TTL = int(os.environ.get('SECRET_CACHE_TTL_SECONDS', 60))
+SECRET_CACHE_DIR = os.environ.get('SECRET_CACHE_DIR')
+SECRET_CACHE_KEY = os.environ.get('SECRET_CACHE_ENCRYPTION_KEY')
+
+# BigQuery metadata cache settings
+DEFAULT_METADATA_CACHE_TTL = 600  # 10 minutes in seconds
+DEFAULT_METADATA_NEGATIVE_TTL = 30  # Seconds a "not found" result is trusted
+
+# Storage Write API settings
+DEFAULT_STREAM_BATCH_ROWS = 500
+DEFAULT_STREAM_MAX_INFLIGHT = 8  # Unacknowledged append requests before sending blocks
+STREAM_MAX_REQUEST_BYTES = 9 * 1024 * 1024  # AppendRows requests are limited to 10 MB
+
+# Dry-run query estimates keyed by normalized SQL, parameters and location
+_dry_run_cache: Dict[str, Dict] = {}
+DEFAULT_DRY_RUN_CACHE_TTL = 3600  # 1 hour in seconds
+BIGQUERY_ON_DEMAND_USD_PER_TIB = 6.25
 
 
 def get_gcp_connection(conn_id: str = DEFAULT_GCP_CONN_ID) -> Connection:
@@ -110,7 +177,9 @@ def initialize_gcp_client(service_name: str, conn_id: str = DEFAULT_GCP_CONN_ID)
                 credentials=conn._get_credentials()
             )
         elif service_name.lower() == 'bigquery':
-            client = BigQueryClient(
+            # BigQueryClient is redefined below as the helper class, so use the
+            # fully qualified google-cloud-bigquery client
+            client = google.cloud.bigquery.Client(
                 project=conn.extra_dejson.get('project'),
                 credentials=conn._get_credentials()
             )
@@ -158,21 +227,327 @@ def gcs_file_exists(bucket_name: str, object_name: str,
         return False
 
 
+def choose_upload_chunk_size(file_size: int, bandwidth: float = None) -> int:
+    """
+    Pick a resumable upload chunk size from the file size and observed bandwidth.
+    
+    With a bandwidth estimate, chunks are sized to take about TARGET_CHUNK_SECONDS
+    to send; otherwise the file is split into roughly 16 chunks. The result is
+    clamped to [MIN_UPLOAD_CHUNK_SIZE, MAX_UPLOAD_CHUNK_SIZE] and aligned to
+    256 KiB as required by the resumable upload protocol.
+    
+    Args:
+        file_size: Size of the file in bytes
+        bandwidth: Observed upload bandwidth in bytes/sec (optional)
+        
+    Returns:
+        Chunk size in bytes
+    """
+    target = bandwidth * TARGET_CHUNK_SECONDS if bandwidth else file_size / 16
+    target = max(MIN_UPLOAD_CHUNK_SIZE, min(MAX_UPLOAD_CHUNK_SIZE, target))
+    # No point in chunks larger than the file itself
+    target = min(target, max(file_size, UPLOAD_CHUNK_ALIGNMENT))
+    aligned = int(target) // UPLOAD_CHUNK_ALIGNMENT * UPLOAD_CHUNK_ALIGNMENT
+    return max(aligned, UPLOAD_CHUNK_ALIGNMENT)
+
+
+class GCSResumableUploader:
+    """
+    Resumable upload of a local file to Google Cloud Storage.
+    
+    The file is read once: crc32c (and MD5 for uploads that start from zero)
+    are computed over each chunk as it is sent and checked against the object
+    metadata GCS returns. Chunk size adapts to the measured bandwidth unless
+    fixed by the caller. The upload session and the checksum of acknowledged
+    bytes are persisted in a state directory, so a retried task on the same
+    host resumes from the last offset GCS acknowledged instead of starting
+    over. The source file's directory may be read-only.
+    """
+    
+    def __init__(self, credentials: Any, bucket_name: str, object_name: str,
+                 local_file_path: str, chunk_size: int = None,
+                 content_type: str = 'application/octet-stream', state_dir: str = None):
+        """
+        Initialize the GCSResumableUploader.
+        
+        Args:
+            credentials: Google credentials used to authorize requests
+            bucket_name: Name of the GCS bucket
+            object_name: Name to give the uploaded object
+            local_file_path: Path to the local file to upload
+            chunk_size: Fixed chunk size in bytes (adaptive if None)
+            content_type: Content type of the object
+            state_dir: Directory for upload state (defaults to DEFAULT_UPLOAD_STATE_DIR)
+        """
+        self.credentials = credentials
+        self.bucket_name = bucket_name
+        self.object_name = object_name
+        self.local_file_path = local_file_path
+        self.fixed_chunk_size = chunk_size
+        self.content_type = content_type
+        self.state_dir = Path(state_dir or DEFAULT_UPLOAD_STATE_DIR)
+        state_key = hashlib.sha256(
+            f"{os.path.abspath(local_file_path)}\n{bucket_name}\n{object_name}".encode('utf-8')
+        ).hexdigest()[:32]
+        self.state_path = str(self.state_dir / f"{state_key}.gcsupload")
+        self.session = None
+    
+    def _get_session(self) -> Any:
+        if self.session is None:
+            from google.auth.transport.requests import AuthorizedSession
+            self.session = AuthorizedSession(self.credentials)
+        return self.session
+    
+    def _load_state(self, file_size: int, mtime: float) -> Optional[Dict]:
+        try:
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        # Only resume an upload of the same file to the same object
+        if (state.get('bucket') == self.bucket_name and state.get('object') == self.object_name
+                and state.get('size') == file_size and state.get('mtime') == mtime):
+            return state
+        return None
+    
+    def _save_state(self, state: Dict) -> None:
+        # The state holds the upload session URI, which authorizes writes to the object
+        self.state_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+    
+    def _clear_state(self) -> None:
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+    
+    def _initiate(self, file_size: int) -> str:
+        response = self._get_session().post(
+            GCS_UPLOAD_URL.format(bucket=self.bucket_name),
+            params={'uploadType': 'resumable', 'name': self.object_name},
+            headers={
+                'X-Upload-Content-Type': self.content_type,
+                'X-Upload-Content-Length': str(file_size)
+            },
+            json={}
+        )
+        if response.status_code != 200:
+            raise AirflowException(
+                f"Failed to start resumable upload ({response.status_code}): {response.text}"
+            )
+        return response.headers['Location']
+    
+    @staticmethod
+    def _acknowledged_offset(response: Any) -> int:
+        # A 308 response reports the persisted range as 'bytes=0-N'
+        range_header = response.headers.get('Range')
+        if not range_header:
+            return 0
+        return int(range_header.split('-')[-1]) + 1
+    
+    def _query_offset(self, session_url: str, file_size: int) -> Optional[int]:
+        """
+        Ask GCS how many bytes of the session it has persisted.
+        
+        Returns:
+            Acknowledged offset, file_size if the upload already finished,
+            or None if the session no longer exists
+        """
+        response = self._get_session().put(
+            session_url, headers={'Content-Range': f"bytes */{file_size}"}
+        )
+        if response.status_code in (200, 201):
+            return file_size
+        if response.status_code == 308:
+            return self._acknowledged_offset(response)
+        if response.status_code in (404, 410):
+            return None
+        raise AirflowException(
+            f"Failed to query upload status ({response.status_code}): {response.text}"
+        )
+    
+    def upload(self) -> Dict:
+        """
+        Upload the file, resuming a previous session when possible.
+        
+        Returns:
+            Metrics dict with uri, bytes, bytes_sent, seconds, bytes_per_sec,
+            chunks, resumed_from, crc32c and md5 (None when resumed)
+            
+        Raises:
+            AirflowException: If the upload fails or the checksums do not match
+        """
+        import google_crc32c
+        
+        stat = os.stat(self.local_file_path)
+        file_size, mtime = stat.st_size, stat.st_mtime
+        
+        state = self._load_state(file_size, mtime)
+        offset, crc, crc_offset = 0, 0, 0
+        session_url = None
+        
+        if state is not None:
+            acknowledged = self._query_offset(state['session_url'], file_size)
+            if acknowledged is not None:
+                session_url = state['session_url']
+                offset = acknowledged
+                crc, crc_offset = state.get('crc32c', 0), state.get('offset', 0)
+                logger.info(f"Resuming upload of {self.local_file_path} from byte {offset}")
+        
+        if session_url is None:
+            session_url = self._initiate(file_size)
+            offset = 0
+        
+        resumed_from = offset
+        md5 = hashlib.md5() if resumed_from == 0 else None
+        bandwidth = _observed_upload_bandwidth.get('bytes_per_sec')
+        chunk_size = self.fixed_chunk_size or choose_upload_chunk_size(file_size, bandwidth)
+        
+        start_time = time.monotonic()
+        bytes_sent = 0
+        chunks = 0
+        result = None
+        
+        with open(self.local_file_path, 'rb') as f:
+            # Bring the checksum up to the acknowledged offset; only the gap between
+            # the persisted checksum and what GCS acknowledged is read again
+            f.seek(crc_offset)
+            while crc_offset < offset:
+                data = f.read(min(UPLOAD_CHUNK_ALIGNMENT * 16, offset - crc_offset))
+                crc = google_crc32c.extend(crc, data)
+                crc_offset += len(data)
+            
+            if file_size == 0:
+                response = self._get_session().put(session_url, headers={'Content-Range': 'bytes */0'})
+                result = response.json() if response.status_code in (200, 201) else None
+            
+            retries = 0
+            while offset < file_size:
+                f.seek(offset)
+                data = f.read(chunk_size)
+                end = offset + len(data) - 1
+                
+                chunk_start = time.monotonic()
+                try:
+                    response = self._get_session().put(
+                        session_url,
+                        data=data,
+                        headers={'Content-Range': f"bytes {offset}-{end}/{file_size}"}
+                    )
+                    if response.status_code >= 500 or response.status_code == 429:
+                        raise AirflowException(f"Transient upload error {response.status_code}")
+                except Exception as e:
+                    retries += 1
+                    if retries > UPLOAD_MAX_RETRIES:
+                        raise AirflowException(f"Upload failed after {UPLOAD_MAX_RETRIES} retries: {str(e)}")
+                    logger.warning(f"Chunk at byte {offset} failed ({str(e)}), retry {retries}")
+                    time.sleep(min(2 ** retries, 32))
+                    acknowledged = self._query_offset(session_url, file_size)
+                    if acknowledged is None:
+                        raise AirflowException("Upload session expired while retrying")
+                    if acknowledged > offset:
+                        acked_data = data[:acknowledged - offset]
+                        crc = google_crc32c.extend(crc, acked_data)
+                        if md5 is not None:
+                            md5.update(acked_data)
+                        offset = acknowledged
+                    continue
+                
+                elapsed = time.monotonic() - chunk_start
+                retries = 0
+                chunks += 1
+                bytes_sent += len(data)
+                
+                if response.status_code in (200, 201):
+                    acknowledged = file_size
+                    result = response.json()
+                elif response.status_code == 308:
+                    acknowledged = self._acknowledged_offset(response)
+                else:
+                    raise AirflowException(
+                        f"Upload of chunk at byte {offset} failed ({response.status_code}): {response.text}"
+                    )
+                
+                # Hash exactly the bytes GCS persisted; anything beyond is resent
+                acked_data = data[:acknowledged - offset]
+                crc = google_crc32c.extend(crc, acked_data)
+                if md5 is not None:
+                    md5.update(acked_data)
+                offset = acknowledged
+                
+                self._save_state({
+                    'session_url': session_url,
+                    'bucket': self.bucket_name,
+                    'object': self.object_name,
+                    'size': file_size,
+                    'mtime': mtime,
+                    'offset': offset,
+                    'crc32c': crc
+                })
+                
+                if elapsed > 0:
+                    chunk_bandwidth = len(data) / elapsed
+                    bandwidth = chunk_bandwidth if not bandwidth else 0.7 * bandwidth + 0.3 * chunk_bandwidth
+                    _observed_upload_bandwidth['bytes_per_sec'] = bandwidth
+                    if not self.fixed_chunk_size:
+                        chunk_size = choose_upload_chunk_size(file_size, bandwidth)
+        
+        if result is None:
+            # Resumed sessions that were already complete report the object on a status query
+            response = self._get_session().put(session_url, headers={'Content-Range': f"bytes */{file_size}"})
+            result = response.json() if response.status_code in (200, 201) else {}
+        
+        local_crc32c = base64.b64encode(crc.to_bytes(4, 'big')).decode('utf-8')
+        local_md5 = base64.b64encode(md5.digest()).decode('utf-8') if md5 is not None else None
+        if result.get('crc32c') and result['crc32c'] != local_crc32c:
+            raise AirflowException(
+                f"crc32c mismatch for gs://{self.bucket_name}/{self.object_name}: "
+                f"local {local_crc32c}, remote {result['crc32c']}"
+            )
+        if local_md5 and result.get('md5Hash') and result['md5Hash'] != local_md5:
+            raise AirflowException(f"MD5 mismatch for gs://{self.bucket_name}/{self.object_name}")
+        
+        self._clear_state()
+        
+        seconds = time.monotonic() - start_time
+        return {
+            'uri': f"gs://{self.bucket_name}/{self.object_name}",
+            'bytes': file_size,
+            'bytes_sent': bytes_sent,
+            'seconds': round(seconds, 3),
+            'bytes_per_sec': round(bytes_sent / seconds, 1) if seconds > 0 else None,
+            'chunks': chunks,
+            'resumed_from': resumed_from,
+            'crc32c': local_crc32c,
+            'md5': local_md5
+        }
+
+
 def gcs_upload_file(local_file_path: str, bucket_name: str, object_name: str,
                     conn_id: str = DEFAULT_GCP_CONN_ID, 
-                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+                    chunk_size: int = None,
+                    return_metrics: bool = False) -> Union[str, Dict]:
     """
     Upload a local file to Google Cloud Storage.
     
+    Uses GCSResumableUploader: checksums are verified on the fly, interrupted
+    uploads resume from the last acknowledged offset and chunk size adapts to
+    the observed bandwidth unless chunk_size is given.
+    
     Args:
         local_file_path: Path to the local file to upload
         bucket_name: Name of the GCS bucket
         object_name: Name to give the uploaded object
         conn_id: Airflow connection ID for GCP
-        chunk_size: Size of chunks for uploading large files
+        chunk_size: Fixed chunk size for uploading large files (adaptive if None)
+        return_metrics: Return the upload metrics dict instead of the URI
         
     Returns:
-        GCS URI of uploaded file (gs://bucket-name/object-name)
+        GCS URI of uploaded file (gs://bucket-name/object-name), or the upload
+        metrics (including bytes_per_sec) if return_metrics is True
         
     Raises:
         AirflowException: If upload fails or file does not exist
@@ -186,28 +561,254 @@ def gcs_upload_file(local_file_path: str, bucket_name: str, object_name: str,
     
     try:
         hook = GCSHook(gcp_conn_id=conn_id)
-        hook.upload(
+        metrics = GCSResumableUploader(
+            credentials=hook.get_credentials(),
             bucket_name=bucket_name,
             object_name=object_name,
-            filename=local_file_path,
+            local_file_path=local_file_path,
             chunk_size=chunk_size
-        )
+        ).upload()
         
-        file_size = local_path.stat().st_size
         logger.info(
             f"Successfully uploaded {local_file_path} "
-            f"({file_size} bytes) to gs://{bucket_name}/{object_name}"
+            f"({metrics['bytes']} bytes) to gs://{bucket_name}/{object_name} "
+            f"in {metrics['seconds']}s ({metrics['bytes_per_sec']} bytes/sec, "
+            f"{metrics['chunks']} chunks)"
         )
         
-        return f"gs://{bucket_name}/{object_name}"
+        return metrics if return_metrics else metrics['uri']
     
     except Exception as e:
         logger.error(f"Failed to upload {local_file_path} to GCS: {str(e)}")
         raise AirflowException(f"Failed to upload file to GCS: {str(e)}")
 
 
+class GCSDownloadCache:
+    """
+    Local content-addressed cache for objects downloaded from Google Cloud Storage.
+
+    Entries are keyed by bucket, object name and generation, so a new object
+    generation never matches a stale entry. Each entry stores the object's
+    crc32c, etag and size alongside the data and is only served when they still
+    match the live object metadata. The cache directory can be shared between
+    worker processes: every entry is guarded by an fcntl lock file so concurrent
+    tasks asking for the same object download it once, and total size is kept
+    under a byte budget by evicting least recently used entries.
+    """
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        """
+        Initialize the GCSDownloadCache.
+
+        Args:
+            cache_dir: Directory holding cached objects (defaults to DEFAULT_DOWNLOAD_CACHE_DIR)
+            max_bytes: Maximum total size of cached data in bytes
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_DOWNLOAD_CACHE_DIR)
+        self.max_bytes = max_bytes if max_bytes is not None else DEFAULT_DOWNLOAD_CACHE_MAX_BYTES
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def cache_key(bucket_name: str, object_name: str, generation: Any) -> str:
+        """
+        Build the cache key for an object generation.
+
+        Args:
+            bucket_name: Name of the GCS bucket
+            object_name: Name of the object
+            generation: Object generation number
+
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        raw = f"{bucket_name}/{object_name}#{generation}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _data_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.data"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _lock_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.lock"
+
+    @contextmanager
+    def _locked(self, lock_path: Path, blocking: bool = True) -> Iterator[bool]:
+        """
+        Hold an exclusive fcntl lock on lock_path for the duration of the block.
+
+        Yields True when the lock was acquired, False if blocking is disabled and
+        another process holds it.
+        """
+        with open(lock_path, 'a') as lock_file:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(lock_file.fileno(), flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read_meta(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._meta_path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _is_valid(self, key: str, metadata: Dict) -> bool:
+        """
+        Check that a cache entry exists and matches the live object metadata.
+        """
+        data_path = self._data_path(key)
+        cached = self._read_meta(key)
+        if cached is None or not data_path.exists():
+            return False
+
+        for field in ('crc32c', 'etag', 'size'):
+            if metadata.get(field) is not None and cached.get(field) != metadata.get(field):
+                logger.info(f"Cache entry {key} is stale ({field} changed)")
+                return False
+
+        return data_path.stat().st_size == cached.get('size', data_path.stat().st_size)
+
+    @staticmethod
+    def _file_crc32c(file_path: str) -> str:
+        """
+        Compute the base64 encoded crc32c of a file, as reported by GCS.
+        """
+        import google_crc32c
+
+        checksum = google_crc32c.Checksum()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                checksum.update(chunk)
+        return base64.b64encode(checksum.digest()).decode('utf-8')
+
+    def fetch(self, bucket_name: str, object_name: str, metadata: Dict,
+              download_fn: Callable[[str], None]) -> str:
+        """
+        Return the path of a cached copy of an object, downloading it on a miss.
+
+        Args:
+            bucket_name: Name of the GCS bucket
+            object_name: Name of the object
+            metadata: Live object metadata with generation, crc32c, etag and size
+            download_fn: Callable that downloads the object to the given path
+
+        Returns:
+            Path of the cached data file
+
+        Raises:
+            AirflowException: If the downloaded data fails crc32c validation
+        """
+        key = self.cache_key(bucket_name, object_name, metadata.get('generation'))
+        data_path = self._data_path(key)
+
+        with self._locked(self._lock_path(key)):
+            if self._is_valid(key, metadata):
+                # Touch the entry so LRU eviction sees it as recently used
+                os.utime(data_path, None)
+                logger.info(f"Download cache hit for gs://{bucket_name}/{object_name}")
+                return str(data_path)
+
+            logger.info(f"Download cache miss for gs://{bucket_name}/{object_name}")
+            tmp_path = f"{data_path}.{os.getpid()}.tmp"
+            try:
+                download_fn(tmp_path)
+
+                expected_crc = metadata.get('crc32c')
+                if expected_crc and self._file_crc32c(tmp_path) != expected_crc:
+                    raise AirflowException(
+                        f"crc32c mismatch for gs://{bucket_name}/{object_name}"
+                    )
+
+                os.replace(tmp_path, data_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+            with open(self._meta_path(key), 'w') as f:
+                json.dump({
+                    'bucket': bucket_name,
+                    'object': object_name,
+                    'generation': metadata.get('generation'),
+                    'crc32c': metadata.get('crc32c'),
+                    'etag': metadata.get('etag'),
+                    'size': data_path.stat().st_size,
+                    'cached_at': time.time()
+                }, f)
+
+        self.evict(protect_key=key)
+        return str(data_path)
+
+    def evict(self, protect_key: str = None) -> int:
+        """
+        Evict least recently used entries until the cache fits its byte budget.
+
+        Entries locked by another process are skipped.
+
+        Args:
+            protect_key: Cache key that must not be evicted
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._locked(self.cache_dir / '.eviction.lock'):
+            entries = []
+            for data_path in self.cache_dir.glob('*.data'):
+                try:
+                    stat = data_path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, data_path.stem))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, key in sorted(entries):
+                if total_size <= self.max_bytes:
+                    break
+                if key == protect_key:
+                    continue
+
+                with self._locked(self._lock_path(key), blocking=False) as acquired:
+                    if not acquired:
+                        continue
+                    for path in (self._data_path(key), self._meta_path(key)):
+                        if path.exists():
+                            path.unlink()
+
+                total_size -= size
+                removed += 1
+
+        if removed:
+            logger.info(f"Evicted {removed} entries from download cache {self.cache_dir}")
+        return removed
+
+
+def get_download_cache(cache_dir: str = None) -> GCSDownloadCache:
+    """
+    Get the shared GCSDownloadCache for a cache directory.
+
+    Args:
+        cache_dir: Cache directory (defaults to DEFAULT_DOWNLOAD_CACHE_DIR)
+
+    Returns:
+        GCSDownloadCache instance
+    """
+    cache_dir = cache_dir or DEFAULT_DOWNLOAD_CACHE_DIR
+    if cache_dir not in _download_caches:
+        _download_caches[cache_dir] = GCSDownloadCache(cache_dir=cache_dir)
+    return _download_caches[cache_dir]
+
+
 def gcs_download_file(bucket_name: str, object_name: str, local_file_path: str,
-                      conn_id: str = DEFAULT_GCP_CONN_ID) -> str:
+                      conn_id: str = DEFAULT_GCP_CONN_ID, use_cache: bool = False,
+                      cache_dir: str = None) -> str:
     """
     Download a file from Google Cloud Storage to a local path.
     
@@ -216,6 +817,9 @@ def gcs_download_file(bucket_name: str, object_name: str, local_file_path: str,
         object_name: Name of the object to download
         local_file_path: Local path where the file should be saved
         conn_id: Airflow connection ID for GCP
+        use_cache: Serve the object from the local download cache when the cached
+            generation still matches the object's crc32c/etag
+        cache_dir: Download cache directory (defaults to DEFAULT_DOWNLOAD_CACHE_DIR)
         
     Returns:
         Local path of downloaded file
@@ -229,11 +833,32 @@ def gcs_download_file(bucket_name: str, object_name: str, local_file_path: str,
         local_path.parent.mkdir(parents=True, exist_ok=True)
         
         hook = GCSHook(gcp_conn_id=conn_id)
-        hook.download(
-            bucket_name=bucket_name,
-            object_name=object_name,
-            filename=local_file_path
-        )
+
+        if use_cache:
+            blob = hook.get_conn().bucket(bucket_name).get_blob(object_name)
+            if blob is None:
+                raise AirflowException(f"Object gs://{bucket_name}/{object_name} not found")
+
+            # The blob carries its generation, so the download is pinned to it
+            cached_path = get_download_cache(cache_dir).fetch(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                metadata={
+                    'generation': blob.generation,
+                    'crc32c': blob.crc32c,
+                    'etag': blob.etag,
+                    'size': blob.size
+                },
+                download_fn=blob.download_to_filename
+            )
+            # Copy rather than link so callers can modify their file freely
+            shutil.copyfile(cached_path, local_file_path)
+        else:
+            hook.download(
+                bucket_name=bucket_name,
+                object_name=object_name,
+                filename=local_file_path
+            )
         
         # Get file size after download
         file_size = local_path.stat().st_size
@@ -306,85 +931,909 @@ def gcs_delete_file(bucket_name: str, object_name: str,
         return False
 
 
-def bigquery_execute_query(sql: str, query_params: Dict = None, location: str = None,
-                          conn_id: str = DEFAULT_GCP_CONN_ID, 
-                          as_dataframe: bool = False) -> Union[List, DataFrame]:
+class GCSObjectIndex:
     """
-    Execute a BigQuery SQL query and return results.
+    Local index of GCS objects maintained from object change notifications.
     
-    Args:
-        sql: SQL query to execute
-        query_params: Query parameters (optional)
-        location: BigQuery dataset location (optional)
-        conn_id: Airflow connection ID for GCP
-        as_dataframe: Return results as pandas DataFrame if True
+    A single GCSNotificationListener applies OBJECT_FINALIZE and OBJECT_DELETE
+    notifications to the index; sensors and DAG tasks then answer "does this
+    object exist" and "what is under this prefix" from it without calling the
+    GCS API. Notifications only describe changes, so the index also records
+    which bucket/prefixes were seeded from a listing; it is only trusted for
+    queries inside a seeded prefix and while the listener keeps its heartbeat
+    fresh, so callers fall back to listing GCS otherwise.
+    
+    The index is a SQLite database in WAL mode, which is safe for one writer
+    and many concurrent readers across processes.
+    """
+    
+    def __init__(self, index_path: str = None):
+        """
+        Initialize the GCSObjectIndex.
         
-    Returns:
-        Query results as list or pandas DataFrame
+        Args:
+            index_path: Path of the SQLite database file
+        """
+        self.index_path = index_path or DEFAULT_OBJECT_INDEX_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS objects ('
+                'bucket TEXT NOT NULL, name TEXT NOT NULL, generation INTEGER NOT NULL, '
+                'size INTEGER, updated TEXT, PRIMARY KEY (bucket, name))'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS heartbeat (source TEXT PRIMARY KEY, last_seen REAL NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS seeded (bucket TEXT NOT NULL, prefix TEXT NOT NULL, '
+                'seeded_at REAL NOT NULL, PRIMARY KEY (bucket, prefix))'
+            )
+    
+    @contextmanager
+    def _connect(self) -> Iterator[Any]:
+        import sqlite3
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def apply_notification(self, attributes: Dict, data: Dict = None) -> bool:
+        """
+        Apply a GCS Pub/Sub notification to the index.
         
-    Raises:
-        AirflowException: If query execution fails
-    """
-    try:
-        start_time = pd.Timestamp.now()
-        hook = BigQueryHook(gcp_conn_id=conn_id, location=location)
+        Generations are compared so that out-of-order delivery never lets an
+        older event overwrite a newer one, and a delete caused by an overwrite
+        does not remove the object.
         
-        if as_dataframe:
-            results = hook.get_pandas_df(
-                sql=sql,
-                parameters=query_params
+        Args:
+            attributes: Notification attributes (eventType, bucketId, objectId, objectGeneration)
+            data: Decoded JSON_API_V1 payload with the object resource (optional)
+            
+        Returns:
+            True if the index changed, False if the event was ignored
+        """
+        event_type = attributes.get('eventType')
+        bucket = attributes.get('bucketId')
+        name = attributes.get('objectId')
+        generation = int(attributes.get('objectGeneration') or 0)
+        data = data or {}
+        
+        if not bucket or not name:
+            return False
+        
+        with self._connect() as conn:
+            if event_type == 'OBJECT_FINALIZE':
+                cursor = conn.execute(
+                    'INSERT INTO objects (bucket, name, generation, size, updated) VALUES (?, ?, ?, ?, ?) '
+                    'ON CONFLICT (bucket, name) DO UPDATE SET generation = excluded.generation, '
+                    'size = excluded.size, updated = excluded.updated '
+                    'WHERE excluded.generation >= objects.generation',
+                    (bucket, name, generation, int(data.get('size') or 0), data.get('updated'))
+                )
+                return cursor.rowcount > 0
+            
+            if event_type in ('OBJECT_DELETE', 'OBJECT_ARCHIVE'):
+                if attributes.get('overwrittenByGeneration'):
+                    return False
+                cursor = conn.execute(
+                    'DELETE FROM objects WHERE bucket = ? AND name = ? AND generation <= ?',
+                    (bucket, name, generation)
+                )
+                return cursor.rowcount > 0
+        
+        return False
+    
+    def seed(self, bucket_name: str, object_names: List[str], prefix: str = '') -> None:
+        """
+        Add objects that existed before the listener started.
+        
+        The prefix is recorded as covered, so the index answers for it from
+        then on. The listing must be taken after the notification subscription
+        exists, otherwise changes in between are missed.
+        
+        Args:
+            bucket_name: Name of the GCS bucket
+            object_names: Object names from a listing of the prefix
+            prefix: Prefix the listing covered ('' for the whole bucket)
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                'INSERT OR IGNORE INTO objects (bucket, name, generation) VALUES (?, ?, 0)',
+                [(bucket_name, name) for name in object_names]
             )
-        else:
-            results = hook.get_records(
-                sql=sql,
-                parameters=query_params
+            conn.execute(
+                'INSERT OR REPLACE INTO seeded (bucket, prefix, seeded_at) VALUES (?, ?, ?)',
+                (bucket_name, prefix or '', time.time())
             )
+    
+    def covers(self, bucket_name: str, prefix: str = '') -> bool:
+        """
+        Check whether a bucket/prefix lies inside a seeded prefix.
+        
+        Args:
+            bucket_name: Name of the GCS bucket
+            prefix: Prefix or object name being queried
             
-        duration = (pd.Timestamp.now() - start_time).total_seconds()
-        row_count = len(results)
+        Returns:
+            True if the index holds every object under the prefix
+        """
+        prefix = prefix or ''
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT 1 FROM seeded WHERE bucket = ? AND substr(?, 1, length(prefix)) = prefix',
+                (bucket_name, prefix)
+            ).fetchone()
+        return row is not None
+    
+    def exists(self, bucket_name: str, object_name: str) -> bool:
+        """
+        Check whether an object is in the index.
         
-        logger.info(
-            f"Query executed successfully in {duration:.2f}s, "
-            f"returned {row_count} rows"
-        )
+        Args:
+            bucket_name: Name of the GCS bucket
+            object_name: Name of the object
+            
+        Returns:
+            True if the object is indexed
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT 1 FROM objects WHERE bucket = ? AND name = ?', (bucket_name, object_name)
+            ).fetchone()
+        return row is not None
+    
+    def list_objects(self, bucket_name: str, prefix: str = '') -> List[str]:
+        """
+        List indexed object names under a prefix, in name order.
         
-        return results
+        Args:
+            bucket_name: Name of the GCS bucket
+            prefix: Prefix to filter objects
+            
+        Returns:
+            List of object names
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT name FROM objects WHERE bucket = ? AND substr(name, 1, ?) = ? ORDER BY name',
+                (bucket_name, len(prefix), prefix)
+            ).fetchall()
+        return [row[0] for row in rows]
     
-    except Exception as e:
-        logger.error(f"Failed to execute BigQuery query: {str(e)}")
-        raise AirflowException(f"Failed to execute BigQuery query: {str(e)}")
+    def heartbeat(self, source: str = 'listener') -> None:
+        """
+        Record that the listener is alive and has drained its queue.
+        
+        Args:
+            source: Name of the listener
+        """
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO heartbeat (source, last_seen) VALUES (?, ?)', (source, time.time())
+            )
+    
+    def is_live(self, max_lag: float = DEFAULT_INDEX_MAX_LAG, bucket_name: str = None,
+                prefix: str = '') -> bool:
+        """
+        Check whether a listener has updated the index recently.
+        
+        When bucket_name is given the bucket/prefix must also be covered by a
+        seed (see covers), since objects created before the listener started
+        are otherwise missing from the index.
+        
+        Args:
+            max_lag: Maximum seconds since the last heartbeat
+            bucket_name: Bucket about to be queried (optional)
+            prefix: Prefix or object name about to be queried
+            
+        Returns:
+            True if the index can be trusted
+        """
+        with self._connect() as conn:
+            row = conn.execute('SELECT MAX(last_seen) FROM heartbeat').fetchone()
+        if not (row and row[0] and time.time() - row[0] <= max_lag):
+            return False
+        return bucket_name is None or self.covers(bucket_name, prefix)
 
 
-def bigquery_create_dataset(dataset_id: str, location: str = 'US',
-                           conn_id: str = DEFAULT_GCP_CONN_ID) -> bool:
+def get_object_index(index_path: str = None) -> GCSObjectIndex:
     """
-    Create a BigQuery dataset if it doesn't exist.
+    Get the shared GCSObjectIndex for an index path.
     
     Args:
-        dataset_id: ID of the dataset to create
-        location: Geographic location of the dataset
-        conn_id: Airflow connection ID for GCP
+        index_path: Path of the SQLite database file (defaults to DEFAULT_OBJECT_INDEX_PATH)
         
     Returns:
-        True if created or already exists, False on failure
+        GCSObjectIndex instance
     """
-    try:
-        hook = BigQueryHook(gcp_conn_id=conn_id)
-        conn = hook.get_conn()
-        client = hook.get_client(project_id=conn.project)
-        
-        try:
-            client.get_dataset(dataset_id)
-            logger.info(f"Dataset {dataset_id} already exists")
-            return True
-        except Exception:
-            # Dataset doesn't exist, create it
-            dataset = google.cloud.bigquery.Dataset(f"{client.project}.{dataset_id}")
-            dataset.location = location
-            client.create_dataset(dataset)
+    index_path = index_path or DEFAULT_OBJECT_INDEX_PATH
+    if index_path not in _object_indexes:
+        _object_indexes[index_path] = GCSObjectIndex(index_path)
+    return _object_indexes[index_path]
+
+
+class GCSNotificationListener:
+    """
+    Consumes GCS object change notifications into a GCSObjectIndex.
+    
+    Notifications are read either from a Pub/Sub subscription attached to a
+    bucket notification config (JSON_API_V1 payload; honours PUBSUB_EMULATOR_HOST
+    for a local emulator) or from a drop directory of JSON files, each holding
+    {"attributes": {...}, "data": {...}}, as a stand-in for testing.
+    """
+    
+    def __init__(self, index: GCSObjectIndex, subscription: str = None, drop_dir: str = None):
+        """
+        Initialize the GCSNotificationListener.
+        
+        Args:
+            index: Index to update
+            subscription: Full Pub/Sub subscription path (projects/.../subscriptions/...)
+            drop_dir: Directory of notification JSON files
+            
+        Raises:
+            AirflowException: If neither or both sources are given
+        """
+        if bool(subscription) == bool(drop_dir):
+            raise AirflowException("Exactly one of subscription or drop_dir must be provided")
+        self.index = index
+        self.subscription = subscription
+        self.drop_dir = drop_dir
+        self.subscriber = None
+        self.failed = 0
+    
+    def _poll_pubsub(self, max_messages: int, timeout: float) -> int:
+        if self.subscriber is None:
+            try:
+                from google.cloud import pubsub_v1
+            except ImportError:
+                raise AirflowException("google-cloud-pubsub is required to consume GCS notifications")
+            self.subscriber = pubsub_v1.SubscriberClient()
+        
+        from google.api_core.exceptions import DeadlineExceeded
+        try:
+            response = self.subscriber.pull(
+                request={'subscription': self.subscription, 'max_messages': max_messages},
+                timeout=timeout
+            )
+        except DeadlineExceeded:
+            return 0
+        
+        ack_ids = []
+        for received in response.received_messages:
+            message = received.message
+            try:
+                data = json.loads(message.data.decode('utf-8')) if message.data else {}
+                self.index.apply_notification(dict(message.attributes), data)
+            except ValueError as e:
+                logger.warning(f"Dropping malformed notification {message.message_id}: {str(e)}")
+            except Exception as e:
+                # Left unacknowledged so Pub/Sub redelivers it
+                logger.error(f"Failed to apply notification {message.message_id}: {str(e)}")
+                self.failed += 1
+                continue
+            ack_ids.append(received.ack_id)
+        
+        if ack_ids:
+            self.subscriber.acknowledge(request={'subscription': self.subscription, 'ack_ids': ack_ids})
+        return len(ack_ids)
+    
+    def _poll_drop_dir(self, max_messages: int) -> int:
+        os.makedirs(self.drop_dir, exist_ok=True)
+        names = sorted(name for name in os.listdir(self.drop_dir) if name.endswith('.json'))[:max_messages]
+        
+        for name in names:
+            path = os.path.join(self.drop_dir, name)
+            try:
+                with open(path, 'r') as f:
+                    notification = json.load(f)
+                self.index.apply_notification(notification.get('attributes', {}), notification.get('data'))
+            except ValueError as e:
+                logger.warning(f"Skipping malformed notification {path}: {str(e)}")
+            except Exception as e:
+                # Left in place so the next poll retries it
+                logger.error(f"Failed to apply notification {path}: {str(e)}")
+                self.failed += 1
+                continue
+            os.remove(path)
+        return len(names) - self.failed
+    
+    def poll_once(self, max_messages: int = 500, timeout: float = 10.0) -> int:
+        """
+        Apply one batch of notifications and refresh the index heartbeat.
+        
+        The heartbeat is only refreshed when every notification in the batch
+        was applied, so readers fall back to GCS while one is pending a retry.
+        
+        Args:
+            max_messages: Maximum notifications to apply
+            timeout: Seconds to wait for Pub/Sub messages
+            
+        Returns:
+            Number of notifications applied
+        """
+        self.failed = 0
+        if self.subscription:
+            count = self._poll_pubsub(max_messages, timeout)
+        else:
+            count = self._poll_drop_dir(max_messages)
+        if not self.failed:
+            self.index.heartbeat()
+        return count
+    
+    def run(self, idle_sleep: float = 1.0, max_iterations: int = None) -> None:
+        """
+        Consume notifications until interrupted.
+        
+        Args:
+            idle_sleep: Seconds to sleep when a poll returned nothing
+            max_iterations: Stop after this many polls (runs forever if None)
+        """
+        iterations = 0
+        while max_iterations is None or iterations < max_iterations:
+            try:
+                count = self.poll_once()
+            except Exception as e:
+                # Keep consuming; the heartbeat goes stale until polls succeed again
+                logger.error(f"Failed to poll GCS notifications: {str(e)}")
+                time.sleep(idle_sleep)
+                iterations += 1
+                continue
+            if count:
+                logger.info(f"Applied {count} GCS notifications to {self.index.index_path}")
+            elif self.drop_dir:
+                # Pub/Sub pulls already block until messages arrive or the timeout expires
+                time.sleep(idle_sleep)
+            iterations += 1
+
+
+def bigquery_execute_query(sql: str, query_params: Dict = None, location: str = None,
+                          conn_id: str = DEFAULT_GCP_CONN_ID, 
+                          as_dataframe: bool = False, use_storage_api: bool = False,
+                          max_streams: int = DEFAULT_READ_STREAMS,
+                          use_legacy_sql: bool = True) -> Union[List, DataFrame]:
+    """
+    Execute a BigQuery SQL query and return results.
+    
+    Both read paths run the same statement: query_params fill %(name)s
+    placeholders client-side (see render_query) and use_legacy_sql selects
+    the dialect, defaulting to legacy SQL like BigQueryHook.
+    
+    Args:
+        sql: SQL query to execute
+        query_params: Values for %(name)s placeholders (optional)
+        location: BigQuery dataset location (optional)
+        conn_id: Airflow connection ID for GCP
+        as_dataframe: Return results as pandas DataFrame if True
+        use_storage_api: Read the DataFrame through the BigQuery Storage Read API
+            (only used when as_dataframe is True)
+        max_streams: Maximum number of parallel read streams for the Storage Read API
+        use_legacy_sql: Run the query as legacy SQL rather than standard SQL
+        
+    Returns:
+        Query results as list or pandas DataFrame
+        
+    Raises:
+        AirflowException: If query execution fails
+    """
+    if as_dataframe and use_storage_api:
+        return bigquery_query_to_dataframe(
+            sql=sql,
+            query_params=query_params,
+            location=location,
+            conn_id=conn_id,
+            max_streams=max_streams,
+            use_legacy_sql=use_legacy_sql
+        )
+
+    try:
+        start_time = pd.Timestamp.now()
+        hook = BigQueryHook(gcp_conn_id=conn_id, location=location, use_legacy_sql=use_legacy_sql)
+        
+        if as_dataframe:
+            results = hook.get_pandas_df(
+                sql=sql,
+                parameters=query_params
+            )
+        else:
+            results = hook.get_records(
+                sql=sql,
+                parameters=query_params
+            )
+            
+        duration = (pd.Timestamp.now() - start_time).total_seconds()
+        row_count = len(results)
+        
+        logger.info(
+            f"Query executed successfully in {duration:.2f}s, "
+            f"returned {row_count} rows"
+        )
+        
+        return results
+    
+    except Exception as e:
+        logger.error(f"Failed to execute BigQuery query: {str(e)}")
+        raise AirflowException(f"Failed to execute BigQuery query: {str(e)}")
+
+
+def render_query(sql: str, query_params: Dict = None) -> str:
+    """
+    Substitute %(name)s placeholders into SQL the way BigQueryHook does.
+    
+    BigQueryHook.get_records and get_pandas_df bind parameters client-side
+    with the provider's cursor rules; rendering through the same function
+    lets the job-based paths run exactly the statement the hook would.
+    
+    Args:
+        sql: SQL with %(name)s placeholders
+        query_params: Mapping of placeholder name to Python value (optional)
+        
+    Returns:
+        SQL with the values substituted
+    """
+    if not query_params:
+        return sql
+    from airflow.providers.google.cloud.hooks.bigquery import _bind_parameters
+    return _bind_parameters(sql, query_params)
+
+
+def bigquery_iter_arrow_batches(sql: str, query_params: Dict = None, location: str = None,
+                                conn_id: str = DEFAULT_GCP_CONN_ID,
+                                max_streams: int = DEFAULT_READ_STREAMS,
+                                use_legacy_sql: bool = True) -> Iterator[Any]:
+    """
+    Run a query and stream its results as Arrow record batches via the Storage Read API.
+    
+    The query result table is read with up to max_streams parallel streams.
+    Batches are handed over through a bounded queue, so memory use stays
+    proportional to the number of streams rather than the result size. Row
+    order is only preserved when max_streams is 1. Parameters and dialect
+    follow bigquery_execute_query.
+    
+    Args:
+        sql: SQL query to execute
+        query_params: Values for %(name)s placeholders (optional)
+        location: BigQuery dataset location (optional)
+        conn_id: Airflow connection ID for GCP
+        max_streams: Maximum number of parallel read streams
+        use_legacy_sql: Run the query as legacy SQL rather than standard SQL
+        
+    Yields:
+        pyarrow.RecordBatch objects
+        
+    Raises:
+        AirflowException: If the query or read session fails
+    """
+    try:
+        from google.cloud import bigquery_storage
+    except ImportError:
+        raise AirflowException("google-cloud-bigquery-storage is required for the Storage Read API")
+
+    try:
+        hook = BigQueryHook(gcp_conn_id=conn_id, location=location)
+        client = hook.get_client(project_id=hook.project_id, location=location)
+
+        job_config = QueryJobConfig(use_legacy_sql=use_legacy_sql)
+        job = client.query(render_query(sql, query_params), job_config=job_config, location=location)
+        job.result()
+
+        table = job.destination
+        read_client = bigquery_storage.BigQueryReadClient(credentials=hook.get_credentials())
+        session = read_client.create_read_session(
+            parent=f"projects/{client.project}",
+            read_session=bigquery_storage.types.ReadSession(
+                table=f"projects/{table.project}/datasets/{table.dataset_id}/tables/{table.table_id}",
+                data_format=bigquery_storage.types.DataFormat.ARROW
+            ),
+            max_stream_count=max_streams
+        )
+    except Exception as e:
+        logger.error(f"Failed to start Storage Read API session: {str(e)}")
+        raise AirflowException(f"Failed to start Storage Read API session: {str(e)}")
+
+    streams = list(session.streams)
+    logger.info(f"Reading results of job {job.job_id} with {len(streams)} streams")
+    if not streams:
+        return
+
+    batches = queue.Queue(maxsize=2 * len(streams))
+    stop_event = threading.Event()
+    done_marker = object()
+
+    def _put(item: Any) -> bool:
+        while not stop_event.is_set():
+            try:
+                batches.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read_stream(stream_name: str) -> None:
+        try:
+            for page in read_client.read_rows(stream_name).rows(session).pages:
+                if not _put(page.to_arrow()):
+                    return
+            _put(done_marker)
+        except Exception as e:
+            _put(e)
+
+    executor = ThreadPoolExecutor(max_workers=len(streams))
+    try:
+        for stream in streams:
+            executor.submit(_read_stream, stream.name)
+
+        remaining = len(streams)
+        while remaining:
+            item = batches.get()
+            if item is done_marker:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                logger.error(f"Storage Read API stream failed: {str(item)}")
+                raise AirflowException(f"Storage Read API stream failed: {str(item)}")
+            else:
+                yield item
+    finally:
+        # Unblock readers if the consumer stopped early or a stream failed
+        stop_event.set()
+        executor.shutdown(wait=True)
+
+
+def bigquery_query_to_dataframe(sql: str, query_params: Dict = None, location: str = None,
+                                conn_id: str = DEFAULT_GCP_CONN_ID,
+                                max_streams: int = DEFAULT_READ_STREAMS,
+                                use_legacy_sql: bool = True) -> DataFrame:
+    """
+    Run a query and return the results as a DataFrame read via the Storage Read API.
+    
+    Args:
+        sql: SQL query to execute
+        query_params: Values for %(name)s placeholders (optional)
+        location: BigQuery dataset location (optional)
+        conn_id: Airflow connection ID for GCP
+        max_streams: Maximum number of parallel read streams
+        use_legacy_sql: Run the query as legacy SQL rather than standard SQL
+        
+    Returns:
+        pandas DataFrame with the query results
+    """
+    import pyarrow
+
+    start_time = pd.Timestamp.now()
+    batches = list(bigquery_iter_arrow_batches(
+        sql=sql,
+        query_params=query_params,
+        location=location,
+        conn_id=conn_id,
+        max_streams=max_streams,
+        use_legacy_sql=use_legacy_sql
+    ))
+    df = pyarrow.Table.from_batches(batches).to_pandas() if batches else pd.DataFrame()
+
+    duration = (pd.Timestamp.now() - start_time).total_seconds()
+    logger.info(f"Query read via Storage Read API in {duration:.2f}s, returned {len(df)} rows")
+    return df
+
+
+def bigquery_query_to_parquet(sql: str, parquet_file_path: str, query_params: Dict = None,
+                              location: str = None, conn_id: str = DEFAULT_GCP_CONN_ID,
+                              max_streams: int = DEFAULT_READ_STREAMS,
+                              use_legacy_sql: bool = True) -> int:
+    """
+    Run a query and write the results straight to a Parquet file via the Storage Read API.
+    
+    Args:
+        sql: SQL query to execute
+        parquet_file_path: Path of the Parquet file to write
+        query_params: Values for %(name)s placeholders (optional)
+        location: BigQuery dataset location (optional)
+        conn_id: Airflow connection ID for GCP
+        max_streams: Maximum number of parallel read streams
+        use_legacy_sql: Run the query as legacy SQL rather than standard SQL
+        
+    Returns:
+        Number of rows written
+    """
+    import pyarrow.parquet as pq
+
+    Path(parquet_file_path).parent.mkdir(parents=True, exist_ok=True)
+
+    row_count = 0
+    writer = None
+    try:
+        for batch in bigquery_iter_arrow_batches(
+            sql=sql,
+            query_params=query_params,
+            location=location,
+            conn_id=conn_id,
+            max_streams=max_streams,
+            use_legacy_sql=use_legacy_sql
+        ):
+            if writer is None:
+                writer = pq.ParquetWriter(parquet_file_path, batch.schema)
+            writer.write_batch(batch)
+            row_count += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    logger.info(f"Wrote {row_count} query result rows to {parquet_file_path}")
+    return row_count
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Normalize SQL text so formatting-only differences share a cache entry.
+    
+    Comments are removed and whitespace is collapsed outside of string literals;
+    literals and identifiers keep their case.
+    
+    Args:
+        sql: SQL text
+        
+    Returns:
+        Normalized SQL text
+    """
+    pattern = re.compile(
+        r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`)"  # string literals and quoted identifiers
+        r"|((?:\s|--[^\n]*|#[^\n]*|/\*.*?\*/)+)",  # runs of whitespace and comments
+        re.DOTALL
+    )
+    
+    def _replace(match: Any) -> str:
+        return match.group(1) or ' '
+    
+    return pattern.sub(_replace, sql).strip().rstrip(';').strip()
+
+
+def bigquery_estimate_query(sql: str, query_params: Dict = None, location: str = None,
+                            conn_id: str = DEFAULT_GCP_CONN_ID, use_cache: bool = True,
+                            cache_ttl: int = DEFAULT_DRY_RUN_CACHE_TTL,
+                            use_legacy_sql: bool = True, delegate_to: str = None) -> Dict:
+    """
+    Estimate the bytes a query would scan by running it as a dry-run job.
+    
+    Dry runs are free and return in milliseconds. The dry run covers the
+    statement bigquery_execute_query would run: parameters are rendered into
+    the SQL with render_query and the dialect follows use_legacy_sql. Results
+    are cached by normalized SQL, dialect, location and credentials so
+    repeated checks of the same query skip the API call.
+    
+    Args:
+        sql: SQL query to estimate
+        query_params: Values for %(name)s placeholders (optional)
+        location: BigQuery dataset location (optional)
+        conn_id: Airflow connection ID for GCP
+        use_cache: Serve the estimate from the cache when available
+        cache_ttl: Seconds a cached estimate stays valid
+        use_legacy_sql: Estimate the query as legacy SQL rather than standard SQL
+        delegate_to: The account to impersonate, if any
+        
+    Returns:
+        Dict with total_bytes_processed, estimated_cost_usd, referenced_tables
+        and whether the result came from the cache
+        
+    Raises:
+        AirflowException: If the dry run fails (e.g. invalid SQL)
+    """
+    sql = render_query(sql, query_params)
+    cache_key = hashlib.sha256(json.dumps(
+        [normalize_sql(sql), use_legacy_sql, location, conn_id, delegate_to], sort_keys=True, default=str
+    ).encode('utf-8')).hexdigest()
+    
+    cached = _dry_run_cache.get(cache_key)
+    if use_cache and cached and time.time() - cached['estimated_at'] < cache_ttl:
+        logger.info(f"Using cached dry-run estimate: {cached['total_bytes_processed']} bytes")
+        return dict(cached, cached=True)
+    
+    try:
+        hook = BigQueryHook(gcp_conn_id=conn_id, location=location, delegate_to=delegate_to)
+        client = hook.get_client(project_id=hook.project_id, location=location)
+        
+        job_config = QueryJobConfig(
+            dry_run=True,
+            use_query_cache=False,
+            use_legacy_sql=use_legacy_sql
+        )
+        job = client.query(sql, job_config=job_config, location=location)
+        
+        total_bytes = job.total_bytes_processed or 0
+        estimate = {
+            'total_bytes_processed': total_bytes,
+            'estimated_cost_usd': round(total_bytes / 1024 ** 4 * BIGQUERY_ON_DEMAND_USD_PER_TIB, 4),
+            'referenced_tables': [
+                f"{table.project}.{table.dataset_id}.{table.table_id}"
+                for table in (job.referenced_tables or [])
+            ],
+            'estimated_at': time.time()
+        }
+        _dry_run_cache[cache_key] = estimate
+        
+        logger.info(
+            f"Dry run estimate: {total_bytes} bytes processed "
+            f"(~${estimate['estimated_cost_usd']} on-demand)"
+        )
+        return dict(estimate, cached=False)
+    
+    except Exception as e:
+        logger.error(f"Failed to estimate BigQuery query: {str(e)}")
+        raise AirflowException(f"Failed to estimate BigQuery query: {str(e)}")
+
+
+class BigQueryMetadataCache:
+    """
+    Process-wide cache of BigQuery dataset and table metadata.
+    
+    Entries are keyed by fully qualified reference ('project.dataset' or
+    'project.dataset.table'). Found objects are cached for ttl seconds and
+    "not found" results for the shorter negative_ttl, so sensors waiting for
+    a table still see it appear promptly. Our own create and load calls update
+    or invalidate the affected entries.
+    """
+    
+    def __init__(self, ttl: int = DEFAULT_METADATA_CACHE_TTL,
+                 negative_ttl: int = DEFAULT_METADATA_NEGATIVE_TTL):
+        """
+        Initialize the BigQueryMetadataCache.
+        
+        Args:
+            ttl: Seconds a found dataset/table stays cached
+            negative_ttl: Seconds a missing dataset/table stays cached
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, ref: str) -> Optional[tuple]:
+        """
+        Look up a cached entry.
+        
+        Args:
+            ref: Fully qualified dataset or table reference
+            
+        Returns:
+            Tuple of (metadata,) where metadata is None for a cached miss,
+            or None if there is no valid entry
+        """
+        with self._lock:
+            entry = self._entries.get(ref)
+        if entry is None:
+            return None
+        
+        metadata, cached_at = entry
+        ttl = self.ttl if metadata is not None else self.negative_ttl
+        if time.time() - cached_at >= ttl:
+            return None
+        return (metadata,)
+    
+    def put(self, ref: str, metadata: Any) -> None:
+        """
+        Store metadata for a reference (None records that it does not exist).
+        
+        Args:
+            ref: Fully qualified dataset or table reference
+            metadata: Dataset/Table object, or None if not found
+        """
+        with self._lock:
+            self._entries[ref] = (metadata, time.time())
+    
+    def invalidate(self, ref: str = None) -> None:
+        """
+        Drop a reference and everything below it, or the whole cache.
+        
+        Args:
+            ref: Dataset or table reference to invalidate (all entries if None)
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if ref is None or key == ref or key.startswith(f"{ref}."):
+                    del self._entries[key]
+    
+    def get_or_fetch(self, ref: str, fetch_fn: Callable[[], Any]) -> Optional[Any]:
+        """
+        Return cached metadata, calling fetch_fn on a miss.
+        
+        Args:
+            ref: Fully qualified dataset or table reference
+            fetch_fn: Callable returning the metadata or raising NotFound
             
-            logger.info(f"Successfully created dataset {dataset_id} in {location}")
+        Returns:
+            Dataset/Table object, or None if it does not exist
+        """
+        entry = self.get(ref)
+        if entry is not None:
+            return entry[0]
+        
+        try:
+            metadata = fetch_fn()
+        except NotFound:
+            metadata = None
+        
+        self.put(ref, metadata)
+        return metadata
+
+
+_metadata_cache = BigQueryMetadataCache()
+
+
+def get_metadata_cache() -> BigQueryMetadataCache:
+    """
+    Get the process-wide BigQueryMetadataCache.
+    
+    Returns:
+        BigQueryMetadataCache instance
+    """
+    return _metadata_cache
+
+
+def bigquery_get_table(dataset_id: str, table_id: str, project_id: str = None,
+                       conn_id: str = DEFAULT_GCP_CONN_ID) -> Optional[Table]:
+    """
+    Get table metadata (including schema) through the metadata cache.
+    
+    Args:
+        dataset_id: BigQuery dataset ID
+        table_id: BigQuery table ID
+        project_id: Project containing the table (defaults to the connection's project)
+        conn_id: Airflow connection ID for GCP
+        
+    Returns:
+        Table object, or None if the table does not exist
+    """
+    hook = BigQueryHook(gcp_conn_id=conn_id)
+    table_ref = f"{project_id or hook.project_id}.{dataset_id}.{table_id}"
+    
+    return get_metadata_cache().get_or_fetch(
+        table_ref,
+        lambda: hook.get_client(project_id=hook.project_id).get_table(table_ref)
+    )
+
+
+def bigquery_create_dataset(dataset_id: str, location: str = 'US',
+                           conn_id: str = DEFAULT_GCP_CONN_ID) -> bool:
+    """
+    Create a BigQuery dataset if it doesn't exist.
+    
+    Existence is checked through the metadata cache, so repeated calls for
+    the same dataset do not make API round trips.
+    
+    Args:
+        dataset_id: ID of the dataset to create
+        location: Geographic location of the dataset
+        conn_id: Airflow connection ID for GCP
+        
+    Returns:
+        True if created or already exists, False on failure
+    """
+    try:
+        hook = BigQueryHook(gcp_conn_id=conn_id)
+        dataset_ref = f"{hook.project_id}.{dataset_id}"
+        cache = get_metadata_cache()
+        client = None
+        
+        def _fetch_dataset() -> Any:
+            nonlocal client
+            client = hook.get_client(project_id=hook.project_id)
+            return client.get_dataset(dataset_ref)
+        
+        if cache.get_or_fetch(dataset_ref, _fetch_dataset) is not None:
+            logger.info(f"Dataset {dataset_id} already exists")
             return True
+        
+        # Dataset doesn't exist, create it
+        if client is None:
+            client = hook.get_client(project_id=hook.project_id)
+        dataset = google.cloud.bigquery.Dataset(dataset_ref)
+        dataset.location = location
+        cache.put(dataset_ref, client.create_dataset(dataset, exists_ok=True))
+        
+        logger.info(f"Successfully created dataset {dataset_id} in {location}")
+        return True
     
     except Exception as e:
         logger.error(f"Failed to create dataset {dataset_id}: {str(e)}")
@@ -396,6 +1845,9 @@ def bigquery_create_table(dataset_id: str, table_id: str, schema: List,
     """
     Create a BigQuery table with the specified schema.
     
+    Existence is checked through the metadata cache, so repeated calls for
+    the same table do not make API round trips.
+    
     Args:
         dataset_id: ID of the dataset containing the table
         table_id: ID of the table to create
@@ -407,22 +1859,21 @@ def bigquery_create_table(dataset_id: str, table_id: str, schema: List,
     """
     try:
         hook = BigQueryHook(gcp_conn_id=conn_id)
-        conn = hook.get_conn()
-        client = hook.get_client(project_id=conn.project)
+        client = hook.get_client(project_id=hook.project_id)
+        cache = get_metadata_cache()
         
         table_ref = f"{client.project}.{dataset_id}.{table_id}"
         
-        try:
-            client.get_table(table_ref)
+        if cache.get_or_fetch(table_ref, lambda: client.get_table(table_ref)) is not None:
             logger.info(f"Table {table_ref} already exists")
             return True
-        except Exception:
-            # Table doesn't exist, create it
-            table = google.cloud.bigquery.Table(table_ref, schema=schema)
-            client.create_table(table)
-            
-            logger.info(f"Successfully created table {table_ref}")
-            return True
+        
+        # Table doesn't exist, create it
+        table = google.cloud.bigquery.Table(table_ref, schema=schema)
+        cache.put(table_ref, client.create_table(table, exists_ok=True))
+        
+        logger.info(f"Successfully created table {table_ref}")
+        return True
     
     except Exception as e:
         logger.error(f"Failed to create table {dataset_id}.{table_id}: {str(e)}")
@@ -430,7 +1881,8 @@ def bigquery_create_table(dataset_id: str, table_id: str, schema: List,
 
 
 def bigquery_load_data(bucket_name: str, object_name: str, dataset_id: str, table_id: str,
-                      source_format: str = 'CSV', conn_id: str = DEFAULT_GCP_CONN_ID) -> bool:
+                      source_format: str = 'CSV', conn_id: str = DEFAULT_GCP_CONN_ID,
+                      write_disposition: str = 'WRITE_TRUNCATE') -> bool:
     """
     Load data from GCS into a BigQuery table.
     
@@ -441,6 +1893,7 @@ def bigquery_load_data(bucket_name: str, object_name: str, dataset_id: str, tabl
         table_id: BigQuery table ID
         source_format: Format of the data (CSV, JSON, AVRO, etc.)
         conn_id: Airflow connection ID for GCP
+        write_disposition: BigQuery write disposition (default: WRITE_TRUNCATE)
         
     Returns:
         True if load job completed successfully, False otherwise
@@ -454,8 +1907,9 @@ def bigquery_load_data(bucket_name: str, object_name: str, dataset_id: str, tabl
             'skip_leading_rows': 1 if source_format == 'CSV' else 0,
             'allow_quoted_newlines': True if source_format == 'CSV' else False,
             'allow_jagged_rows': True if source_format == 'CSV' else False,
-            'autodetect': True,
-            'write_disposition': 'WRITE_TRUNCATE',
+            # Parquet and Avro files carry their own schema
+            'autodetect': source_format not in ('PARQUET', 'AVRO'),
+            'write_disposition': write_disposition,
         }
         
         job = hook.run_load(
@@ -465,6 +1919,9 @@ def bigquery_load_data(bucket_name: str, object_name: str, dataset_id: str, tabl
             **job_config
         )
         
+        # The load may have created the table or changed its schema
+        get_metadata_cache().invalidate(f"{hook.project_id}.{dataset_id}.{table_id}")
+        
         logger.info(
             f"Successfully loaded data from {gcs_uri} to "
             f"{dataset_id}.{table_id}, job_id: {job.job_id}"
@@ -477,8 +1934,378 @@ def bigquery_load_data(bucket_name: str, object_name: str, dataset_id: str, tabl
         return False
 
 
+def _job_handle(job: Any) -> Dict:
+    """
+    Build a serializable handle for a submitted BigQuery job.
+    """
+    return {
+        'job_id': job.job_id,
+        'project': job.project,
+        'location': job.location,
+        'job_type': job.job_type
+    }
+
+
+def bigquery_submit_query(sql: str, query_params: Dict = None, location: str = None,
+                          conn_id: str = DEFAULT_GCP_CONN_ID, destination: str = None,
+                          write_disposition: str = None, use_legacy_sql: bool = True) -> Dict:
+    """
+    Submit a BigQuery query job without waiting for it to finish.
+    
+    The job runs the statement bigquery_execute_query would run: parameters
+    are rendered into the SQL with render_query and the dialect follows
+    use_legacy_sql.
+    
+    Args:
+        sql: SQL query to execute
+        query_params: Values for %(name)s placeholders (optional)
+        location: BigQuery dataset location (optional)
+        conn_id: Airflow connection ID for GCP
+        destination: Destination table as dataset.table (optional)
+        write_disposition: Write disposition for the destination table (optional)
+        use_legacy_sql: Run the query as legacy SQL rather than standard SQL
+        
+    Returns:
+        Job handle dict with job_id, project, location and job_type
+        
+    Raises:
+        AirflowException: If the job cannot be submitted
+    """
+    try:
+        hook = BigQueryHook(gcp_conn_id=conn_id, location=location)
+        client = hook.get_client(project_id=hook.project_id, location=location)
+        
+        job_config = QueryJobConfig(use_legacy_sql=use_legacy_sql)
+        if destination:
+            job_config.destination = f"{client.project}.{destination}"
+        if write_disposition:
+            job_config.write_disposition = write_disposition
+        
+        job = client.query(render_query(sql, query_params), job_config=job_config, location=location)
+        logger.info(f"Submitted BigQuery query job {job.job_id}")
+        return _job_handle(job)
+    
+    except Exception as e:
+        logger.error(f"Failed to submit BigQuery query job: {str(e)}")
+        raise AirflowException(f"Failed to submit BigQuery query job: {str(e)}")
+
+
+def bigquery_submit_load(bucket_name: str, object_name: Union[str, List[str]], dataset_id: str,
+                         table_id: str, source_format: str = 'CSV', location: str = None,
+                         conn_id: str = DEFAULT_GCP_CONN_ID,
+                         write_disposition: str = 'WRITE_TRUNCATE') -> Dict:
+    """
+    Submit a BigQuery load job from GCS without waiting for it to finish.
+    
+    Args:
+        bucket_name: GCS bucket containing the data
+        object_name: GCS object (or list of objects) to load
+        dataset_id: BigQuery dataset ID
+        table_id: BigQuery table ID
+        source_format: Format of the data (CSV, JSON, AVRO, PARQUET, etc.)
+        location: BigQuery dataset location (optional)
+        conn_id: Airflow connection ID for GCP
+        write_disposition: BigQuery write disposition (default: WRITE_TRUNCATE)
+        
+    Returns:
+        Job handle dict with job_id, project, location and job_type
+        
+    Raises:
+        AirflowException: If the job cannot be submitted
+    """
+    try:
+        hook = BigQueryHook(gcp_conn_id=conn_id, location=location)
+        client = hook.get_client(project_id=hook.project_id, location=location)
+        
+        object_names = [object_name] if isinstance(object_name, str) else object_name
+        source_uris = [f"gs://{bucket_name}/{name}" for name in object_names]
+        
+        job_config = LoadJobConfig(
+            source_format=source_format,
+            write_disposition=write_disposition,
+            # Parquet and Avro files carry their own schema
+            autodetect=source_format not in ('PARQUET', 'AVRO')
+        )
+        if source_format == 'CSV':
+            job_config.skip_leading_rows = 1
+            job_config.allow_quoted_newlines = True
+        
+        job = client.load_table_from_uri(
+            source_uris,
+            f"{client.project}.{dataset_id}.{table_id}",
+            job_config=job_config,
+            location=location
+        )
+        logger.info(f"Submitted BigQuery load job {job.job_id} for {dataset_id}.{table_id}")
+        return _job_handle(job)
+    
+    except Exception as e:
+        logger.error(f"Failed to submit BigQuery load job: {str(e)}")
+        raise AirflowException(f"Failed to submit BigQuery load job: {str(e)}")
+
+
+def bigquery_get_job_states(job_handles: List[Dict],
+                            conn_id: str = DEFAULT_GCP_CONN_ID) -> Dict[str, Dict]:
+    """
+    Get the current state of a set of BigQuery jobs.
+    
+    Args:
+        job_handles: Job handles returned by the submit functions
+        conn_id: Airflow connection ID for GCP
+        
+    Returns:
+        Dict mapping job_id to a dict with 'state' and 'error' (None unless failed)
+        
+    Raises:
+        AirflowException: If a job cannot be fetched
+    """
+    try:
+        hook = BigQueryHook(gcp_conn_id=conn_id)
+        client = hook.get_client(project_id=hook.project_id)
+        
+        states = {}
+        for handle in job_handles:
+            job = client.get_job(
+                handle['job_id'],
+                project=handle.get('project'),
+                location=handle.get('location')
+            )
+            states[handle['job_id']] = {
+                'state': job.state,
+                'error': job.error_result if job.state == 'DONE' else None
+            }
+        return states
+    
+    except Exception as e:
+        logger.error(f"Failed to get BigQuery job states: {str(e)}")
+        raise AirflowException(f"Failed to get BigQuery job states: {str(e)}")
+
+
+def bigquery_wait_for_jobs(job_handles: List[Dict], conn_id: str = DEFAULT_GCP_CONN_ID,
+                           poll_interval: float = 10, timeout: float = None,
+                           raise_on_failure: bool = True) -> Dict[str, Dict]:
+    """
+    Wait until all of the given BigQuery jobs have finished.
+    
+    All pending jobs are polled together on every cycle, so waiting on many
+    jobs costs one poll cycle rather than one blocking wait per job.
+    
+    Args:
+        job_handles: Job handles returned by the submit functions
+        conn_id: Airflow connection ID for GCP
+        poll_interval: Seconds between poll cycles
+        timeout: Maximum seconds to wait (optional)
+        raise_on_failure: Raise if any job finished with an error
+        
+    Returns:
+        Dict mapping job_id to its final state dict
+        
+    Raises:
+        AirflowException: If a job failed (and raise_on_failure) or the timeout expired
+    """
+    start_time = time.monotonic()
+    pending = list(job_handles)
+    final_states = {}
+    
+    while pending:
+        states = bigquery_get_job_states(pending, conn_id=conn_id)
+        for job_id, state in states.items():
+            if state['state'] == 'DONE':
+                final_states[job_id] = state
+        pending = [handle for handle in pending if handle['job_id'] not in final_states]
+        
+        if not pending:
+            break
+        if timeout is not None and time.monotonic() - start_time > timeout:
+            raise AirflowException(
+                f"Timed out waiting for {len(pending)} BigQuery jobs: "
+                f"{[handle['job_id'] for handle in pending]}"
+            )
+        
+        logger.info(f"Waiting for {len(pending)} of {len(job_handles)} BigQuery jobs")
+        time.sleep(poll_interval)
+    
+    failed = {job_id: state['error'] for job_id, state in final_states.items() if state['error']}
+    if failed:
+        logger.error(f"{len(failed)} BigQuery jobs failed: {failed}")
+        if raise_on_failure:
+            raise AirflowException(f"BigQuery jobs failed: {failed}")
+    
+    logger.info(f"{len(final_states)} BigQuery jobs finished")
+    return final_states
+
+
+class SecretCache:
+    """
+    Cache for Secret Manager payloads keyed by connection, secret ID and version.
+    
+    Pinned versions are immutable and cached for the life of the process, while
+    'latest' is refreshed after the TTL. When a cache directory and a Fernet key
+    are configured, entries are also written to disk encrypted so other worker
+    processes on the same host can reuse them. Entries can be invalidated per
+    secret, e.g. after a rotation.
+    
+    Invalidation only reaches this process and the on-disk cache of this host.
+    Other workers pick up a rotated 'latest' value when their entry expires,
+    so the TTL bounds the rotation lag. Callers that cannot tolerate it should
+    pin a version or pass use_cache=False.
+    """
+    
+    def __init__(self, ttl: int = None, cache_dir: str = None, encryption_key: str = None):
+        """
+        Initialize the SecretCache.
+        
+        Args:
+            ttl: Seconds a cached 'latest' value stays valid
+            cache_dir: Directory for the encrypted on-disk cache (optional)
+            encryption_key: Fernet key used to encrypt on-disk entries (optional)
+        """
+        self.ttl = ttl if ttl is not None else DEFAULT_SECRET_CACHE_TTL
+        self._memory: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+        self._fernet = None
+        self.cache_dir = None
+        
+        if cache_dir and encryption_key:
+            from cryptography.fernet import Fernet
+            
+            self._fernet = Fernet(encryption_key.encode('utf-8'))
+            self.cache_dir = Path(cache_dir)
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    
+    @staticmethod
+    def _is_pinned(version_id: str) -> bool:
+        return str(version_id).isdigit()
+    
+    def _disk_path(self, secret_id: str, version_id: str, conn_id: str) -> Path:
+        # Prefix with the secret hash so all versions of a secret can be invalidated together
+        secret_hash = hashlib.sha256(secret_id.encode('utf-8')).hexdigest()[:16]
+        entry_hash = hashlib.sha256(f"{conn_id}/{version_id}".encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{secret_hash}.{entry_hash}.secret"
+    
+    def get(self, secret_id: str, version_id: str, conn_id: str) -> Optional[str]:
+        """
+        Look up a cached secret value.
+        
+        Args:
+            secret_id: The ID of the secret
+            version_id: The version of the secret
+            conn_id: Airflow connection ID for GCP
+            
+        Returns:
+            Cached value, or None on a miss or expired entry
+        """
+        pinned = self._is_pinned(version_id)
+        key = (conn_id, secret_id, version_id)
+        
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None:
+            value, fetched_at = entry
+            if pinned or time.time() - fetched_at < self.ttl:
+                return value
+        
+        if self._fernet is None:
+            return None
+        
+        from cryptography.fernet import InvalidToken
+        
+        path = self._disk_path(secret_id, version_id, conn_id)
+        try:
+            token = path.read_bytes()
+            # Fernet tokens carry their creation time, which enforces the TTL
+            value = self._fernet.decrypt(token, ttl=None if pinned else self.ttl).decode('utf-8')
+            # Age the memory entry from when the value was fetched, not when it was read from disk
+            fetched_at = self._fernet.extract_timestamp(token)
+        except (OSError, InvalidToken):
+            return None
+        
+        with self._lock:
+            self._memory[key] = (value, fetched_at)
+        return value
+    
+    def put(self, secret_id: str, version_id: str, conn_id: str, value: str) -> None:
+        """
+        Store a secret value in the cache.
+        
+        Args:
+            secret_id: The ID of the secret
+            version_id: The version of the secret
+            conn_id: Airflow connection ID for GCP
+            value: Secret value
+        """
+        with self._lock:
+            self._memory[(conn_id, secret_id, version_id)] = (value, time.time())
+        
+        if self._fernet is None:
+            return
+        
+        path = self._disk_path(secret_id, version_id, conn_id)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self._fernet.encrypt(value.encode('utf-8')))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write secret cache entry for {secret_id}: {str(e)}")
+    
+    def invalidate(self, secret_id: str = None) -> None:
+        """
+        Drop cached values for one secret, or for all secrets.
+        
+        Args:
+            secret_id: The ID of the secret to invalidate (all secrets if None)
+        """
+        with self._lock:
+            for key in list(self._memory):
+                if secret_id is None or key[1] == secret_id:
+                    del self._memory[key]
+        
+        if self.cache_dir is not None:
+            pattern = '*.secret'
+            if secret_id is not None:
+                pattern = f"{hashlib.sha256(secret_id.encode('utf-8')).hexdigest()[:16]}.*.secret"
+            for path in self.cache_dir.glob(pattern):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        
+        logger.info(f"Invalidated secret cache for {secret_id or 'all secrets'}")
+
+
+_secret_cache: Optional[SecretCache] = None
+
+
+def get_secret_cache() -> SecretCache:
+    """
+    Get the process-wide SecretCache.
+    
+    Returns:
+        SecretCache instance configured from the environment
+    """
+    global _secret_cache
+    if _secret_cache is None:
+        _secret_cache = SecretCache(cache_dir=SECRET_CACHE_DIR, encryption_key=SECRET_CACHE_KEY)
+    return _secret_cache
+
+
+def invalidate_secret_cache(secret_id: str = None) -> None:
+    """
+    Invalidate cached values for a secret (or all secrets) after it changes.
+    
+    Only this process and the on-disk cache of this host are affected; other
+    workers keep the previous 'latest' value for up to the cache TTL.
+    
+    Args:
+        secret_id: The ID of the secret to invalidate (all secrets if None)
+    """
+    get_secret_cache().invalidate(secret_id)
+
+
 def get_secret(secret_id: str, version_id: str = 'latest',
-              conn_id: str = DEFAULT_GCP_CONN_ID) -> str:
+              conn_id: str = DEFAULT_GCP_CONN_ID, use_cache: bool = True) -> str:
     """
     Retrieve a secret from Google Secret Manager.
     
@@ -486,6 +2313,7 @@ def get_secret(secret_id: str, version_id: str = 'latest',
         secret_id: The ID of the secret to retrieve
         version_id: The version of the secret (default: 'latest')
         conn_id: Airflow connection ID for GCP
+        use_cache: Serve the value from the secret cache when available
         
     Returns:
         Secret value as a string
@@ -493,10 +2321,19 @@ def get_secret(secret_id: str, version_id: str = 'latest',
     Raises:
         AirflowException: If secret retrieval fails
     """
+    if use_cache:
+        cached = get_secret_cache().get(secret_id, version_id, conn_id)
+        if cached is not None:
+            logger.debug(f"Using cached secret {secret_id} (version: {version_id})")
+            return cached
+    
     try:
         hook = SecretManagerHook(gcp_conn_id=conn_id)
         secret = hook.get_secret(secret_id=secret_id, secret_version=version_id)
         
+        if use_cache and secret is not None:
+            get_secret_cache().put(secret_id, version_id, conn_id, secret)
+        
         logger.info(f"Successfully retrieved secret {secret_id} (version: {version_id})")
         return secret
     
@@ -540,18 +2377,342 @@ def create_secret(secret_id: str, secret_value: str,
             )
             logger.info(f"Created new secret {secret_id}")
         
-        # Add the secret version
-        client.add_secret_version(
-            parent=secret_path,
-            payload={"data": secret_value.encode("UTF-8")}
+        # Add the secret version
+        client.add_secret_version(
+            parent=secret_path,
+            payload={"data": secret_value.encode("UTF-8")}
+        )
+        
+        # Cached 'latest' values are now stale
+        invalidate_secret_cache(secret_id)
+        
+        logger.info(f"Successfully added new version to secret {secret_id}")
+        return True
+    
+    except Exception as e:
+        logger.error(f"Failed to create/update secret {secret_id}: {str(e)}")
+        return False
+
+
+def _build_row_message(schema: List) -> tuple:
+    """
+    Build a protobuf message type matching a BigQuery table schema.
+    
+    Args:
+        schema: List of SchemaField objects
+        
+    Returns:
+        Tuple of (DescriptorProto for the writer schema, message class)
+        
+    Raises:
+        AirflowException: If the schema contains unsupported column types
+    """
+    from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+    
+    field_types = descriptor_pb2.FieldDescriptorProto
+    proto_types = {
+        'STRING': field_types.TYPE_STRING,
+        'BYTES': field_types.TYPE_BYTES,
+        'INTEGER': field_types.TYPE_INT64,
+        'INT64': field_types.TYPE_INT64,
+        'FLOAT': field_types.TYPE_DOUBLE,
+        'FLOAT64': field_types.TYPE_DOUBLE,
+        'BOOLEAN': field_types.TYPE_BOOL,
+        'BOOL': field_types.TYPE_BOOL,
+        'TIMESTAMP': field_types.TYPE_INT64,  # Microseconds since the epoch
+        'DATE': field_types.TYPE_STRING,
+        'DATETIME': field_types.TYPE_STRING,
+        'TIME': field_types.TYPE_STRING,
+        'NUMERIC': field_types.TYPE_STRING,
+        'BIGNUMERIC': field_types.TYPE_STRING,
+        'JSON': field_types.TYPE_STRING,
+        'GEOGRAPHY': field_types.TYPE_STRING,
+    }
+    
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name='airflow_bq_stream_row.proto', package='airflow_bq_stream', syntax='proto2'
+    )
+    message_proto = file_proto.message_type.add(name='Row')
+    for number, field in enumerate(schema, start=1):
+        if field.field_type not in proto_types:
+            raise AirflowException(
+                f"Column {field.name} of type {field.field_type} is not supported for streaming"
+            )
+        message_proto.field.add(
+            name=field.name,
+            number=number,
+            type=proto_types[field.field_type],
+            label=field_types.LABEL_REPEATED if field.mode == 'REPEATED' else field_types.LABEL_OPTIONAL
+        )
+    
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    descriptor = pool.FindMessageTypeByName('airflow_bq_stream.Row')
+    
+    if hasattr(message_factory, 'GetMessageClass'):
+        message_class = message_factory.GetMessageClass(descriptor)
+    else:
+        message_class = message_factory.MessageFactory(pool).GetPrototype(descriptor)
+    
+    writer_schema = descriptor_pb2.DescriptorProto()
+    descriptor.CopyToProto(writer_schema)
+    return writer_schema, message_class
+
+
+def _coerce_stream_value(field_type: str, value: Any) -> Any:
+    """
+    Convert a Python or CSV string value to the representation used in the row message.
+    """
+    if field_type in ('INTEGER', 'INT64'):
+        return int(value)
+    if field_type in ('FLOAT', 'FLOAT64'):
+        return float(value)
+    if field_type in ('BOOLEAN', 'BOOL'):
+        if isinstance(value, str):
+            return value.strip().lower() in ('true', '1', 't', 'yes')
+        return bool(value)
+    if field_type == 'TIMESTAMP':
+        if isinstance(value, (int, float)):
+            return int(value)
+        if isinstance(value, str):
+            value = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return int(value.timestamp() * 1000000)
+    if field_type == 'BYTES':
+        return value if isinstance(value, bytes) else str(value).encode('utf-8')
+    if field_type == 'JSON' and not isinstance(value, str):
+        return json.dumps(value, default=str)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def bigquery_stream_rows(table: str, row_iter: Any, conn_id: str = DEFAULT_GCP_CONN_ID,
+                         stream_type: str = 'pending',
+                         batch_rows: int = DEFAULT_STREAM_BATCH_ROWS,
+                         max_inflight: int = DEFAULT_STREAM_MAX_INFLIGHT,
+                         write_disposition: str = 'WRITE_APPEND',
+                         schema: List = None) -> int:
+    """
+    Stream rows into a BigQuery table with the Storage Write API.
+    
+    Rows are serialized to protobuf against the table schema and appended in
+    batches with explicit offsets, so BigQuery rejects an append that does not
+    land where expected instead of writing it out of order. A failed append
+    fails the whole call; with stream_type='pending' nothing is committed in
+    that case. At most max_inflight appends are unacknowledged at a time;
+    beyond that the producer blocks, which bounds memory when row_iter is
+    faster than BigQuery.
+    
+    With stream_type='pending' rows become visible atomically when the stream
+    is committed at the end. With 'committed' rows are visible as soon as each
+    append is acknowledged.
+    
+    WRITE_APPEND adds the rows to the table, so a task that reruns after the
+    commit appends them again. WRITE_TRUNCATE streams into a staging table
+    with the destination's schema and partitioning, then replaces the
+    destination with one copy job, so reruns leave the same result, like a
+    WRITE_TRUNCATE load job. A missing destination is created from schema.
+    
+    Args:
+        table: Destination table as dataset.table or project.dataset.table
+        row_iter: Iterable of dicts keyed by column name
+        conn_id: Airflow connection ID for GCP
+        stream_type: 'pending' or 'committed'
+        batch_rows: Maximum rows per append request
+        max_inflight: Maximum unacknowledged append requests
+        write_disposition: 'WRITE_APPEND' or 'WRITE_TRUNCATE'
+        schema: SchemaField list used when the destination does not exist (optional)
+        
+    Returns:
+        Number of rows appended
+        
+    Raises:
+        AirflowException: If the table cannot be streamed to or an append fails
+    """
+    try:
+        from google.cloud import bigquery_storage_v1  # noqa: F401
+    except ImportError:
+        raise AirflowException("google-cloud-bigquery-storage is required for the Storage Write API")
+    
+    if stream_type not in ('pending', 'committed'):
+        raise AirflowException(f"Unsupported stream_type: {stream_type}")
+    if write_disposition not in ('WRITE_APPEND', 'WRITE_TRUNCATE'):
+        raise AirflowException(f"Unsupported write_disposition: {write_disposition}")
+    
+    hook = BigQueryHook(gcp_conn_id=conn_id)
+    parts = table.split('.')
+    if len(parts) == 2:
+        parts = [hook.project_id] + parts
+    project_id, dataset_id, table_id = parts
+    table_ref = f"{project_id}.{dataset_id}.{table_id}"
+    
+    table_obj = bigquery_get_table(dataset_id=dataset_id, table_id=table_id,
+                                   project_id=project_id, conn_id=conn_id)
+    if table_obj is None and not schema:
+        raise AirflowException(f"Table {table} does not exist and no schema was given to create it")
+    table_schema = table_obj.schema if table_obj is not None else schema
+    
+    client = hook.get_client(project_id=project_id)
+    stream_table_id = table_id
+    if write_disposition == 'WRITE_TRUNCATE':
+        # Stream into a staging table that replaces the destination at the end
+        stream_table_id = f"{table_id}_stream_{uuid.uuid4().hex[:12]}"
+    
+    try:
+        if stream_table_id != table_id:
+            staging = google.cloud.bigquery.Table(f"{project_id}.{dataset_id}.{stream_table_id}", schema=table_schema)
+            if table_obj is not None:
+                staging.time_partitioning = table_obj.time_partitioning
+                staging.range_partitioning = table_obj.range_partitioning
+                staging.clustering_fields = table_obj.clustering_fields
+            # Expire the staging table even if this task dies before cleaning up
+            staging.expires = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=1)
+            client.create_table(staging)
+        elif table_obj is None:
+            get_metadata_cache().put(
+                table_ref,
+                client.create_table(google.cloud.bigquery.Table(table_ref, schema=table_schema), exists_ok=True)
+            )
+            logger.info(f"Created table {table_ref} for streaming")
+        
+        row_count = _stream_rows_to_table(
+            hook, project_id, dataset_id, stream_table_id, table_schema, row_iter,
+            stream_type, batch_rows, max_inflight
+        )
+        
+        if write_disposition == 'WRITE_TRUNCATE':
+            copy_job = client.copy_table(
+                f"{project_id}.{dataset_id}.{stream_table_id}",
+                table_ref,
+                job_config=google.cloud.bigquery.CopyJobConfig(
+                    write_disposition='WRITE_TRUNCATE',
+                    create_disposition='CREATE_IF_NEEDED'
+                )
+            )
+            copy_job.result()
+            get_metadata_cache().invalidate(table_ref)
+            logger.info(f"Replaced {table_ref} with {row_count} streamed rows")
+    
+    except AirflowException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to stream rows to {table_ref}: {str(e)}")
+        raise AirflowException(f"Failed to stream rows to {table_ref}: {str(e)}")
+    finally:
+        if stream_table_id != table_id:
+            try:
+                client.delete_table(f"{project_id}.{dataset_id}.{stream_table_id}", not_found_ok=True)
+            except Exception as e:
+                logger.warning(f"Failed to delete staging table {stream_table_id}: {str(e)}")
+    
+    return row_count
+
+
+def _stream_rows_to_table(hook: BigQueryHook, project_id: str, dataset_id: str, table_id: str,
+                          table_schema: List, row_iter: Any, stream_type: str, batch_rows: int,
+                          max_inflight: int) -> int:
+    """
+    Append rows to one table through a single write stream (see bigquery_stream_rows).
+    """
+    from google.cloud import bigquery_storage_v1
+    from google.cloud.bigquery_storage_v1 import types, writer
+    
+    table = f"{project_id}.{dataset_id}.{table_id}"
+    writer_schema, row_class = _build_row_message(table_schema)
+    field_types = {field.name: field.field_type for field in table_schema}
+    
+    write_client = bigquery_storage_v1.BigQueryWriteClient(credentials=hook.get_credentials())
+    parent = write_client.table_path(project_id, dataset_id, table_id)
+    write_stream = write_client.create_write_stream(
+        parent=parent,
+        write_stream=types.WriteStream(
+            type_=types.WriteStream.Type.PENDING if stream_type == 'pending'
+            else types.WriteStream.Type.COMMITTED
+        )
+    )
+    
+    request_template = types.AppendRowsRequest(
+        write_stream=write_stream.name,
+        proto_rows=types.AppendRowsRequest.ProtoData(
+            writer_schema=types.ProtoSchema(proto_descriptor=writer_schema)
+        )
+    )
+    append_stream = writer.AppendRowsStream(write_client, request_template)
+    
+    start_time = time.monotonic()
+    offset = 0
+    inflight = deque()
+    
+    def _wait_oldest() -> None:
+        inflight.popleft().result()
+    
+    def _send(serialized_rows: List[bytes]) -> None:
+        nonlocal offset
+        request = types.AppendRowsRequest(
+            offset=offset,
+            proto_rows=types.AppendRowsRequest.ProtoData(
+                rows=types.ProtoRows(serialized_rows=serialized_rows)
+            )
         )
+        inflight.append(append_stream.send(request))
+        offset += len(serialized_rows)
         
-        logger.info(f"Successfully added new version to secret {secret_id}")
-        return True
+        # Backpressure: block until the oldest append is acknowledged
+        while len(inflight) >= max_inflight:
+            _wait_oldest()
+    
+    try:
+        batch, batch_bytes = [], 0
+        for row in row_iter:
+            message = row_class()
+            for name, value in row.items():
+                if value is None or value == '' or name not in field_types:
+                    continue
+                if isinstance(value, (list, tuple)):
+                    getattr(message, name).extend(
+                        _coerce_stream_value(field_types[name], item) for item in value
+                    )
+                else:
+                    setattr(message, name, _coerce_stream_value(field_types[name], value))
+            serialized = message.SerializeToString()
+            
+            if batch and (len(batch) >= batch_rows or batch_bytes + len(serialized) > STREAM_MAX_REQUEST_BYTES):
+                _send(batch)
+                batch, batch_bytes = [], 0
+            batch.append(serialized)
+            batch_bytes += len(serialized)
+        
+        if batch:
+            _send(batch)
+        while inflight:
+            _wait_oldest()
+        
+        append_stream.close()
+        write_client.finalize_write_stream(name=write_stream.name)
+        
+        if stream_type == 'pending':
+            response = write_client.batch_commit_write_streams(
+                types.BatchCommitWriteStreamsRequest(parent=parent, write_streams=[write_stream.name])
+            )
+            if response.stream_errors:
+                raise AirflowException(f"Failed to commit write stream: {response.stream_errors}")
     
     except Exception as e:
-        logger.error(f"Failed to create/update secret {secret_id}: {str(e)}")
-        return False
+        try:
+            append_stream.close()
+        except Exception:
+            pass
+        logger.error(f"Failed to stream rows to {table}: {str(e)}")
+        raise AirflowException(f"Failed to stream rows to {table}: {str(e)}")
+    
+    duration = time.monotonic() - start_time
+    logger.info(
+        f"Streamed {offset} rows to {table} in {duration:.2f}s "
+        f"({offset / duration if duration else offset:.0f} rows/s)"
+    )
+    return offset
 
 
 def dataframe_to_bigquery(dataframe: DataFrame, dataset_id: str, table_id: str,
@@ -607,6 +2768,9 @@ def dataframe_to_bigquery(dataframe: DataFrame, dataset_id: str, table_id: str,
         # Wait for the job to complete
         job.result()
         
+        # The load may have created the table or changed its schema
+        get_metadata_cache().invalidate(full_table_id)
+        
         logger.info(
             f"Successfully loaded DataFrame with {len(dataframe)} rows to "
             f"{full_table_id}, job_id: {job.job_id}"
@@ -619,6 +2783,209 @@ def dataframe_to_bigquery(dataframe: DataFrame, dataset_id: str, table_id: str,
         raise AirflowException(f"Failed to load DataFrame to BigQuery: {str(e)}")
 
 
+def bigquery_arrow_column_types(table: Table) -> Dict[str, Any]:
+    """
+    Map the scalar columns of a BigQuery table to the Arrow types a CSV
+    conversion should parse them as.
+
+    Columns whose CSV form Arrow cannot parse into the BigQuery type directly
+    (TIMESTAMP without a zone offset, BYTES) and nested or repeated columns
+    are left out, so their type is inferred.
+
+    Args:
+        table: BigQuery table whose schema is used
+
+    Returns:
+        Dict mapping column name to Arrow type
+
+    Raises:
+        AirflowException: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise AirflowException("pyarrow is required for Parquet staging loads")
+
+    arrow_types = {
+        'STRING': pa.string(),
+        'INTEGER': pa.int64(),
+        'INT64': pa.int64(),
+        'FLOAT': pa.float64(),
+        'FLOAT64': pa.float64(),
+        'BOOLEAN': pa.bool_(),
+        'BOOL': pa.bool_(),
+        'NUMERIC': pa.decimal128(38, 9),
+        'DATE': pa.date32(),
+        'DATETIME': pa.timestamp('us'),
+        'TIME': pa.time64('us'),
+    }
+    return {
+        field.name: arrow_types[field.field_type]
+        for field in table.schema
+        if field.field_type in arrow_types and field.mode != 'REPEATED'
+    }
+
+
+def csv_to_parquet(csv_file_path: str, parquet_file_path: str,
+                   column_types: Dict[str, Any] = None, block_size: int = 16 * 1024 * 1024) -> int:
+    """
+    Convert a CSV file to Parquet in record batches without building a DataFrame.
+
+    Columns listed in column_types are parsed as the given Arrow types; the
+    types of other columns are inferred from the first block of the file. A
+    column that is empty throughout the first block is read as strings, since
+    its inferred null type could not hold values later in the file.
+
+    Args:
+        csv_file_path: Path of the CSV file to convert
+        parquet_file_path: Path of the Parquet file to write
+        column_types: Arrow types by column name, e.g. from bigquery_arrow_column_types (optional)
+        block_size: Number of bytes parsed per record batch
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        AirflowException: If pyarrow is not installed or conversion fails
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise AirflowException("pyarrow is required for Parquet staging loads")
+
+    read_options = pa_csv.ReadOptions(block_size=block_size)
+    column_types = dict(column_types or {})
+
+    row_count = 0
+    writer = None
+    try:
+        reader = pa_csv.open_csv(
+            csv_file_path,
+            read_options=read_options,
+            convert_options=pa_csv.ConvertOptions(column_types=column_types)
+        )
+
+        null_columns = [field.name for field in reader.schema if pa.types.is_null(field.type)]
+        if null_columns:
+            logger.info(f"Reading columns empty in the first block as strings: {null_columns}")
+            column_types.update({name: pa.string() for name in null_columns})
+            reader = pa_csv.open_csv(
+                csv_file_path,
+                read_options=read_options,
+                convert_options=pa_csv.ConvertOptions(column_types=column_types)
+            )
+
+        writer = pq.ParquetWriter(parquet_file_path, reader.schema)
+        for batch in reader:
+            writer.write_batch(batch)
+            row_count += batch.num_rows
+
+    except Exception as e:
+        logger.error(f"Failed to convert {csv_file_path} to Parquet: {str(e)}")
+        raise AirflowException(f"Failed to convert CSV to Parquet: {str(e)}")
+    finally:
+        if writer is not None:
+            writer.close()
+
+    logger.info(f"Converted {csv_file_path} to {parquet_file_path} ({row_count} rows)")
+    return row_count
+
+
+def stage_and_load_to_bigquery(local_file_path: str, bucket_name: str, dataset_id: str,
+                               table_id: str, staging_prefix: str = 'staging/bigquery',
+                               if_exists: str = 'replace',
+                               conn_id: str = DEFAULT_GCP_CONN_ID,
+                               delete_staged: bool = True) -> int:
+    """
+    Load a local CSV or Parquet file to BigQuery through a Parquet file staged in GCS.
+
+    CSV input is converted to Parquet batch by batch, uploaded to the staging
+    prefix and loaded with a BigQuery load job from the GCS URI, so the data is
+    never materialized as a DataFrame. When the destination table exists, CSV
+    columns are parsed as its column types rather than inferred from the file.
+
+    Args:
+        local_file_path: Path of the CSV or Parquet file to load
+        bucket_name: GCS bucket used for staging
+        dataset_id: BigQuery dataset ID
+        table_id: BigQuery table ID
+        staging_prefix: GCS prefix for staged files
+        if_exists: Action if table exists ('fail', 'replace', or 'append')
+        conn_id: Airflow connection ID for GCP
+        delete_staged: Delete the staged GCS object after the load
+
+    Returns:
+        Number of rows in the loaded file (-1 if unknown for Parquet input)
+
+    Raises:
+        AirflowException: If staging or loading fails
+    """
+    write_disposition = {
+        'replace': 'WRITE_TRUNCATE',
+        'append': 'WRITE_APPEND'
+    }.get(if_exists, 'WRITE_EMPTY')
+
+    local_path = Path(local_file_path)
+    if not local_path.exists():
+        raise AirflowException(f"Local file does not exist: {local_file_path}")
+
+    parquet_path = str(local_path)
+    converted = False
+    row_count = -1
+
+    if local_path.suffix.lower() != '.parquet':
+        table = bigquery_get_table(dataset_id=dataset_id, table_id=table_id, conn_id=conn_id)
+        parquet_path = str(local_path.with_suffix('.parquet'))
+        row_count = csv_to_parquet(
+            csv_file_path=str(local_path),
+            parquet_file_path=parquet_path,
+            column_types=bigquery_arrow_column_types(table) if table is not None else None
+        )
+        converted = True
+
+    # A run-unique suffix keeps concurrent loads of the same file name from sharing (and deleting) an object
+    staged_name = f"{Path(parquet_path).stem}-{uuid.uuid4().hex}{Path(parquet_path).suffix}"
+    object_name = f"{staging_prefix.rstrip('/')}/{dataset_id}/{table_id}/{staged_name}"
+
+    try:
+        gcs_upload_file(
+            local_file_path=parquet_path,
+            bucket_name=bucket_name,
+            object_name=object_name,
+            conn_id=conn_id
+        )
+
+        if not bigquery_create_dataset(dataset_id=dataset_id, conn_id=conn_id):
+            raise AirflowException(f"Failed to create dataset {dataset_id}")
+
+        if not bigquery_load_data(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            dataset_id=dataset_id,
+            table_id=table_id,
+            source_format='PARQUET',
+            conn_id=conn_id,
+            write_disposition=write_disposition
+        ):
+            raise AirflowException(
+                f"Load job from gs://{bucket_name}/{object_name} to {dataset_id}.{table_id} failed"
+            )
+
+        logger.info(
+            f"Loaded {local_file_path} to {dataset_id}.{table_id} "
+            f"via gs://{bucket_name}/{object_name}"
+        )
+        return row_count
+
+    finally:
+        if converted and os.path.exists(parquet_path):
+            os.remove(parquet_path)
+        if delete_staged:
+            gcs_delete_file(bucket_name=bucket_name, object_name=object_name, conn_id=conn_id)
+
+
 class GCSClient:
     """
     Helper class that provides simplified access to Google Cloud Storage.
@@ -678,7 +3045,8 @@ class GCSClient:
         )
     
     def upload_file(self, local_file_path: str, bucket_name: str, 
-                    object_name: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+                    object_name: str, chunk_size: int = None,
+                    return_metrics: bool = False) -> Union[str, Dict]:
         """
         Upload a local file to Google Cloud Storage.
         
@@ -686,21 +3054,24 @@ class GCSClient:
             local_file_path: Path to the local file to upload
             bucket_name: Name of the GCS bucket
             object_name: Name to give the uploaded object
-            chunk_size: Size of chunks for uploading large files
+            chunk_size: Fixed chunk size for uploading large files (adaptive if None)
+            return_metrics: Return the upload metrics dict instead of the URI
             
         Returns:
-            GCS URI of uploaded file (gs://bucket-name/object-name)
+            GCS URI of uploaded file (gs://bucket-name/object-name), or upload metrics
         """
         return gcs_upload_file(
             local_file_path=local_file_path,
             bucket_name=bucket_name,
             object_name=object_name,
             conn_id=self.conn_id,
-            chunk_size=chunk_size
+            chunk_size=chunk_size,
+            return_metrics=return_metrics
         )
     
     def download_file(self, bucket_name: str, object_name: str, 
-                      local_file_path: str) -> str:
+                      local_file_path: str, use_cache: bool = False,
+                      cache_dir: str = None) -> str:
         """
         Download a file from Google Cloud Storage.
         
@@ -708,6 +3079,8 @@ class GCSClient:
             bucket_name: Name of the GCS bucket
             object_name: Name of the object to download
             local_file_path: Local path where the file should be saved
+            use_cache: Serve the object from the local download cache if valid
+            cache_dir: Download cache directory (optional)
             
         Returns:
             Local path of downloaded file
@@ -716,7 +3089,9 @@ class GCSClient:
             bucket_name=bucket_name,
             object_name=object_name,
             local_file_path=local_file_path,
-            conn_id=self.conn_id
+            conn_id=self.conn_id,
+            use_cache=use_cache,
+            cache_dir=cache_dir
         )
     
     def list_files(self, bucket_name: str, prefix: str = None, 
@@ -799,15 +3174,21 @@ class BigQueryClient:
         return self.client
     
     def execute_query(self, sql: str, query_params: Dict = None,
-                      location: str = None, as_dataframe: bool = False) -> Union[List, DataFrame]:
+                      location: str = None, as_dataframe: bool = False,
+                      use_storage_api: bool = False,
+                      max_streams: int = DEFAULT_READ_STREAMS,
+                      use_legacy_sql: bool = True) -> Union[List, DataFrame]:
         """
         Execute a BigQuery SQL query.
         
         Args:
             sql: SQL query to execute
-            query_params: Query parameters (optional)
+            query_params: Values for %(name)s placeholders (optional)
             location: BigQuery dataset location (optional)
             as_dataframe: Return results as pandas DataFrame if True
+            use_storage_api: Read DataFrame results through the Storage Read API
+            max_streams: Maximum number of parallel read streams
+            use_legacy_sql: Run the query as legacy SQL rather than standard SQL
             
         Returns:
             Query results
@@ -817,9 +3198,252 @@ class BigQueryClient:
             query_params=query_params,
             location=location,
             conn_id=self.conn_id,
-            as_dataframe=as_dataframe
+            as_dataframe=as_dataframe,
+            use_storage_api=use_storage_api,
+            max_streams=max_streams,
+            use_legacy_sql=use_legacy_sql
+        )
+    
+    def iter_query_batches(self, sql: str, query_params: Dict = None, location: str = None,
+                           max_streams: int = DEFAULT_READ_STREAMS,
+                           use_legacy_sql: bool = True) -> Iterator[Any]:
+        """
+        Stream query results as Arrow record batches via the Storage Read API.
+        
+        Args:
+            sql: SQL query to execute
+            query_params: Values for %(name)s placeholders (optional)
+            location: BigQuery dataset location (optional)
+            max_streams: Maximum number of parallel read streams
+            use_legacy_sql: Run the query as legacy SQL rather than standard SQL
+            
+        Returns:
+            Iterator of pyarrow.RecordBatch objects
+        """
+        return bigquery_iter_arrow_batches(
+            sql=sql,
+            query_params=query_params,
+            location=location,
+            conn_id=self.conn_id,
+            max_streams=max_streams,
+            use_legacy_sql=use_legacy_sql
+        )
+    
+    def query_to_parquet(self, sql: str, parquet_file_path: str, query_params: Dict = None,
+                         location: str = None, max_streams: int = DEFAULT_READ_STREAMS,
+                         use_legacy_sql: bool = True) -> int:
+        """
+        Write query results directly to a Parquet file via the Storage Read API.
+        
+        Args:
+            sql: SQL query to execute
+            parquet_file_path: Path of the Parquet file to write
+            query_params: Values for %(name)s placeholders (optional)
+            location: BigQuery dataset location (optional)
+            max_streams: Maximum number of parallel read streams
+            use_legacy_sql: Run the query as legacy SQL rather than standard SQL
+            
+        Returns:
+            Number of rows written
+        """
+        return bigquery_query_to_parquet(
+            sql=sql,
+            parquet_file_path=parquet_file_path,
+            query_params=query_params,
+            location=location,
+            conn_id=self.conn_id,
+            max_streams=max_streams,
+            use_legacy_sql=use_legacy_sql
+        )
+    
+    def estimate(self, sql: str, params: Dict = None, location: str = None,
+                 use_cache: bool = True, use_legacy_sql: bool = True) -> Dict:
+        """
+        Estimate the bytes a query would scan using a cached dry run.
+        
+        Args:
+            sql: SQL query to estimate
+            params: Values for %(name)s placeholders (optional)
+            location: BigQuery dataset location (optional)
+            use_cache: Serve the estimate from the cache when available
+            use_legacy_sql: Estimate the query as legacy SQL rather than standard SQL
+            
+        Returns:
+            Dict with total_bytes_processed and estimated_cost_usd
+        """
+        return bigquery_estimate_query(
+            sql=sql,
+            query_params=params,
+            location=location,
+            conn_id=self.conn_id,
+            use_cache=use_cache,
+            use_legacy_sql=use_legacy_sql
+        )
+    
+    def submit_query(self, sql: str, query_params: Dict = None, location: str = None,
+                     destination: str = None, write_disposition: str = None,
+                     use_legacy_sql: bool = True) -> Dict:
+        """
+        Submit a query job without waiting for it to finish.
+        
+        Args:
+            sql: SQL query to execute
+            query_params: Values for %(name)s placeholders (optional)
+            location: BigQuery dataset location (optional)
+            destination: Destination table as dataset.table (optional)
+            write_disposition: Write disposition for the destination table (optional)
+            use_legacy_sql: Run the query as legacy SQL rather than standard SQL
+            
+        Returns:
+            Job handle dict
+        """
+        return bigquery_submit_query(
+            sql=sql,
+            query_params=query_params,
+            location=location,
+            conn_id=self.conn_id,
+            destination=destination,
+            write_disposition=write_disposition,
+            use_legacy_sql=use_legacy_sql
+        )
+    
+    def submit_load(self, bucket_name: str, object_name: Union[str, List[str]],
+                    dataset_id: str, table_id: str, source_format: str = 'CSV',
+                    location: str = None, write_disposition: str = 'WRITE_TRUNCATE') -> Dict:
+        """
+        Submit a load job from GCS without waiting for it to finish.
+        
+        Args:
+            bucket_name: GCS bucket containing the data
+            object_name: GCS object (or list of objects) to load
+            dataset_id: BigQuery dataset ID
+            table_id: BigQuery table ID
+            source_format: Format of the data (CSV, JSON, AVRO, PARQUET, etc.)
+            location: BigQuery dataset location (optional)
+            write_disposition: BigQuery write disposition
+            
+        Returns:
+            Job handle dict
+        """
+        return bigquery_submit_load(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            dataset_id=dataset_id,
+            table_id=table_id,
+            source_format=source_format,
+            location=location,
+            conn_id=self.conn_id,
+            write_disposition=write_disposition
+        )
+    
+    def stream_rows(self, table: str, row_iter: Any, stream_type: str = 'pending',
+                    batch_rows: int = DEFAULT_STREAM_BATCH_ROWS,
+                    max_inflight: int = DEFAULT_STREAM_MAX_INFLIGHT,
+                    write_disposition: str = 'WRITE_APPEND', schema: List = None) -> int:
+        """
+        Stream rows into a table with the Storage Write API.
+        
+        Args:
+            table: Destination table as dataset.table or project.dataset.table
+            row_iter: Iterable of dicts keyed by column name
+            stream_type: 'pending' (atomic commit at the end) or 'committed'
+            batch_rows: Maximum rows per append request
+            max_inflight: Maximum unacknowledged append requests
+            write_disposition: 'WRITE_APPEND' or 'WRITE_TRUNCATE' (replace the table)
+            schema: SchemaField list used when the table does not exist (optional)
+            
+        Returns:
+            Number of rows appended
+        """
+        return bigquery_stream_rows(
+            table=table,
+            row_iter=row_iter,
+            conn_id=self.conn_id,
+            stream_type=stream_type,
+            batch_rows=batch_rows,
+            max_inflight=max_inflight,
+            write_disposition=write_disposition,
+            schema=schema
+        )
+    
+    def get_job_states(self, job_handles: List[Dict]) -> Dict[str, Dict]:
+        """
+        Get the current state of submitted jobs.
+        
+        Args:
+            job_handles: Job handles returned by submit_query/submit_load
+            
+        Returns:
+            Dict mapping job_id to its state dict
+        """
+        return bigquery_get_job_states(job_handles=job_handles, conn_id=self.conn_id)
+    
+    def wait_for_jobs(self, job_handles: List[Dict], poll_interval: float = 10,
+                      timeout: float = None, raise_on_failure: bool = True) -> Dict[str, Dict]:
+        """
+        Wait until all submitted jobs have finished.
+        
+        Args:
+            job_handles: Job handles returned by submit_query/submit_load
+            poll_interval: Seconds between poll cycles
+            timeout: Maximum seconds to wait (optional)
+            raise_on_failure: Raise if any job finished with an error
+            
+        Returns:
+            Dict mapping job_id to its final state dict
+        """
+        return bigquery_wait_for_jobs(
+            job_handles=job_handles,
+            conn_id=self.conn_id,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            raise_on_failure=raise_on_failure
+        )
+    
+    def get_table(self, dataset_id: str, table_id: str, project_id: str = None) -> Optional[Table]:
+        """
+        Get cached table metadata, including its schema.
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            table_id: BigQuery table ID
+            project_id: Project containing the table (optional)
+            
+        Returns:
+            Table object, or None if the table does not exist
+        """
+        return bigquery_get_table(
+            dataset_id=dataset_id,
+            table_id=table_id,
+            project_id=project_id,
+            conn_id=self.conn_id
         )
     
+    def get_table_schema(self, dataset_id: str, table_id: str,
+                         project_id: str = None) -> Optional[List]:
+        """
+        Get the cached schema of a table.
+        
+        Args:
+            dataset_id: BigQuery dataset ID
+            table_id: BigQuery table ID
+            project_id: Project containing the table (optional)
+            
+        Returns:
+            List of SchemaField objects, or None if the table does not exist
+        """
+        table = self.get_table(dataset_id=dataset_id, table_id=table_id, project_id=project_id)
+        return table.schema if table is not None else None
+    
+    def invalidate_metadata(self, ref: str = None) -> None:
+        """
+        Invalidate cached dataset/table metadata.
+        
+        Args:
+            ref: 'project.dataset' or 'project.dataset.table' to invalidate (all if None)
+        """
+        get_metadata_cache().invalidate(ref)
+    
     def create_dataset(self, dataset_id: str, location: str = 'US') -> bool:
         """
         Create a BigQuery dataset.
@@ -902,6 +3526,33 @@ class BigQueryClient:
             if_exists=if_exists
         )
 
+    def load_from_file(self, local_file_path: str, bucket_name: str, dataset_id: str,
+                       table_id: str, staging_prefix: str = 'staging/bigquery',
+                       if_exists: str = 'replace') -> int:
+        """
+        Load a local CSV or Parquet file to BigQuery through GCS staging.
+        
+        Args:
+            local_file_path: Path of the CSV or Parquet file to load
+            bucket_name: GCS bucket used for staging
+            dataset_id: BigQuery dataset ID
+            table_id: BigQuery table ID
+            staging_prefix: GCS prefix for staged files
+            if_exists: Action if table exists ('fail', 'replace', or 'append')
+            
+        Returns:
+            Number of rows loaded (-1 if unknown)
+        """
+        return stage_and_load_to_bigquery(
+            local_file_path=local_file_path,
+            bucket_name=bucket_name,
+            dataset_id=dataset_id,
+            table_id=table_id,
+            staging_prefix=staging_prefix,
+            if_exists=if_exists,
+            conn_id=self.conn_id
+        )
+
 
 class SecretManagerClient:
     """
@@ -944,13 +3595,15 @@ class SecretManagerClient:
             self.client = initialize_gcp_client('secretmanager', self.conn_id)
         return self.client
     
-    def get_secret(self, secret_id: str, version_id: str = 'latest') -> str:
+    def get_secret(self, secret_id: str, version_id: str = 'latest',
+                   use_cache: bool = True) -> str:
         """
         Get a secret from Secret Manager.
         
         Args:
             secret_id: The ID of the secret to retrieve
             version_id: The version of the secret (default: 'latest')
+            use_cache: Serve the value from the secret cache when available
             
         Returns:
             Secret value
@@ -958,7 +3611,8 @@ class SecretManagerClient:
         return get_secret(
             secret_id=secret_id,
             version_id=version_id,
-            conn_id=self.conn_id
+            conn_id=self.conn_id,
+            use_cache=use_cache
         )
     
     def create_secret(self, secret_id: str, secret_value: str) -> bool:
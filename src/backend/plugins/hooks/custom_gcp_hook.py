@@ -30,14 +30,13 @@ import pandas  # pandas v1.3.0+
 from pandas import DataFrame
 
 # Internal imports
-from dags.utils.gcp_utils import get_gcp_connection, initialize_gcp_client
+from dags.utils.gcp_utils import get_gcp_connection, initialize_gcp_client, GCSResumableUploader
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 # Global constants
 DEFAULT_GCP_CONN_ID = 'google_cloud_default'
-DEFAULT_CHUNK_SIZE = 104857600  # 100 MB in bytes
 
 
 def _validate_service_account_key_file(key_file: str) -> bool:
@@ -256,7 +255,8 @@ class CustomGCPHook(BaseHook):
             local_file_path: Path to the local file to upload
             bucket_name: Name of the GCS bucket
             object_name: Name to give the uploaded object
-            chunk_size: Size of chunks for uploading large files
+            chunk_size: Size of chunks for uploading large files; picked from the
+                file size and observed bandwidth if not provided
             
         Returns:
             GCS URI of uploaded file (gs://bucket-name/object-name)
@@ -274,24 +274,22 @@ class CustomGCPHook(BaseHook):
                 logger.error(error_msg)
                 raise AirflowException(error_msg)
             
-            # Use default chunk size if none provided
-            chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
-            
-            hook = self.get_gcs_hook()
-            hook.upload(
+            # Resumable upload with on-the-fly checksums and adaptive chunking
+            metrics = GCSResumableUploader(
+                credentials=self.get_gcs_hook().get_credentials(),
                 bucket_name=bucket_name,
                 object_name=object_name,
-                filename=local_file_path,
+                local_file_path=local_file_path,
                 chunk_size=chunk_size
-            )
+            ).upload()
             
-            file_size = os.path.getsize(local_file_path)
             logger.info(
                 f"Successfully uploaded {local_file_path} "
-                f"({file_size} bytes) to gs://{bucket_name}/{object_name}"
+                f"({metrics['bytes']} bytes) to gs://{bucket_name}/{object_name} "
+                f"at {metrics['bytes_per_sec']} bytes/sec"
             )
             
-            return f"gs://{bucket_name}/{object_name}"
+            return metrics['uri']
             
         except Exception as e:
             logger.error(f"Failed to upload {local_file_path} to GCS: {str(e)}")
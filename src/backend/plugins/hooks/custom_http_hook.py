@@ -11,12 +11,27 @@ while leveraging Airflow 2.X provider packages.
 """
 
 import os
+import re
+import sys
+import time
+import uuid
+import hashlib
+import tempfile
+import queue
+import asyncio
 import logging
 import json
-from typing import Dict, List, Optional, Any, Union, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from urllib.parse import urljoin, urlparse
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Any, Union, Callable, Tuple, Iterator
 
+import jmespath
 import requests
 from requests import Response
+from requests.structures import CaseInsensitiveDict
 import tenacity
 from tenacity import retry_if_exception_type, stop_after_attempt, wait_exponential
 
@@ -36,6 +51,61 @@ DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_DELAY = 1.0  # seconds
 DEFAULT_RETRY_BACKOFF = 2.0  # exponential backoff multiplier
 DEFAULT_RETRY_STATUS_CODES = [500, 502, 503, 504]
+DEFAULT_POOL_CONNECTIONS = 10  # Number of host pools kept per session
+DEFAULT_POOL_MAXSIZE = 32  # Keep-alive connections kept per host
+SESSION_CACHE_TTL = 300  # Seconds before a cached session re-reads its connection
+DEFAULT_CONCURRENCY = 16  # Concurrent requests for run_many
+PAGINATION_STYLES = ('cursor', 'offset', 'page', 'link')
+DEFAULT_PAGE_LIMIT = 100
+JSON_STREAM_CHUNK_SIZE = 64 * 1024  # Bytes read at a time when streaming JSON
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # Bytes per ranged download segment
+DEFAULT_DOWNLOAD_WORKERS = 4  # Segments downloaded in parallel
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024  # Bytes read from the socket at a time
+DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # Bytes per resumable upload request
+UPLOAD_BUFFER_SIZE = 1024 * 1024  # Bytes per chunk of a chunked-encoding upload
+CIRCUIT_FAILURE_THRESHOLD = 0.5  # Error rate that opens a circuit
+CIRCUIT_MIN_REQUESTS = 20  # Requests in a window before the error rate is considered
+CIRCUIT_WINDOW_SECONDS = 60  # Length of the error rate window
+CIRCUIT_OPEN_SECONDS = 30  # Time an open circuit fails fast before probing
+CIRCUIT_HALF_OPEN_PROBES = 3  # Probes allowed, and needed to close, while half-open
+REDIS_SOCKET_TIMEOUT = 1.0  # Seconds before shared circuit/rate limit state is skipped
+DEFAULT_HTTP_CACHE_DIR = os.environ.get(
+    'HTTP_RESPONSE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'airflow_http_cache')
+)
+DEFAULT_HTTP_CACHE_MAX_BYTES = int(os.environ.get('HTTP_RESPONSE_CACHE_MAX_BYTES', 512 * 1024 * 1024))
+
+# Connection extras consumed by the hook rather than sent as request headers
+HOOK_EXTRA_KEYS = (
+    'oauth_token', 'token_type', 'timeout', 'pool_connections', 'pool_maxsize', 'http2',
+    'circuit_breaker', 'rate_limit'
+)
+
+# Sessions and connection settings shared by all hook instances in a process,
+# keyed by (pid, conn_id) so forked workers never share sockets
+_session_cache: Dict[Tuple[int, str], Dict] = {}
+_session_cache_lock = threading.Lock()
+
+# On-disk response caches shared by all hook instances in a process, keyed by directory
+_response_caches: Dict[str, 'HTTPResponseCache'] = {}
+
+# Redis clients for shared circuit breaker and rate limiter state, keyed by pid
+_redis_clients: Dict[int, Any] = {}
+
+
+def clear_session_cache(http_conn_id: str = None) -> None:
+    """
+    Close and drop cached HTTP sessions.
+    
+    Args:
+        http_conn_id: Only drop sessions for this connection (all if None)
+    """
+    with _session_cache_lock:
+        for key in list(_session_cache):
+            if http_conn_id is None or key[1] == http_conn_id:
+                entry = _session_cache.pop(key)
+                entry['session'].close()
+                if entry.get('httpx_client') is not None:
+                    entry['httpx_client'].close()
 
 
 def _check_response(response: Response, alert_on_error: bool = True) -> Response:
@@ -125,6 +195,925 @@ def _retry_if_request_error(exception: Exception, retry_status_codes: List[int])
     return False
 
 
+def _checksum_hasher(checksum: Optional[str]) -> Tuple[Any, Optional[str]]:
+    """
+    Create the hasher for an expected checksum.
+    
+    Args:
+        checksum: Expected checksum as 'algorithm:hexdigest', or None
+        
+    Returns:
+        Tuple of (hashlib object, expected hex digest), or (None, None) without a checksum
+        
+    Raises:
+        AirflowException: If the checksum is malformed or the algorithm is unknown
+    """
+    if not checksum:
+        return None, None
+    algorithm, _, digest = checksum.partition(':')
+    if not digest:
+        raise AirflowException(f"Checksum must be given as 'algorithm:hexdigest', got: {checksum}")
+    try:
+        return hashlib.new(algorithm.lower()), digest.lower()
+    except ValueError:
+        raise AirflowException(f"Unsupported checksum algorithm: {algorithm}")
+
+
+def _content_range_total(response: Response) -> Optional[int]:
+    """
+    Get the complete file size from a 206 response's Content-Range header.
+    
+    Args:
+        response: HTTP response
+        
+    Returns:
+        Total size in bytes, or None if missing or unknown
+    """
+    total = response.headers.get('Content-Range', '').rpartition('/')[2]
+    return int(total) if total.isdigit() else None
+
+
+def _prepare_download_state(
+    state_path: str,
+    part_path: str,
+    url: str,
+    size: int,
+    chunk_size: int,
+    validator: Optional[str]
+) -> Dict:
+    """
+    Load the resume state of a ranged download, or start a new one.
+    
+    A previous state is reused only if it describes the same URL, size, segment
+    size and ETag/Last-Modified, and its partial file is still present;
+    otherwise the partial file is recreated at full size.
+    
+    Args:
+        state_path: Resume state file
+        part_path: Partial file
+        url: URL of the file
+        size: File size in bytes
+        chunk_size: Segment size in bytes
+        validator: ETag or Last-Modified of the remote file
+        
+    Returns:
+        Resume state with url, size, chunk_size, validator and the done segment numbers
+    """
+    state = {'url': url, 'size': size, 'chunk_size': chunk_size, 'validator': validator, 'done': []}
+    try:
+        with open(state_path, 'r') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = None
+    
+    if (
+        previous is not None
+        and validator
+        and all(previous.get(key) == state[key] for key in ('url', 'size', 'chunk_size', 'validator'))
+        and os.path.exists(part_path)
+        and os.path.getsize(part_path) == size
+    ):
+        return previous
+    
+    with open(part_path, 'wb') as f:
+        f.truncate(size)
+    _save_download_state(state_path, state)
+    return state
+
+
+def _save_download_state(state_path: str, state: Dict) -> None:
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, state_path)
+
+
+def _write_segment(response: Response, part_path: str, start: int, end: int) -> None:
+    """
+    Write a ranged response body into the partial file at its offset.
+    
+    Args:
+        response: Streamed 206 response for bytes start..end-1
+        part_path: Partial file to write to
+        start: First byte of the segment
+        end: Byte after the last byte of the segment
+        
+    Raises:
+        requests.ConnectionError: If the body is shorter or longer than the range
+    """
+    written = 0
+    with open(part_path, 'r+b') as f:
+        f.seek(start)
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_BUFFER_SIZE):
+            if chunk:
+                f.write(chunk)
+                written += len(chunk)
+    if written != end - start:
+        raise requests.ConnectionError(f"Received {written} of {end - start} bytes for range {start}-{end - 1}")
+
+
+def _write_body(response: Response, part_path: str, hasher: Any = None) -> None:
+    """
+    Write a complete (non-ranged) response body to the partial file.
+    
+    Args:
+        response: Streamed 200 response
+        part_path: Partial file to write to
+        hasher: hashlib object updated with the body (optional)
+    """
+    with open(part_path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_BUFFER_SIZE):
+            if chunk:
+                f.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+
+
+def _committed_offset(response: Response) -> int:
+    """
+    Get the number of bytes persisted from a 308 resumable upload response.
+    
+    Args:
+        response: 308 response with an optional 'Range: bytes=0-N' header
+        
+    Returns:
+        Offset to continue the upload from
+    """
+    committed = response.headers.get('Range', '').rpartition('-')[2]
+    return int(committed) + 1 if committed.isdigit() else 0
+
+
+class TokenBucket:
+    """
+    Asyncio token bucket limiting the request rate of CustomHTTPHook.run_many.
+    
+    Tokens refill continuously at rate per second up to capacity; each request
+    takes one token and waits for the next one when the bucket is empty.
+    Create it inside the event loop that uses it.
+    """
+    
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Initialize the TokenBucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and take it.
+        """
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse a Cache-Control header into a dict of lower-cased directives.
+    
+    Args:
+        value: Cache-Control header value
+        
+    Returns:
+        Directive names mapped to their values (None for valueless directives)
+    """
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, directive_value = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = directive_value.strip('"') or None
+    return directives
+
+
+def _freshness_lifetime(headers: Dict) -> float:
+    """
+    Compute how long a response may be served without revalidation.
+    
+    Args:
+        headers: Response headers
+        
+    Returns:
+        Freshness lifetime in seconds (0 means always revalidate)
+    """
+    directives = _parse_cache_control(headers.get('Cache-Control'))
+    if 'no-cache' in directives:
+        return 0.0
+    
+    lifetime = None
+    if directives.get('max-age'):
+        try:
+            lifetime = float(directives['max-age'])
+        except ValueError:
+            lifetime = 0.0
+    elif headers.get('Expires'):
+        try:
+            expires = parsedate_to_datetime(headers['Expires'])
+            date = parsedate_to_datetime(headers['Date']) if headers.get('Date') else None
+            lifetime = (expires - date).total_seconds() if date else expires.timestamp() - time.time()
+        except (TypeError, ValueError):
+            # Invalid Expires values mean the response is already stale
+            lifetime = 0.0
+    
+    if lifetime is None:
+        return 0.0
+    try:
+        age = float(headers.get('Age') or 0)
+    except ValueError:
+        age = 0.0
+    return max(lifetime - age, 0.0)
+
+
+class HTTPResponseCache:
+    """
+    Size-bounded on-disk cache of GET responses with conditional revalidation.
+    
+    Each entry is a body file plus a JSON metadata file holding the status,
+    headers, ETag/Last-Modified validators and expiry time. Fresh entries are
+    served without a request; stale ones are revalidated with If-None-Match and
+    If-Modified-Since and served again on 304 Not Modified. Cache-Control
+    no-store responses are never stored and no-cache ones are always
+    revalidated. The least recently used entries are evicted once the bodies
+    exceed max_bytes. Files are replaced atomically, so the cache directory can
+    be shared by all workers on a host. Bodies of authenticated requests end up
+    here, so the directory is created 0700 and its files 0600.
+    """
+    
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        """
+        Initialize the HTTPResponseCache.
+        
+        Args:
+            cache_dir: Directory holding cached responses (default: DEFAULT_HTTP_CACHE_DIR)
+            max_bytes: Maximum total size of cached bodies (default: DEFAULT_HTTP_CACHE_MAX_BYTES)
+        """
+        self.cache_dir = cache_dir or DEFAULT_HTTP_CACHE_DIR
+        self.max_bytes = max_bytes or DEFAULT_HTTP_CACHE_MAX_BYTES
+        self.lock = threading.Lock()
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+    
+    @staticmethod
+    def make_key(http_conn_id: str, endpoint: str, data: Any = None, headers: Dict = None) -> str:
+        """
+        Build the cache key of a GET request.
+        
+        Args:
+            http_conn_id: Connection the request is sent through
+            endpoint: Request endpoint
+            data: Query parameters
+            headers: Request headers
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        request = [http_conn_id, endpoint or '', data or {}, headers or {}]
+        return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.json", f"{base}.body"
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Load the metadata of a cached response.
+        
+        Args:
+            key: Cache key from make_key
+            
+        Returns:
+            Entry metadata, or None if the response is not cached
+        """
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if os.path.exists(body_path) else None
+    
+    @staticmethod
+    def is_fresh(meta: Dict) -> bool:
+        """
+        Check whether an entry may be served without revalidation.
+        
+        Args:
+            meta: Entry metadata
+            
+        Returns:
+            True if the entry has not expired
+        """
+        return time.time() < meta['expires_at']
+    
+    @staticmethod
+    def validators(meta: Dict) -> Dict[str, str]:
+        """
+        Build the conditional request headers for an entry.
+        
+        Args:
+            meta: Entry metadata
+            
+        Returns:
+            If-None-Match and/or If-Modified-Since headers
+        """
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def response(self, key: str, meta: Dict) -> Optional[Response]:
+        """
+        Rebuild a response from a cache entry and mark the entry as recently used.
+        
+        Args:
+            key: Cache key from make_key
+            meta: Entry metadata
+            
+        Returns:
+            Response object with from_cache set to True, or None if the body
+            was evicted meanwhile
+        """
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(body_path, 'rb') as f:
+                content = f.read()
+            os.utime(meta_path)
+        except OSError:
+            return None
+        
+        response = Response()
+        response.status_code = meta['status_code']
+        response.reason = meta.get('reason')
+        response.url = meta['url']
+        response.encoding = meta.get('encoding')
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response._content = content
+        response.from_cache = True
+        return response
+    
+    def store(self, key: str, response: Response) -> bool:
+        """
+        Store a response if it is cacheable.
+        
+        Args:
+            key: Cache key from make_key
+            response: Response to store
+            
+        Returns:
+            True if the response was stored
+        """
+        headers = response.headers
+        directives = _parse_cache_control(headers.get('Cache-Control'))
+        lifetime = _freshness_lifetime(headers)
+        if (
+            response.status_code != 200
+            or 'no-store' in directives
+            or headers.get('Vary') == '*'
+            or not (headers.get('ETag') or headers.get('Last-Modified') or lifetime > 0)
+        ):
+            return False
+        
+        content = response.content
+        if len(content) > self.max_bytes:
+            return False
+        
+        meta = {
+            'url': response.url,
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'encoding': response.encoding,
+            'headers': dict(headers),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'expires_at': time.time() + lifetime,
+            'size': len(content)
+        }
+        meta_path, body_path = self._paths(key)
+        self._write_atomic(body_path, content)
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        self.evict()
+        return True
+    
+    def revalidated(self, key: str, meta: Dict, not_modified: Response) -> Optional[Response]:
+        """
+        Refresh an entry from a 304 Not Modified response and return the cached response.
+        
+        Args:
+            key: Cache key from make_key
+            meta: Entry metadata
+            not_modified: The 304 response
+            
+        Returns:
+            Cached response, or None if the body was evicted meanwhile
+        """
+        headers = CaseInsensitiveDict(meta['headers'])
+        for name in ('Cache-Control', 'Expires', 'Date', 'Age', 'ETag', 'Last-Modified'):
+            if name in not_modified.headers:
+                headers[name] = not_modified.headers[name]
+        meta.update({
+            'headers': dict(headers),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'expires_at': time.time() + _freshness_lifetime(headers)
+        })
+        self._write_atomic(self._paths(key)[0], json.dumps(meta).encode('utf-8'))
+        return self.response(key, meta)
+    
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the cached bodies fit in max_bytes.
+        """
+        with self.lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith('.json'):
+                    continue
+                meta_path = os.path.join(self.cache_dir, name)
+                body_path = meta_path[:-len('.json')] + '.body'
+                try:
+                    size = os.path.getsize(body_path)
+                    used = os.path.getmtime(meta_path)
+                except OSError:
+                    continue
+                entries.append((used, size, meta_path, body_path))
+                total += size
+            
+            for used, size, meta_path, body_path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for path in (meta_path, body_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= size
+                logger.debug(f"Evicted cached HTTP response {os.path.basename(meta_path)}")
+    
+    def _write_atomic(self, path: str, content: bytes) -> None:
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
+def get_response_cache(cache_dir: str = None) -> HTTPResponseCache:
+    """
+    Get the process-wide response cache for a directory.
+    
+    Args:
+        cache_dir: Cache directory (default: DEFAULT_HTTP_CACHE_DIR)
+        
+    Returns:
+        Shared HTTPResponseCache instance
+    """
+    cache_dir = cache_dir or DEFAULT_HTTP_CACHE_DIR
+    with _session_cache_lock:
+        if cache_dir not in _response_caches:
+            _response_caches[cache_dir] = HTTPResponseCache(cache_dir)
+        return _response_caches[cache_dir]
+
+
+@lru_cache(maxsize=256)
+def compile_jmespath(expression: str) -> Any:
+    """
+    Compile a JMESPath expression, caching the result for the process.
+    
+    Args:
+        expression: JMESPath expression
+        
+    Returns:
+        Compiled expression with a search method
+    """
+    return jmespath.compile(expression)
+
+
+@lru_cache(maxsize=256)
+def compile_jsonpath(expression: str) -> Any:
+    """
+    Parse a JSONPath expression, caching the result for the process.
+    
+    Args:
+        expression: JSONPath expression
+        
+    Returns:
+        Parsed jsonpath_ng expression with a find method
+    """
+    from jsonpath_ng import parse as parse_jsonpath
+    return parse_jsonpath(expression)
+
+
+@lru_cache(maxsize=256)
+def simple_path_prefix(expression: str) -> Optional[str]:
+    """
+    Translate a simple JMESPath or JSONPath expression into an ijson prefix.
+    
+    Only dotted field names and [*] wildcards are supported, e.g. 'data.items',
+    'data[*].id' or '$.data[*].id'. Anything else (indexes, filters, functions,
+    recursive descent) returns None so callers fall back to a full parse.
+    
+    Args:
+        expression: JMESPath or JSONPath expression
+        
+    Returns:
+        ijson prefix, or None if the expression is not a simple path
+    """
+    path = expression.strip()
+    if path.startswith('$'):
+        path = path[1:]
+        if path.startswith('.'):
+            path = path[1:]
+    if not path:
+        return ''
+    
+    parts = []
+    for segment in path.split('.'):
+        match = re.fullmatch(r'([A-Za-z_][\w-]*)?((?:\[\*\])*)', segment)
+        if match is None or not segment:
+            return None
+        if match.group(1):
+            parts.append(match.group(1))
+        parts.extend(['item'] * (len(match.group(2)) // 3))
+    return '.'.join(parts)
+
+
+class _ResponseReader:
+    """File-like adapter reading a response body chunk by chunk, for ijson."""
+    
+    def __init__(self, response: Response, chunk_size: int):
+        self.chunks = response.iter_content(chunk_size=chunk_size)
+    
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes the source type with read(0), which must not consume a chunk
+        if size == 0:
+            return b''
+        return next(self.chunks, b'')
+
+
+def iter_json_path(response: Response, expression: str, chunk_size: int = JSON_STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Incrementally parse a JSON response and yield the values at a simple path.
+    
+    The body is read chunk by chunk, so memory stays proportional to the
+    matched values rather than the payload; stop iterating to stop reading.
+    Request the response with extra_options={'stream': True} to avoid
+    requests loading the body first.
+    
+    Args:
+        response: HTTP response with a JSON body
+        expression: Simple JMESPath or JSONPath expression (see simple_path_prefix)
+        chunk_size: Bytes read from the response at a time
+        
+    Yields:
+        Each value matched by the expression, in document order
+        
+    Raises:
+        AirflowException: If ijson is not installed or the expression is not a simple path
+    """
+    try:
+        import ijson
+    except ImportError:
+        raise AirflowException("ijson is required for streaming JSON parsing, install ijson")
+    
+    prefix = simple_path_prefix(expression)
+    if prefix is None:
+        raise AirflowException(f"Expression cannot be evaluated while streaming: {expression}")
+    
+    try:
+        yield from ijson.items(_ResponseReader(response, chunk_size), prefix, use_float=True)
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON response: {str(e)}") from e
+
+
+class CircuitOpenError(AirflowException):
+    """Raised instead of sending a request while the circuit for its host is open."""
+
+
+# Opens the circuit when the error rate of the current window crosses the threshold,
+# and closes it again after enough successful half-open probes.
+# KEYS: state hash, window request counter, window error counter
+# ARGV: success, probe, window seconds, error rate threshold, minimum requests, probes to close
+_CIRCUIT_RECORD_SCRIPT = """
+local success = tonumber(ARGV[1]) == 1
+local probe = tonumber(ARGV[2]) == 1
+local now = tonumber(redis.call('TIME')[1])
+local state = redis.call('HGET', KEYS[1], 'state') or 'closed'
+if state == 'half_open' then
+    if not probe then
+        return 'half_open'
+    end
+    if not success then
+        redis.call('HSET', KEYS[1], 'state', 'open', 'opened_at', now)
+        return 'open'
+    end
+    if redis.call('HINCRBY', KEYS[1], 'successes', 1) >= tonumber(ARGV[6]) then
+        redis.call('DEL', KEYS[1], KEYS[2], KEYS[3])
+        return 'closed'
+    end
+    return 'half_open'
+end
+if state == 'open' then
+    return 'open'
+end
+local window = tonumber(ARGV[3])
+local requests = redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], window * 2)
+if success then
+    return 'closed'
+end
+local errors = redis.call('INCR', KEYS[3])
+redis.call('EXPIRE', KEYS[3], window * 2)
+if requests >= tonumber(ARGV[5]) and errors / requests >= tonumber(ARGV[4]) then
+    redis.call('HSET', KEYS[1], 'state', 'open', 'opened_at', now)
+    return 'opened'
+end
+return 'closed'
+"""
+
+# Lets a request through unless the circuit is open; after open_seconds the circuit
+# half-opens and admits up to the probe limit, re-admitting probes that never reported.
+# KEYS: state hash
+# ARGV: open seconds, probe limit
+# Returns 0 (rejected), 1 (allowed) or 2 (allowed as a probe)
+_CIRCUIT_ALLOW_SCRIPT = """
+local now = tonumber(redis.call('TIME')[1])
+local open_seconds = tonumber(ARGV[1])
+local state = redis.call('HGET', KEYS[1], 'state')
+if state == 'open' then
+    if now - tonumber(redis.call('HGET', KEYS[1], 'opened_at')) < open_seconds then
+        return 0
+    end
+    redis.call('HSET', KEYS[1], 'state', 'half_open', 'half_opened_at', now, 'probes', 0, 'successes', 0)
+    state = 'half_open'
+end
+if state == 'half_open' then
+    if now - tonumber(redis.call('HGET', KEYS[1], 'half_opened_at')) >= open_seconds then
+        redis.call('HSET', KEYS[1], 'half_opened_at', now, 'probes', 0, 'successes', 0)
+    end
+    if redis.call('HINCRBY', KEYS[1], 'probes', 1) > tonumber(ARGV[2]) then
+        return 0
+    end
+    return 2
+end
+return 1
+"""
+
+# Token bucket refilled at ARGV[1] tokens per second up to ARGV[2] tokens.
+# KEYS: bucket hash
+# Returns 0 when a token was taken, otherwise the milliseconds until one is available
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens') or capacity)
+local updated = tonumber(redis.call('HGET', KEYS[1], 'updated') or now)
+tokens = math.min(capacity, tokens + math.max(now - updated, 0) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate * 1000)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return wait
+"""
+
+
+def get_redis_client() -> Any:
+    """
+    Get the process-wide Redis client holding shared circuit and rate limit state.
+    
+    The URL comes from HTTP_RESILIENCE_REDIS_URL, falling back to the Celery
+    broker URL, so all workers share the state without extra infrastructure.
+    
+    Returns:
+        redis.Redis client
+        
+    Raises:
+        AirflowException: If the redis package is not installed
+    """
+    try:
+        import redis
+    except ImportError:
+        raise AirflowException("redis is required for the HTTP circuit breaker and rate limiter, install redis")
+    
+    key = os.getpid()
+    with _session_cache_lock:
+        if key not in _redis_clients:
+            url = os.environ.get('HTTP_RESILIENCE_REDIS_URL') or os.environ.get(
+                'AIRFLOW__CELERY__BROKER_URL', 'redis://redis:6379/0'
+            )
+            _redis_clients[key] = redis.Redis.from_url(
+                url, socket_timeout=REDIS_SOCKET_TIMEOUT, socket_connect_timeout=REDIS_SOCKET_TIMEOUT
+            )
+        return _redis_clients[key]
+
+
+class HTTPCircuitBreaker:
+    """
+    Circuit breaker for one connection and host, with its state shared in Redis.
+    
+    Requests and downstream failures (connection errors, timeouts and the
+    failure status codes) are counted per window across all workers. Once the
+    error rate reaches the threshold over at least min_requests requests, the
+    circuit opens and requests fail fast with CircuitOpenError. After
+    open_seconds, up to half_open_probes probe requests are let through; a
+    failed probe reopens the circuit and that many successful probes close it.
+    
+    If Redis is unreachable the breaker lets every request through, so it
+    never becomes an outage of its own.
+    """
+    
+    def __init__(
+        self,
+        http_conn_id: str,
+        host: str,
+        failure_threshold: float = CIRCUIT_FAILURE_THRESHOLD,
+        min_requests: int = CIRCUIT_MIN_REQUESTS,
+        window_seconds: int = CIRCUIT_WINDOW_SECONDS,
+        open_seconds: int = CIRCUIT_OPEN_SECONDS,
+        half_open_probes: int = CIRCUIT_HALF_OPEN_PROBES,
+        redis_client: Any = None,
+    ):
+        """
+        Initialize the HTTPCircuitBreaker.
+        
+        Args:
+            http_conn_id: Connection the requests are sent through
+            host: Downstream host
+            failure_threshold: Error rate (0-1) that opens the circuit
+            min_requests: Requests in a window before the error rate is considered
+            window_seconds: Length of the counting window
+            open_seconds: Time the circuit stays open before half-opening
+            half_open_probes: Probe requests allowed, and needed to close, while half-open
+            redis_client: Redis client (default: get_redis_client())
+        """
+        self.key = f"http:circuit:{http_conn_id}:{host}"
+        self.name = f"{http_conn_id} ({host})"
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self.redis = redis_client or get_redis_client()
+        self.allow_script = self.redis.register_script(_CIRCUIT_ALLOW_SCRIPT)
+        self.record_script = self.redis.register_script(_CIRCUIT_RECORD_SCRIPT)
+    
+    def before_request(self) -> bool:
+        """
+        Check that a request may be sent.
+        
+        Returns:
+            True if the request is a half-open probe whose outcome decides the circuit
+            
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        try:
+            allowed = int(self.allow_script(keys=[self.key], args=[self.open_seconds, self.half_open_probes]))
+        except Exception as e:
+            logger.warning(f"Circuit breaker state unavailable for {self.name}, allowing request: {str(e)}")
+            return False
+        
+        if allowed == 0:
+            raise CircuitOpenError(f"Circuit open for {self.name}, failing fast without sending the request")
+        return allowed == 2
+    
+    def record(self, success: bool, probe: bool = False) -> str:
+        """
+        Record the outcome of a request.
+        
+        Args:
+            success: Whether the downstream handled the request
+            probe: Whether the request was a half-open probe
+            
+        Returns:
+            Circuit state after the request: 'closed', 'open', 'half_open', or
+            'opened' if this request opened the circuit
+        """
+        window = int(time.time() // self.window_seconds)
+        try:
+            state = self.record_script(
+                keys=[self.key, f"{self.key}:requests:{window}", f"{self.key}:errors:{window}"],
+                args=[
+                    int(success), int(probe), self.window_seconds,
+                    self.failure_threshold, self.min_requests, self.half_open_probes
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record request outcome for circuit {self.name}: {str(e)}")
+            return 'closed'
+        
+        state = state.decode('utf-8') if isinstance(state, bytes) else state
+        if state == 'opened':
+            logger.error(f"Circuit opened for {self.name} after error rate reached {self.failure_threshold:.0%}")
+        elif probe and state == 'closed':
+            logger.info(f"Circuit closed for {self.name} after successful probes")
+        return state
+
+
+class DistributedRateLimiter:
+    """
+    Token bucket rate limiter for one connection and host, shared in Redis by
+    every hook instance on every worker.
+    
+    If Redis is unreachable the limiter lets every request through.
+    """
+    
+    def __init__(self, http_conn_id: str, host: str, rate: float, capacity: float = None, redis_client: Any = None):
+        """
+        Initialize the DistributedRateLimiter.
+        
+        Args:
+            http_conn_id: Connection the requests are sent through
+            host: Downstream host
+            rate: Requests per second allowed across all workers
+            capacity: Maximum burst size (defaults to one second of requests)
+            redis_client: Redis client (default: get_redis_client())
+        """
+        self.key = f"http:ratelimit:{http_conn_id}:{host}"
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self.redis = redis_client or get_redis_client()
+        self.script = self.redis.register_script(_TOKEN_BUCKET_SCRIPT)
+    
+    def acquire(self, timeout: float = None) -> None:
+        """
+        Wait until a request may be sent and take its token.
+        
+        Args:
+            timeout: Maximum seconds to wait (wait indefinitely if None)
+            
+        Raises:
+            AirflowException: If no token became available within timeout
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            try:
+                wait_ms = int(self.script(keys=[self.key], args=[self.rate, self.capacity]))
+            except Exception as e:
+                logger.warning(f"Rate limiter state unavailable for {self.key}, allowing request: {str(e)}")
+                return
+            if wait_ms == 0:
+                return
+            if deadline is not None and time.monotonic() + wait_ms / 1000 > deadline:
+                raise AirflowException(f"Rate limit for {self.key} not available within {timeout}s")
+            time.sleep(wait_ms / 1000)
+
+
+def _is_downstream_failure(
+    exception: Exception = None,
+    response: Response = None,
+    failure_status_codes: List[int] = None
+) -> bool:
+    """
+    Decide whether a request outcome counts against the circuit breaker.
+    
+    Connection errors, timeouts and failure status codes count; other client
+    errors (e.g. 400 or 404) mean the downstream is healthy.
+    
+    Args:
+        exception: Exception raised by the request, if any
+        response: Response received, if any
+        failure_status_codes: Status codes that count as failures
+        
+    Returns:
+        True if the outcome indicates the downstream is failing
+    """
+    failure_status_codes = failure_status_codes or DEFAULT_RETRY_STATUS_CODES
+    if response is not None:
+        return response.status_code in failure_status_codes
+    if isinstance(exception, (requests.ConnectionError, requests.Timeout)):
+        return True
+    # httpx is only imported by the concurrent request paths
+    httpx = sys.modules.get('httpx')
+    if httpx is not None and isinstance(exception, httpx.TransportError):
+        return True
+    status_code = getattr(getattr(exception, 'response', None), 'status_code', None)
+    if status_code is None and isinstance(exception, AirflowException):
+        # HttpHook.check_response raises AirflowException('<status>:<reason>')
+        match = re.match(r'(\d{3}):', str(exception))
+        status_code = int(match.group(1)) if match else None
+    return status_code in failure_status_codes
+
+
 class CustomHTTPHook(HttpHook):
     """
     An enhanced HTTP hook for Airflow 2.X with additional capabilities for API integrations.
@@ -145,6 +1134,10 @@ class CustomHTTPHook(HttpHook):
         retry_backoff: Multiplier for exponential backoff
         retry_status_codes: HTTP status codes that should trigger a retry
         alert_on_error: Whether to send alerts on HTTP errors
+        use_cache: Whether GET responses are cached on disk and revalidated
+        cache_dir: Directory of the response cache
+        circuit_breaker: Whether requests go through the shared circuit breaker
+        rate_limit: Requests per second shared by all hooks for the connection and host
     """
     
     def __init__(
@@ -156,6 +1149,10 @@ class CustomHTTPHook(HttpHook):
         retry_backoff: float = DEFAULT_RETRY_BACKOFF,
         retry_status_codes: List[int] = None,
         alert_on_error: bool = True,
+        use_cache: bool = False,
+        cache_dir: str = None,
+        circuit_breaker: bool = None,
+        rate_limit: float = None,
     ):
         """
         Initialize the CustomHTTPHook.
@@ -168,6 +1165,13 @@ class CustomHTTPHook(HttpHook):
             retry_backoff: Multiplier for exponential backoff
             retry_status_codes: HTTP status codes that should trigger a retry
             alert_on_error: Whether to send alerts on HTTP errors
+            use_cache: Whether GET responses are cached on disk and revalidated
+                with ETag/Last-Modified, honoring Cache-Control
+            cache_dir: Directory of the response cache (default: DEFAULT_HTTP_CACHE_DIR)
+            circuit_breaker: Whether requests go through a circuit breaker shared in
+                Redis per connection and host (default: connection extra circuit_breaker)
+            rate_limit: Requests per second allowed across all workers for the
+                connection and host (default: connection extra rate_limit, unlimited)
         """
         super().__init__(http_conn_id=http_conn_id, method=method)
         
@@ -176,9 +1180,19 @@ class CustomHTTPHook(HttpHook):
         self.retry_backoff = retry_backoff
         self.retry_status_codes = retry_status_codes or DEFAULT_RETRY_STATUS_CODES
         self.alert_on_error = alert_on_error
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.circuit_breaker = circuit_breaker
+        self.rate_limit = rate_limit
+        self._resilience_guards = None
         
         # Initialize session if needed
         self.session = None
+        self.extras = None
+        
+        # Keep-alive is configured once on the pooled adapter of the cached session;
+        # remounting an adapter per request would drop the pooled sockets
+        self.tcp_keep_alive = False
         
         logger.debug(
             f"Initialized CustomHTTPHook - conn_id: {http_conn_id}, method: {method}, "
@@ -186,15 +1200,12 @@ class CustomHTTPHook(HttpHook):
             f"retry_backoff: {retry_backoff}, alert_on_error: {alert_on_error}"
         )
         
-    def get_conn(self) -> requests.Session:
+    def _build_session_entry(self) -> Dict:
         """
-        Get connection with proper authentication and headers.
-        
-        Gets connection from the base HttpHook and adds OAuth header if configured.
-        Sets default headers for content-type and adds timeout based on connection config.
+        Build a session for the connection with authentication, headers and pooling.
         
         Returns:
-            Configured requests session object
+            Cache entry with the session, base URL, connection extras and timeout
         """
         session = super().get_conn()
         
@@ -202,6 +1213,10 @@ class CustomHTTPHook(HttpHook):
         conn = self.get_connection(self.http_conn_id)
         extras = conn.extra_dejson or {}
         
+        # The base hook copies every extra into the headers; drop the ones the hook consumes
+        for key in HOOK_EXTRA_KEYS:
+            session.headers.pop(key, None)
+        
         # Add OAuth2 token if provided in the connection
         if extras.get('oauth_token'):
             oauth_token = extras.get('oauth_token')
@@ -211,25 +1226,205 @@ class CustomHTTPHook(HttpHook):
             })
             logger.debug(f"Added OAuth authorization header with token type {token_type}")
         
-        # Set default headers if not already set
-        if 'Content-Type' not in session.headers:
-            session.headers.update({
-                'Content-Type': 'application/json'
-            })
+        # Set default headers if not already set
+        if 'Content-Type' not in session.headers:
+            session.headers.update({
+                'Content-Type': 'application/json'
+            })
+            
+        # Set timeout from connection configuration or default
+        timeout = extras.get('timeout')
+        timeout_value = None
+        if timeout:
+            try:
+                timeout_value = float(timeout)
+                session.request_kwargs = {
+                    'timeout': timeout_value
+                }
+                logger.debug(f"Set request timeout to {timeout_value}s")
+            except (ValueError, TypeError):
+                logger.warning(f"Invalid timeout value in connection: {timeout}")
+        
+        # Pooled keep-alive adapter so repeated requests reuse sockets
+        from requests_toolbelt.adapters.socket_options import TCPKeepAliveAdapter
+        pool_connections = int(extras.get('pool_connections', DEFAULT_POOL_CONNECTIONS))
+        pool_maxsize = int(extras.get('pool_maxsize', DEFAULT_POOL_MAXSIZE))
+        adapter = TCPKeepAliveAdapter(
+            idle=getattr(self, 'keep_alive_idle', 120),
+            count=getattr(self, 'keep_alive_count', 20),
+            interval=getattr(self, 'keep_alive_interval', 30),
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        
+        return {
+            'session': session,
+            'base_url': self.base_url,
+            'extras': extras,
+            'timeout': timeout_value,
+            'created': time.monotonic(),
+            'httpx_client': None
+        }
+    
+    def _get_session_entry(self) -> Dict:
+        cache_key = (os.getpid(), self.http_conn_id)
+        with _session_cache_lock:
+            entry = _session_cache.get(cache_key)
+            if entry is None or time.monotonic() - entry['created'] > SESSION_CACHE_TTL:
+                if entry is not None:
+                    entry['session'].close()
+                    if entry['httpx_client'] is not None:
+                        entry['httpx_client'].close()
+                entry = self._build_session_entry()
+                _session_cache[cache_key] = entry
+                logger.debug(f"Created pooled HTTP session for {self.http_conn_id}")
+        
+        self.base_url = entry['base_url']
+        self.extras = entry['extras']
+        return entry
+    
+    def get_conn(self, headers: Dict = None) -> requests.Session:
+        """
+        Get connection with proper authentication and headers.
+        
+        Sessions are cached per process and connection ID, so the Airflow
+        connection is read once per SESSION_CACHE_TTL and keep-alive sockets are
+        reused across requests and hook instances. Pool sizes come from the
+        connection extras pool_connections and pool_maxsize.
+        
+        Args:
+            headers: Request headers; accepted for compatibility with HttpHook.run,
+                which also sets them on each request, so the shared session is
+                not modified
+        
+        Returns:
+            Configured requests session object
+        """
+        entry = self._get_session_entry()
+        self.session = entry['session']
+        return self.session
+    
+    def get_httpx_client(self) -> Any:
+        """
+        Get a pooled httpx client for the connection, using HTTP/2 if the
+        connection extra http2 is true.
+        
+        The client shares the headers and authentication of the cached requests
+        session and is cached alongside it.
+        
+        Returns:
+            httpx.Client instance
+            
+        Raises:
+            AirflowException: If httpx is not installed
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise AirflowException("httpx is required for HTTP/2 support, install httpx[http2]")
+        
+        entry = self._get_session_entry()
+        with _session_cache_lock:
+            if entry['httpx_client'] is None:
+                pool_maxsize = int(entry['extras'].get('pool_maxsize', DEFAULT_POOL_MAXSIZE))
+                entry['httpx_client'] = httpx.Client(**self._httpx_client_kwargs(entry, pool_maxsize))
+        return entry['httpx_client']
+    
+    @staticmethod
+    def _httpx_client_kwargs(entry: Dict, max_connections: int) -> Dict:
+        import httpx
+        session = entry['session']
+        auth = session.auth
+        if auth is not None and hasattr(auth, 'username'):
+            auth = (auth.username, auth.password)
+        return {
+            'base_url': entry['base_url'] or '',
+            'headers': dict(session.headers),
+            'auth': auth,
+            'http2': str(entry['extras'].get('http2', '')).lower() == 'true',
+            'limits': httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            'timeout': entry['timeout']
+        }
+    
+    def _get_resilience_guards(self) -> Tuple[Optional[HTTPCircuitBreaker], Optional[DistributedRateLimiter]]:
+        """
+        Get the circuit breaker and rate limiter configured for the connection.
+        
+        Must be called after the session entry is loaded, which sets the base
+        URL and extras.
+        
+        Returns:
+            Tuple of (circuit breaker, rate limiter), each None when disabled
+        """
+        if self._resilience_guards is None:
+            extras = self.extras or {}
+            enabled = self.circuit_breaker
+            if enabled is None:
+                enabled = str(extras.get('circuit_breaker', '')).lower() == 'true'
+            rate = self.rate_limit if self.rate_limit is not None else extras.get('rate_limit')
+            host = urlparse(self.base_url or '').netloc or 'default'
             
-        # Set timeout from connection configuration or default
-        timeout = extras.get('timeout')
-        if timeout:
-            try:
-                timeout_value = float(timeout)
-                session.request_kwargs = {
-                    'timeout': timeout_value
+            breaker = HTTPCircuitBreaker(self.http_conn_id, host) if enabled else None
+            limiter = DistributedRateLimiter(self.http_conn_id, host, float(rate)) if rate else None
+            self._resilience_guards = (breaker, limiter)
+        return self._resilience_guards
+    
+    def _record_outcome(
+        self,
+        breaker: HTTPCircuitBreaker,
+        probe: bool,
+        endpoint: str,
+        response: Response = None,
+        exception: Exception = None
+    ) -> None:
+        failure_status_codes = list(self.retry_status_codes) + [429]
+        failed = _is_downstream_failure(exception, response, failure_status_codes)
+        state = breaker.record(not failed, probe)
+        
+        # Only the request that opens the circuit alerts, not every request failing fast after it
+        if state == 'opened' and self.alert_on_error:
+            send_alert(
+                alert_level=AlertLevel.ERROR,
+                context={
+                    'status': "Circuit Opened",
+                    'endpoint': endpoint,
+                    'details': (
+                        f"Requests to {breaker.name} fail fast for {breaker.open_seconds}s "
+                        f"after the error rate reached {breaker.failure_threshold:.0%}"
+                    )
                 }
-                logger.debug(f"Set request timeout to {timeout_value}s")
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid timeout value in connection: {timeout}")
+            )
+    
+    def _send_guarded(self, endpoint: str, send: Callable[[], Any]) -> Any:
+        """
+        Send one request through the connection's rate limiter and circuit breaker.
+        
+        Args:
+            endpoint: Endpoint or URL of the request, for alerts
+            send: Sends the request and returns the response
+            
+        Returns:
+            The response returned by send
+            
+        Raises:
+            CircuitOpenError: If the circuit for the connection and host is open
+        """
+        breaker, limiter = self._get_resilience_guards()
+        if limiter is not None:
+            limiter.acquire()
+        probe = breaker.before_request() if breaker is not None else False
         
-        return session
+        try:
+            response = send()
+        except Exception as e:
+            if breaker is not None:
+                self._record_outcome(breaker, probe, endpoint, exception=e)
+            raise
+        if breaker is not None:
+            self._record_outcome(breaker, probe, endpoint, response=response)
+        return response
     
     def run(
         self,
@@ -244,7 +1439,11 @@ class CustomHTTPHook(HttpHook):
         Execute HTTP request with basic retry functionality.
         
         This method extends the base HttpHook.run method with error checking
-        and uses the connection with all configured authentication.
+        and uses the connection with all configured authentication. With
+        use_cache, fresh cached GET responses are returned without a request
+        and stale ones are revalidated; responses served from the cache have
+        from_cache set to True. Requests wait for the shared rate limiter and
+        pass through the shared circuit breaker when either is configured.
         
         Args:
             endpoint: The URL endpoint to call
@@ -258,23 +1457,66 @@ class CustomHTTPHook(HttpHook):
             HTTP response object from the requests library
             
         Raises:
+            CircuitOpenError: If the circuit for the connection and host is open
             AirflowException: If the request fails
         """
         try:
             # Use method parameter or instance method
             self.method = method or self.method
             
-            # Get session with authentication
-            session = self.get_conn()
+            # Apply the connection timeout unless the caller set one
+            entry = self._get_session_entry()
+            if entry['timeout'] and 'timeout' not in (extra_options or {}):
+                extra_options = dict(extra_options or {}, timeout=entry['timeout'])
+            
+            # HttpHook.run sends data as the query string for GET requests, so
+            # params are merged into it rather than passed a second time
+            request_kwargs = {}
+            if params and self.method == 'GET' and (data is None or isinstance(data, dict)):
+                data = {**(data or {}), **params}
+            elif params:
+                request_kwargs['params'] = params
+            
+            # Streamed bodies are left unread for the caller, so they are never cached
+            cache = None
+            request_headers = headers
+            if self.use_cache and self.method == 'GET' and not request_kwargs and not (extra_options or {}).get('stream'):
+                cache = get_response_cache(self.cache_dir)
+                cache_key = cache.make_key(self.http_conn_id, endpoint, data, headers)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    if cache.is_fresh(cached):
+                        response = cache.response(cache_key, cached)
+                        if response is not None:
+                            logger.info(f"HTTP GET {endpoint} served from cache")
+                            return response
+                    request_headers = {**(headers or {}), **cache.validators(cached)}
             
             # Execute the request
-            response = super().run(
+            response = self._send_guarded(endpoint, partial(
+                super().run,
                 endpoint=endpoint,
                 data=data,
-                headers=headers,
-                params=params,
-                extra_options=extra_options
-            )
+                headers=request_headers,
+                extra_options=extra_options,
+                **request_kwargs
+            ))
+            
+            if cache is not None:
+                if response.status_code == 304 and cached is not None:
+                    cached_response = cache.revalidated(cache_key, cached, response)
+                    if cached_response is not None:
+                        logger.info(f"HTTP GET {endpoint} not modified, served from cache")
+                        return cached_response
+                    # The body was evicted after the lookup, so fetch it unconditionally
+                    response = self._send_guarded(endpoint, partial(
+                        super().run,
+                        endpoint=endpoint,
+                        data=data,
+                        headers=headers,
+                        extra_options=extra_options
+                    ))
+                cache.store(cache_key, response)
             
             # Check response for errors
             _check_response(response, self.alert_on_error)
@@ -324,7 +1566,9 @@ class CustomHTTPHook(HttpHook):
         
         Args:
             endpoint: The URL endpoint to call
-            data: Payload to send (dict for JSON, string for raw data)
+            data: Payload to send (dict for JSON, string for raw data), or a
+                callable returning a fresh payload for each attempt, for streamed
+                bodies that cannot be re-read
             headers: Additional HTTP headers
             params: Query parameters
             method: HTTP method to override instance method
@@ -370,7 +1614,7 @@ class CustomHTTPHook(HttpHook):
             try:
                 return self.run(
                     endpoint=endpoint,
-                    data=data,
+                    data=data() if callable(data) else data,
                     headers=headers,
                     params=params,
                     method=self.method,
@@ -406,6 +1650,9 @@ class CustomHTTPHook(HttpHook):
             
             return response
             
+        except CircuitOpenError:
+            # Failing fast is expected while the circuit is open, so it is neither retried nor alerted
+            raise
         except Exception as e:
             error_msg = f"HTTP request failed after {retry_limit} retries: {str(e)}"
             logger.error(error_msg)
@@ -530,6 +1777,401 @@ class CustomHTTPHook(HttpHook):
         logger.debug(f"Successfully got text response from {endpoint}")
         return response.text
     
+    def _next_page_request(
+        self,
+        pagination: Dict,
+        request: Tuple[str, Dict],
+        response: Response,
+        body: Any,
+        records: List[Any],
+    ) -> Optional[Tuple[str, Dict]]:
+        """
+        Work out the (endpoint, params) of the page after the current one.
+        
+        Returns:
+            Next request, or None if the current page is the last one
+        """
+        style = pagination.get('style', 'cursor')
+        endpoint, params = request
+        
+        if style == 'cursor':
+            cursor = compile_jmespath(pagination.get('cursor_path', 'next_cursor')).search(body)
+            if not cursor:
+                return None
+            return endpoint, {**params, pagination.get('cursor_param', 'cursor'): cursor}
+        
+        if style == 'offset':
+            limit = pagination.get('limit', DEFAULT_PAGE_LIMIT)
+            if len(records) < limit:
+                return None
+            offset_param = pagination.get('offset_param', 'offset')
+            return endpoint, {**params, offset_param: params[offset_param] + len(records)}
+        
+        if style == 'page':
+            page_size = pagination.get('page_size')
+            if not records or (page_size and len(records) < page_size):
+                return None
+            page_param = pagination.get('page_param', 'page')
+            return endpoint, {**params, page_param: params[page_param] + 1}
+        
+        # Link header style (RFC 8288); the next URL already carries its query string
+        next_url = response.links.get('next', {}).get('url')
+        if not next_url:
+            return None
+        next_url = urljoin(response.url, next_url)
+        if self.base_url and next_url.startswith(self.base_url):
+            return next_url[len(self.base_url):], {}
+        raise AirflowException(f"Next page link {next_url} is outside the connection base URL {self.base_url}")
+    
+    def paginate(
+        self,
+        endpoint: str,
+        pagination: Dict,
+        params: Dict = None,
+        data: Dict = None,
+        headers: Dict = None,
+        method: str = None,
+        records_path: str = None,
+        max_pages: int = None,
+        prefetch: bool = True,
+    ) -> Iterator[List[Any]]:
+        """
+        Iterate over the pages of a paginated JSON API.
+        
+        Each page is requested with run_with_advanced_retry. With prefetch, the
+        next page is requested in a background thread as soon as the current
+        one has been parsed, so network time overlaps with the caller's
+        processing of the current page.
+        
+        Supported pagination configs:
+            {'style': 'cursor', 'cursor_param': 'cursor', 'cursor_path': 'next_cursor'}
+            {'style': 'offset', 'offset_param': 'offset', 'limit_param': 'limit', 'limit': 100}
+            {'style': 'page', 'page_param': 'page', 'start_page': 1,
+             'page_size_param': 'per_page', 'page_size': 100}
+            {'style': 'link'}  (follows rel="next" in the Link header)
+        
+        Args:
+            endpoint: The URL endpoint of the first page
+            pagination: Pagination config as above
+            params: Query parameters sent with every page
+            data: Payload sent with every page
+            headers: Additional HTTP headers
+            method: HTTP method to override instance method
+            records_path: JMESPath expression selecting the records in a page body
+                (the body itself if None)
+            max_pages: Stop after this many pages
+            prefetch: Fetch the next page while the current one is processed
+            
+        Yields:
+            List of records for each page
+            
+        Raises:
+            AirflowException: If the pagination style is unknown or a request fails
+        """
+        style = pagination.get('style', 'cursor')
+        if style not in PAGINATION_STYLES:
+            raise AirflowException(f"Unsupported pagination style: {style}, expected one of {PAGINATION_STYLES}")
+        
+        query = dict(params or {})
+        if style == 'offset':
+            query[pagination.get('offset_param', 'offset')] = pagination.get('start_offset', 0)
+            query[pagination.get('limit_param', 'limit')] = pagination.get('limit', DEFAULT_PAGE_LIMIT)
+        elif style == 'page':
+            query[pagination.get('page_param', 'page')] = pagination.get('start_page', 1)
+            if pagination.get('page_size'):
+                query[pagination.get('page_size_param', 'per_page')] = pagination['page_size']
+        
+        def fetch(page_endpoint: str, page_params: Dict) -> Tuple[Response, Any]:
+            response = self.run_with_advanced_retry(
+                endpoint=page_endpoint,
+                data=data,
+                headers=headers,
+                params=page_params,
+                method=method,
+            )
+            return response, response.json()
+        
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        request = (endpoint, query)
+        pending = None
+        pages = 0
+        records_total = 0
+        
+        try:
+            while request is not None:
+                response, body = pending.result() if pending is not None else fetch(*request)
+                pending = None
+                pages += 1
+                
+                records = compile_jmespath(records_path).search(body) if records_path else body
+                if records is None:
+                    records = []
+                elif not isinstance(records, list):
+                    records = [records]
+                records_total += len(records)
+                
+                request = self._next_page_request(pagination, request, response, body, records)
+                if max_pages and pages >= max_pages:
+                    request = None
+                if request is not None and executor is not None:
+                    pending = executor.submit(fetch, *request)
+                
+                yield records
+            
+            logger.info(f"Fetched {pages} pages ({records_total} records) from {endpoint}")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+    
+    async def _run_many_async(
+        self,
+        request_specs: List[Dict],
+        concurrency: int,
+        per_host_limit: Optional[int],
+        rate_limit: Optional[float],
+        parse_json: bool,
+        on_result: Callable,
+    ) -> None:
+        """
+        Execute request specs concurrently, passing (index, result) to on_result.
+        
+        Results are response objects (or parsed JSON), or the exception raised
+        for that request after retries.
+        """
+        import httpx
+        
+        entry = self._get_session_entry()
+        limiter = TokenBucket(rate_limit) if rate_limit else None
+        # The shared guards make blocking Redis calls, so they run in the default executor
+        breaker, shared_limiter = self._get_resilience_guards()
+        loop = asyncio.get_running_loop()
+        global_semaphore = asyncio.Semaphore(concurrency)
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        
+        async with httpx.AsyncClient(**self._httpx_client_kwargs(entry, concurrency)) as client:
+            
+            async def execute(index: int, spec: Dict) -> None:
+                endpoint = spec.get('endpoint', '')
+                try:
+                    method = (spec.get('method') or self.method).upper()
+                    params, data = spec.get('params'), spec.get('data')
+                    if method == 'GET' and data and not params:
+                        # HttpHook.run sends data as the query string for GET requests
+                        params, data = data, None
+                    request = client.build_request(
+                        method,
+                        endpoint,
+                        params=params,
+                        data=data if isinstance(data, dict) else None,
+                        content=data if isinstance(data, (str, bytes)) else None,
+                        json=spec.get('json'),
+                        headers=spec.get('headers')
+                    )
+                    host = request.url.host
+                    if host not in host_semaphores:
+                        host_semaphores[host] = asyncio.Semaphore(per_host_limit or concurrency)
+                    
+                    async with global_semaphore, host_semaphores[host]:
+                        # Same retry semantics as run_with_advanced_retry: retry_limit attempts
+                        # (at least one) with exponential backoff on connection errors and
+                        # retry status codes
+                        attempts = max(1, self.retry_limit)
+                        for attempt in range(attempts):
+                            if limiter is not None:
+                                await limiter.acquire()
+                            if shared_limiter is not None:
+                                await loop.run_in_executor(None, shared_limiter.acquire)
+                            probe = False
+                            if breaker is not None:
+                                probe = await loop.run_in_executor(None, breaker.before_request)
+                            
+                            try:
+                                response = await client.send(request)
+                            except httpx.TransportError as e:
+                                response, error = None, e
+                            else:
+                                error = None
+                                if response.status_code in self.retry_status_codes:
+                                    error = AirflowException(
+                                        f"HTTP error: {response.status_code} - {response.reason_phrase}"
+                                    )
+                            if breaker is not None:
+                                await loop.run_in_executor(None, partial(
+                                    self._record_outcome, breaker, probe, endpoint,
+                                    response=response, exception=error if response is None else None
+                                ))
+                            
+                            if error is None:
+                                break
+                            if attempt + 1 < attempts:
+                                await asyncio.sleep(self.retry_delay * self.retry_backoff ** attempt)
+                        else:
+                            raise AirflowException(
+                                f"HTTP request to {endpoint} failed after {attempts} attempts: {str(error)}"
+                            )
+                    
+                    if response.is_error:
+                        raise AirflowException(f"HTTP error: {response.status_code} - {response.reason_phrase}")
+                    result = response.json() if parse_json else response
+                except Exception as e:
+                    result = e if isinstance(e, AirflowException) else AirflowException(
+                        f"HTTP request to {endpoint} failed: {str(e)}"
+                    )
+                await on_result(index, result)
+            
+            await asyncio.gather(*(execute(index, spec) for index, spec in enumerate(request_specs)))
+    
+    def _report_failures(self, failures: int, total: int) -> None:
+        if not failures:
+            return
+        error_msg = f"{failures} of {total} concurrent HTTP requests failed"
+        logger.error(error_msg)
+        # One alert per batch rather than one per failed request
+        if self.alert_on_error:
+            send_alert(
+                alert_level=AlertLevel.ERROR,
+                context={
+                    'status': "Concurrent HTTP Requests Failed",
+                    'conn_id': self.http_conn_id,
+                    'details': error_msg
+                }
+            )
+    
+    def run_many(
+        self,
+        request_specs: List[Dict],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        per_host_limit: int = None,
+        rate_limit: float = None,
+        parse_json: bool = False,
+        stream: bool = False,
+        return_exceptions: bool = False,
+    ) -> Union[List[Any], Iterator[Tuple[int, Any]]]:
+        """
+        Execute many HTTP requests concurrently.
+        
+        Requests run on an asyncio event loop with httpx, sharing the connection's
+        headers and authentication. Each request is retried like
+        run_with_advanced_retry using the hook's retry settings.
+        
+        Args:
+            request_specs: List of dicts with endpoint and optional method, params,
+                data, json and headers
+            concurrency: Maximum requests in flight
+            per_host_limit: Maximum requests in flight per host (defaults to concurrency)
+            rate_limit: Maximum requests per second across all requests (unlimited if None)
+            parse_json: Return parsed JSON bodies instead of response objects
+            stream: Yield (index, result) pairs as requests complete instead of
+                returning a list
+            return_exceptions: Put the AirflowException of a failed request in its
+                result slot instead of raising
+            
+        Returns:
+            Results in input order, or an iterator of (index, result) in completion order
+            
+        Raises:
+            AirflowException: If a request fails and return_exceptions is False
+        """
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            raise AirflowException("httpx is required for run_many")
+        
+        logger.info(
+            f"Running {len(request_specs)} HTTP requests with concurrency {concurrency}"
+            + (f" and rate limit {rate_limit}/s" if rate_limit else "")
+        )
+        
+        if stream:
+            return self._stream_many(
+                request_specs, concurrency, per_host_limit, rate_limit, parse_json, return_exceptions
+            )
+        
+        results: List[Any] = [None] * len(request_specs)
+        
+        async def collect(index: int, result: Any) -> None:
+            results[index] = result
+        
+        asyncio.run(self._run_many_async(
+            request_specs, concurrency, per_host_limit, rate_limit, parse_json, collect
+        ))
+        
+        failures = [result for result in results if isinstance(result, Exception)]
+        self._report_failures(len(failures), len(results))
+        if failures and not return_exceptions:
+            raise failures[0]
+        return results
+    
+    def _stream_many(
+        self,
+        request_specs: List[Dict],
+        concurrency: int,
+        per_host_limit: Optional[int],
+        rate_limit: Optional[float],
+        parse_json: bool,
+        return_exceptions: bool,
+    ) -> Iterator[Tuple[int, Any]]:
+        # The event loop runs in a background thread; a bounded queue keeps it
+        # from racing ahead of a slow consumer
+        results: queue.Queue = queue.Queue(maxsize=concurrency * 2)
+        stopped = threading.Event()
+        finished = object()
+        
+        def deliver(item: Any) -> None:
+            # Gives up once the consumer has stopped, so a full queue never
+            # blocks the loop thread forever
+            while not stopped.is_set():
+                try:
+                    results.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+        
+        async def emit(index: int, result: Any) -> None:
+            await asyncio.get_running_loop().run_in_executor(None, deliver, (index, result))
+        
+        async def run_until_stopped() -> None:
+            runner = asyncio.ensure_future(self._run_many_async(
+                request_specs, concurrency, per_host_limit, rate_limit, parse_json, emit
+            ))
+            # Cancel in-flight requests as soon as the consumer stops iterating
+            while not runner.done():
+                if stopped.is_set():
+                    runner.cancel()
+                    break
+                await asyncio.wait({runner}, timeout=0.1)
+            try:
+                await runner
+            except asyncio.CancelledError:
+                pass
+        
+        def run_loop() -> None:
+            try:
+                asyncio.run(run_until_stopped())
+            except Exception as e:
+                deliver((None, AirflowException(f"Concurrent HTTP requests failed: {str(e)}")))
+            finally:
+                deliver(finished)
+        
+        worker = threading.Thread(target=run_loop, name='custom-http-run-many', daemon=True)
+        worker.start()
+        
+        failures = 0
+        try:
+            while True:
+                item = results.get()
+                if item is finished:
+                    break
+                index, result = item
+                if isinstance(result, Exception):
+                    failures += 1
+                    if not return_exceptions or index is None:
+                        raise result
+                yield index, result
+        finally:
+            stopped.set()
+            self._report_failures(failures, len(request_specs))
+    
     def download_file(
         self,
         endpoint: str,
@@ -537,22 +2179,39 @@ class CustomHTTPHook(HttpHook):
         params: Dict = None,
         headers: Dict = None,
         create_dirs: bool = True,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        checksum: str = None,
     ) -> str:
         """
         Download a file from a URL to a local path.
         
+        If the server supports range requests, the file is fetched as segments of
+        chunk_size bytes by up to max_workers parallel requests, each retried on
+        its own with the hook's retry settings. Data is written to
+        '<local_path>.part' and completed segments are recorded in
+        '<local_path>.part.json', so a failed download resumes from the segments
+        already on disk as long as the remote ETag/Last-Modified is unchanged.
+        Servers without range support, or that do not report the file size in
+        Content-Range, are streamed sequentially. The file is
+        moved to local_path only once complete and verified.
+        
         Args:
             endpoint: The URL endpoint where the file is located
             local_path: Local file path to save the downloaded file
             params: Query parameters for the request
             headers: Additional HTTP headers
             create_dirs: Whether to create parent directories if they don't exist
+            chunk_size: Size of each ranged segment in bytes
+            max_workers: Maximum number of segments downloaded in parallel
+            checksum: Expected checksum as 'algorithm:hexdigest' (e.g. 'sha256:ab12...'),
+                computed while the download progresses
             
         Returns:
             Path to the downloaded file
             
         Raises:
-            AirflowException: If the download fails
+            AirflowException: If the download fails or the checksum does not match
         """
         # Create directory structure if needed
         if create_dirs:
@@ -560,13 +2219,18 @@ class CustomHTTPHook(HttpHook):
             if directory and not os.path.exists(directory):
                 os.makedirs(directory, exist_ok=True)
                 logger.info(f"Created directory: {directory}")
-                
+        
+        part_path = f"{local_path}.part"
+        state_path = f"{part_path}.json"
+        ranged = False
+        
         try:
             # Set method to GET
             self.method = 'GET'
             
             # Add headers for binary content if needed
             request_headers = headers or {}
+            hasher, expected_digest = _checksum_hasher(checksum)
             
             # Execute request with streaming
             logger.info(f"Downloading file from {endpoint} to {local_path}")
@@ -575,21 +2239,71 @@ class CustomHTTPHook(HttpHook):
             session = self.get_conn()
             url = self.base_url + endpoint if self.base_url else endpoint
             
-            # Stream the response to a file
-            with session.get(
+            # The first segment doubles as the probe for range support and file size
+            refetch = False
+            with self._send_guarded(endpoint, partial(
+                session.get,
                 url,
                 params=params,
-                headers=request_headers,
+                headers={**request_headers, 'Range': f"bytes=0-{chunk_size - 1}"},
                 stream=True,
-            ) as response:
-                # Check response
-                _check_response(response, self.alert_on_error)
-                
-                # Save file
-                with open(local_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+            )) as response:
+                if response.status_code == 416:
+                    # Nothing to range over in an empty file
+                    open(part_path, 'wb').close()
+                else:
+                    # Check response
+                    _check_response(response, self.alert_on_error)
+                    
+                    total = _content_range_total(response)
+                    if response.status_code == 206 and total is not None:
+                        ranged = True
+                        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+                        state = _prepare_download_state(state_path, part_path, url, total, chunk_size, validator)
+                        if 0 not in state['done']:
+                            _write_segment(response, part_path, 0, min(chunk_size, total))
+                            state['done'].append(0)
+                            _save_download_state(state_path, state)
+                    elif response.status_code == 200:
+                        # The server ignored the range, so stream the whole body
+                        _write_body(response, part_path, hasher)
+                    elif response.status_code == 206:
+                        # A partial response without the total size cannot be split
+                        # into segments, so fetch the whole file without a range
+                        refetch = True
+                    else:
+                        raise AirflowException(
+                            f"Unexpected response to ranged request: {response.status_code} - {response.reason}"
+                        )
+            
+            if refetch:
+                logger.info(f"Server did not report the size of {url}, downloading it without ranges")
+                with self._send_guarded(endpoint, partial(
+                    session.get, url, params=params, headers=request_headers, stream=True
+                )) as response:
+                    _check_response(response, self.alert_on_error)
+                    if response.status_code != 200:
+                        raise AirflowException(
+                            f"Unexpected response to download request: {response.status_code} - {response.reason}"
+                        )
+                    _write_body(response, part_path, hasher)
+            
+            if ranged:
+                self._download_segments(
+                    session, url, params, request_headers, part_path, state_path, state, max_workers, hasher
+                )
+            
+            if hasher is not None and hasher.hexdigest() != expected_digest:
+                for path in (part_path, state_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                raise AirflowException(
+                    f"Checksum mismatch for {local_path}: expected {expected_digest}, got {hasher.hexdigest()}"
+                )
+            
+            os.replace(part_path, local_path)
+            if os.path.exists(state_path):
+                os.remove(state_path)
             
             # Verify file exists and has content
             file_size = os.path.getsize(local_path)
@@ -601,14 +2315,19 @@ class CustomHTTPHook(HttpHook):
             error_msg = f"Failed to download file from {endpoint}: {str(e)}"
             logger.error(error_msg)
             
-            # Remove partial file if it exists
-            if os.path.exists(local_path):
+            if ranged and os.path.exists(state_path):
+                logger.info(f"Keeping partial download {part_path} to resume from")
+            elif os.path.exists(part_path):
+                # Remove partial file if it cannot be resumed
                 try:
-                    os.remove(local_path)
-                    logger.info(f"Removed partial download: {local_path}")
+                    os.remove(part_path)
+                    logger.info(f"Removed partial download: {part_path}")
                 except Exception as remove_err:
                     logger.warning(f"Failed to remove partial download: {str(remove_err)}")
             
+            if isinstance(e, CircuitOpenError):
+                # Failing fast is expected while the circuit is open, so it is not alerted
+                raise
             if self.alert_on_error:
                 send_alert(
                     alert_level=AlertLevel.ERROR,
@@ -623,6 +2342,133 @@ class CustomHTTPHook(HttpHook):
                 
             raise AirflowException(error_msg) from e
     
+    def _download_segments(
+        self,
+        session: requests.Session,
+        url: str,
+        params: Dict,
+        headers: Dict,
+        part_path: str,
+        state_path: str,
+        state: Dict,
+        max_workers: int,
+        hasher: Any = None,
+    ) -> None:
+        """
+        Download the remaining segments of a ranged download in parallel.
+        
+        Segments are hashed in file order as soon as they are complete, so the
+        checksum is ready when the last segment lands.
+        
+        Args:
+            session: Session to send the requests with
+            url: URL of the file
+            params: Query parameters for the request
+            headers: Additional HTTP headers
+            part_path: Partial file the segments are written to
+            state_path: Resume state file
+            state: Resume state from _prepare_download_state
+            max_workers: Maximum number of segments downloaded in parallel
+            hasher: hashlib object updated with the file contents, if any
+        """
+        total, chunk_size = state['size'], state['chunk_size']
+        segments = [
+            (index, start, min(start + chunk_size, total))
+            for index, start in enumerate(range(0, total, chunk_size))
+        ]
+        done = set(state['done'])
+        if done:
+            logger.info(f"Resuming download of {url}: {len(done)}/{len(segments)} segments on disk")
+        
+        # Only send the range if the file is still the one the segments came from
+        segment_headers = dict(headers)
+        if state['validator']:
+            segment_headers['If-Range'] = state['validator']
+        state_lock = threading.Lock()
+        
+        def fetch(index: int, start: int, end: int) -> None:
+            self._fetch_segment(session, url, params, segment_headers, part_path, index, start, end)
+            with state_lock:
+                state['done'].append(index)
+                _save_download_state(state_path, state)
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                index: executor.submit(fetch, index, start, end)
+                for index, start, end in segments if index not in done
+            }
+            try:
+                # Unbuffered, so no read-ahead holds bytes from before a segment was written
+                with open(part_path, 'rb', buffering=0) as part:
+                    for index, start, end in segments:
+                        if index in futures:
+                            futures[index].result()
+                        if hasher is not None:
+                            part.seek(start)
+                            remaining = end - start
+                            while remaining:
+                                block = part.read(min(DOWNLOAD_BUFFER_SIZE, remaining))
+                                if not block:
+                                    raise AirflowException(f"Partial file {part_path} is truncated")
+                                hasher.update(block)
+                                remaining -= len(block)
+            except Exception:
+                # Segments already in flight finish and are recorded for resume
+                for future in futures.values():
+                    future.cancel()
+                raise
+    
+    def _fetch_segment(
+        self,
+        session: requests.Session,
+        url: str,
+        params: Dict,
+        headers: Dict,
+        part_path: str,
+        index: int,
+        start: int,
+        end: int,
+    ) -> None:
+        """
+        Download one byte range into the partial file, retrying with backoff.
+        
+        Args:
+            session: Session to send the request with
+            url: URL of the file
+            params: Query parameters for the request
+            headers: HTTP headers, including If-Range when available
+            part_path: Partial file to write to
+            index: Segment number, for logging
+            start: First byte of the segment
+            end: Byte after the last byte of the segment
+            
+        Raises:
+            AirflowException: If the remote file changed or a non-retryable error occurs
+        """
+        for attempt in range(1, max(1, self.retry_limit) + 1):
+            try:
+                with self._send_guarded(url, partial(
+                    session.get,
+                    url,
+                    params=params,
+                    headers={**headers, 'Range': f"bytes={start}-{end - 1}"},
+                    stream=True,
+                )) as response:
+                    if response.status_code == 200:
+                        # If-Range mismatch: the server sent the whole, changed file
+                        raise AirflowException(f"Remote file {url} changed during download")
+                    response.raise_for_status()
+                    _write_segment(response, part_path, start, end)
+                return
+            except requests.RequestException as e:
+                status_code = getattr(getattr(e, 'response', None), 'status_code', None)
+                retryable = status_code in self.retry_status_codes if status_code else True
+                if attempt >= self.retry_limit or not retryable:
+                    raise
+                delay = self.retry_delay * self.retry_backoff ** (attempt - 1)
+                logger.warning(f"Segment {index} of {url} failed: {str(e)}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
     def upload_file(
         self,
         endpoint: str,
@@ -631,9 +2477,14 @@ class CustomHTTPHook(HttpHook):
         data: Dict = None,
         headers: Dict = None,
         params: Dict = None,
+        progress_callback: Callable[[int, int], None] = None,
+        chunked: bool = False,
     ) -> Response:
         """
-        Upload a file to a URL.
+        Upload a file to a URL as a streamed multipart/form-data request.
+        
+        The multipart body is encoded while it is sent, so memory use does not
+        grow with the file size. Each retry streams the file again from the start.
         
         Args:
             endpoint: The URL endpoint to upload to
@@ -642,6 +2493,9 @@ class CustomHTTPHook(HttpHook):
             data: Additional form data to include
             headers: Additional HTTP headers
             params: Query parameters
+            progress_callback: Called with (bytes_sent, total_bytes) of the body as it is sent
+            chunked: Whether to send the body with chunked transfer encoding
+                instead of a Content-Length
             
         Returns:
             HTTP response object
@@ -655,34 +2509,51 @@ class CustomHTTPHook(HttpHook):
             logger.error(error_msg)
             raise AirflowException(error_msg)
             
+        open_files = []
         try:
+            from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
+            
             # Set method to POST
             self.method = 'POST'
             
             # Prepare form data if provided
-            form_data = data or {}
+            form_data = {
+                key: value if isinstance(value, (str, bytes, tuple)) else str(value)
+                for key, value in (data or {}).items()
+            }
             
-            logger.info(f"Uploading file {file_path} to {endpoint}")
+            # A fixed boundary keeps the Content-Type valid for every attempt's body
+            boundary = uuid.uuid4().hex
+            request_headers = {**(headers or {}), 'Content-Type': f"multipart/form-data; boundary={boundary}"}
             
-            # Open file for reading in binary mode
-            with open(file_path, 'rb') as file_obj:
-                # Prepare file upload
-                files = {
-                    field_name: (
-                        os.path.basename(file_path),
-                        file_obj,
-                        'application/octet-stream'
-                    )
-                }
-                
-                # Make request with file payload
-                response = self.run_with_advanced_retry(
-                    endpoint=endpoint,
-                    data=form_data,
-                    headers=headers,
-                    params=params,
-                    extra_options={'files': files}
+            def build_body() -> Any:
+                # Streamed bodies cannot be re-read, so each attempt reopens the file
+                file_obj = open(file_path, 'rb')
+                open_files.append(file_obj)
+                encoder = MultipartEncoder(
+                    fields={
+                        **form_data,
+                        field_name: (os.path.basename(file_path), file_obj, 'application/octet-stream')
+                    },
+                    boundary=boundary
                 )
+                if progress_callback:
+                    encoder = MultipartEncoderMonitor(
+                        encoder, lambda monitor: progress_callback(monitor.bytes_read, monitor.len)
+                    )
+                if chunked:
+                    return iter(partial(encoder.read, UPLOAD_BUFFER_SIZE), b'')
+                return encoder
+            
+            logger.info(f"Uploading file {file_path} to {endpoint}")
+            
+            # Make request with the streamed file payload
+            response = self.run_with_advanced_retry(
+                endpoint=endpoint,
+                data=build_body,
+                headers=request_headers,
+                params=params
+            )
             
             file_size = os.path.getsize(file_path)
             logger.info(
@@ -709,6 +2580,135 @@ class CustomHTTPHook(HttpHook):
                 )
                 
             raise AirflowException(error_msg) from e
+        finally:
+            for file_obj in open_files:
+                file_obj.close()
+    
+    def upload_file_resumable(
+        self,
+        endpoint: str,
+        file_path: str,
+        headers: Dict = None,
+        params: Dict = None,
+        method: str = 'PUT',
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        progress_callback: Callable[[int, int], None] = None,
+    ) -> Response:
+        """
+        Upload a file in chunks using the Content-Range resumable upload protocol.
+        
+        Each chunk is sent with 'Content-Range: bytes start-end/total'. The server
+        answers 308 with a Range header covering the bytes it has persisted, and
+        200 or 201 once the last chunk is stored. After a failed chunk the
+        committed offset is queried with an empty 'bytes */total' request and the
+        upload continues from there, so only one chunk is held in memory and a
+        network error never restarts the upload. This is the protocol of GCS and
+        Google Drive resumable uploads and compatible upload session endpoints.
+        
+        Args:
+            endpoint: The upload session URL or endpoint
+            file_path: Path to the file to upload
+            headers: Additional HTTP headers
+            params: Query parameters
+            method: HTTP method used for the chunks
+            chunk_size: Bytes sent per request
+            progress_callback: Called with (bytes_committed, total_bytes) after each chunk
+            
+        Returns:
+            HTTP response object of the final chunk
+            
+        Raises:
+            AirflowException: If the upload fails or the file does not exist
+        """
+        # Check if file exists
+        if not os.path.exists(file_path):
+            error_msg = f"File does not exist: {file_path}"
+            logger.error(error_msg)
+            raise AirflowException(error_msg)
+        
+        try:
+            self.method = method
+            session = self.get_conn()
+            url = self.base_url + endpoint if self.base_url else endpoint
+            request_headers = {**(headers or {}), 'Content-Type': 'application/octet-stream'}
+            file_size = os.path.getsize(file_path)
+            
+            logger.info(f"Uploading file {file_path} ({file_size} bytes) to {endpoint} in chunks of {chunk_size} bytes")
+            
+            offset = 0
+            failures = 0
+            query_offset = False
+            with open(file_path, 'rb') as f:
+                while True:
+                    if query_offset:
+                        chunk = b''
+                        content_range = f"bytes */{file_size}"
+                    else:
+                        f.seek(offset)
+                        chunk = f.read(chunk_size)
+                        end = offset + len(chunk)
+                        content_range = f"bytes {offset}-{end - 1}/{file_size}" if chunk else f"bytes */{file_size}"
+                    
+                    try:
+                        response = self._send_guarded(endpoint, partial(
+                            session.request,
+                            method,
+                            url,
+                            data=chunk,
+                            params=params,
+                            headers={**request_headers, 'Content-Range': content_range},
+                            allow_redirects=False,
+                        ))
+                        if response.status_code in (200, 201):
+                            if progress_callback:
+                                progress_callback(file_size, file_size)
+                            logger.info(
+                                f"Successfully uploaded file {file_path} ({file_size} bytes) "
+                                f"to {endpoint}, status: {response.status_code}"
+                            )
+                            return response
+                        if response.status_code != 308:
+                            response.raise_for_status()
+                            raise AirflowException(f"Unexpected status {response.status_code} for chunk upload")
+                    except requests.RequestException as e:
+                        failures += 1
+                        status_code = getattr(getattr(e, 'response', None), 'status_code', None)
+                        retryable = status_code in self.retry_status_codes if status_code else True
+                        if failures >= self.retry_limit or not retryable:
+                            raise
+                        delay = self.retry_delay * self.retry_backoff ** (failures - 1)
+                        logger.warning(f"Chunk upload to {endpoint} failed: {str(e)}, resuming in {delay:.1f}s")
+                        time.sleep(delay)
+                        query_offset = True
+                        continue
+                    
+                    # The server reports the bytes it has persisted, which may be fewer than sent
+                    offset = _committed_offset(response)
+                    failures = 0
+                    query_offset = False
+                    if progress_callback:
+                        progress_callback(offset, file_size)
+                        
+        except Exception as e:
+            error_msg = f"Failed to upload file {file_path} to {endpoint}: {str(e)}"
+            logger.error(error_msg)
+            
+            if isinstance(e, CircuitOpenError):
+                # Failing fast is expected while the circuit is open, so it is not alerted
+                raise
+            if self.alert_on_error:
+                send_alert(
+                    alert_level=AlertLevel.ERROR,
+                    context={
+                        'status': "File Upload Failed",
+                        'endpoint': endpoint,
+                        'file_path': file_path,
+                        'details': error_msg
+                    },
+                    exception=e
+                )
+                
+            raise AirflowException(error_msg) from e
     
     def test_connection(self) -> bool:
         """
@@ -150,6 +150,22 @@ class CustomPostgresHook(PostgresHook):
             logger.error(error_msg)
             raise AirflowException(error_msg)
     
+    def _rollback_quietly(self, conn) -> None:
+        """
+        Roll back after a failed statement without masking the original error.
+
+        Even with autocommit the failed statement leaves the transaction
+        aborted, and a kept connection would fail every later statement.
+
+        Args:
+            conn: Connection the statement failed on
+        """
+        try:
+            conn.rollback()
+            logger.info("Transaction rolled back")
+        except Exception as e:
+            logger.warning(f"Failed to roll back transaction: {str(e)}")
+    
     @tenacity.retry(
         stop=tenacity.stop_after_attempt(MAX_RETRIES),
         wait=tenacity.wait_fixed(DEFAULT_RETRY_DELAY),
@@ -216,9 +232,8 @@ class CustomPostgresHook(PostgresHook):
         except Exception as e:
             error_msg = f"Failed to execute query: {str(e)}"
             logger.error(error_msg)
-            if conn and not autocommit:
-                conn.rollback()
-                logger.info("Transaction rolled back")
+            if conn:
+                self._rollback_quietly(conn)
             raise AirflowException(error_msg)
             
         finally:
@@ -291,9 +306,8 @@ class CustomPostgresHook(PostgresHook):
         except Exception as e:
             error_msg = f"Failed to execute batch insert: {str(e)}"
             logger.error(error_msg)
-            if conn and not autocommit:
-                conn.rollback()
-                logger.info("Transaction rolled back")
+            if conn:
+                self._rollback_quietly(conn)
             raise AirflowException(error_msg)
             
         finally:
@@ -351,9 +365,8 @@ class CustomPostgresHook(PostgresHook):
         except Exception as e:
             error_msg = f"Failed to execute batch: {str(e)}"
             logger.error(error_msg)
-            if conn and not autocommit:
-                conn.rollback()
-                logger.info("Transaction rolled back")
+            if conn:
+                self._rollback_quietly(conn)
             return False
             
         finally:
@@ -683,9 +696,8 @@ class CustomPostgresHook(PostgresHook):
         except Exception as e:
             error_msg = f"Failed to execute COPY command: {str(e)}"
             logger.error(error_msg)
-            if conn and not autocommit:
-                conn.rollback()
-                logger.info("Transaction rolled back")
+            if conn:
+                self._rollback_quietly(conn)
             return False
             
         finally:
@@ -305,6 +305,9 @@ def get_gcp_secret(secret_id: str, version_id: str = 'latest', conn_id: str = DE
     """
     Retrieve a secret from Google Cloud Secret Manager.
     
+    Values come from the shared secret cache, so rendering the macro across many
+    task instances does not call Secret Manager each time.
+    
     Args:
         secret_id: ID of the secret to retrieve
         version_id: Version of the secret (default: 'latest')
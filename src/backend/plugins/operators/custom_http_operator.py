@@ -11,7 +11,7 @@ import os
 import logging
 import json
 import tempfile
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, Iterator, List, Optional, Union, Callable
 
 import jmespath
 import tenacity
@@ -21,7 +21,7 @@ from airflow.exceptions import AirflowException
 from airflow.providers.http.operators.http import SimpleHttpOperator
 
 # Internal imports
-from ..hooks.custom_http_hook import CustomHTTPHook
+from ..hooks.custom_http_hook import CustomHTTPHook, compile_jmespath, iter_json_path, simple_path_prefix
 from ...dags.utils.validation_utils import validate_connection
 from ...dags.utils.alert_utils import send_alert, AlertLevel
 
@@ -34,16 +34,29 @@ DEFAULT_RETRY_LIMIT = 3
 DEFAULT_RETRY_DELAY = 1.0
 DEFAULT_RETRY_BACKOFF = 2.0
 DEFAULT_RETRY_STATUS_CODES = [500, 502, 503, 504]
+OUTPUT_FORMATS = ('jsonl', 'parquet')
+PARQUET_SCHEMA_SAMPLE_RECORDS = 10000
 
 
-def _process_response(response: object, response_filter: str = None, response_check: callable = None) -> object:
+def _process_response(
+    response: object,
+    response_filter: str = None,
+    response_check: callable = None,
+    stream: bool = False
+) -> object:
     """
     Process HTTP response with optional filtering and validation.
     
+    With stream, JSON responses filtered by a simple path (dotted fields and
+    [*] wildcards, see simple_path_prefix) are parsed incrementally, so only
+    the selected values are held in memory and a non-wildcard path stops
+    reading at its first match. Other filters fall back to a full parse.
+    
     Args:
         response: The HTTP response object
         response_filter: JMESPath expression to filter the response data
         response_check: Function to validate the response
+        stream: Whether to parse a streamed JSON response incrementally
         
     Returns:
         Processed response data (filtered if filter applied)
@@ -56,7 +69,20 @@ def _process_response(response: object, response_filter: str = None, response_ch
     is_json = 'application/json' in content_type.lower()
     
     # Parse response based on content type
-    if is_json:
+    if stream and is_json and response_filter and simple_path_prefix(response_filter) is not None:
+        values = iter_json_path(response, response_filter)
+        try:
+            if '[*]' in response_filter:
+                # Projections drop null values, as jmespath.search does
+                response_data = [value for value in values if value is not None]
+            else:
+                response_data = next(values, None)
+        finally:
+            values.close()
+            response.close()
+        logger.debug(f"Applied JMESPath filter while streaming: {response_filter}")
+        response_filter = None
+    elif is_json:
         try:
             response_data = response.json()
         except ValueError:
@@ -69,7 +95,7 @@ def _process_response(response: object, response_filter: str = None, response_ch
     # Apply jmespath filter if provided
     if response_filter and is_json:
         try:
-            response_data = jmespath.search(response_filter, response_data)
+            response_data = compile_jmespath(response_filter).search(response_data)
             logger.debug(f"Applied JMESPath filter: {response_filter}")
         except jmespath.exceptions.JMESPathError as e:
             logger.warning(f"JMESPath filter error: {str(e)}, returning unfiltered response")
@@ -82,6 +108,122 @@ def _process_response(response: object, response_filter: str = None, response_ch
     return response_data
 
 
+def _write_pages(pages: Iterator[List[Any]], output_path: str, output_format: str = 'jsonl',
+                 output_schema: Any = None) -> Dict:
+    """
+    Stream pages of records to a JSONL or Parquet file, one page at a time.
+    
+    A Parquet file has one schema. Without output_schema it is inferred from
+    the first pages: pages are held back, and their schemas unified, until
+    every column has a non-null type or PARQUET_SCHEMA_SAMPLE_RECORDS records
+    were seen. Later pages that add columns or do not fit the schema fail
+    rather than being silently truncated.
+    
+    Args:
+        pages: Iterator of record lists, e.g. from CustomHTTPHook.paginate
+        output_path: Path of the file to write
+        output_format: 'jsonl' or 'parquet'
+        output_schema: pyarrow.Schema of the Parquet file (optional)
+        
+    Returns:
+        Summary dict with output_path, format, pages and records
+        
+    Raises:
+        AirflowException: If the format is unsupported, pyarrow is missing for Parquet
+            or a page does not match the Parquet schema
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise AirflowException(f"Unsupported output format: {output_format}, expected one of {OUTPUT_FORMATS}")
+    
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    page_count = 0
+    record_count = 0
+    
+    if output_format == 'jsonl':
+        with open(output_path, 'w') as f:
+            for records in pages:
+                for record in records:
+                    f.write(json.dumps(record, default=str))
+                    f.write('\n')
+                page_count += 1
+                record_count += len(records)
+    else:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise AirflowException("pyarrow is required to write Parquet output")
+        
+        writer = None
+        schema = output_schema
+        pending = []
+        
+        def write(records: List[Any], page: int) -> None:
+            new_columns = sorted({key for record in records for key in record} - set(schema.names))
+            if new_columns:
+                raise AirflowException(
+                    f"Page {page} has columns {new_columns} that are not in the Parquet schema; "
+                    f"pass output_schema to declare them"
+                )
+            try:
+                table = pa.Table.from_pylist(records, schema=schema)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                raise AirflowException(
+                    f"Page {page} does not match the Parquet schema: {str(e)}; pass output_schema to declare it"
+                )
+            writer.write_table(table)
+        
+        try:
+            for records in pages:
+                page_count += 1
+                if not records:
+                    continue
+                record_count += len(records)
+                
+                if writer is None and output_schema is None:
+                    # Hold pages back until every column has been seen with a value
+                    try:
+                        page_schema = pa.Table.from_pylist(records).schema
+                        schema = page_schema if schema is None else pa.unify_schemas([schema, page_schema])
+                    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                        raise AirflowException(
+                            f"Page {page_count} has conflicting column types: {str(e)}; "
+                            f"pass output_schema to declare them"
+                        )
+                    pending.append((page_count, records))
+                    if any(pa.types.is_null(field.type) for field in schema) and \
+                            record_count < PARQUET_SCHEMA_SAMPLE_RECORDS:
+                        continue
+                
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, schema)
+                    for page, held in pending:
+                        write(held, page)
+                    pending = []
+                    if output_schema is None:
+                        continue
+                write(records, page_count)
+            
+            if writer is None and schema is not None:
+                writer = pq.ParquetWriter(output_path, schema)
+                for page, held in pending:
+                    write(held, page)
+        finally:
+            if writer is not None:
+                writer.close()
+    
+    logger.info(f"Wrote {record_count} records from {page_count} pages to {output_path}")
+    return {
+        'output_path': output_path,
+        'format': output_format,
+        'pages': page_count,
+        'records': record_count
+    }
+
+
 class CustomHttpOperator(BaseOperator):
     """
     Enhanced HTTP operator for Airflow 2.X with advanced capabilities for API integrations.
@@ -111,9 +253,17 @@ class CustomHttpOperator(BaseOperator):
     :param retry_status_codes: HTTP status codes that should trigger a retry
     :param extra_options: Additional options for the HTTP request
     :param alert_on_error: Whether to send alerts on HTTP errors
+    :param pagination: Pagination config for CustomHTTPHook.paginate; fetches every page
+    :param records_path: JMESPath expression selecting the records of each page
+    :param max_pages: Maximum number of pages to fetch
+    :param output_path: File to stream paginated records to (returns a summary instead of the records)
+    :param output_format: Format of output_path, 'jsonl' or 'parquet'
+    :param output_schema: pyarrow.Schema for Parquet output (inferred from the first pages if omitted)
+    :param use_cache: Whether to cache GET responses on disk and revalidate them across runs
+    :param stream_response: Whether to stream the response and apply a simple response_filter while parsing
     """
     
-    template_fields = ('endpoint', 'data', 'headers', 'params')
+    template_fields = ('endpoint', 'data', 'headers', 'params', 'output_path')
     template_fields_renderers = {'headers': 'json', 'data': 'json', 'params': 'json'}
     
     def __init__(
@@ -133,6 +283,14 @@ class CustomHttpOperator(BaseOperator):
         retry_status_codes: List[int] = None,
         extra_options: Optional[Dict] = None,
         alert_on_error: bool = True,
+        pagination: Optional[Dict] = None,
+        records_path: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        output_path: Optional[str] = None,
+        output_format: str = 'jsonl',
+        output_schema: Optional[Any] = None,
+        use_cache: bool = False,
+        stream_response: bool = False,
         **kwargs
     ) -> None:
         """
@@ -154,10 +312,25 @@ class CustomHttpOperator(BaseOperator):
             retry_status_codes: HTTP status codes that should trigger a retry
             extra_options: Additional options for the HTTP request
             alert_on_error: Whether to send alerts on HTTP errors
+            pagination: Pagination config for CustomHTTPHook.paginate
+            records_path: JMESPath expression selecting the records of each page
+            max_pages: Maximum number of pages to fetch
+            output_path: File to stream paginated records to
+            output_format: Format of output_path, 'jsonl' or 'parquet'
+            output_schema: pyarrow.Schema for Parquet output (inferred from the
+                first pages if omitted)
+            use_cache: Whether to cache GET responses on disk and revalidate them
+            stream_response: Whether to stream the response and apply a simple
+                response_filter while parsing, for very large JSON payloads
             **kwargs: Additional arguments for BaseOperator
         """
         super().__init__(**kwargs)
         
+        if output_path and not pagination:
+            raise AirflowException("output_path requires pagination to be configured")
+        if output_format not in OUTPUT_FORMATS:
+            raise AirflowException(f"Unsupported output format: {output_format}, expected one of {OUTPUT_FORMATS}")
+        
         self.endpoint = endpoint
         self.method = method
         self.http_conn_id = http_conn_id
@@ -178,6 +351,15 @@ class CustomHttpOperator(BaseOperator):
         self.extra_options = extra_options or {}
         self.alert_on_error = alert_on_error
         
+        self.pagination = pagination
+        self.records_path = records_path
+        self.max_pages = max_pages
+        self.output_path = output_path
+        self.output_format = output_format
+        self.output_schema = output_schema
+        self.use_cache = use_cache
+        self.stream_response = stream_response
+        
         # Validate connection
         validate_connection(self.http_conn_id, 'http')
         
@@ -209,11 +391,20 @@ class CustomHttpOperator(BaseOperator):
                 retry_delay=self.retry_delay,
                 retry_backoff=self.retry_backoff,
                 retry_status_codes=self.retry_status_codes,
-                alert_on_error=self.alert_on_error
+                alert_on_error=self.alert_on_error,
+                use_cache=self.use_cache
             )
             
             logger.info(f"Executing HTTP {self.method} request to {self.endpoint}")
             
+            if self.pagination:
+                return self.execute_paginated(hook)
+            
+            # Leave the body unread so it can be parsed incrementally
+            extra_options = self.extra_options
+            if self.stream_response:
+                extra_options = {**extra_options, 'stream': True}
+            
             # Execute request with or without advanced retry
             if self.use_advanced_retry:
                 response = hook.run_with_advanced_retry(
@@ -221,7 +412,7 @@ class CustomHttpOperator(BaseOperator):
                     data=self.data,
                     headers=self.headers,
                     params=self.params,
-                    extra_options=self.extra_options
+                    extra_options=extra_options
                 )
             else:
                 response = hook.run(
@@ -229,7 +420,7 @@ class CustomHttpOperator(BaseOperator):
                     data=self.data,
                     headers=self.headers,
                     params=self.params,
-                    extra_options=self.extra_options
+                    extra_options=extra_options
                 )
             
             # Process the response
@@ -264,6 +455,45 @@ class CustomHttpOperator(BaseOperator):
             
             raise AirflowException(error_msg) from e
     
+    def execute_paginated(self, hook: CustomHTTPHook) -> Any:
+        """
+        Fetch every page of the endpoint.
+        
+        With output_path set, records are streamed to the file page by page and
+        only a small summary is returned (and pushed to XCom); otherwise the
+        records of all pages are returned as one list.
+        
+        Args:
+            hook: Configured CustomHTTPHook
+            
+        Returns:
+            Summary dict when writing to output_path, otherwise the list of records
+            
+        Raises:
+            AirflowException: If response_check rejects the result
+        """
+        pages = hook.paginate(
+            endpoint=self.endpoint,
+            pagination=self.pagination,
+            params=self.params,
+            data=self.data or None,
+            headers=self.headers,
+            method=self.method,
+            records_path=self.records_path,
+            max_pages=self.max_pages
+        )
+        
+        if self.output_path:
+            result = _write_pages(pages, self.output_path, self.output_format, self.output_schema)
+        else:
+            result = [record for records in pages for record in records]
+        
+        if self.response_check and not self.response_check(result):
+            raise AirflowException("Response check failed: response_check returned False")
+        
+        logger.info(f"Paginated HTTP request to {self.endpoint} completed successfully")
+        return result
+    
     def download_file(self, local_path: str, create_dirs: bool = True, context: Dict = None) -> str:
         """
         Download file from HTTP endpoint to local path.
@@ -324,14 +554,24 @@ class CustomHttpOperator(BaseOperator):
             
             raise AirflowException(error_msg) from e
     
-    def upload_file(self, file_path: str, field_name: str = 'file', context: Dict = None) -> object:
+    def upload_file(
+        self,
+        file_path: str,
+        field_name: str = 'file',
+        context: Dict = None,
+        resumable: bool = False
+    ) -> object:
         """
         Upload file to HTTP endpoint.
         
+        The file is streamed, as a multipart form by default or in chunks with
+        the Content-Range resumable protocol when the endpoint is an upload session.
+        
         Args:
             file_path: Path to the file to upload
             field_name: Name of the form field for the file
             context: Task context (for error handling)
+            resumable: Whether to use CustomHTTPHook.upload_file_resumable
             
         Returns:
             HTTP response object
@@ -352,14 +592,22 @@ class CustomHttpOperator(BaseOperator):
             logger.info(f"Uploading file {file_path} to {self.endpoint}")
             
             # Upload the file
-            response = hook.upload_file(
-                endpoint=self.endpoint,
-                file_path=file_path,
-                field_name=field_name,
-                data=self.data,
-                headers=self.headers,
-                params=self.params
-            )
+            if resumable:
+                response = hook.upload_file_resumable(
+                    endpoint=self.endpoint,
+                    file_path=file_path,
+                    headers=self.headers,
+                    params=self.params
+                )
+            else:
+                response = hook.upload_file(
+                    endpoint=self.endpoint,
+                    file_path=file_path,
+                    field_name=field_name,
+                    data=self.data,
+                    headers=self.headers,
+                    params=self.params
+                )
             
             logger.info(f"File {file_path} successfully uploaded to {self.endpoint}")
             return response
@@ -408,7 +656,8 @@ class CustomHttpOperator(BaseOperator):
         return _process_response(
             response=response,
             response_filter=response_filter,
-            response_check=response_check
+            response_check=response_check,
+            stream=self.stream_response
         )
 
 
@@ -13,6 +13,9 @@ the migration to Cloud Composer 2.
 
 import logging
 
+# Import the shared adaptive poke interval policy
+from .adaptive_interval import AdaptivePokeIntervalMixin
+
 # Import GCP sensors
 from .custom_gcp_sensor import (
     CustomGCSFileSensor,
@@ -36,6 +39,7 @@ from .custom_postgres_sensor import (
     CustomPostgresTableExistenceSensor,
     CustomPostgresRowCountSensor,
     CustomPostgresValueCheckSensor,
+    CustomPostgresMultiSensor,
     DEFAULT_POSTGRES_CONN_ID,
     DEFAULT_SCHEMA,
 )
@@ -48,6 +52,9 @@ __version__ = '1.0.0'
 
 # Define all exported components
 __all__ = [
+    # Shared sensor behavior
+    'AdaptivePokeIntervalMixin',
+    
     # GCP Sensors
     'CustomGCSFileSensor',
     'CustomBigQueryTableSensor',
@@ -66,6 +73,7 @@ __all__ = [
     'CustomPostgresTableExistenceSensor',
     'CustomPostgresRowCountSensor',
     'CustomPostgresValueCheckSensor',
+    'CustomPostgresMultiSensor',
     'DEFAULT_POSTGRES_CONN_ID',
     'DEFAULT_SCHEMA',
 ]
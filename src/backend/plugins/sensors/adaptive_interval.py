@@ -0,0 +1,217 @@
+"""
+Adaptive poke interval scheduling shared by the custom sensors.
+
+Sensors that opt in with adaptive_poke_interval=True stop poking at a fixed
+poke_interval. Instead, the wait between pokes doubles from poke_interval up to
+max_poke_interval, with jitter, as the time the sensor has been waiting grows
+(so the backoff carries over between reschedule-mode tries), except inside the
+sensor's learned arrival window: the range of offsets from the run's data
+interval end at which the same task succeeded in its recent successful runs. Inside the window the
+sensor pokes at poke_interval, and a backed-off wait is cut short so the
+sensor wakes when the window opens.
+"""
+
+import logging
+import math
+import random
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Airflow imports
+from airflow.utils import timezone  # airflow v2.0.0+
+
+# Set up logging
+logger = logging.getLogger('airflow.sensors.adaptive_interval')
+
+# Global constants
+DEFAULT_MAX_POKE_INTERVAL = 3600.0
+DEFAULT_ARRIVAL_HISTORY = 30  # Successful runs used to learn the arrival window
+MIN_ARRIVAL_SAMPLES = 5  # Fewer successful runs than this means no window yet
+ARRIVAL_WINDOW_PERCENTILES = (0.1, 0.9)
+ARRIVAL_WINDOW_CACHE_TTL = 3600.0
+POKE_INTERVAL_JITTER = 0.1  # Fraction of the interval added or removed at random
+
+# Learned windows keyed by (dag_id, task_id), with the time they were learned
+_arrival_windows: Dict[Tuple[str, str], Tuple[float, Optional[Tuple[float, float]]]] = {}
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    index = min(len(values) - 1, max(0, int(round(fraction * (len(values) - 1)))))
+    return values[index]
+
+
+def learn_arrival_window(
+    dag_id: str,
+    task_id: str,
+    history: int = DEFAULT_ARRIVAL_HISTORY,
+    margin: float = 0.0
+) -> Optional[Tuple[float, float]]:
+    """
+    Learn when a sensor's condition usually becomes true, from its recent successful runs.
+
+    Each successful try contributes the offset of its end date from its DAG
+    run's data interval end. The window spans the 10th to 90th percentile of
+    those offsets, widened by margin on each side. Windows are cached per
+    process for ARRIVAL_WINDOW_CACHE_TTL seconds.
+
+    Args:
+        dag_id: DAG of the sensor
+        task_id: Task ID of the sensor
+        history: Number of recent successful runs to learn from
+        margin: Seconds added before and after the window
+
+    Returns:
+        (start, end) offsets in seconds, or None with fewer than MIN_ARRIVAL_SAMPLES runs
+    """
+    key = (dag_id, task_id)
+    cached = _arrival_windows.get(key)
+    if cached is not None and time.monotonic() - cached[0] < ARRIVAL_WINDOW_CACHE_TTL:
+        return cached[1]
+
+    from airflow.models import DagRun, TaskInstance
+    from airflow.utils.session import create_session
+    from airflow.utils.state import TaskInstanceState
+
+    window = None
+    try:
+        with create_session() as session:
+            rows = (
+                session.query(TaskInstance.end_date, DagRun.data_interval_end)
+                .join(TaskInstance.dag_run)
+                .filter(
+                    TaskInstance.dag_id == dag_id,
+                    TaskInstance.task_id == task_id,
+                    TaskInstance.state == TaskInstanceState.SUCCESS,
+                    TaskInstance.end_date.isnot(None),
+                    DagRun.data_interval_end.isnot(None)
+                )
+                .order_by(DagRun.data_interval_end.desc())
+                .limit(history)
+                .all()
+            )
+        offsets = sorted((end_date - interval_end).total_seconds() for end_date, interval_end in rows)
+        if len(offsets) >= MIN_ARRIVAL_SAMPLES:
+            low, high = ARRIVAL_WINDOW_PERCENTILES
+            window = (_percentile(offsets, low) - margin, _percentile(offsets, high) + margin)
+            logger.info(
+                f"Learned arrival window for {dag_id}.{task_id} from {len(offsets)} runs: "
+                f"{window[0]:.0f}s to {window[1]:.0f}s after the data interval end"
+            )
+    except Exception as e:
+        logger.warning(f"Failed to learn arrival window for {dag_id}.{task_id}: {str(e)}")
+
+    _arrival_windows[key] = (time.monotonic(), window)
+    return window
+
+
+def adaptive_interval(
+    poke_interval: float,
+    max_poke_interval: float,
+    elapsed: float,
+    offset: Optional[float] = None,
+    window: Optional[Tuple[float, float]] = None,
+    jitter: float = POKE_INTERVAL_JITTER
+) -> float:
+    """
+    Compute the wait before the next poke.
+
+    The backoff step is derived from the time already spent waiting: waits
+    of poke_interval, 2x, 4x, ... add up to poke_interval * (2 ** step - 1),
+    so the step does not depend on counting pokes, which restart at 1 on
+    every reschedule-mode try.
+
+    Args:
+        poke_interval: Shortest wait, used inside the arrival window
+        max_poke_interval: Longest wait
+        elapsed: Seconds since the sensor started (across reschedules)
+        offset: Seconds since the run's data interval end
+        window: Learned (start, end) arrival offsets
+
+    Returns:
+        Seconds to wait before the next poke
+    """
+    step = 0
+    if poke_interval > 0 and elapsed > 0:
+        step = min(int(math.log2(elapsed / poke_interval + 1)), 32)
+    interval = min(max_poke_interval, poke_interval * 2 ** step)
+
+    if window is not None and offset is not None:
+        start, end = window
+        if start <= offset <= end:
+            interval = poke_interval
+        elif offset < start:
+            # Wake up when the window opens rather than sleeping through it
+            interval = max(poke_interval, min(interval, start - offset))
+
+    interval *= 1 + random.uniform(-jitter, jitter)
+    return min(max_poke_interval, max(poke_interval * (1 - jitter), interval))
+
+
+class AdaptivePokeIntervalMixin:
+    """
+    Mixin giving a sensor an opt-in adaptive poke interval.
+
+    It must come before BaseSensorOperator in the bases; sensors that
+    subclass a custom sensor inherit it. The interval applies in both poke
+    and reschedule modes. It does not apply to the wait in the triggerer.
+
+    Args:
+        adaptive_poke_interval: Whether to back off and follow the learned arrival window
+        max_poke_interval: Longest wait between pokes
+        arrival_history: Number of recent successful runs to learn the arrival window from
+    """
+
+    def __init__(
+        self,
+        *,
+        adaptive_poke_interval: bool = False,
+        max_poke_interval: float = DEFAULT_MAX_POKE_INTERVAL,
+        arrival_history: int = DEFAULT_ARRIVAL_HISTORY,
+        **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+        self.adaptive_poke_interval = adaptive_poke_interval
+        self.max_poke_interval = max_poke_interval
+        self.arrival_history = arrival_history
+        self._arrival_anchor: Optional[datetime] = None
+        self._arrival_window: Optional[Tuple[float, float]] = None
+
+    def execute(self, context: Dict) -> Any:
+        """
+        Learn the arrival window for this run, then run the sensor.
+
+        Args:
+            context: Airflow context dictionary
+        """
+        if self.adaptive_poke_interval:
+            dag_run = context.get('dag_run')
+            self._arrival_anchor = context.get('data_interval_end') or getattr(dag_run, 'data_interval_end', None)
+            if self.dag_id and self._arrival_anchor is not None:
+                self._arrival_window = learn_arrival_window(
+                    self.dag_id, self.task_id, history=self.arrival_history, margin=self.poke_interval
+                )
+        return super().execute(context)
+
+    def _get_next_poke_interval(
+        self,
+        started_at: Any,
+        run_duration: Callable[[], float],
+        try_number: int
+    ) -> float:
+        if not self.adaptive_poke_interval:
+            return super()._get_next_poke_interval(started_at, run_duration, try_number)
+
+        offset = None
+        if self._arrival_anchor is not None:
+            offset = (timezone.utcnow() - self._arrival_anchor).total_seconds()
+        elapsed = run_duration()
+        interval = adaptive_interval(
+            self.poke_interval, self.max_poke_interval, elapsed, offset=offset, window=self._arrival_window
+        )
+        # Do not sleep past the sensor timeout
+        remaining = self.timeout - elapsed
+        if remaining > 0:
+            interval = min(interval, remaining)
+        logger.info(f"Next poke in {interval:.0f}s ({elapsed:.0f}s since the sensor started)")
+        return interval
@@ -9,9 +9,17 @@ This module provides a set of sensors for monitoring Google Cloud Platform resou
 
 These sensors are designed to work with Cloud Composer 2 and Airflow 2.X,
 migrated from the Airflow 1.10.15 implementation used in Cloud Composer 1.
+
+Each sensor accepts deferrable=True to hand the wait to an asyncio trigger in
+the triggerer instead of holding a worker slot between pokes. The GCS sensors
+also accept use_notifications=True to resolve pokes against the object index
+maintained by GCSNotificationListener, with no GCS API call per poke.
 """
 
+import ast
+import json
 import logging
+from datetime import timedelta
 from typing import Dict, List, Optional, Union, Any
 
 # Airflow imports
@@ -20,6 +28,15 @@ from airflow.exceptions import AirflowException  # airflow v2.0.0+
 
 # Internal imports
 from ..hooks.custom_gcp_hook import CustomGCPHook, DEFAULT_GCP_CONN_ID
+from .adaptive_interval import AdaptivePokeIntervalMixin
+from ..triggers.custom_gcp_trigger import (
+    GCPPollingTrigger,
+    GCSObjectTrigger,
+    GCSPrefixTrigger,
+    BigQueryTableTrigger,
+    BigQueryJobTrigger
+)
+from dags.utils.gcp_utils import get_metadata_cache, get_object_index, DEFAULT_INDEX_MAX_LAG
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -27,9 +44,67 @@ logger = logging.getLogger(__name__)
 # Global constants
 DEFAULT_DELIMITER = None
 DEFAULT_MIN_OBJECTS = 1
+# Pending jobs in one project above which a poke lists running jobs instead of fetching each
+JOB_LIST_MIN_JOBS = 10
+
+
+class DeferrableGCPSensorMixin:
+    """
+    Mixin adding a deferrable mode to the GCP sensors.
+    
+    With deferrable=True the sensor pokes once on the worker and, if the
+    condition is not met yet, defers to the trigger returned by build_trigger()
+    for the rest of the wait. Sensors set self.deferrable in __init__.
+    """
+    
+    def build_trigger(self) -> GCPPollingTrigger:
+        """
+        Build the trigger that continues the wait in the triggerer.
+        
+        Returns:
+            Trigger instance for this sensor
+        """
+        raise NotImplementedError
+    
+    def execute(self, context: Dict) -> Any:
+        """
+        Run the sensor, deferring to the triggerer when deferrable is set.
+        
+        Args:
+            context: Airflow context dict
+        """
+        if not self.deferrable:
+            return super().execute(context)
+        
+        # A single check on the worker avoids a round trip through the triggerer
+        # when the condition is already met
+        if self.poke(context):
+            return None
+        
+        self.defer(
+            trigger=self.build_trigger(),
+            method_name='execute_complete',
+            timeout=timedelta(seconds=self.timeout)
+        )
+    
+    def execute_complete(self, context: Dict, event: Dict) -> None:
+        """
+        Resume after the trigger fires.
+        
+        Args:
+            context: Airflow context dict
+            event: Trigger event payload with status and message
+            
+        Raises:
+            AirflowException: If the trigger reported an error
+        """
+        if event.get('status') == 'error':
+            logger.error(event['message'])
+            raise AirflowException(event['message'])
+        logger.info(event['message'])
 
 
-class CustomGCSFileSensor(BaseSensorOperator):
+class CustomGCSFileSensor(DeferrableGCPSensorMixin, AdaptivePokeIntervalMixin, BaseSensorOperator):
     """
     Sensor that checks for the existence of a file in Google Cloud Storage.
     
@@ -40,6 +115,8 @@ class CustomGCSFileSensor(BaseSensorOperator):
         bucket_name: The GCS bucket where the file should exist
         object_name: The name of the object to check for, can be a specific file or a prefix
         gcp_conn_id: The connection ID to use for GCP authentication
+        deferrable: Wait in the triggerer instead of on a worker
+        use_notifications: Resolve pokes against the GCS notification index when it is live
         **kwargs: Additional arguments to pass to the BaseSensorOperator
     """
     
@@ -48,6 +125,8 @@ class CustomGCSFileSensor(BaseSensorOperator):
         bucket_name: str,
         object_name: str,
         gcp_conn_id: str = DEFAULT_GCP_CONN_ID,
+        deferrable: bool = False,
+        use_notifications: bool = False,
         **kwargs
     ) -> None:
         """
@@ -57,14 +136,26 @@ class CustomGCSFileSensor(BaseSensorOperator):
             bucket_name: The GCS bucket where the file should exist
             object_name: The name of the object to check for
             gcp_conn_id: The connection ID to use for GCP authentication
+            deferrable: Wait in the triggerer instead of on a worker
+            use_notifications: Resolve pokes against the GCS notification index when it is live
             **kwargs: Additional arguments to pass to the BaseSensorOperator
         """
         super().__init__(**kwargs)
         self.bucket_name = bucket_name
         self.object_name = object_name
         self.gcp_conn_id = gcp_conn_id
+        self.deferrable = deferrable
+        self.use_notifications = use_notifications
         self.hook = None
     
+    def build_trigger(self) -> GCSObjectTrigger:
+        return GCSObjectTrigger(
+            bucket_name=self.bucket_name,
+            object_name=self.object_name,
+            gcp_conn_id=self.gcp_conn_id,
+            poll_interval=self.poke_interval
+        )
+    
     def poke(self, context: Dict) -> bool:
         """
         Check if the file exists in the specified GCS bucket.
@@ -75,13 +166,19 @@ class CustomGCSFileSensor(BaseSensorOperator):
         Returns:
             True if the file exists, False otherwise
         """
-        if self.hook is None:
-            self.hook = CustomGCPHook(gcp_conn_id=self.gcp_conn_id)
-        
-        exists = self.hook.gcs_file_exists(
-            bucket_name=self.bucket_name,
-            object_name=self.object_name
-        )
+        index = get_object_index() if self.use_notifications else None
+        if index is not None and index.is_live(DEFAULT_INDEX_MAX_LAG, self.bucket_name, self.object_name):
+            exists = index.exists(self.bucket_name, self.object_name)
+        else:
+            if index is not None:
+                logger.info("GCS notification index is not live for this object, checking GCS directly")
+            if self.hook is None:
+                self.hook = CustomGCPHook(gcp_conn_id=self.gcp_conn_id)
+            
+            exists = self.hook.gcs_file_exists(
+                bucket_name=self.bucket_name,
+                object_name=self.object_name
+            )
         
         if exists:
             logger.info(f"File gs://{self.bucket_name}/{self.object_name} exists")
@@ -91,7 +188,7 @@ class CustomGCSFileSensor(BaseSensorOperator):
         return exists
 
 
-class CustomBigQueryTableSensor(BaseSensorOperator):
+class CustomBigQueryTableSensor(DeferrableGCPSensorMixin, AdaptivePokeIntervalMixin, BaseSensorOperator):
     """
     Sensor that checks for the existence of a table in Google BigQuery.
     
@@ -103,6 +200,7 @@ class CustomBigQueryTableSensor(BaseSensorOperator):
         dataset_id: The BigQuery dataset ID
         table_id: The BigQuery table ID
         gcp_conn_id: The connection ID to use for GCP authentication
+        deferrable: Wait in the triggerer instead of on a worker
         **kwargs: Additional arguments to pass to the BaseSensorOperator
     """
     
@@ -112,6 +210,7 @@ class CustomBigQueryTableSensor(BaseSensorOperator):
         dataset_id: str,
         table_id: str,
         gcp_conn_id: str = DEFAULT_GCP_CONN_ID,
+        deferrable: bool = False,
         **kwargs
     ) -> None:
         """
@@ -122,6 +221,7 @@ class CustomBigQueryTableSensor(BaseSensorOperator):
             dataset_id: The BigQuery dataset ID
             table_id: The BigQuery table ID
             gcp_conn_id: The connection ID to use for GCP authentication
+            deferrable: Wait in the triggerer instead of on a worker
             **kwargs: Additional arguments to pass to the BaseSensorOperator
         """
         super().__init__(**kwargs)
@@ -129,8 +229,18 @@ class CustomBigQueryTableSensor(BaseSensorOperator):
         self.dataset_id = dataset_id
         self.table_id = table_id
         self.gcp_conn_id = gcp_conn_id
+        self.deferrable = deferrable
         self.hook = None
     
+    def build_trigger(self) -> BigQueryTableTrigger:
+        return BigQueryTableTrigger(
+            project_id=self.project_id,
+            dataset_id=self.dataset_id,
+            table_id=self.table_id,
+            gcp_conn_id=self.gcp_conn_id,
+            poll_interval=self.poke_interval
+        )
+    
     def poke(self, context: Dict) -> bool:
         """
         Check if the table exists in the specified BigQuery dataset.
@@ -145,14 +255,19 @@ class CustomBigQueryTableSensor(BaseSensorOperator):
             self.hook = CustomGCPHook(gcp_conn_id=self.gcp_conn_id)
         
         try:
-            # Get the BigQuery client
-            bigquery_client = self.hook.get_bigquery_client()
-            
             # Create reference to the table
             table_ref = f"{self.project_id}.{self.dataset_id}.{self.table_id}"
             
-            # Try to get the table metadata to check if it exists
-            bigquery_client.get_table(table_ref)
+            # Check the table through the shared metadata cache; a cached
+            # "not found" expires quickly so new tables are still seen promptly
+            table = get_metadata_cache().get_or_fetch(
+                table_ref,
+                lambda: self.hook.get_bigquery_client().get_table(table_ref)
+            )
+            
+            if table is None:
+                logger.info(f"Table {table_ref} does not exist")
+                return False
             
             logger.info(f"Table {table_ref} exists")
             return True
@@ -162,27 +277,64 @@ class CustomBigQueryTableSensor(BaseSensorOperator):
             return False
 
 
-class CustomBigQueryJobSensor(BaseSensorOperator):
+def _parse_rendered_value(value: str) -> Any:
+    """
+    Parse a list or dict that a template rendered as a JSON or Python literal string.
+    
+    Args:
+        value: Rendered template string
+        
+    Returns:
+        Parsed list or dict
+        
+    Raises:
+        AirflowException: If the string is neither valid JSON nor a Python literal
+    """
+    try:
+        return json.loads(value)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        raise AirflowException(f"Could not parse rendered job_id as a list or job handle: {value}")
+
+
+class CustomBigQueryJobSensor(DeferrableGCPSensorMixin, AdaptivePokeIntervalMixin, BaseSensorOperator):
     """
-    Sensor that checks for the status of a BigQuery job.
+    Sensor that checks for the status of one or more BigQuery jobs.
+    
+    This sensor uses the CustomGCPHook to check if specific BigQuery jobs
+    have completed successfully. Combined with BigQueryClient.submit_query or
+    submit_load and mode='reschedule', a DAG can launch many jobs from one task
+    and wait on all of them without holding a worker slot per job.
     
-    This sensor uses the CustomGCPHook to check if a specific BigQuery job
-    has completed successfully.
+    Each poke fetches its pending jobs with jobs.get. When one sensor waits on
+    at least JOB_LIST_MIN_JOBS jobs in a project, it lists that project's
+    running jobs once instead and only fetches the jobs missing from the
+    listing. When deferred, job triggers in the triggerer share one listing
+    per project and poll cycle.
     
     Args:
         project_id: The GCP project ID containing the job
-        job_id: The BigQuery job ID to check
+        job_id: The BigQuery job ID to check, a list of job IDs, or a list of
+            job handles as returned by BigQueryClient.submit_query/submit_load.
+            A list templated from XCom may also arrive as its string form.
         location: The location of the BigQuery job
         gcp_conn_id: The connection ID to use for GCP authentication
+        deferrable: Wait in the triggerer instead of on a worker
         **kwargs: Additional arguments to pass to the BaseSensorOperator
     """
     
+    template_fields = ('project_id', 'job_id', 'location')
+    
     def __init__(
         self,
         project_id: str,
-        job_id: str,
+        job_id: Union[str, List[str], List[Dict]],
         location: str = 'US',
         gcp_conn_id: str = DEFAULT_GCP_CONN_ID,
+        deferrable: bool = False,
         **kwargs
     ) -> None:
         """
@@ -190,9 +342,10 @@ class CustomBigQueryJobSensor(BaseSensorOperator):
         
         Args:
             project_id: The GCP project ID containing the job
-            job_id: The BigQuery job ID to check
+            job_id: The BigQuery job ID, list of job IDs or list of job handles
             location: The location of the BigQuery job (default: US)
             gcp_conn_id: The connection ID to use for GCP authentication
+            deferrable: Wait in the triggerer instead of on a worker
             **kwargs: Additional arguments to pass to the BaseSensorOperator
         """
         super().__init__(**kwargs)
@@ -200,20 +353,100 @@ class CustomBigQueryJobSensor(BaseSensorOperator):
         self.job_id = job_id
         self.location = location
         self.gcp_conn_id = gcp_conn_id
+        self.deferrable = deferrable
         self.hook = None
+        self._finished_jobs = set()
+    
+    def _get_job_refs(self) -> List[Dict]:
+        """
+        Normalize job_id into a list of job references.
+        
+        Returns:
+            List of dicts with job_id, project and location
+        """
+        job_id = self.job_id
+        if isinstance(job_id, str) and job_id.strip()[:1] in ('[', '{'):
+            # A list of handles pulled from XCom renders as its string form
+            # unless the DAG sets render_template_as_native_obj
+            job_id = _parse_rendered_value(job_id)
+        job_ids = job_id if isinstance(job_id, (list, tuple)) else [job_id]
+        
+        refs = []
+        for job in job_ids:
+            if isinstance(job, dict):
+                if 'job_id' not in job:
+                    raise AirflowException(f"BigQuery job handle has no job_id: {job}")
+                refs.append({
+                    'job_id': job['job_id'],
+                    'project': job.get('project') or self.project_id,
+                    'location': job.get('location') or self.location
+                })
+            elif isinstance(job, str) and job:
+                refs.append({'job_id': job, 'project': self.project_id, 'location': self.location})
+            else:
+                raise AirflowException(f"Invalid BigQuery job ID: {job!r}")
+        return refs
+    
+    def _get_job_states(self, client: Any, refs: List[Dict]) -> Dict[str, Dict]:
+        """
+        Get the current state of this sensor's pending jobs.
+        
+        Args:
+            client: BigQuery client used for the calls
+            refs: Job references to check
+            
+        Returns:
+            Dict mapping job_id to a dict with 'state' and 'error' (None unless failed)
+        """
+        per_project = {}
+        for ref in refs:
+            per_project[ref['project']] = per_project.get(ref['project'], 0) + 1
+        
+        running = set()
+        for project, count in per_project.items():
+            if count < JOB_LIST_MIN_JOBS:
+                continue
+            try:
+                running.update(
+                    (project, job.job_id) for job in client.list_jobs(project=project, state_filter='running')
+                )
+            except Exception as e:
+                # Fall back to fetching every job in this project
+                logger.warning(f"Failed to list running BigQuery jobs in {project}: {str(e)}")
+        
+        states = {}
+        for ref in refs:
+            # jobs.list only shows the caller's jobs, so anything not listed is fetched
+            if (ref['project'], ref['job_id']) in running:
+                states[ref['job_id']] = {'state': 'RUNNING', 'error': None}
+                continue
+            job = client.get_job(job_id=ref['job_id'], project=ref['project'], location=ref['location'])
+            states[ref['job_id']] = {
+                'state': job.state,
+                'error': job.error_result if job.state == 'DONE' else None
+            }
+        return states
+    
+    def build_trigger(self) -> BigQueryJobTrigger:
+        # Jobs already seen finishing on the worker are not polled again
+        return BigQueryJobTrigger(
+            jobs=[ref for ref in self._get_job_refs() if ref['job_id'] not in self._finished_jobs],
+            gcp_conn_id=self.gcp_conn_id,
+            poll_interval=self.poke_interval
+        )
     
     def poke(self, context: Dict) -> bool:
         """
-        Check if the BigQuery job has completed successfully.
+        Check if the BigQuery jobs have completed successfully.
         
         Args:
             context: Airflow context dict
             
         Returns:
-            True if the job has completed successfully, False if still running
+            True if all jobs have completed successfully, False if any is still running
             
         Raises:
-            AirflowException: If the job has failed
+            AirflowException: If a job has failed
         """
         if self.hook is None:
             self.hook = CustomGCPHook(gcp_conn_id=self.gcp_conn_id)
@@ -222,38 +455,43 @@ class CustomBigQueryJobSensor(BaseSensorOperator):
             # Get the BigQuery client
             bigquery_client = self.hook.get_bigquery_client()
             
-            # Get the job
-            job = bigquery_client.get_job(
-                job_id=self.job_id,
-                project=self.project_id,
-                location=self.location
-            )
+            refs = self._get_job_refs()
+            pending = [ref for ref in refs if ref['job_id'] not in self._finished_jobs]
+            states = self._get_job_states(bigquery_client, pending)
             
-            # Check the job status
-            if job.state == 'DONE':
-                if job.error_result:
-                    error_msg = f"BigQuery job {self.job_id} failed: {job.error_result}"
+            running = []
+            for ref in pending:
+                state = states[ref['job_id']]
+                
+                # Check the job status
+                if state['state'] == 'DONE':
+                    if state['error']:
+                        error_msg = f"BigQuery job {ref['job_id']} failed: {state['error']}"
+                        logger.error(error_msg)
+                        raise AirflowException(error_msg)
+                    self._finished_jobs.add(ref['job_id'])
+                    
+                elif state['state'] in ('RUNNING', 'PENDING'):
+                    running.append(ref['job_id'])
+                    
+                else:
+                    error_msg = f"BigQuery job {ref['job_id']} has unexpected state: {state['state']}"
                     logger.error(error_msg)
                     raise AirflowException(error_msg)
-                    
-                logger.info(f"BigQuery job {self.job_id} completed successfully")
-                return True
-                
-            elif job.state == 'RUNNING':
-                logger.info(f"BigQuery job {self.job_id} is still running")
+            
+            if running:
+                logger.info(f"{len(running)} of {len(refs)} BigQuery jobs still running: {running}")
                 return False
-                
-            else:
-                error_msg = f"BigQuery job {self.job_id} has unexpected state: {job.state}"
-                logger.error(error_msg)
-                raise AirflowException(error_msg)
+            
+            logger.info(f"All {len(refs)} BigQuery jobs completed successfully")
+            return True
                 
         except Exception as e:
-            logger.error(f"Error checking BigQuery job {self.job_id}: {str(e)}")
-            raise AirflowException(f"Error checking BigQuery job {self.job_id}: {str(e)}")
+            logger.error(f"Error checking BigQuery jobs {self.job_id}: {str(e)}")
+            raise AirflowException(f"Error checking BigQuery jobs {self.job_id}: {str(e)}")
 
 
-class CustomGCSObjectsWithPrefixExistenceSensor(BaseSensorOperator):
+class CustomGCSObjectsWithPrefixExistenceSensor(DeferrableGCPSensorMixin, AdaptivePokeIntervalMixin, BaseSensorOperator):
     """
     Sensor that checks for the existence of objects with a specific prefix in Google Cloud Storage.
     
@@ -266,6 +504,8 @@ class CustomGCSObjectsWithPrefixExistenceSensor(BaseSensorOperator):
         min_objects: The minimum number of objects that should exist (default: 1)
         gcp_conn_id: The connection ID to use for GCP authentication
         delimiter: Whether to use a delimiter for hierarchical listing
+        deferrable: Wait in the triggerer instead of on a worker
+        use_notifications: Resolve pokes against the GCS notification index when it is live
         **kwargs: Additional arguments to pass to the BaseSensorOperator
     """
     
@@ -276,6 +516,8 @@ class CustomGCSObjectsWithPrefixExistenceSensor(BaseSensorOperator):
         min_objects: int = DEFAULT_MIN_OBJECTS,
         gcp_conn_id: str = DEFAULT_GCP_CONN_ID,
         delimiter: Optional[bool] = DEFAULT_DELIMITER,
+        deferrable: bool = False,
+        use_notifications: bool = False,
         **kwargs
     ) -> None:
         """
@@ -287,6 +529,8 @@ class CustomGCSObjectsWithPrefixExistenceSensor(BaseSensorOperator):
             min_objects: The minimum number of objects that should exist (default: 1)
             gcp_conn_id: The connection ID to use for GCP authentication
             delimiter: Whether to use a delimiter for hierarchical listing
+            deferrable: Wait in the triggerer instead of on a worker
+            use_notifications: Resolve pokes against the GCS notification index when it is live
             **kwargs: Additional arguments to pass to the BaseSensorOperator
         """
         super().__init__(**kwargs)
@@ -299,8 +543,20 @@ class CustomGCSObjectsWithPrefixExistenceSensor(BaseSensorOperator):
         self.min_objects = min_objects
         self.delimiter = delimiter
         self.gcp_conn_id = gcp_conn_id
+        self.deferrable = deferrable
+        self.use_notifications = use_notifications
         self.hook = None
     
+    def build_trigger(self) -> GCSPrefixTrigger:
+        return GCSPrefixTrigger(
+            bucket_name=self.bucket_name,
+            prefix=self.prefix,
+            min_objects=self.min_objects,
+            delimiter='/' if self.delimiter else None,
+            gcp_conn_id=self.gcp_conn_id,
+            poll_interval=self.poke_interval
+        )
+    
     def poke(self, context: Dict) -> bool:
         """
         Check if there are sufficient objects with the specified prefix in GCS.
@@ -311,16 +567,20 @@ class CustomGCSObjectsWithPrefixExistenceSensor(BaseSensorOperator):
         Returns:
             True if there are at least min_objects with the prefix, False otherwise
         """
-        if self.hook is None:
-            self.hook = CustomGCPHook(gcp_conn_id=self.gcp_conn_id)
-        
         try:
-            # List objects with the prefix
-            objects = self.hook.gcs_list_files(
-                bucket_name=self.bucket_name,
-                prefix=self.prefix,
-                delimiter=self.delimiter
-            )
+            index = get_object_index() if self.use_notifications and not self.delimiter else None
+            if index is not None and index.is_live(DEFAULT_INDEX_MAX_LAG, self.bucket_name, self.prefix):
+                objects = index.list_objects(self.bucket_name, self.prefix)
+            else:
+                if self.hook is None:
+                    self.hook = CustomGCPHook(gcp_conn_id=self.gcp_conn_id)
+                
+                # List objects with the prefix
+                objects = self.hook.gcs_list_files(
+                    bucket_name=self.bucket_name,
+                    prefix=self.prefix,
+                    delimiter=self.delimiter
+                )
             
             # Check if we have enough objects
             object_count = len(objects)
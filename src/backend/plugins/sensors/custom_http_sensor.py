@@ -8,6 +8,8 @@ sensor capabilities with additional functionality for API monitoring, including:
 - Status code validation
 - Robust retry capabilities
 - Comprehensive error handling with alerting
+- Deferrable mode that waits in the triggerer instead of a worker slot
+- Opt-in adaptive poke interval with backoff and learned arrival windows
 - Full Airflow 2.X compatibility
 
 These sensors are designed to work with the CustomHTTPHook and integrate with
@@ -17,10 +19,10 @@ the alert and validation utilities.
 import logging
 import json
 import re
+from datetime import timedelta
 from typing import Dict, Any, Optional, Callable, List, Pattern, Union
 
 # For JSONPath support
-from jsonpath_ng import parse as parse_jsonpath
 from jsonpath_ng.exceptions import JsonPathParserError
 
 # Airflow imports
@@ -29,7 +31,11 @@ from airflow.sensors.base import BaseSensorOperator
 from airflow.utils.decorators import apply_defaults
 
 # Internal imports
-from ..hooks.custom_http_hook import CustomHTTPHook
+from ..hooks.custom_http_hook import (
+    CustomHTTPHook, compile_jsonpath, iter_json_path, simple_path_prefix
+)
+from ..triggers.custom_http_trigger import HttpSensorTrigger
+from .adaptive_interval import AdaptivePokeIntervalMixin
 from ...dags.utils.alert_utils import send_alert, AlertLevel
 from ...dags.utils.validation_utils import validate_sensor_args
 
@@ -40,7 +46,13 @@ DEFAULT_HTTP_CONN_ID = 'http_default'
 logger = logging.getLogger('airflow.sensors.custom_http_sensor')
 
 
-def _get_hook(http_conn_id: str, method: str, retry_limit: int, retry_delay: float) -> CustomHTTPHook:
+def _get_hook(
+    http_conn_id: str,
+    method: str,
+    retry_limit: int,
+    retry_delay: float,
+    use_cache: bool = False
+) -> CustomHTTPHook:
     """
     Helper function to instantiate a CustomHTTPHook with the appropriate parameters.
     
@@ -49,6 +61,7 @@ def _get_hook(http_conn_id: str, method: str, retry_limit: int, retry_delay: flo
         method: HTTP method to use (GET, POST, etc.)
         retry_limit: Maximum number of retries
         retry_delay: Delay between retries in seconds
+        use_cache: Whether to cache GET responses and revalidate them with ETag/Last-Modified
         
     Returns:
         CustomHTTPHook: Configured HTTP hook instance
@@ -57,20 +70,23 @@ def _get_hook(http_conn_id: str, method: str, retry_limit: int, retry_delay: flo
         http_conn_id=http_conn_id,
         method=method,
         retry_limit=retry_limit,
-        retry_delay=retry_delay
+        retry_delay=retry_delay,
+        use_cache=use_cache
     )
     
     logger.debug(f"Created HTTP hook with connection ID: {http_conn_id}, method: {method}")
     return hook
 
 
-class CustomHttpSensor(BaseSensorOperator):
+class CustomHttpSensor(AdaptivePokeIntervalMixin, BaseSensorOperator):
     """
     Sensor that periodically polls an HTTP endpoint and executes a provided 
     response check function.
     
     This sensor enhances the standard HttpSensor with improved error handling,
-    configurable retry behavior, and alerting capabilities.
+    configurable retry behavior, and alerting capabilities. One hook and its
+    pooled session serve every poke of a run and are released when the run
+    ends, times out, reschedules or is killed.
     
     Attributes:
         endpoint: The relative URL to hit
@@ -85,6 +101,12 @@ class CustomHttpSensor(BaseSensorOperator):
         retry_limit: Maximum number of retry attempts for the HTTP request
         retry_delay: Delay between retries in seconds
         alert_on_error: Whether to send an alert when an HTTP error occurs
+        use_cache: Whether to cache GET responses between pokes, so unchanged
+            resources are revalidated with ETag/Last-Modified instead of re-downloaded.
+            Off by default since response bodies are written to the worker's disk
+        deferrable: Whether to wait in the triggerer instead of holding a worker slot
+        share_requests: Whether deferred sensors polling the same request share
+            one response per poke interval
     """
     
     template_fields = ('endpoint', 'headers', 'params', 'data')
@@ -104,6 +126,9 @@ class CustomHttpSensor(BaseSensorOperator):
         retry_limit: int = 3,
         retry_delay: float = 1.0,
         alert_on_error: bool = False,
+        use_cache: bool = False,
+        deferrable: bool = False,
+        share_requests: bool = False,
         **kwargs
     ) -> None:
         """
@@ -122,7 +147,15 @@ class CustomHttpSensor(BaseSensorOperator):
             retry_limit: Maximum number of retry attempts for the HTTP request
             retry_delay: Delay between retries in seconds
             alert_on_error: Whether to send an alert when an HTTP error occurs
+            use_cache: Whether to cache GET responses between pokes
+            deferrable: Whether to wait in the triggerer instead of holding a worker slot
+            share_requests: Whether deferred sensors polling the same request share
+                one response per poke interval
             **kwargs: Additional arguments to pass to the BaseSensorOperator
+            
+        Raises:
+            AirflowException: If deferrable is combined with a custom response_check,
+                which cannot be serialized to the triggerer
         """
         super().__init__(**kwargs)
         self.endpoint = endpoint
@@ -145,6 +178,17 @@ class CustomHttpSensor(BaseSensorOperator):
         self.retry_limit = retry_limit
         self.retry_delay = retry_delay
         self.alert_on_error = alert_on_error
+        self.use_cache = use_cache
+        self.deferrable = deferrable
+        self.share_requests = share_requests
+        self.hook = None
+        
+        # Built-in checks are bound to this sensor; anything else only runs on a worker
+        if deferrable and response_check and getattr(response_check, '__self__', None) is not self:
+            raise AirflowException(
+                "A custom response_check cannot run in the triggerer; "
+                "use pattern, json_path or expected_status_codes with deferrable=True"
+            )
         
         # Validate the sensor arguments for Airflow 2.X compatibility
         validate_sensor_args(self)
@@ -173,6 +217,37 @@ class CustomHttpSensor(BaseSensorOperator):
             
         return found
 
+    def get_hook(self) -> CustomHTTPHook:
+        """
+        Get the HTTP hook, creating it on the first poke.
+        
+        Returns:
+            CustomHTTPHook: Configured HTTP hook instance
+        """
+        if self.hook is None:
+            self.hook = _get_hook(
+                http_conn_id=self.http_conn_id,
+                method=self.method,
+                retry_limit=self.retry_limit,
+                retry_delay=self.retry_delay,
+                use_cache=self.use_cache
+            )
+        return self.hook
+
+    def close_hook(self) -> None:
+        """
+        Drop the sensor's hook. The pooled session it used is shared with other
+        tasks in the process, so it is left open and expires with SESSION_CACHE_TTL.
+        """
+        self.hook = None
+
+    def on_kill(self) -> None:
+        """
+        Drop the hook when the task is killed.
+        """
+        logger.info(f"Received kill signal for sensor {self.task_id}")
+        self.close_hook()
+
     @apply_defaults
     def poke(self, context: Dict) -> bool:
         """
@@ -184,12 +259,7 @@ class CustomHttpSensor(BaseSensorOperator):
         Returns:
             bool: True if the criteria are met, False otherwise
         """
-        hook = _get_hook(
-            http_conn_id=self.http_conn_id,
-            method=self.method,
-            retry_limit=self.retry_limit,
-            retry_delay=self.retry_delay
-        )
+        hook = self.get_hook()
         
         try:
             logger.info(f"Poking: {self.endpoint} with method {self.method}")
@@ -201,7 +271,10 @@ class CustomHttpSensor(BaseSensorOperator):
                 extra_options=self.extra_options
             )
             
-            logger.info(f"HTTP response status code: {response.status_code}")
+            logger.info(
+                f"HTTP response status code: {response.status_code}"
+                f"{' (cached)' if getattr(response, 'from_cache', False) else ''}"
+            )
             return self.response_check(response)
             
         except Exception as e:
@@ -212,6 +285,75 @@ class CustomHttpSensor(BaseSensorOperator):
                 
             return False
 
+    def _trigger_conditions(self) -> Dict:
+        """
+        Conditions the trigger evaluates in place of response_check.
+        
+        Returns:
+            Dict: Condition keyword arguments for HttpSensorTrigger
+        """
+        return {'pattern': getattr(self, 'pattern', None)}
+
+    def build_trigger(self) -> HttpSensorTrigger:
+        """
+        Build the trigger that continues the wait in the triggerer.
+        
+        Returns:
+            HttpSensorTrigger: Trigger polling the same request and condition
+        """
+        return HttpSensorTrigger(
+            endpoint=self.endpoint,
+            http_conn_id=self.http_conn_id,
+            method=self.method,
+            headers=self.headers,
+            params=self.params,
+            data=self.data,
+            poll_interval=self.poke_interval,
+            batch_window=self.poke_interval if self.share_requests else 0.0,
+            **self._trigger_conditions()
+        )
+
+    def execute(self, context: Dict) -> Any:
+        """
+        Run the sensor, deferring to the triggerer when deferrable is set, and
+        release the hook however the run ends.
+        
+        Args:
+            context: Airflow context dictionary
+        """
+        try:
+            if not self.deferrable:
+                return super().execute(context)
+            
+            # A single check on the worker avoids a round trip through the triggerer
+            # when the condition is already met
+            if self.poke(context):
+                return None
+            
+            self.defer(
+                trigger=self.build_trigger(),
+                method_name='execute_complete',
+                timeout=timedelta(seconds=self.timeout)
+            )
+        finally:
+            self.close_hook()
+
+    def execute_complete(self, context: Dict, event: Dict) -> None:
+        """
+        Resume after the trigger fires.
+        
+        Args:
+            context: Airflow context dictionary
+            event: Trigger event payload with status and message
+            
+        Raises:
+            AirflowException: If the trigger reported an error
+        """
+        if event.get('status') == 'error':
+            logger.error(event['message'])
+            raise AirflowException(event['message'])
+        logger.info(event['message'])
+
     def send_error_alert(self, exception: Exception, context: Dict) -> None:
         """
         Send an alert when the sensor encounters an error.
@@ -249,11 +391,14 @@ class CustomHttpJsonSensor(CustomHttpSensor):
     Sensor that polls an HTTP endpoint and validates the JSON response using JSONPath.
     
     This sensor extends CustomHttpSensor to specifically handle JSON responses and
-    validate them using JSONPath expressions.
+    validate them using JSONPath expressions. Parsed expressions are cached per
+    process, and with stream_response a simple path (dotted fields and [*]
+    wildcards) is evaluated while the body streams in, stopping at the first match.
     
     Attributes:
         json_path: JSONPath expression to evaluate against the response
         expected_value: Expected value from the JSONPath expression
+        stream_response: Whether to evaluate json_path while streaming the response
     """
     
     template_fields = CustomHttpSensor.template_fields + ('json_path',)
@@ -272,6 +417,8 @@ class CustomHttpJsonSensor(CustomHttpSensor):
         retry_limit: int = 3,
         retry_delay: float = 1.0,
         alert_on_error: bool = False,
+        use_cache: bool = False,
+        stream_response: bool = False,
         **kwargs
     ) -> None:
         """
@@ -289,14 +436,18 @@ class CustomHttpJsonSensor(CustomHttpSensor):
             retry_limit: Maximum number of retry attempts for the HTTP request
             retry_delay: Delay between retries in seconds
             alert_on_error: Whether to send an alert when an HTTP error occurs
+            use_cache: Whether to cache GET responses between pokes
+            stream_response: Whether to evaluate json_path while streaming the
+                response; paths that are not simple fall back to a full parse
             **kwargs: Additional arguments to pass to the CustomHttpSensor
         """
         self.json_path = json_path
         self.expected_value = expected_value
+        self.stream_response = stream_response
         
-        # Parse JSONPath expression
+        # Parse JSONPath expression (cached across sensors in the process)
         try:
-            self.jsonpath_expression = parse_jsonpath(json_path)
+            self.jsonpath_expression = compile_jsonpath(json_path)
         except JsonPathParserError as e:
             raise AirflowException(f"Invalid JSONPath expression: {json_path}. Error: {str(e)}")
         
@@ -312,8 +463,13 @@ class CustomHttpJsonSensor(CustomHttpSensor):
             retry_limit=retry_limit,
             retry_delay=retry_delay,
             alert_on_error=alert_on_error,
+            use_cache=use_cache,
             **kwargs
         )
+        
+        # Leave the body unread so it can be parsed incrementally
+        if stream_response and simple_path_prefix(json_path) is not None:
+            self.extra_options = {**self.extra_options, 'stream': True}
 
     def _json_path_response_check(self, response) -> bool:
         """
@@ -329,6 +485,9 @@ class CustomHttpJsonSensor(CustomHttpSensor):
             return False
             
         try:
+            if self.extra_options.get('stream'):
+                return self._streaming_json_path_check(response)
+            
             # Parse response as JSON
             json_data = response.json()
             
@@ -359,6 +518,40 @@ class CustomHttpJsonSensor(CustomHttpSensor):
             logger.error(f"Error checking JSON response with JSONPath: {str(e)}")
             return False
 
+    def _streaming_json_path_check(self, response) -> bool:
+        """
+        Evaluate the JSONPath expression while streaming the response, stopping
+        at the first value that satisfies the check.
+        
+        Args:
+            response: The HTTP response object, requested with stream=True
+            
+        Returns:
+            bool: True if the expected value (or any value) is found, False otherwise
+        """
+        values = iter_json_path(response, self.json_path)
+        scanned = 0
+        found = False
+        try:
+            for value in values:
+                scanned += 1
+                if self.expected_value is None or value == self.expected_value:
+                    found = True
+                    break
+        finally:
+            values.close()
+            response.close()
+        
+        logger.info(
+            f"JSONPath '{self.json_path}' streamed {scanned} match(es). "
+            f"{'Found' if found else 'Did not find'} "
+            f"{'any match' if self.expected_value is None else f'expected value {self.expected_value}'}."
+        )
+        return found
+
+    def _trigger_conditions(self) -> Dict:
+        return {'json_path': self.json_path, 'expected_value': self.expected_value}
+
 
 class CustomHttpStatusSensor(CustomHttpSensor):
     """
@@ -384,6 +577,7 @@ class CustomHttpStatusSensor(CustomHttpSensor):
         retry_limit: int = 3,
         retry_delay: float = 1.0,
         alert_on_error: bool = False,
+        use_cache: bool = False,
         **kwargs
     ) -> None:
         """
@@ -400,6 +594,7 @@ class CustomHttpStatusSensor(CustomHttpSensor):
             retry_limit: Maximum number of retry attempts for the HTTP request
             retry_delay: Delay between retries in seconds
             alert_on_error: Whether to send an alert when an HTTP error occurs
+            use_cache: Whether to cache GET responses between pokes
             **kwargs: Additional arguments to pass to the CustomHttpSensor
         """
         self.expected_status_codes = expected_status_codes or [200]
@@ -416,6 +611,7 @@ class CustomHttpStatusSensor(CustomHttpSensor):
             retry_limit=retry_limit,
             retry_delay=retry_delay,
             alert_on_error=alert_on_error,
+            use_cache=use_cache,
             **kwargs
         )
 
@@ -440,4 +636,7 @@ class CustomHttpStatusSensor(CustomHttpSensor):
         else:
             logger.info(f"Status code {status_code} does not match any expected code: {self.expected_status_codes}")
             
-        return matches
\ No newline at end of file
+        return matches
+
+    def _trigger_conditions(self) -> Dict:
+        return {'expected_status_codes': self.expected_status_codes}
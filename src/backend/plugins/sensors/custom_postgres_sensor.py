@@ -6,10 +6,13 @@ row counting, and value validation while ensuring compatibility with Cloud Compo
 
 import logging
 import re
-from typing import Dict, Optional, Union
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 # Third-party imports
-from airflow.exceptions import AirflowException  # apache-airflow v2.0.0+
+from airflow.exceptions import AirflowException, AirflowSensorTimeout  # apache-airflow v2.0.0+
+from airflow.models import Variable  # apache-airflow v2.0.0+
+from airflow.models.skipmixin import SkipMixin  # apache-airflow v2.0.0+
 from airflow.sensors.base import BaseSensorOperator  # apache-airflow v2.0.0+
 from airflow.utils.decorators import apply_defaults  # apache-airflow v2.0.0+
 
@@ -18,6 +21,8 @@ from ...dags.utils import alert_utils  # Import alert_utils module
 from ...dags.utils import db_utils  # Import db_utils module
 from ...dags.utils import validation_utils  # Import validation_utils module
 from ..hooks.custom_postgres_hook import CustomPostgresHook  # Import CustomPostgresHook class
+from ..triggers.custom_postgres_trigger import PostgresNotifyTrigger, DEFAULT_FALLBACK_POLL_INTERVAL
+from .adaptive_interval import AdaptivePokeIntervalMixin
 from alert_utils import AlertLevel  # Import AlertLevel class
 from alert_utils import send_alert  # Import send_alert function
 from db_utils import DEFAULT_SCHEMA  # Import DEFAULT_SCHEMA constant
@@ -29,6 +34,9 @@ logger = logging.getLogger('airflow.sensors.custom_postgres_sensor')
 # Global constants
 DEFAULT_POSTGRES_CONN_ID = 'postgres_default'
 DEFAULT_SCHEMA = db_utils.DEFAULT_SCHEMA
+MULTI_CONDITION_TYPES = ('table_exists', 'row_count', 'value')
+# Airflow clears a task's XComs at the start of every try, so met conditions are kept in a Variable
+MET_CONDITIONS_VARIABLE_PREFIX = 'postgres_multi_sensor_met'
 
 
 def _get_hook(postgres_conn_id: str, schema: str, use_persistent_connection: bool) -> CustomPostgresHook:
@@ -49,9 +57,14 @@ def _get_hook(postgres_conn_id: str, schema: str, use_persistent_connection: boo
     return hook
 
 
-class CustomPostgresSensor(BaseSensorOperator):
+class CustomPostgresSensor(AdaptivePokeIntervalMixin, BaseSensorOperator):
     """
     Sensor that polls a PostgreSQL database and executes a custom SQL check.
+
+    The sensor keeps one hook for every poke of a run and closes it when the
+    run ends, times out, reschedules or is killed. The database connection is
+    only kept open between pokes when use_persistent_connection is set; it is
+    off by default, so existing sensors open a connection per poke as before.
     """
 
     template_fields = ('sql', 'params',)
@@ -79,7 +92,7 @@ class CustomPostgresSensor(BaseSensorOperator):
             params (Optional[dict]): Query parameters.
             fail_on_error (bool): Whether to fail the sensor on error.
             alert_on_error (bool): Whether to send an alert on error.
-            use_persistent_connection (bool): Whether to use a persistent database connection.
+            use_persistent_connection (bool): Whether to keep the database connection open between pokes.
             **kwargs (Dict): Additional keyword arguments for BaseSensorOperator.
         """
         super().__init__(**kwargs)
@@ -90,6 +103,7 @@ class CustomPostgresSensor(BaseSensorOperator):
         self.fail_on_error = fail_on_error
         self.alert_on_error = alert_on_error
         self.use_persistent_connection = use_persistent_connection
+        self.hook = None
 
         # Validate arguments
         validate_sensor_args(fail_on_error=self.fail_on_error, alert_on_error=self.alert_on_error)
@@ -103,13 +117,42 @@ class CustomPostgresSensor(BaseSensorOperator):
 
     def get_hook(self) -> CustomPostgresHook:
         """
-        Get a PostgreSQL hook.
+        Get the PostgreSQL hook, creating it on the first poke.
 
         Returns:
             CustomPostgresHook: Configured PostgreSQL hook instance.
         """
-        return _get_hook(postgres_conn_id=self.postgres_conn_id, schema=self.schema,
-                         use_persistent_connection=self.use_persistent_connection)
+        if self.hook is None:
+            self.hook = _get_hook(postgres_conn_id=self.postgres_conn_id, schema=self.schema,
+                                  use_persistent_connection=self.use_persistent_connection)
+        return self.hook
+
+    def close_hook(self) -> None:
+        """
+        Close the hook's database connection and drop the hook.
+        """
+        if self.hook is not None:
+            self.hook.close_conn()
+            self.hook = None
+
+    def execute(self, context: Dict) -> Any:
+        """
+        Run the sensor, closing the hook however the run ends.
+
+        Args:
+            context (Dict): Airflow context dictionary.
+        """
+        try:
+            return super().execute(context)
+        finally:
+            self.close_hook()
+
+    def on_kill(self) -> None:
+        """
+        Close the database connection when the task is killed.
+        """
+        logger.info(f"Received kill signal for sensor {self.task_id}")
+        self.close_hook()
 
     @apply_defaults
     def poke(self, context: Dict) -> bool:
@@ -125,7 +168,8 @@ class CustomPostgresSensor(BaseSensorOperator):
         hook = self.get_hook()
         try:
             logger.info(f"Executing SQL query: {self.sql} with params: {self.params}")
-            records = hook.execute_query(sql=self.sql, parameters=self.params)
+            # Commit so a kept connection does not sit idle in transaction between pokes
+            records = hook.execute_query(sql=self.sql, parameters=self.params, autocommit=True)
             if records:
                 logger.info(f"Query returned {len(records)} records.")
                 return True
@@ -135,6 +179,8 @@ class CustomPostgresSensor(BaseSensorOperator):
         except Exception as e:
             error_message = str(e)
             logger.error(f"Error executing query: {error_message}")
+            # A failed query can leave the kept connection unusable; reconnect on the next poke
+            self.close_hook()
             self.send_error_alert(exception=e, context=context)
             if self.fail_on_error:
                 raise
@@ -275,7 +321,7 @@ class CustomPostgresRowCountSensor(CustomPostgresSensor):
         """
         hook = self.get_hook()
         try:
-            row_count = hook.execute_query(sql=self.sql)[0][0]
+            row_count = hook.execute_query(sql=self.sql, parameters=self.params, autocommit=True)[0][0]
             has_enough_rows = row_count >= self.min_rows
             logger.info(
                 f"Table '{self.table_name}' has {row_count} rows, "
@@ -285,6 +331,7 @@ class CustomPostgresRowCountSensor(CustomPostgresSensor):
         except Exception as e:
             error_message = str(e)
             logger.error(f"Error executing query: {error_message}")
+            self.close_hook()
             self.send_error_alert(exception=e, context=context)
             if self.fail_on_error:
                 raise
@@ -294,6 +341,11 @@ class CustomPostgresRowCountSensor(CustomPostgresSensor):
 class CustomPostgresValueCheckSensor(CustomPostgresSensor):
     """
     Sensor that checks if a value from a PostgreSQL query matches an expected value.
+
+    With deferrable=True the sensor checks once on the worker and then waits in
+    the triggerer, where it re-checks whenever notify_channel receives a NOTIFY
+    (optionally only payloads matching notify_payload_pattern) and otherwise
+    every fallback_poll_interval seconds.
     """
 
     @apply_defaults
@@ -308,6 +360,10 @@ class CustomPostgresValueCheckSensor(CustomPostgresSensor):
             params: Optional[dict] = None,
             fail_on_error: bool = False,
             alert_on_error: bool = False,
+            deferrable: bool = False,
+            notify_channel: Optional[str] = None,
+            notify_payload_pattern: Optional[str] = None,
+            fallback_poll_interval: float = DEFAULT_FALLBACK_POLL_INTERVAL,
             **kwargs: Dict,
     ) -> None:
         """
@@ -322,10 +378,19 @@ class CustomPostgresValueCheckSensor(CustomPostgresSensor):
             params (Optional[dict]): Query parameters.
             fail_on_error (bool): Whether to fail the sensor on error.
             alert_on_error (bool): Whether to send an alert on error.
+            deferrable (bool): Whether to wait in the triggerer instead of on a worker.
+            notify_channel (Optional[str]): Channel the upstream system NOTIFYs on commit;
+                without it the deferred sensor polls at poke_interval.
+            notify_payload_pattern (Optional[str]): Regex a notification payload must contain.
+            fallback_poll_interval (float): Seconds without a matching notification before checking anyway.
             **kwargs (Dict): Additional keyword arguments for BaseSensorOperator.
         """
         self.expected_value = expected_value
         self.exact_match = exact_match
+        self.deferrable = deferrable
+        self.notify_channel = notify_channel
+        self.notify_payload_pattern = notify_payload_pattern
+        self.fallback_poll_interval = fallback_poll_interval
         super().__init__(sql=sql, postgres_conn_id=postgres_conn_id, schema=schema, params=params,
                          fail_on_error=fail_on_error, alert_on_error=alert_on_error, **kwargs)
         logger.info(
@@ -346,7 +411,7 @@ class CustomPostgresValueCheckSensor(CustomPostgresSensor):
         """
         hook = self.get_hook()
         try:
-            records = hook.execute_query(sql=self.sql, parameters=self.params)
+            records = hook.execute_query(sql=self.sql, parameters=self.params, autocommit=True)
             if not records:
                 logger.info("Query returned no records.")
                 return False
@@ -367,7 +432,392 @@ class CustomPostgresValueCheckSensor(CustomPostgresSensor):
         except Exception as e:
             error_message = str(e)
             logger.error(f"Error executing query: {error_message}")
+            self.close_hook()
+            self.send_error_alert(exception=e, context=context)
+            if self.fail_on_error:
+                raise
+            return False
+
+
+    def build_trigger(self) -> PostgresNotifyTrigger:
+        """
+        Build the trigger that continues the wait in the triggerer.
+
+        Returns:
+            PostgresNotifyTrigger: Trigger running the same check.
+        """
+        return PostgresNotifyTrigger(
+            sql=self.sql,
+            expected_value=self.expected_value,
+            exact_match=self.exact_match,
+            # self.params is an Airflow ParamsDict at runtime, which trigger serialization turns into a string
+            parameters=dict(self.params or {}),
+            postgres_conn_id=self.postgres_conn_id,
+            channel=self.notify_channel,
+            payload_pattern=self.notify_payload_pattern,
+            poll_interval=self.fallback_poll_interval if self.notify_channel else self.poke_interval
+        )
+
+    def execute(self, context: Dict) -> Any:
+        """
+        Run the sensor, deferring to the triggerer when deferrable is set.
+
+        Args:
+            context (Dict): Airflow context dictionary.
+        """
+        if not self.deferrable:
+            return super().execute(context)
+
+        # A single check on the worker avoids a round trip through the triggerer
+        # when the value already matches
+        try:
+            if self.poke(context):
+                return None
+        finally:
+            self.close_hook()
+
+        self.defer(
+            trigger=self.build_trigger(),
+            method_name='execute_complete',
+            timeout=timedelta(seconds=self.timeout)
+        )
+
+    def execute_complete(self, context: Dict, event: Dict) -> None:
+        """
+        Resume after the trigger fires.
+
+        Args:
+            context (Dict): Airflow context dictionary.
+            event (Dict): Trigger event payload with status and message.
+
+        Raises:
+            AirflowException: If the trigger reported an error.
+        """
+        if event.get('status') == 'error':
+            logger.error(event['message'])
+            raise AirflowException(event['message'])
+        logger.info(event['message'])
+
+
+def _quote_identifier(name: str) -> str:
+    """
+    Quote a PostgreSQL identifier.
+
+    Args:
+        name (str): Schema or table name.
+
+    Returns:
+        str: Identifier safe to embed in SQL.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _value_matches(actual: Optional[str], expected: Union[str, int, float, bool], exact_match: bool) -> bool:
+    """
+    Compare a value returned as text by the multi-condition query with the expected value.
+
+    Args:
+        actual (Optional[str]): Text value returned by PostgreSQL.
+        expected (Union[str, int, float, bool]): Expected value.
+        exact_match (bool): Whether to perform an exact match or containment check.
+
+    Returns:
+        bool: True if the value matches.
+    """
+    if actual is None:
+        return False
+    if not exact_match:
+        return str(expected) in actual
+    if isinstance(expected, bool):
+        return (actual.lower() in ('t', 'true')) == expected
+    if isinstance(expected, (int, float)):
+        try:
+            return float(actual) == float(expected)
+        except ValueError:
+            return False
+    return actual == str(expected)
+
+
+class CustomPostgresMultiSensor(CustomPostgresSensor, SkipMixin):
+    """
+    Sensor that evaluates many table, row-count and value conditions against
+    one database in a single round trip per poke.
+
+    Conditions are named dicts with a 'type' of 'table_exists' ('table'),
+    'row_count' ('table', 'min_rows', 'where_clause') or 'value' ('sql',
+    'expected_value', 'exact_match'); 'schema' defaults to the sensor's schema.
+    Each poke runs one UNION ALL query over the conditions not met yet, with
+    row counts capped at min_rows, and guards row counts on tables that do not
+    exist yet with a catalog check in the same query. Met conditions are not
+    queried again. They are pushed to XCom as met_conditions for downstream
+    tasks and kept in a Variable keyed by dag_id, run_id and task_id, from
+    which the next try (a reschedule or retry runs on a new operator instance,
+    after Airflow has cleared the task's XComs) restores them. The Variable is
+    deleted once the sensor finishes.
+
+    Downstream tasks can be mapped to conditions with branches. Airflow starts
+    downstream tasks only once the sensor finishes, so branches are released
+    then: with skip_unmet_branches, a timeout with at least one condition met
+    succeeds and skips only the branches whose conditions never became true.
+    """
+
+    template_fields = ('conditions', 'params',)
+
+    @apply_defaults
+    def __init__(
+            self,
+            *,
+            conditions: Dict[str, Dict],
+            branches: Optional[Dict[str, List[str]]] = None,
+            skip_unmet_branches: bool = False,
+            postgres_conn_id: str = DEFAULT_POSTGRES_CONN_ID,
+            schema: str = DEFAULT_SCHEMA,
+            fail_on_error: bool = False,
+            alert_on_error: bool = False,
+            **kwargs: Dict,
+    ) -> None:
+        """
+        Initialize the CustomPostgresMultiSensor.
+
+        Args:
+            conditions (Dict[str, Dict]): Conditions to wait for, keyed by name.
+            branches (Optional[Dict[str, List[str]]]): Downstream task IDs released by each condition.
+            skip_unmet_branches (bool): Whether a timeout skips the branches of unmet conditions
+                instead of failing, when at least one condition is met.
+            postgres_conn_id (str): Airflow connection ID for PostgreSQL.
+            schema (str): Default schema for table conditions.
+            fail_on_error (bool): Whether to fail the sensor on error.
+            alert_on_error (bool): Whether to send an alert on error.
+            **kwargs (Dict): Additional keyword arguments for BaseSensorOperator.
+
+        Raises:
+            AirflowException: If a condition is invalid or a branch names an unknown condition.
+        """
+        if not conditions:
+            raise AirflowException("CustomPostgresMultiSensor requires at least one condition")
+        for name, condition in conditions.items():
+            condition_type = condition.get('type')
+            if condition_type not in MULTI_CONDITION_TYPES:
+                raise AirflowException(
+                    f"Condition '{name}' has invalid type '{condition_type}'; expected one of {MULTI_CONDITION_TYPES}"
+                )
+            required = 'sql' if condition_type == 'value' else 'table'
+            if not condition.get(required):
+                raise AirflowException(f"Condition '{name}' of type '{condition_type}' requires '{required}'")
+        unknown = set(branches or {}) - set(conditions)
+        if unknown:
+            raise AirflowException(f"Branches reference unknown conditions: {sorted(unknown)}")
+
+        self.conditions = conditions
+        self.branches = branches or {}
+        self.skip_unmet_branches = skip_unmet_branches
+        self._met: Set[str] = set()
+        self._existing_tables: Set[Tuple[str, str]] = set()
+
+        super().__init__(sql='', postgres_conn_id=postgres_conn_id, schema=schema,
+                         fail_on_error=fail_on_error, alert_on_error=alert_on_error, **kwargs)
+        logger.info(f"Initializing CustomPostgresMultiSensor with {len(conditions)} conditions")
+
+    def _table_of(self, condition: Dict) -> Tuple[str, str]:
+        return condition.get('schema') or self.schema, condition['table']
+
+    def _build_query(self, pending: List[str]) -> Tuple[str, Dict]:
+        """
+        Build one UNION ALL query over the pending conditions.
+
+        Row counts on tables not known to exist are replaced by a catalog check
+        of the table, so a missing table cannot fail the whole query.
+
+        Args:
+            pending (List[str]): Names of the conditions not met yet.
+
+        Returns:
+            Tuple[str, Dict]: SQL returning (kind, name, value) rows, and its parameters.
+        """
+        parts = []
+        parameters = {}
+        checked_tables = set()
+
+        def exists_sql(index: int, table: Tuple[str, str]) -> str:
+            parameters[f'schema_{index}'], parameters[f'table_{index}'] = table
+            return (
+                f"EXISTS (SELECT 1 FROM pg_catalog.pg_class c "
+                f"JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+                f"WHERE n.nspname = %(schema_{index})s AND c.relname = %(table_{index})s AND c.relkind = 'r')"
+            )
+
+        # User SQL is embedded in a parameterized query, so literal percent signs are escaped
+        for index, name in enumerate(pending):
+            condition = self.conditions[name]
+            condition_type = condition['type']
+            parameters[f'name_{index}'] = name
+
+            if condition_type == 'table_exists':
+                value_sql = exists_sql(index, self._table_of(condition))
+            elif condition_type == 'row_count':
+                table = self._table_of(condition)
+                if table not in self._existing_tables:
+                    if table not in checked_tables:
+                        checked_tables.add(table)
+                        parts.append(f"SELECT 'table', %(name_{index})s, ({exists_sql(index, table)})::text")
+                    continue
+                where_clause = (condition.get('where_clause') or '').replace('%', '%%')
+                min_rows = int(condition.get('min_rows', 1))
+                # Stop counting once min_rows is reached
+                value_sql = (
+                    f"SELECT COUNT(*) FROM (SELECT 1 FROM {_quote_identifier(table[0])}.{_quote_identifier(table[1])}"
+                    f"{f' WHERE {where_clause}' if where_clause else ''} LIMIT {min_rows}) AS capped"
+                )
+            else:
+                value_sql = (
+                    f"SELECT value::text FROM ({condition['sql'].strip().rstrip(';').replace('%', '%%')}) "
+                    f"AS result(value) LIMIT 1"
+                )
+
+            parts.append(f"SELECT 'condition', %(name_{index})s, ({value_sql})::text")
+
+        return "\nUNION ALL\n".join(parts), parameters
+
+    def _met_variable_key(self, context: Dict) -> Optional[str]:
+        dag_run = context.get('dag_run')
+        run_id = context.get('run_id') or getattr(dag_run, 'run_id', None)
+        if not self.dag_id or not isinstance(run_id, str):
+            return None
+        return f"{MET_CONDITIONS_VARIABLE_PREFIX}.{self.dag_id}.{run_id}.{self.task_id}"
+
+    def _restore_met(self, context: Dict) -> None:
+        """
+        Restore the conditions met by a previous try of this task instance.
+
+        Args:
+            context (Dict): Airflow context dictionary.
+        """
+        key = self._met_variable_key(context)
+        if key is None:
+            return
+        try:
+            previous = Variable.get(key, default_var=None, deserialize_json=True) or []
+        except Exception as e:
+            logger.warning(f"Failed to read met conditions from Variable '{key}': {str(e)}")
+            return
+        restored = {name for name in previous if name in self.conditions} - self._met
+        if restored:
+            logger.info(f"Restored conditions met by a previous try: {sorted(restored)}")
+            self._met.update(restored)
+
+    def _save_met(self, context: Dict) -> None:
+        key = self._met_variable_key(context)
+        if key is None:
+            return
+        try:
+            Variable.set(key, sorted(self._met), serialize_json=True)
+        except Exception as e:
+            logger.warning(f"Failed to save met conditions to Variable '{key}': {str(e)}")
+
+    def _clear_met(self, context: Dict) -> None:
+        key = self._met_variable_key(context)
+        if key is None:
+            return
+        try:
+            Variable.delete(key)
+        except Exception as e:
+            logger.warning(f"Failed to delete Variable '{key}': {str(e)}")
+
+    def _is_met(self, name: str, value: Optional[str]) -> bool:
+        condition = self.conditions[name]
+        if condition['type'] == 'table_exists':
+            return value == 'true'
+        if condition['type'] == 'row_count':
+            return value is not None and int(value) >= int(condition.get('min_rows', 1))
+        return _value_matches(value, condition.get('expected_value'), condition.get('exact_match', True))
+
+    @apply_defaults
+    def poke(self, context: Dict) -> bool:
+        """
+        Evaluate every pending condition in one query.
+
+        Args:
+            context (Dict): Airflow context dictionary.
+
+        Returns:
+            bool: True once all conditions are met, False otherwise.
+        """
+        hook = self.get_hook()
+        try:
+            while True:
+                pending = [name for name in self.conditions if name not in self._met]
+                if not pending:
+                    break
+                sql, parameters = self._build_query(pending)
+                records = hook.execute_query(sql=sql, parameters=parameters, autocommit=True)
+
+                new_tables = False
+                newly_met = False
+                for kind, name, value in records:
+                    if kind == 'table':
+                        if value == 'true':
+                            self._existing_tables.add(self._table_of(self.conditions[name]))
+                            new_tables = True
+                    elif self._is_met(name, value):
+                        logger.info(f"Condition '{name}' met")
+                        self._met.add(name)
+                        newly_met = True
+                if newly_met:
+                    self._save_met(context)
+                # Count rows of tables that just appeared without waiting for the next poke
+                if not new_tables:
+                    break
+        except Exception as e:
+            error_message = str(e)
+            logger.error(f"Error executing query: {error_message}")
+            self.close_hook()
             self.send_error_alert(exception=e, context=context)
             if self.fail_on_error:
                 raise
-            return False
\ No newline at end of file
+            return False
+
+        met = sorted(self._met)
+        if context.get('ti') is not None:
+            context['ti'].xcom_push(key='met_conditions', value=met)
+        logger.info(f"{len(met)} of {len(self.conditions)} conditions met: {met}")
+        return len(met) == len(self.conditions)
+
+    def execute(self, context: Dict) -> List[str]:
+        """
+        Wait for the conditions, then release the branches of met conditions.
+
+        Args:
+            context (Dict): Airflow context dictionary.
+
+        Returns:
+            List[str]: Names of the met conditions.
+        """
+        self._restore_met(context)
+        try:
+            super().execute(context)
+        except AirflowSensorTimeout:
+            # A timeout is not retried, so the saved state is no longer needed
+            self._clear_met(context)
+            if not (self.skip_unmet_branches and self._met):
+                raise
+            logger.warning(
+                f"Sensor timed out with conditions {sorted(set(self.conditions) - self._met)} unmet; "
+                f"skipping their branches"
+            )
+        else:
+            self._clear_met(context)
+
+        released = {task_id for name in self._met for task_id in self.branches.get(name, [])}
+        skipped = {
+            task_id
+            for name, task_ids in self.branches.items() if name not in self._met
+            for task_id in task_ids
+        } - released
+        if skipped:
+            logger.info(f"Skipping branches of unmet conditions: {sorted(skipped)}")
+            self.skip(
+                context['dag_run'],
+                context['ti'].execution_date,
+                [self.dag.get_task(task_id) for task_id in sorted(skipped)]
+            )
+        return sorted(self._met)
@@ -0,0 +1,42 @@
+"""
+Custom triggers package for Apache Airflow 2.X.
+
+Triggers run in the Airflow triggerer and back the deferrable mode of the
+custom sensors, so long waits do not hold a worker slot.
+"""
+
+import logging
+
+# Import GCP triggers
+from .custom_gcp_trigger import (
+    GCPPollingTrigger,
+    GCSObjectTrigger,
+    GCSPrefixTrigger,
+    BigQueryTableTrigger,
+    BigQueryJobTrigger,
+    get_shared_session,
+)
+
+# Import HTTP triggers
+from .custom_http_trigger import HttpSensorTrigger
+
+# Import PostgreSQL triggers
+from .custom_postgres_trigger import PostgresNotifyTrigger
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Define all exported components
+__all__ = [
+    # GCP Triggers
+    'GCPPollingTrigger',
+    'GCSObjectTrigger',
+    'GCSPrefixTrigger',
+    'BigQueryTableTrigger',
+    'BigQueryJobTrigger',
+    'get_shared_session',
+    # HTTP Triggers
+    'HttpSensorTrigger',
+    # PostgreSQL Triggers
+    'PostgresNotifyTrigger',
+]
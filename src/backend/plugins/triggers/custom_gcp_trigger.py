@@ -0,0 +1,466 @@
+"""
+Asyncio triggers backing the deferrable mode of the custom GCP sensors.
+
+Triggers run in the Airflow triggerer, which executes every deferred task on a
+single event loop. All triggers in this module talk to the GCS and BigQuery
+JSON APIs through one shared aiohttp session per event loop and one cached set
+of credentials per connection, so thousands of concurrent waits cost a handful
+of pooled connections rather than a worker slot each:
+- GCSObjectTrigger: Waits for a GCS object to exist
+- GCSPrefixTrigger: Waits for a minimum number of GCS objects under a prefix
+- BigQueryTableTrigger: Waits for a BigQuery table to exist
+- BigQueryJobTrigger: Waits for one or more BigQuery jobs to finish, sharing
+  one job listing per project and poll cycle with the other job triggers
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+# Airflow imports
+from airflow.exceptions import AirflowException  # airflow v2.0.0+
+from airflow.triggers.base import BaseTrigger, TriggerEvent  # airflow v2.2.0+
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Global constants
+DEFAULT_GCP_CONN_ID = 'google_cloud_default'
+DEFAULT_POLL_INTERVAL = 60.0
+SESSION_CONNECTION_LIMIT = 100
+SESSION_REQUEST_TIMEOUT = 30
+GCS_API_URL = 'https://storage.googleapis.com/storage/v1'
+BIGQUERY_API_URL = 'https://bigquery.googleapis.com/bigquery/v2'
+# Client errors worth retrying: an expired token (the cached credentials are
+# dropped on 401), a request timeout and rate limiting
+RETRYABLE_CLIENT_STATUSES = (401, 408, 429)
+
+# Shared aiohttp sessions keyed by event loop, and credentials keyed by connection ID
+_shared_sessions: Dict[int, Any] = {}
+_credentials_cache: Dict[str, Any] = {}
+_credentials_locks: Dict[str, asyncio.Lock] = {}
+# BigQuery job listings and job states shared by job triggers for one poll cycle,
+# keyed by event loop and request, with the loop time they expire
+_job_sweeps: Dict[Tuple, Tuple[float, asyncio.Task]] = {}
+
+
+def get_shared_session() -> Any:
+    """
+    Get the aiohttp session shared by all triggers on the running event loop.
+
+    Returns:
+        aiohttp.ClientSession bound to the current event loop
+
+    Raises:
+        AirflowException: If aiohttp is not installed
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        raise AirflowException("aiohttp is required for deferrable sensors")
+
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.get(id(loop))
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=SESSION_CONNECTION_LIMIT),
+            timeout=aiohttp.ClientTimeout(total=SESSION_REQUEST_TIMEOUT)
+        )
+        _shared_sessions[id(loop)] = session
+    return session
+
+
+async def get_access_token(gcp_conn_id: str) -> str:
+    """
+    Get an OAuth access token for a connection, refreshing it only when expired.
+
+    Credential loading and refresh are blocking calls, so they run in the default
+    executor; a per-connection lock keeps concurrent triggers from refreshing the
+    same token at once.
+
+    Args:
+        gcp_conn_id: Airflow connection ID for GCP
+
+    Returns:
+        Access token string
+    """
+    lock = _credentials_locks.setdefault(gcp_conn_id, asyncio.Lock())
+    async with lock:
+        credentials = _credentials_cache.get(gcp_conn_id)
+        loop = asyncio.get_running_loop()
+
+        if credentials is None:
+            from airflow.providers.google.common.hooks.base_google import GoogleBaseHook
+            credentials = await loop.run_in_executor(
+                None, lambda: GoogleBaseHook(gcp_conn_id=gcp_conn_id).get_credentials()
+            )
+            _credentials_cache[gcp_conn_id] = credentials
+
+        if not credentials.valid:
+            from google.auth.transport.requests import Request
+            await loop.run_in_executor(None, credentials.refresh, Request())
+
+        return credentials.token
+
+
+def invalidate_access_token(gcp_conn_id: str) -> None:
+    """
+    Drop cached credentials for a connection so the next request reloads them.
+
+    Args:
+        gcp_conn_id: Airflow connection ID for GCP
+    """
+    _credentials_cache.pop(gcp_conn_id, None)
+
+
+async def shared_poll(key: Tuple, max_age: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run a poll request, or join the same request started by another trigger within max_age.
+
+    Args:
+        key: Identifies the request across triggers
+        max_age: Seconds the result is shared (the poll interval)
+        fetch: Coroutine function making the request
+
+    Returns:
+        Result of fetch()
+    """
+    loop = asyncio.get_running_loop()
+    now = loop.time()
+    key = (id(loop),) + key
+    shared = _job_sweeps.get(key)
+    if shared is None or now >= shared[0]:
+        for expired in [k for k, (expires_at, task) in _job_sweeps.items() if now >= expires_at and task.done()]:
+            del _job_sweeps[expired]
+        shared = (now + max_age, loop.create_task(fetch()))
+        _job_sweeps[key] = shared
+    # Shield the shared request so one trigger's cancellation does not cancel it for the others
+    return await asyncio.shield(shared[1])
+
+
+class GCPPollingTrigger(BaseTrigger):
+    """
+    Base trigger that polls a GCP JSON API endpoint until a condition is met.
+
+    Subclasses implement check(), which returns an event payload once the wait
+    is over or None to keep polling. Transient request errors, rate limiting
+    and server errors are logged and retried on the next interval; a client
+    error such as a missing permission or an unknown job ends the wait with an
+    error event, as it fails the sensor in poke mode.
+
+    Args:
+        gcp_conn_id: The connection ID to use for GCP authentication
+        poll_interval: Seconds to wait between checks
+    """
+
+    def __init__(self, gcp_conn_id: str = DEFAULT_GCP_CONN_ID,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        super().__init__()
+        self.gcp_conn_id = gcp_conn_id
+        self.poll_interval = poll_interval
+
+    def _serialize_kwargs(self) -> Dict:
+        return {'gcp_conn_id': self.gcp_conn_id, 'poll_interval': self.poll_interval}
+
+    def serialize(self) -> Tuple[str, Dict]:
+        """
+        Serialize the trigger so the triggerer can recreate it.
+
+        Returns:
+            Tuple of the trigger classpath and its keyword arguments
+        """
+        return f"{self.__class__.__module__}.{self.__class__.__name__}", self._serialize_kwargs()
+
+    async def get_json(self, url: str, params: Optional[Dict] = None) -> Tuple[int, Dict]:
+        """
+        GET a GCP API URL with the shared session.
+
+        Args:
+            url: API URL to request
+            params: Optional query parameters
+
+        Returns:
+            Tuple of HTTP status code and decoded JSON body ({} for errors)
+        """
+        token = await get_access_token(self.gcp_conn_id)
+        session = get_shared_session()
+        async with session.get(url, params=params, headers={'Authorization': f"Bearer {token}"}) as response:
+            if response.status == 401:
+                invalidate_access_token(self.gcp_conn_id)
+            if response.status != 200:
+                return response.status, {}
+            return response.status, await response.json()
+
+    @staticmethod
+    def request_failure(status: int, target: str) -> Optional[Dict]:
+        """
+        Build the error event for a response that retrying cannot fix.
+
+        Args:
+            status: HTTP status code of a non-200 response
+            target: What was requested, for the error message
+
+        Returns:
+            Error event payload for 4xx responses other than RETRYABLE_CLIENT_STATUSES,
+            None to retry on the next poll
+        """
+        if status < 400 or status >= 500 or status in RETRYABLE_CLIENT_STATUSES:
+            return None
+        return {'status': 'error', 'message': f"Request for {target} failed with HTTP status {status}"}
+
+    async def check(self) -> Optional[Dict]:
+        """
+        Check the awaited condition once.
+
+        Returns:
+            Event payload if the wait is over, None to keep polling
+        """
+        raise NotImplementedError
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        """
+        Poll until check() returns a payload, then fire it as the trigger event.
+        """
+        while True:
+            try:
+                payload = await self.check()
+            except Exception as e:
+                logger.warning(f"{self.__class__.__name__} check failed, retrying: {str(e)}")
+                payload = None
+
+            if payload is not None:
+                yield TriggerEvent(payload)
+                return
+
+            await asyncio.sleep(self.poll_interval)
+
+
+class GCSObjectTrigger(GCPPollingTrigger):
+    """
+    Trigger that fires once an object exists in a GCS bucket.
+
+    Args:
+        bucket_name: The GCS bucket where the object should exist
+        object_name: The name of the object to wait for
+        gcp_conn_id: The connection ID to use for GCP authentication
+        poll_interval: Seconds to wait between checks
+    """
+
+    def __init__(self, bucket_name: str, object_name: str,
+                 gcp_conn_id: str = DEFAULT_GCP_CONN_ID,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        super().__init__(gcp_conn_id=gcp_conn_id, poll_interval=poll_interval)
+        self.bucket_name = bucket_name
+        self.object_name = object_name
+
+    def _serialize_kwargs(self) -> Dict:
+        kwargs = super()._serialize_kwargs()
+        kwargs.update({'bucket_name': self.bucket_name, 'object_name': self.object_name})
+        return kwargs
+
+    async def check(self) -> Optional[Dict]:
+        url = f"{GCS_API_URL}/b/{self.bucket_name}/o/{quote(self.object_name, safe='')}"
+        status, _ = await self.get_json(url, params={'fields': 'name'})
+        if status == 200:
+            return {'status': 'success', 'message': f"File gs://{self.bucket_name}/{self.object_name} exists"}
+        if status == 404:
+            return None
+        return self.request_failure(status, f"gs://{self.bucket_name}/{self.object_name}")
+
+
+class GCSPrefixTrigger(GCPPollingTrigger):
+    """
+    Trigger that fires once enough objects exist under a GCS prefix.
+
+    Listing stops as soon as min_objects have been seen, so large prefixes are
+    not paged through in full on every check.
+
+    Args:
+        bucket_name: The GCS bucket to check
+        prefix: The object prefix to filter by
+        min_objects: The minimum number of objects that should exist
+        delimiter: Delimiter for hierarchical listing
+        gcp_conn_id: The connection ID to use for GCP authentication
+        poll_interval: Seconds to wait between checks
+    """
+
+    def __init__(self, bucket_name: str, prefix: str, min_objects: int = 1,
+                 delimiter: Optional[str] = None,
+                 gcp_conn_id: str = DEFAULT_GCP_CONN_ID,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        super().__init__(gcp_conn_id=gcp_conn_id, poll_interval=poll_interval)
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self.min_objects = min_objects
+        self.delimiter = delimiter
+
+    def _serialize_kwargs(self) -> Dict:
+        kwargs = super()._serialize_kwargs()
+        kwargs.update({
+            'bucket_name': self.bucket_name,
+            'prefix': self.prefix,
+            'min_objects': self.min_objects,
+            'delimiter': self.delimiter
+        })
+        return kwargs
+
+    async def check(self) -> Optional[Dict]:
+        params = {'prefix': self.prefix, 'fields': 'items(name),prefixes,nextPageToken'}
+        if self.delimiter:
+            params['delimiter'] = self.delimiter
+
+        count = 0
+        while True:
+            status, body = await self.get_json(f"{GCS_API_URL}/b/{self.bucket_name}/o", params=params)
+            if status != 200:
+                return self.request_failure(status, f"gs://{self.bucket_name}/{self.prefix}")
+            count += len(body.get('items', [])) + len(body.get('prefixes', []))
+            if count >= self.min_objects:
+                return {
+                    'status': 'success',
+                    'message': f"Found at least {self.min_objects} objects in gs://{self.bucket_name}/{self.prefix}"
+                }
+            if not body.get('nextPageToken'):
+                return None
+            params['pageToken'] = body['nextPageToken']
+
+
+class BigQueryTableTrigger(GCPPollingTrigger):
+    """
+    Trigger that fires once a BigQuery table exists.
+
+    Args:
+        project_id: The GCP project ID containing the table
+        dataset_id: The BigQuery dataset ID
+        table_id: The BigQuery table ID
+        gcp_conn_id: The connection ID to use for GCP authentication
+        poll_interval: Seconds to wait between checks
+    """
+
+    def __init__(self, project_id: str, dataset_id: str, table_id: str,
+                 gcp_conn_id: str = DEFAULT_GCP_CONN_ID,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        super().__init__(gcp_conn_id=gcp_conn_id, poll_interval=poll_interval)
+        self.project_id = project_id
+        self.dataset_id = dataset_id
+        self.table_id = table_id
+
+    def _serialize_kwargs(self) -> Dict:
+        kwargs = super()._serialize_kwargs()
+        kwargs.update({
+            'project_id': self.project_id,
+            'dataset_id': self.dataset_id,
+            'table_id': self.table_id
+        })
+        return kwargs
+
+    async def check(self) -> Optional[Dict]:
+        url = (f"{BIGQUERY_API_URL}/projects/{self.project_id}"
+               f"/datasets/{self.dataset_id}/tables/{self.table_id}")
+        status, _ = await self.get_json(url, params={'fields': 'id'})
+        if status == 200:
+            return {
+                'status': 'success',
+                'message': f"Table {self.project_id}.{self.dataset_id}.{self.table_id} exists"
+            }
+        if status == 404:
+            return None
+        return self.request_failure(status, f"table {self.project_id}.{self.dataset_id}.{self.table_id}")
+
+
+class BigQueryJobTrigger(GCPPollingTrigger):
+    """
+    Trigger that fires once every listed BigQuery job has finished.
+
+    Fires an error event as soon as any job fails, so the sensor fails without
+    waiting for the remaining jobs. Job triggers on the same event loop share
+    one jobs.list call per connection, project and poll cycle for the running
+    and pending jobs; only jobs missing from it (finished, or submitted by
+    another principal) are fetched individually, and those fetches are shared
+    too.
+
+    Args:
+        jobs: List of job references (dicts with job_id, project and location)
+        gcp_conn_id: The connection ID to use for GCP authentication
+        poll_interval: Seconds to wait between checks
+    """
+
+    def __init__(self, jobs: List[Dict], gcp_conn_id: str = DEFAULT_GCP_CONN_ID,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        super().__init__(gcp_conn_id=gcp_conn_id, poll_interval=poll_interval)
+        self.jobs = jobs
+        self._finished_jobs = set()
+
+    def _serialize_kwargs(self) -> Dict:
+        kwargs = super()._serialize_kwargs()
+        kwargs['jobs'] = self.jobs
+        return kwargs
+
+    async def _list_active_jobs(self, project: str) -> Optional[Set[str]]:
+        params = [
+            ('stateFilter', 'running'),
+            ('stateFilter', 'pending'),
+            ('projection', 'minimal'),
+            ('maxResults', '1000'),
+            ('fields', 'jobs(jobReference/jobId),nextPageToken')
+        ]
+        active = set()
+        while True:
+            status, body = await self.get_json(f"{BIGQUERY_API_URL}/projects/{project}/jobs", params=params)
+            if status != 200:
+                # Fall back to fetching every job for this cycle
+                logger.warning(f"Failed to list active BigQuery jobs in {project} (status {status})")
+                return None
+            active.update(job['jobReference']['jobId'] for job in body.get('jobs', []))
+            if not body.get('nextPageToken'):
+                return active
+            params = [param for param in params if param[0] != 'pageToken'] + [('pageToken', body['nextPageToken'])]
+
+    async def _get_job_state(self, ref: Dict) -> Tuple[str, Optional[Dict]]:
+        url = f"{BIGQUERY_API_URL}/projects/{ref['project']}/jobs/{ref['job_id']}"
+        status, body = await self.get_json(
+            url, params={'location': ref['location'], 'fields': 'status'}
+        )
+        if status != 200:
+            # A wrong job ID (404) or a missing permission (403) would never resolve
+            failure = self.request_failure(status, f"BigQuery job {ref['job_id']}")
+            return ('REQUEST_FAILED', failure) if failure else ('UNKNOWN', None)
+        job_status = body.get('status', {})
+        return job_status.get('state', 'UNKNOWN'), job_status.get('errorResult')
+
+    async def _job_state(self, ref: Dict, active: Optional[Set[str]]) -> Tuple[str, Optional[Dict]]:
+        if active is not None and ref['job_id'] in active:
+            return 'RUNNING', None
+        return await shared_poll(
+            ('job', self.gcp_conn_id, ref['project'], ref['location'], ref['job_id']),
+            self.poll_interval,
+            lambda: self._get_job_state(ref)
+        )
+
+    async def check(self) -> Optional[Dict]:
+        pending = [ref for ref in self.jobs if ref['job_id'] not in self._finished_jobs]
+        projects = sorted({ref['project'] for ref in pending})
+        listings = await asyncio.gather(*(
+            shared_poll(('list', self.gcp_conn_id, project), self.poll_interval,
+                        lambda project=project: self._list_active_jobs(project))
+            for project in projects
+        ))
+        active = dict(zip(projects, listings))
+        results = await asyncio.gather(*(self._job_state(ref, active[ref['project']]) for ref in pending))
+
+        for ref, (state, error_result) in zip(pending, results):
+            if state == 'REQUEST_FAILED':
+                return error_result
+            if state != 'DONE':
+                continue
+            if error_result:
+                return {
+                    'status': 'error',
+                    'message': f"BigQuery job {ref['job_id']} failed: {error_result}"
+                }
+            self._finished_jobs.add(ref['job_id'])
+
+        if len(self._finished_jobs) == len(self.jobs):
+            return {'status': 'success', 'message': f"All {len(self.jobs)} BigQuery jobs completed successfully"}
+        return None
@@ -0,0 +1,313 @@
+"""
+Asyncio trigger backing the deferrable mode of the custom HTTP sensors.
+
+Deferred HTTP sensors wait in the Airflow triggerer instead of holding a worker
+slot. Every trigger sends its requests through the aiohttp session shared by
+all custom triggers on the triggerer's event loop, connection settings are
+resolved once per connection and SESSION_CACHE_TTL, polls are jittered so sensors deferred together
+do not hit an API in lockstep, and sensors polling the same request can share
+one response per poll cycle:
+- HttpSensorTrigger: Polls an endpoint until its status, body pattern or
+  JSONPath condition is met
+"""
+
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+# Airflow imports
+from airflow.exceptions import AirflowException  # airflow v2.0.0+
+from airflow.triggers.base import BaseTrigger, TriggerEvent  # airflow v2.2.0+
+
+# Internal imports
+from .custom_gcp_trigger import get_shared_session
+from ..hooks.custom_http_hook import HOOK_EXTRA_KEYS, SESSION_CACHE_TTL, compile_jsonpath
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Global constants
+DEFAULT_HTTP_CONN_ID = 'http_default'
+DEFAULT_POLL_INTERVAL = 60.0
+DEFAULT_JITTER = 0.1  # Fraction of the poll interval added or removed at random
+
+# Connection settings keyed by connection ID, and shared responses (expiry, request) keyed by request
+_connection_settings: Dict[str, Dict] = {}
+_connection_locks: Dict[str, asyncio.Lock] = {}
+_shared_responses: Dict[Tuple[int, str], Tuple[float, asyncio.Task]] = {}
+
+
+class SharedResponse:
+    """
+    Status and body of a polled response, shared by every trigger polling the
+    same request within a batch window.
+    """
+
+    def __init__(self, status: int, text: str):
+        self.status = status
+        self.text = text
+        self._json = None
+
+    def json(self) -> Any:
+        """
+        Decode the body as JSON, once for all triggers sharing the response.
+
+        Returns:
+            Decoded JSON body
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if self._json is None:
+            self._json = json.loads(self.text)
+        return self._json
+
+
+async def get_connection_settings(http_conn_id: str) -> Dict:
+    """
+    Resolve the base URL, headers and authentication of an HTTP connection.
+
+    Settings are cached for SESSION_CACHE_TTL seconds, like the hook's sessions,
+    so rotated credentials are picked up by long-running triggers. The
+    connection lookup is a blocking call, so it runs in the default executor;
+    a per-connection lock keeps concurrent triggers from resolving it at once.
+
+    Args:
+        http_conn_id: Airflow connection ID for the HTTP API
+
+    Returns:
+        Dict with base_url, headers and auth (aiohttp.BasicAuth or None)
+    """
+    lock = _connection_locks.setdefault(http_conn_id, asyncio.Lock())
+    async with lock:
+        settings = _connection_settings.get(http_conn_id)
+        if settings is not None and time.monotonic() - settings['created'] <= SESSION_CACHE_TTL:
+            return settings
+
+        import aiohttp
+        from airflow.hooks.base import BaseHook
+        loop = asyncio.get_running_loop()
+        conn = await loop.run_in_executor(None, BaseHook.get_connection, http_conn_id)
+
+        # Same base URL rules as HttpHook.get_conn
+        host = conn.host or ''
+        base_url = host if '://' in host else f"{conn.schema or 'http'}://{host}"
+        if conn.port:
+            base_url = f"{base_url}:{conn.port}"
+
+        extras = conn.extra_dejson or {}
+        headers = {key: str(value) for key, value in extras.items() if key not in HOOK_EXTRA_KEYS}
+        if extras.get('oauth_token'):
+            headers['Authorization'] = f"{extras.get('token_type', 'Bearer')} {extras['oauth_token']}"
+
+        settings = {
+            'base_url': base_url,
+            'headers': headers,
+            'auth': aiohttp.BasicAuth(conn.login, conn.password or '') if conn.login else None,
+            'created': time.monotonic()
+        }
+        _connection_settings[http_conn_id] = settings
+        return settings
+
+
+def _prune_shared_responses(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Drop shared responses whose batch window has passed, or that belong to
+    another event loop, once their request has finished.
+
+    Args:
+        loop: The running event loop
+    """
+    now = loop.time()
+    for key, (expires_at, task) in list(_shared_responses.items()):
+        if task.done() and (key[0] != id(loop) or now >= expires_at):
+            del _shared_responses[key]
+
+
+class HttpSensorTrigger(BaseTrigger):
+    """
+    Trigger that polls an HTTP endpoint until a response meets the sensor's condition.
+
+    The condition mirrors the synchronous sensors: a successful (2xx) response,
+    or one of expected_status_codes when given, whose body contains pattern
+    and whose JSONPath json_path matches expected_value (or anything when
+    expected_value is None). Request errors are logged and retried on the
+    next poll.
+
+    Args:
+        endpoint: The relative URL to poll
+        http_conn_id: Airflow connection ID for the HTTP connection
+        method: HTTP method to use
+        headers: HTTP headers to send with the request
+        params: Query parameters to include in the request
+        data: Request payload for POST/PUT methods, sent like HttpHook.run sends it
+            (a dict form-encoded, a string as the raw body)
+        pattern: Regex pattern the response text must contain
+        json_path: JSONPath expression evaluated against the JSON response
+        expected_value: Value json_path must match
+        expected_status_codes: Status codes that satisfy the wait
+        poll_interval: Seconds between polls
+        jitter: Fraction of poll_interval randomly added to or removed from each wait
+        batch_window: Seconds a response is shared with other triggers polling
+            the same request (0 disables sharing)
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        http_conn_id: str = DEFAULT_HTTP_CONN_ID,
+        method: str = 'GET',
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        pattern: Optional[str] = None,
+        json_path: Optional[str] = None,
+        expected_value: Any = None,
+        expected_status_codes: Optional[List[int]] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        jitter: float = DEFAULT_JITTER,
+        batch_window: float = 0.0,
+    ) -> None:
+        super().__init__()
+        self.endpoint = endpoint
+        self.http_conn_id = http_conn_id
+        self.method = method
+        self.headers = headers or {}
+        self.params = params or {}
+        self.data = data or {}
+        self.pattern = pattern
+        self.json_path = json_path
+        self.expected_value = expected_value
+        self.expected_status_codes = expected_status_codes
+        self.poll_interval = poll_interval
+        self.jitter = jitter
+        self.batch_window = batch_window
+
+    def serialize(self) -> Tuple[str, Dict]:
+        """
+        Serialize the trigger so the triggerer can recreate it.
+
+        Returns:
+            Tuple of the trigger classpath and its keyword arguments
+        """
+        return f"{self.__class__.__module__}.{self.__class__.__name__}", {
+            'endpoint': self.endpoint,
+            'http_conn_id': self.http_conn_id,
+            'method': self.method,
+            'headers': self.headers,
+            'params': self.params,
+            'data': self.data,
+            'pattern': self.pattern,
+            'json_path': self.json_path,
+            'expected_value': self.expected_value,
+            'expected_status_codes': self.expected_status_codes,
+            'poll_interval': self.poll_interval,
+            'jitter': self.jitter,
+            'batch_window': self.batch_window,
+        }
+
+    def _request_key(self) -> str:
+        return json.dumps(
+            [self.http_conn_id, self.method, self.endpoint, self.headers, self.params, self.data],
+            sort_keys=True, default=str
+        )
+
+    async def _request(self) -> SharedResponse:
+        settings = await get_connection_settings(self.http_conn_id)
+        url = f"{settings['base_url'].rstrip('/')}/{self.endpoint.lstrip('/')}"
+        # Send the body the way HttpHook.run does: form-encoded for a dict, raw for a string
+        kwargs = {'params': self.params} if self.method == 'GET' else {'params': self.params, 'data': self.data}
+        if self.method == 'GET' and self.data:
+            kwargs['params'] = {**self.data, **self.params}
+        elif isinstance(self.data, (str, bytes)):
+            # requests sends a raw body without a Content-Type, where aiohttp would add one
+            kwargs['skip_auto_headers'] = ('Content-Type',)
+
+        session = get_shared_session()
+        async with session.request(
+            self.method,
+            url,
+            headers={**settings['headers'], **self.headers},
+            auth=settings['auth'],
+            **kwargs
+        ) as response:
+            return SharedResponse(response.status, await response.text())
+
+    async def fetch(self) -> SharedResponse:
+        """
+        Send the request, or join a response for the same request fetched by
+        another trigger within batch_window.
+
+        Returns:
+            Response status and body
+        """
+        if not self.batch_window:
+            return await self._request()
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), self._request_key())
+        shared = _shared_responses.get(key)
+        if shared is None or loop.time() >= shared[0]:
+            _prune_shared_responses(loop)
+            shared = (loop.time() + self.batch_window, loop.create_task(self._request()))
+            _shared_responses[key] = shared
+        # Shield the shared request so one trigger's cancellation does not cancel it for the others
+        return await asyncio.shield(shared[1])
+
+    def check(self, response: SharedResponse) -> bool:
+        """
+        Evaluate the sensor condition against a response.
+
+        Args:
+            response: Polled response
+
+        Returns:
+            True if the condition is met
+        """
+        if self.expected_status_codes:
+            if response.status not in self.expected_status_codes:
+                return False
+        elif not 200 <= response.status < 300:
+            return False
+
+        if self.pattern and not re.search(self.pattern, response.text):
+            return False
+
+        if self.json_path:
+            matches = [match.value for match in compile_jsonpath(self.json_path).find(response.json())]
+            if self.expected_value is not None:
+                return self.expected_value in matches
+            return len(matches) > 0
+        return True
+
+    def _next_wait(self) -> float:
+        return max(0.0, self.poll_interval * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        """
+        Poll until the condition is met, then fire a success event.
+        """
+        # Spread the first poll of sensors deferred at the same moment
+        await asyncio.sleep(random.uniform(0, self.poll_interval * self.jitter))
+        while True:
+            try:
+                response = await self.fetch()
+                if self.check(response):
+                    yield TriggerEvent({
+                        'status': 'success',
+                        'message': f"HTTP condition met for {self.endpoint} (status {response.status})"
+                    })
+                    return
+                logger.debug(f"HTTP condition not met for {self.endpoint} (status {response.status})")
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to evaluate response from {self.endpoint}: {str(e)}")
+            except AirflowException:
+                raise
+            except Exception as e:
+                logger.warning(f"HTTP poll of {self.endpoint} failed, retrying: {str(e)}")
+
+            await asyncio.sleep(self._next_wait())
@@ -0,0 +1,348 @@
+"""
+Asyncio trigger backing the deferrable mode of the custom PostgreSQL sensors.
+
+Instead of polling, deferred Postgres sensors LISTEN for a channel that the
+upstream system NOTIFYs on commit, and re-run their check only when a
+matching notification arrives or a slow fallback poll is due. The triggerer
+holds one asyncpg connection per database connection ID and event loop: every
+trigger waiting on that database shares it for both LISTEN and its checks:
+- PostgresNotifyTrigger: Waits until a query returns an expected value
+"""
+
+import asyncio
+import logging
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+# Airflow imports
+from airflow.exceptions import AirflowException  # airflow v2.0.0+
+from airflow.triggers.base import BaseTrigger, TriggerEvent  # airflow v2.2.0+
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Global constants
+DEFAULT_POSTGRES_CONN_ID = 'postgres_default'
+DEFAULT_FALLBACK_POLL_INTERVAL = 900.0
+RECONNECT_DELAY = 5.0
+
+# Shared listener connections keyed by event loop and connection ID
+_listeners: Dict[Tuple[int, str], 'PostgresListener'] = {}
+_listener_locks: Dict[Tuple[int, str], asyncio.Lock] = {}
+
+
+class PostgresListener:
+    """
+    One asyncpg connection shared by every trigger waiting on a database.
+
+    Notifications are fanned out to a queue per subscribing trigger; a channel
+    is LISTENed while it has at least one subscriber. All operations on the
+    connection are serialized, since asyncpg runs one at a time.
+
+    Args:
+        connection: Open asyncpg connection
+    """
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self._lock = asyncio.Lock()
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    @property
+    def closed(self) -> bool:
+        return self.connection.is_closed()
+
+    def _dispatch(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        for queue in self._subscribers.get(channel, ()):
+            queue.put_nowait(payload)
+
+    async def subscribe(self, channel: str) -> asyncio.Queue:
+        """
+        Start receiving notifications for a channel.
+
+        Args:
+            channel: Notification channel to LISTEN on
+
+        Returns:
+            Queue receiving the payload of every notification on the channel
+        """
+        queue = asyncio.Queue()
+        async with self._lock:
+            subscribers = self._subscribers.setdefault(channel, set())
+            if not subscribers:
+                await self.connection.add_listener(channel, self._dispatch)
+            subscribers.add(queue)
+        return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        """
+        Stop delivering notifications to a queue, UNLISTENing once no trigger needs the channel.
+
+        Args:
+            channel: Notification channel
+            queue: Queue returned by subscribe()
+        """
+        async with self._lock:
+            subscribers = self._subscribers.get(channel, set())
+            subscribers.discard(queue)
+            if not subscribers:
+                self._subscribers.pop(channel, None)
+                if not self.closed:
+                    await self.connection.remove_listener(channel, self._dispatch)
+
+    async def fetch_value(self, sql: str, args: List) -> Tuple[bool, Any]:
+        """
+        Run a query and return the first column of its first row.
+
+        Args:
+            sql: Query using $n placeholders
+            args: Positional query arguments
+
+        Returns:
+            Tuple of whether a row was returned and its first value
+        """
+        async with self._lock:
+            row = await self.connection.fetchrow(sql, *args)
+        return (row is not None), (row[0] if row is not None else None)
+
+
+async def get_listener(postgres_conn_id: str) -> PostgresListener:
+    """
+    Get the listener connection shared by all triggers for a database on the running event loop.
+
+    Args:
+        postgres_conn_id: Airflow connection ID for PostgreSQL
+
+    Returns:
+        Open PostgresListener
+
+    Raises:
+        AirflowException: If asyncpg is not installed
+    """
+    try:
+        import asyncpg
+    except ImportError:
+        raise AirflowException("asyncpg is required for deferrable PostgreSQL sensors")
+
+    loop = asyncio.get_running_loop()
+    key = (id(loop), postgres_conn_id)
+    lock = _listener_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        listener = _listeners.get(key)
+        if listener is None or listener.closed:
+            from airflow.hooks.base import BaseHook
+            conn = await loop.run_in_executor(None, BaseHook.get_connection, postgres_conn_id)
+            extras = conn.extra_dejson or {}
+            connection = await asyncpg.connect(
+                host=conn.host,
+                port=conn.port or 5432,
+                user=conn.login,
+                password=conn.password,
+                database=conn.schema,
+                ssl=extras.get('sslmode')
+            )
+            listener = PostgresListener(connection)
+            _listeners[key] = listener
+            logger.info(f"Opened PostgreSQL listener connection for {postgres_conn_id}")
+        return listener
+
+
+def _is_connection_error(error: Exception, listener: Optional[PostgresListener]) -> bool:
+    """
+    Decide whether a failure means the listener connection was lost, rather
+    than that the query (or the login) failed.
+
+    Args:
+        error: Exception raised while connecting or querying
+        listener: Listener in use when it was raised, if any
+
+    Returns:
+        True if reconnecting may help
+    """
+    import asyncpg
+    if listener is not None and listener.closed:
+        return True
+    # Class 08 connection exceptions and class 57 (e.g. admin shutdown) are transient
+    return isinstance(error, (
+        OSError, asyncio.TimeoutError, asyncpg.PostgresConnectionError, asyncpg.exceptions.OperatorInterventionError
+    ))
+
+
+def to_positional(sql: str, parameters: Optional[Dict]) -> Tuple[str, List]:
+    """
+    Convert a query with psycopg2 %(name)s placeholders to asyncpg $n placeholders.
+
+    Args:
+        sql: Query with pyformat placeholders
+        parameters: Named query parameters
+
+    Returns:
+        Tuple of the converted query and its positional arguments
+    """
+    parameters = parameters or {}
+    args = []
+    positions = {}
+
+    def replace(match):
+        name = match.group(1)
+        if name not in positions:
+            args.append(parameters[name])
+            positions[name] = len(args)
+        return f"${positions[name]}"
+
+    return re.sub(r'%\((\w+)\)s', replace, sql).replace('%%', '%'), args
+
+
+class PostgresNotifyTrigger(BaseTrigger):
+    """
+    Trigger that waits until a query returns an expected value, re-checking on
+    NOTIFY and otherwise polling slowly.
+
+    The check runs once right after LISTEN starts, so a commit that lands
+    before the trigger subscribes is not missed. A burst of notifications
+    causes one check. Connection errors are logged and the listener is
+    reopened; any other query error, or parameters that cannot be bound to
+    the query, ends the wait with an error event.
+
+    Args:
+        sql: Query whose first column of the first row is checked
+        expected_value: Value the query must return
+        exact_match: Whether to perform an exact match or containment check
+        parameters: Named query parameters (%(name)s placeholders)
+        postgres_conn_id: Airflow connection ID for PostgreSQL
+        channel: Channel to LISTEN on (None polls at poll_interval only)
+        payload_pattern: Regex a notification payload must contain to trigger a check
+        poll_interval: Seconds without a matching notification before checking anyway
+    """
+
+    def __init__(
+        self,
+        sql: str,
+        expected_value: Any,
+        exact_match: bool = True,
+        parameters: Optional[Dict] = None,
+        postgres_conn_id: str = DEFAULT_POSTGRES_CONN_ID,
+        channel: Optional[str] = None,
+        payload_pattern: Optional[str] = None,
+        poll_interval: float = DEFAULT_FALLBACK_POLL_INTERVAL,
+    ) -> None:
+        super().__init__()
+        self.sql = sql
+        self.expected_value = expected_value
+        self.exact_match = exact_match
+        self.parameters = parameters or {}
+        self.postgres_conn_id = postgres_conn_id
+        self.channel = channel
+        self.payload_pattern = payload_pattern
+        self.poll_interval = poll_interval
+
+    def serialize(self) -> Tuple[str, Dict]:
+        """
+        Serialize the trigger so the triggerer can recreate it.
+
+        Returns:
+            Tuple of the trigger classpath and its keyword arguments
+        """
+        return f"{self.__class__.__module__}.{self.__class__.__name__}", {
+            'sql': self.sql,
+            'expected_value': self.expected_value,
+            'exact_match': self.exact_match,
+            'parameters': self.parameters,
+            'postgres_conn_id': self.postgres_conn_id,
+            'channel': self.channel,
+            'payload_pattern': self.payload_pattern,
+            'poll_interval': self.poll_interval,
+        }
+
+    def matches(self, value: Any) -> bool:
+        """
+        Compare a query result with the expected value, as CustomPostgresValueCheckSensor does.
+
+        Args:
+            value: First column of the first row
+
+        Returns:
+            True if the value matches
+        """
+        if self.exact_match:
+            return value == self.expected_value
+        return str(self.expected_value) in str(value)
+
+    async def _wait(self, queue: Optional[asyncio.Queue]) -> str:
+        """
+        Wait for a matching notification or the fallback poll, whichever comes first.
+
+        Args:
+            queue: Notification queue, or None when not listening
+
+        Returns:
+            'notify' or 'poll'
+        """
+        if queue is None:
+            await asyncio.sleep(self.poll_interval)
+            return 'poll'
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.poll_interval
+        while True:
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                return 'poll'
+            if self.payload_pattern and not re.search(self.payload_pattern, payload or ''):
+                continue
+            # Collapse a burst of notifications into one check
+            while not queue.empty():
+                queue.get_nowait()
+            return 'notify'
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        """
+        Check on every matching notification and fallback poll until the value matches.
+        """
+        try:
+            sql, args = to_positional(self.sql, self.parameters)
+        except (KeyError, TypeError) as e:
+            # Parameters that cannot be bound would fail every check
+            yield TriggerEvent({
+                'status': 'error',
+                'message': f"PostgreSQL trigger query parameters are invalid: {e!r}"
+            })
+            return
+        while True:
+            listener = None
+            queue = None
+            try:
+                listener = await get_listener(self.postgres_conn_id)
+                if self.channel:
+                    queue = await listener.subscribe(self.channel)
+
+                reason = 'initial check'
+                while True:
+                    found, value = await listener.fetch_value(sql, args)
+                    if found and self.matches(value):
+                        yield TriggerEvent({
+                            'status': 'success',
+                            'message': f"Query returned expected value {self.expected_value} ({reason})"
+                        })
+                        return
+                    logger.debug(f"Query returned {value}, expected {self.expected_value} ({reason})")
+                    reason = await self._wait(queue)
+            except AirflowException:
+                raise
+            except Exception as e:
+                if not _is_connection_error(e, listener):
+                    # A failing query (e.g. a missing table or a syntax error) would fail every retry
+                    yield TriggerEvent({
+                        'status': 'error',
+                        'message': f"PostgreSQL trigger query failed: {str(e)}"
+                    })
+                    return
+                logger.warning(f"PostgreSQL listener for {self.postgres_conn_id} failed, reconnecting: {str(e)}")
+                await asyncio.sleep(RECONNECT_DELAY)
+            finally:
+                if queue is not None:
+                    try:
+                        await listener.unsubscribe(self.channel, queue)
+                    except Exception as e:
+                        logger.debug(f"Failed to unsubscribe from {self.channel}: {str(e)}")
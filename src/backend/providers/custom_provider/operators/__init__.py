@@ -39,6 +39,7 @@ from ....plugins.operators.custom_postgres_operator import (
 
 # Import custom hooks and utilities
 from ....plugins.hooks.custom_gcp_hook import CustomGCPHook
+from ....dags.utils.gcp_utils import bigquery_estimate_query
 from ....dags.utils.alert_utils import send_alert, AlertLevel
 
 # Configure logging
@@ -137,6 +138,7 @@ class BigQueryExecuteQueryOperator(CustomBigQueryOperator):
         gcp_conn_id: str = 'google_cloud_default',
         delegate_to: str = None,
         alert_on_error: bool = False,
+        max_bytes_scanned: int = None,
         *args,
         **kwargs
     ):
@@ -151,6 +153,8 @@ class BigQueryExecuteQueryOperator(CustomBigQueryOperator):
             gcp_conn_id: Airflow connection ID for GCP
             delegate_to: The account to impersonate, if any
             alert_on_error: Whether to send alerts on operation failure
+            max_bytes_scanned: Reject the query before submitting it if a dry run
+                estimates it would scan more bytes than this (optional)
         """
         super().__init__(
             gcp_conn_id=gcp_conn_id,
@@ -163,11 +167,49 @@ class BigQueryExecuteQueryOperator(CustomBigQueryOperator):
         self.query_params = query_params or {}
         self.location = location
         self.as_dataframe = as_dataframe
+        self.max_bytes_scanned = max_bytes_scanned
         
         # Validate parameters
         if not sql:
             raise ValueError("SQL query must be provided")
     
+    def check_bytes_budget(self, context) -> None:
+        """
+        Dry-run the query and reject it if it would exceed max_bytes_scanned.
+        
+        The dry run uses the connection, delegation, dialect and location of
+        the BigQueryHook that execute() runs the query with, and the same
+        rendered SQL, so the estimate is for the statement that gets billed.
+        
+        Args:
+            context: Airflow task context
+            
+        Raises:
+            AirflowException: If the estimated bytes scanned exceed the budget
+        """
+        bigquery_hook = self.get_hook().get_bigquery_hook()
+        estimate = bigquery_estimate_query(
+            sql=self.sql,
+            query_params=self.query_params,
+            location=bigquery_hook.location,
+            conn_id=self.gcp_conn_id,
+            delegate_to=self.delegate_to,
+            use_legacy_sql=bigquery_hook.use_legacy_sql
+        )
+        context['ti'].xcom_push(key='query_estimate', value=estimate)
+        
+        if estimate['total_bytes_processed'] > self.max_bytes_scanned:
+            raise AirflowException(
+                f"Query would scan {estimate['total_bytes_processed']} bytes "
+                f"(~${estimate['estimated_cost_usd']}), exceeding the budget of "
+                f"{self.max_bytes_scanned} bytes"
+            )
+        
+        logger.info(
+            f"Query estimate of {estimate['total_bytes_processed']} bytes is within "
+            f"the budget of {self.max_bytes_scanned} bytes"
+        )
+    
     def execute(self, context):
         """
         Execute the BigQuery SQL query.
@@ -182,6 +224,10 @@ class BigQueryExecuteQueryOperator(CustomBigQueryOperator):
             AirflowException: If query execution fails
         """
         try:
+            # Enforce the bytes-scanned budget before anything is billed
+            if self.max_bytes_scanned is not None:
+                self.check_bytes_budget(context)
+            
             hook = self.get_hook()
             
             # Execute query
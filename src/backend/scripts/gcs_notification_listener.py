@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Script to run the GCS notification listener that keeps the shared object index
+up to date. Sensors created with use_notifications=True and the data_sync DAG
+resolve object existence against this index instead of polling GCS, and fall
+back to GCS whenever the listener's heartbeat goes stale or the queried prefix
+was not seeded with --seed.
+
+Run one listener per index, reading either a Pub/Sub subscription attached to
+the bucket notification config or, for local testing, a drop directory of
+notification JSON files.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Internal imports
+# Adjust the imports to make sure Python can find these modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dags.utils.gcp_utils import GCSNotificationListener, get_object_index, gcs_list_files
+
+# Configure logging
+LOGGER = logging.getLogger(__name__)
+
+
+def parse_arguments():
+    """
+    Parse command line arguments for the listener.
+
+    Returns:
+        argparse.Namespace: Parsed command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description='Consume GCS object notifications into the shared object index'
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        '--subscription',
+        help='Pub/Sub subscription path (projects/PROJECT/subscriptions/NAME); '
+             'set PUBSUB_EMULATOR_HOST to use a local emulator'
+    )
+    source.add_argument(
+        '--drop-dir',
+        help='Directory of notification JSON files to consume instead of Pub/Sub'
+    )
+    parser.add_argument(
+        '--index-path',
+        default=None,
+        help='Path of the object index database (default: GCS_OBJECT_INDEX_PATH)'
+    )
+    parser.add_argument(
+        '--seed',
+        action='append',
+        default=[],
+        metavar='BUCKET[/PREFIX]',
+        help='List existing objects into the index before consuming notifications (repeatable)'
+    )
+    parser.add_argument(
+        '--log-level',
+        default='INFO',
+        help='Logging level'
+    )
+    return parser.parse_args()
+
+
+def main():
+    """
+    Seed the index if requested, then consume notifications until interrupted.
+
+    Returns:
+        int: Exit code
+    """
+    args = parse_arguments()
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    index = get_object_index(args.index_path)
+
+    # Notifications only cover changes, so objects that already exist are listed once
+    for target in args.seed:
+        bucket_name, _, prefix = target.partition('/')
+        object_names = gcs_list_files(bucket_name=bucket_name, prefix=prefix or None)
+        index.seed(bucket_name, object_names, prefix=prefix)
+        LOGGER.info(f"Seeded {len(object_names)} objects from gs://{target}")
+
+    listener = GCSNotificationListener(index, subscription=args.subscription, drop_dir=args.drop_dir)
+    LOGGER.info(f"Listening for GCS notifications into {index.index_path}")
+
+    try:
+        listener.run()
+    except KeyboardInterrupt:
+        LOGGER.info("Listener stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
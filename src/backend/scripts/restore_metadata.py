@@ -439,7 +439,8 @@ def download_backup_files(manifest: Dict[str, Any], restore_dir: str, tables_to_
             gcs_client.download_file(
                 bucket_name=bucket_name,
                 object_name=gcs_file_path,
-                local_file_path=local_file_path
+                local_file_path=local_file_path,
+                use_cache=True
             )
             
             # Verify file size
@@ -22,7 +22,9 @@ from google.cloud.secretmanager import SecretManagerServiceClient
 # Internal imports
 # Adjust the imports to make sure Python can find these modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from dags.utils.gcp_utils import get_secret, create_secret, SecretManagerClient
+from dags.utils.gcp_utils import (
+    get_secret, create_secret, SecretManagerClient, invalidate_secret_cache, DEFAULT_SECRET_CACHE_TTL
+)
 from dags.utils.db_utils import execute_query
 from dags.utils.alert_utils import send_email_alert, AlertLevel
 
@@ -490,6 +492,15 @@ def rotate_secret(secret_id, secret_client, project_id, dry_run=False):
                     payload={"data": new_value.encode('UTF-8')}
                 )
                 LOGGER.info(f"Successfully created new version of secret {secret_id}")
+                
+                # Drop cached payloads so the rotated value is picked up here;
+                # workers on other hosts keep the old 'latest' value until
+                # their secret cache TTL expires
+                invalidate_secret_cache(secret_id)
+                LOGGER.info(
+                    f"Workers may serve the previous value of {secret_id} for up to "
+                    f"{DEFAULT_SECRET_CACHE_TTL}s; keep the old credential valid until then"
+                )
             else:
                 LOGGER.info(f"DRY RUN: Would create new version of secret {secret_id}")
             
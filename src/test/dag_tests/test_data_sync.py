@@ -10,7 +10,7 @@ import pandas as pd  # pandas 1.3.5
 import os  # Python standard library
 
 # Internal module imports
-from src.backend.dags.data_sync import data_sync, extract_data_from_postgres, transform_data, load_data_to_bigquery, load_data_to_postgres, upload_processed_file  # DAG module being tested
+from src.backend.dags.data_sync import data_sync, check_source_data, extract_data_from_postgres, transform_data, load_data_to_bigquery, load_data_to_postgres, upload_processed_file  # DAG module being tested
 from test.fixtures.dag_fixtures import create_test_dag, DAGTestContext  # Create test DAGs for comparison and testing
 from test.utils.dag_validation_utils import validate_dag_integrity, validate_airflow2_compatibility, check_parsing_performance  # Validate structural integrity of DAG
 from test.utils.assertion_utils import assert_dag_structure, assert_dag_airflow2_compatible, assert_dag_execution_time  # Assert that DAG structure matches expected specification
@@ -126,19 +126,75 @@ def test_load_data_to_bigquery():
     mock_context = create_mock_airflow_context(task_id='load_data_to_bigquery', dag_id=DAG_ID)
     # Configure task_instance to return transformed data path from XCom
     mock_context['ti'].xcom_pull.return_value = {'output_path': 'test_transformed_data.csv'}
-    # Mock BigQueryClient.load_from_dataframe to simulate successful load
-    with unittest.mock.patch('src.backend.dags.data_sync.BigQueryClient.load_from_dataframe') as mock_load_from_dataframe:
-        mock_load_from_dataframe.return_value = True
+    # Mock BigQueryClient.load_from_file to simulate a successful staged load
+    with unittest.mock.patch('src.backend.dags.data_sync.Variable.get', return_value='batch'), \
+            unittest.mock.patch('src.backend.dags.data_sync.BigQueryClient.load_from_file') as mock_load_from_file:
+        mock_load_from_file.return_value = 2
         # Call load_data_to_bigquery with mock context
         result = load_data_to_bigquery(**mock_context)
         # Verify function returns expected load statistics
         assert isinstance(result, dict)
-        # Verify BigQueryClient.load_from_dataframe was called with correct parameters
-        mock_load_from_dataframe.assert_called_once()
+        assert result['record_count'] == 2
+        # Verify the transformed file is loaded through GCS staging
+        mock_load_from_file.assert_called_once()
+        assert mock_load_from_file.call_args.kwargs['local_file_path'] == 'test_transformed_data.csv'
         # Check that XCom values are pushed correctly
         assert mock_context['ti'].xcom_push.call_count == 1
 
 
+def test_load_data_to_bigquery_stream_mode():
+    """Tests that load_data_to_bigquery streams rows when the stream load mode is configured"""
+    mock_context = create_mock_airflow_context(task_id='load_data_to_bigquery', dag_id=DAG_ID)
+    mock_context['ti'].xcom_pull.return_value = {'output_path': 'test_transformed_data.csv'}
+    with open('test_transformed_data.csv', 'w') as f:
+        f.write('col1,col2\n1,a\n2,b')
+    try:
+        with unittest.mock.patch('src.backend.dags.data_sync.Variable.get', return_value='stream'), \
+                unittest.mock.patch('src.backend.dags.data_sync.BigQueryClient.get_table'), \
+                unittest.mock.patch('src.backend.dags.data_sync.BigQueryClient.stream_rows') as mock_stream_rows:
+            mock_stream_rows.side_effect = lambda table, row_iter, **kwargs: len(list(row_iter))
+            result = load_data_to_bigquery(**mock_context)
+            # Rows are streamed to the table instead of staged for a load job
+            assert result['record_count'] == 2
+            assert result['load_mode'] == 'stream'
+            assert mock_stream_rows.call_args.kwargs['table'] == 'data_sync_dataset.data_sync_table'
+            # Like the batch load, the stream replaces the table instead of appending
+            assert mock_stream_rows.call_args.kwargs['write_disposition'] == 'WRITE_TRUNCATE'
+    finally:
+        os.remove('test_transformed_data.csv')
+
+
+def test_load_data_to_bigquery_stream_mode_creates_missing_table():
+    """Tests that the stream load mode falls back to a batch load that creates a missing table"""
+    mock_context = create_mock_airflow_context(task_id='load_data_to_bigquery', dag_id=DAG_ID)
+    mock_context['ti'].xcom_pull.return_value = {'output_path': 'test_transformed_data.csv'}
+    with unittest.mock.patch('src.backend.dags.data_sync.Variable.get', return_value='stream'), \
+            unittest.mock.patch('src.backend.dags.data_sync.BigQueryClient.get_table', return_value=None), \
+            unittest.mock.patch('src.backend.dags.data_sync.BigQueryClient.stream_rows') as mock_stream_rows, \
+            unittest.mock.patch('src.backend.dags.data_sync.BigQueryClient.load_from_file') as mock_load_from_file:
+        mock_load_from_file.return_value = 2
+        result = load_data_to_bigquery(**mock_context)
+        assert result['load_mode'] == 'batch'
+        mock_stream_rows.assert_not_called()
+        assert mock_load_from_file.call_args.kwargs['if_exists'] == 'replace'
+
+
+def test_check_source_data_uses_notification_index():
+    """Tests that check_source_data resolves files from a live notification index without listing GCS"""
+    mock_context = create_mock_airflow_context(task_id='check_source_data', dag_id=DAG_ID)
+    mock_context['execution_date'] = datetime.datetime(2023, 1, 1)
+    mock_index = unittest.mock.MagicMock()
+    mock_index.is_live.return_value = True
+    mock_index.list_objects.return_value = ['source/data/2023/01/01/part-0.csv']
+    with unittest.mock.patch('src.backend.dags.data_sync.Variable.get', return_value='true'), \
+            unittest.mock.patch('src.backend.dags.data_sync.get_object_index', return_value=mock_index), \
+            unittest.mock.patch('src.backend.dags.data_sync.GCSClient') as mock_gcs_client:
+        assert check_source_data(**mock_context) is True
+        mock_index.is_live.assert_called_once_with(bucket_name='data-sync-bucket', prefix='source/data/2023/01/01/')
+        mock_index.list_objects.assert_called_once_with('data-sync-bucket', 'source/data/2023/01/01/')
+        mock_gcs_client.assert_not_called()
+
+
 def test_load_data_to_postgres():
     """Tests the load_data_to_postgres task function"""
     # Create mock context with task_instance that can pull/push XComs
@@ -239,14 +239,21 @@ class TestCustomGCPHook(unittest.TestCase, Airflow2CompatibilityTestMixin):
         with self.assertRaises(ValueError):
             self.hook.gcs_file_exists(bucket_name=TEST_BUCKET_NAME, object_name=None)
 
-    def test_gcs_upload_file(self):
+    @patch('backend.plugins.hooks.custom_gcp_hook.GCSResumableUploader')
+    def test_gcs_upload_file(self, mock_uploader_class):
         """Test the gcs_upload_file method successfully uploads a file"""
+        mock_uploader_class.return_value.upload.return_value = {
+            'uri': f"gs://{TEST_BUCKET_NAME}/{TEST_OBJECT_NAME}",
+            'bytes': len(TEST_FILE_DATA),
+            'bytes_per_sec': 1024.0
+        }
         # Call hook.gcs_upload_file with temp_file_path, TEST_BUCKET_NAME, and TEST_OBJECT_NAME
         gcs_uri = self.hook.gcs_upload_file(local_file_path=self.temp_file_path, bucket_name=TEST_BUCKET_NAME, object_name=TEST_OBJECT_NAME)
         # Verify the function returns a valid GCS URI
         self.assertEqual(gcs_uri, f"gs://{TEST_BUCKET_NAME}/{TEST_OBJECT_NAME}")
-        # Verify the upload_from_filename method was called on the mock blob
-        self.hook.get_storage_client().bucket(TEST_BUCKET_NAME).blob(TEST_OBJECT_NAME).upload_from_filename.assert_called_once()
+        # Verify the resumable uploader was used with adaptive chunking
+        mock_uploader_class.assert_called_once()
+        self.assertIsNone(mock_uploader_class.call_args.kwargs['chunk_size'])
 
         # Verify error handling with invalid file path
         with self.assertRaises(AirflowException):
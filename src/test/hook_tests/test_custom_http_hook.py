@@ -12,12 +12,16 @@ import requests  # v2.25.0+ - HTTP client library for request testing and mockin
 import requests_mock  # v1.9.0+ - Mocking library for requests HTTP interactions
 import tenacity  # v6.2.0+ - Testing retry functionality in HTTP hook
 import io  # standard library - File-like objects for mock HTTP responses
+import json  # standard library - JSON bodies for mock HTTP responses
 import os  # standard library - Path manipulation for file download/upload tests
 import tempfile  # standard library - Temporary file creation for download/upload tests
+import hashlib  # standard library - Checksums for ranged download tests
 from datetime import datetime  # standard library
+from airflow.exceptions import AirflowException  # airflow v2.0.0+
 
 # Internal imports
-from backend.plugins.hooks.custom_http_hook import CustomHTTPHook  # Import the custom HTTP hook class to be tested
+from backend.plugins.hooks.custom_http_hook import CustomHTTPHook, HTTPResponseCache, clear_session_cache, iter_json_path, simple_path_prefix  # Import the custom HTTP hook class to be tested
+from backend.plugins.hooks.custom_http_hook import CircuitOpenError, HTTPCircuitBreaker, DistributedRateLimiter  # Shared circuit breaker and rate limiter
 from src.test.fixtures.mock_connections import create_mock_http_connection  # Create mock HTTP connections for testing the hook
 from src.test.fixtures.mock_connections import MockConnectionManager  # Manage mock connections during tests
 from src.test.fixtures.mock_connections import HTTP_CONN_ID  # Default HTTP connection ID for testing
@@ -296,6 +300,556 @@ class TestCustomHTTPHook(unittest.TestCase):
         self.assertEqual(session.headers["Authorization"], "OAuth test_token")
 
 
+class TestCustomHTTPHookSessionCache(unittest.TestCase):
+    """Tests for the per-process HTTP session cache"""
+
+    def setUp(self):
+        """Patch connection lookup and base session creation"""
+        clear_session_cache()
+        self.connection = unittest.mock.MagicMock()
+        self.connection.extra_dejson = {"timeout": 60, "pool_maxsize": 4}
+        self.get_connection_patcher = unittest.mock.patch.object(
+            CustomHTTPHook, "get_connection", return_value=self.connection
+        )
+        self.get_connection_patcher.start()
+
+        def base_get_conn(hook, headers=None):
+            hook.base_url = BASE_URL
+            session = requests.Session()
+            # The base hook copies connection extras into the headers
+            session.headers.update({"timeout": "60", "pool_maxsize": "4"})
+            return session
+
+        self.base_get_conn_patcher = unittest.mock.patch(
+            "airflow.providers.http.hooks.http.HttpHook.get_conn",
+            autospec=True,
+            side_effect=base_get_conn,
+        )
+        self.mock_base_get_conn = self.base_get_conn_patcher.start()
+
+    def tearDown(self):
+        """Stop patchers and drop cached sessions"""
+        self.get_connection_patcher.stop()
+        self.base_get_conn_patcher.stop()
+        clear_session_cache()
+
+    def test_session_reused_across_hook_instances(self):
+        """Test that hooks for the same connection share one pooled session"""
+        first = CustomHTTPHook(http_conn_id=TEST_CONN_ID).get_conn()
+        second_hook = CustomHTTPHook(http_conn_id=TEST_CONN_ID)
+        second = second_hook.get_conn({"X-Request": "1"})
+
+        self.assertIs(first, second)
+        self.assertEqual(self.mock_base_get_conn.call_count, 1)
+        # Base URL and extras are restored from the cache for new hook instances
+        self.assertEqual(second_hook.base_url, BASE_URL)
+        self.assertEqual(second_hook.extras["timeout"], 60)
+        # Hook settings are not sent as headers and per-request headers do not leak
+        self.assertNotIn("timeout", second.headers)
+        self.assertNotIn("X-Request", second.headers)
+        self.assertEqual(second.get_adapter("https://example.com")._pool_maxsize, 4)
+
+    def test_clear_session_cache(self):
+        """Test that clearing the cache forces the connection to be re-read"""
+        CustomHTTPHook(http_conn_id=TEST_CONN_ID).get_conn()
+        clear_session_cache(TEST_CONN_ID)
+        CustomHTTPHook(http_conn_id=TEST_CONN_ID).get_conn()
+
+        self.assertEqual(self.mock_base_get_conn.call_count, 2)
+
+
+class TestCustomHTTPHookRunMany(unittest.TestCase):
+    """Tests for concurrent request execution with run_many"""
+
+    def setUp(self):
+        """Create a hook whose async client talks to an in-memory transport"""
+        import httpx
+
+        self.calls = {}
+
+        def handler(request):
+            path = request.url.path
+            self.calls[path] = self.calls.get(path, 0) + 1
+            # The flaky endpoint fails once with a retryable status
+            if path == "/flaky" and self.calls[path] == 1:
+                return httpx.Response(503)
+            if path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"path": path, "query": str(request.url.query, "ascii")})
+
+        self.async_client = httpx.AsyncClient
+        self.client_patcher = unittest.mock.patch(
+            "httpx.AsyncClient",
+            side_effect=lambda **kwargs: self.async_client(
+                transport=httpx.MockTransport(handler), base_url=kwargs["base_url"], headers=kwargs["headers"]
+            ),
+        )
+        self.client_patcher.start()
+
+        self.hook = CustomHTTPHook(http_conn_id=TEST_CONN_ID, retry_delay=0.01, alert_on_error=False)
+        self.hook._get_session_entry = unittest.mock.MagicMock(return_value={
+            "session": requests.Session(), "base_url": BASE_URL, "extras": {}, "timeout": 5
+        })
+
+    def tearDown(self):
+        """Stop the client patcher"""
+        self.client_patcher.stop()
+
+    def test_results_in_input_order_with_retry(self):
+        """Test that results keep input order and retryable errors are retried"""
+        specs = [{"endpoint": f"/items/{i}", "data": {"page": i}} for i in range(5)]
+        specs.append({"endpoint": "/flaky"})
+
+        results = self.hook.run_many(specs, concurrency=3, rate_limit=100, parse_json=True)
+
+        self.assertEqual([result["path"] for result in results[:5]], [f"/api/v1/items/{i}" for i in range(5)])
+        # GET data is sent as the query string, as with HttpHook.run
+        self.assertEqual(results[2]["query"], "page=2")
+        self.assertEqual(self.calls["/api/v1/flaky"], 2)
+
+    def test_failures_raise_or_are_returned(self):
+        """Test that failures raise by default and are returned on request"""
+        specs = [{"endpoint": "/missing"}, {"endpoint": "/ok"}]
+
+        with self.assertRaises(AirflowException):
+            self.hook.run_many(specs)
+
+        results = self.hook.run_many(specs, return_exceptions=True)
+        self.assertIsInstance(results[0], AirflowException)
+        self.assertEqual(results[1].status_code, 200)
+
+    def test_stream_yields_every_result(self):
+        """Test that stream mode yields each (index, result) pair once"""
+        specs = [{"endpoint": f"/items/{i}"} for i in range(10)]
+
+        streamed = dict(self.hook.run_many(specs, concurrency=2, parse_json=True, stream=True))
+
+        self.assertEqual(sorted(streamed), list(range(10)))
+
+    def test_closing_stream_cancels_pending_requests(self):
+        """Test that closing the stream early stops the remaining requests"""
+        import asyncio
+        import time
+        import httpx
+
+        sent = []
+
+        async def slow_handler(request):
+            sent.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={})
+
+        with unittest.mock.patch(
+            "httpx.AsyncClient",
+            side_effect=lambda **kwargs: self.async_client(
+                transport=httpx.MockTransport(slow_handler), base_url=kwargs["base_url"]
+            ),
+        ):
+            specs = [{"endpoint": f"/items/{i}"} for i in range(100)]
+            stream = self.hook.run_many(specs, concurrency=2, stream=True)
+            next(stream)
+            stream.close()
+            time.sleep(0.5)
+
+        self.assertLess(len(sent), 10)
+
+    def test_zero_retry_limit_makes_one_attempt(self):
+        """Test that retry_limit=0 still sends each request once"""
+        self.hook.retry_limit = 0
+
+        results = self.hook.run_many([{"endpoint": "/flaky"}], return_exceptions=True)
+
+        self.assertIsInstance(results[0], AirflowException)
+        self.assertEqual(self.calls["/api/v1/flaky"], 1)
+
+
+class TestCustomHTTPHookPaginate(unittest.TestCase):
+    """Tests for the pagination iterator"""
+
+    def setUp(self):
+        """Create a hook with a stubbed request method"""
+        self.hook = CustomHTTPHook(http_conn_id=TEST_CONN_ID)
+        self.hook.base_url = BASE_URL
+        self.hook.run_with_advanced_retry = unittest.mock.MagicMock()
+
+    def make_response(self, body, link=None, url=BASE_URL):
+        """Build a JSON response with an optional Link header"""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = json.dumps(body).encode("utf-8")
+        if link:
+            response.headers["Link"] = link
+        return response
+
+    def test_cursor_pagination(self):
+        """Test that cursor pagination follows the cursor until it is empty"""
+        self.hook.run_with_advanced_retry.side_effect = [
+            self.make_response({"data": [1, 2], "meta": {"next": "abc"}}),
+            self.make_response({"data": [3], "meta": {"next": None}}),
+        ]
+        pages = list(self.hook.paginate(
+            TEST_ENDPOINT,
+            pagination={"style": "cursor", "cursor_path": "meta.next", "cursor_param": "after"},
+            records_path="data",
+        ))
+        self.assertEqual(pages, [[1, 2], [3]])
+        second_call = self.hook.run_with_advanced_retry.call_args_list[1]
+        self.assertEqual(second_call.kwargs["params"], {"after": "abc"})
+
+    def test_offset_pagination_stops_on_short_page(self):
+        """Test that offset pagination stops when a page is not full"""
+        self.hook.run_with_advanced_retry.side_effect = [
+            self.make_response([1, 2]),
+            self.make_response([3]),
+        ]
+        pages = list(self.hook.paginate(TEST_ENDPOINT, pagination={"style": "offset", "limit": 2}))
+        self.assertEqual(pages, [[1, 2], [3]])
+        self.assertEqual(
+            self.hook.run_with_advanced_retry.call_args_list[1].kwargs["params"], {"offset": 2, "limit": 2}
+        )
+
+    def test_link_header_pagination(self):
+        """Test that Link header pagination follows rel=next relative to the base URL"""
+        self.hook.run_with_advanced_retry.side_effect = [
+            self.make_response([1], link=f'<{BASE_URL}/test?page=2>; rel="next"'),
+            self.make_response([2]),
+        ]
+        pages = list(self.hook.paginate(TEST_ENDPOINT, pagination={"style": "link"}, prefetch=False))
+        self.assertEqual(pages, [[1], [2]])
+        self.assertEqual(self.hook.run_with_advanced_retry.call_args_list[1].kwargs["endpoint"], "/test?page=2")
+
+
+class TestCustomHTTPHookResponseCache(unittest.TestCase):
+    """Tests for the on-disk conditional response cache"""
+
+    def setUp(self):
+        """Create a caching hook whose base requests are stubbed"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.hook = CustomHTTPHook(
+            http_conn_id=TEST_CONN_ID, use_cache=True, cache_dir=self.cache_dir, alert_on_error=False
+        )
+        self.hook._get_session_entry = unittest.mock.MagicMock(return_value={"timeout": None})
+        self.base_run_patcher = unittest.mock.patch("airflow.providers.http.hooks.http.HttpHook.run")
+        self.mock_base_run = self.base_run_patcher.start()
+
+    def tearDown(self):
+        """Stop the base run patcher"""
+        self.base_run_patcher.stop()
+
+    def make_response(self, status_code, body=b"", **headers):
+        """Build a response with the given status, body and headers"""
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = BASE_URL + TEST_ENDPOINT
+        response._content = body
+        response.headers.update(headers)
+        return response
+
+    def test_not_modified_served_from_cache(self):
+        """Test that cached ETags are revalidated and 304s return the cached body"""
+        self.mock_base_run.side_effect = [
+            self.make_response(200, MOCK_RESPONSE_SUCCESS.encode("utf-8"), ETag='"v1"'),
+            self.make_response(304, ETag='"v1"'),
+        ]
+
+        first = self.hook.run(endpoint=TEST_ENDPOINT)
+        second = self.hook.run(endpoint=TEST_ENDPOINT)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+        self.assertTrue(second.from_cache)
+        self.assertEqual(self.mock_base_run.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+
+    def test_cache_control(self):
+        """Test that max-age responses skip the request and no-store responses are not cached"""
+        self.mock_base_run.return_value = self.make_response(200, b"fresh", **{"Cache-Control": "max-age=60"})
+        self.hook.run(endpoint=TEST_ENDPOINT)
+        self.assertEqual(self.hook.run(endpoint=TEST_ENDPOINT).text, "fresh")
+        self.assertEqual(self.mock_base_run.call_count, 1)
+
+        self.mock_base_run.return_value = self.make_response(200, b"private", ETag='"x"', **{"Cache-Control": "no-store"})
+        self.hook.run(endpoint="/no-store")
+        self.hook.run(endpoint="/no-store")
+        self.assertEqual(self.mock_base_run.call_count, 3)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entries are evicted beyond max_bytes"""
+        cache = HTTPResponseCache(tempfile.mkdtemp(), max_bytes=10)
+        for index in range(3):
+            cache.store(f"key{index}", self.make_response(200, b"12345", ETag=f'"{index}"'))
+            # Spread the access times so eviction order is deterministic
+            os.utime(os.path.join(cache.cache_dir, f"key{index}.json"), (index, index))
+
+        cache.evict()
+
+        self.assertIsNone(cache.get("key0"))
+        self.assertIsNotNone(cache.get("key2"))
+
+    def test_cache_files_are_private(self):
+        """Test that cached bodies are only readable by the worker's user"""
+        cache = HTTPResponseCache(os.path.join(tempfile.mkdtemp(), "cache"))
+        cache.store("key", self.make_response(200, b"secret", ETag='"1"'))
+
+        self.assertEqual(os.stat(cache.cache_dir).st_mode & 0o777, 0o700)
+        for name in os.listdir(cache.cache_dir):
+            self.assertEqual(os.stat(os.path.join(cache.cache_dir, name)).st_mode & 0o777, 0o600)
+
+
+class TestStreamingJsonPath(unittest.TestCase):
+    """Tests for incremental JSON path evaluation"""
+
+    def test_simple_path_prefix(self):
+        """Test translation of simple JMESPath and JSONPath expressions to ijson prefixes"""
+        self.assertEqual(simple_path_prefix("data.items"), "data.items")
+        self.assertEqual(simple_path_prefix("$.data[*].id"), "data.item.id")
+        self.assertEqual(simple_path_prefix("[*].id"), "item.id")
+        self.assertIsNone(simple_path_prefix("data[0].id"))
+        self.assertIsNone(simple_path_prefix("$..id"))
+
+    def test_iter_json_path_stops_early(self):
+        """Test that values are yielded as the body streams in and reading stops with iteration"""
+        chunks = [b'{"data": [{"id": 1}, ', b'{"id": 2}, ', b'{"id": 3}]}']
+        response = requests.Response()
+        response.iter_content = unittest.mock.MagicMock(return_value=iter(chunks))
+        chunk_iter = response.iter_content.return_value
+
+        values = iter_json_path(response, "data[*].id")
+        self.assertEqual(next(values), 1)
+        values.close()
+
+        # The last chunk was never read
+        self.assertIn(chunks[-1], list(chunk_iter))
+
+
+class TestCustomHTTPHookRangedDownload(unittest.TestCase):
+    """Tests for parallel ranged downloads with resume"""
+
+    def setUp(self):
+        """Create a hook whose session serves byte ranges of an in-memory file"""
+        self.content = os.urandom(250000)
+        self.requested_ranges = []
+        self.failing_offset = None
+        self.hook = CustomHTTPHook(http_conn_id=TEST_CONN_ID, retry_delay=0.01, alert_on_error=False)
+        session = unittest.mock.MagicMock()
+        session.get.side_effect = self.serve_range
+        self.hook.get_conn = unittest.mock.MagicMock(return_value=session)
+        self.local_path = os.path.join(tempfile.mkdtemp(), "download.bin")
+
+    def serve_range(self, url, params=None, headers=None, stream=False):
+        """Serve the requested range as a 206 response"""
+        start, end = (int(value) for value in headers["Range"][len("bytes="):].split("-"))
+        end = min(end, len(self.content) - 1)
+        self.requested_ranges.append(start)
+        response = requests.Response()
+        response.url = url
+        response.status_code = 404 if start == self.failing_offset else 206
+        response.headers["Content-Range"] = f"bytes {start}-{end}/{len(self.content)}"
+        response.headers["ETag"] = '"v1"'
+        response.raw = io.BytesIO(b"" if start == self.failing_offset else self.content[start:end + 1])
+        return response
+
+    def test_segments_are_verified_and_resumed(self):
+        """Test that a failed download resumes from the segments already on disk"""
+        checksum = "sha256:" + hashlib.sha256(self.content).hexdigest()
+        self.failing_offset = 200000
+
+        with self.assertRaises(AirflowException):
+            self.hook.download_file(TEST_ENDPOINT, self.local_path, chunk_size=50000, max_workers=1)
+        self.assertTrue(os.path.exists(self.local_path + ".part.json"))
+
+        self.failing_offset = None
+        self.requested_ranges = []
+        self.hook.download_file(TEST_ENDPOINT, self.local_path, chunk_size=50000, checksum=checksum)
+
+        with open(self.local_path, "rb") as f:
+            self.assertEqual(f.read(), self.content)
+        # Only the probe and the segments missing after the failure were requested again
+        self.assertEqual(sorted(self.requested_ranges), [0, 200000])
+        self.assertFalse(os.path.exists(self.local_path + ".part"))
+
+    def test_checksum_mismatch_discards_download(self):
+        """Test that a checksum mismatch fails and leaves no file behind"""
+        with self.assertRaises(AirflowException):
+            self.hook.download_file(TEST_ENDPOINT, self.local_path, chunk_size=50000, checksum="md5:0")
+        self.assertEqual(os.listdir(os.path.dirname(self.local_path)), [])
+
+    def test_partial_response_without_total_refetches_whole_file(self):
+        """Test that a 206 with an unknown total size is not mistaken for the whole file"""
+        def serve_unknown_total(url, params=None, headers=None, stream=False):
+            response = requests.Response()
+            response.url = url
+            if "Range" in headers:
+                start, end = (int(value) for value in headers["Range"][len("bytes="):].split("-"))
+                response.status_code = 206
+                response.headers["Content-Range"] = f"bytes {start}-{end}/*"
+                response.raw = io.BytesIO(self.content[start:end + 1])
+            else:
+                response.status_code = 200
+                response.raw = io.BytesIO(self.content)
+            return response
+
+        self.hook.get_conn.return_value.get.side_effect = serve_unknown_total
+        self.hook.download_file(TEST_ENDPOINT, self.local_path, chunk_size=50000)
+
+        with open(self.local_path, "rb") as f:
+            self.assertEqual(f.read(), self.content)
+
+
+class TestCustomHTTPHookStreamingUpload(unittest.TestCase):
+    """Tests for streamed multipart and resumable uploads"""
+
+    def setUp(self):
+        """Create a hook and a file to upload"""
+        self.hook = CustomHTTPHook(http_conn_id=TEST_CONN_ID, retry_delay=0.01, alert_on_error=False)
+        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
+            tmp_file.write(os.urandom(300000))
+            self.file_path = tmp_file.name
+        with open(self.file_path, "rb") as f:
+            self.content = f.read()
+
+    def tearDown(self):
+        """Remove the uploaded file"""
+        os.remove(self.file_path)
+
+    def test_multipart_body_is_streamed(self):
+        """Test that the multipart body is streamed from the file with progress reporting"""
+        progress = []
+        sent_bodies = []
+
+        def send(endpoint=None, data=None, headers=None, params=None, method=None, extra_options=None):
+            self.assertTrue(headers["Content-Type"].startswith("multipart/form-data; boundary="))
+            # The encoder reads the file lazily instead of holding the body in memory
+            first_block = data.read(1024)
+            self.assertEqual(len(first_block), 1024)
+            sent_bodies.append(first_block + data.read())
+            response = requests.Response()
+            response.status_code = 200
+            return response
+
+        self.hook.run = unittest.mock.MagicMock(side_effect=send)
+
+        self.hook.upload_file(
+            TEST_ENDPOINT, self.file_path, data={"id": 1}, progress_callback=lambda sent, total: progress.append(sent)
+        )
+
+        self.assertIn(self.content, sent_bodies[0])
+        self.assertEqual(progress[-1], len(sent_bodies[0]))
+
+    def test_resumable_upload_continues_from_committed_offset(self):
+        """Test that chunks resume from the server's committed offset after a failure"""
+        received = bytearray()
+        ranges = []
+
+        def handle_chunk(method, url, data=None, params=None, headers=None, allow_redirects=True):
+            ranges.append(headers["Content-Range"])
+            if len(ranges) == 2:
+                raise requests.ConnectionError("connection reset")
+            response = requests.Response()
+            response.url = url
+            if data:
+                received.extend(data)
+            if len(received) == len(self.content):
+                response.status_code = 200
+            else:
+                response.status_code = 308
+                response.headers["Range"] = f"bytes=0-{len(received) - 1}"
+            return response
+
+        session = unittest.mock.MagicMock()
+        session.request.side_effect = handle_chunk
+        self.hook.get_conn = unittest.mock.MagicMock(return_value=session)
+
+        response = self.hook.upload_file_resumable(TEST_ENDPOINT, self.file_path, chunk_size=100000)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(bytes(received), self.content)
+        self.assertEqual(ranges[2], "bytes */300000")
+        self.assertEqual(ranges[3], "bytes 100000-199999/300000")
+
+
+class TestCustomHTTPHookCircuitBreaker(unittest.TestCase):
+    """Tests for the Redis-backed circuit breaker and rate limiter"""
+
+    def setUp(self):
+        """Create a Redis client whose scripts are mocks"""
+        self.redis_client = unittest.mock.MagicMock()
+        self.allow_script = unittest.mock.MagicMock(return_value=1)
+        self.record_script = unittest.mock.MagicMock(return_value=b"closed")
+        self.redis_client.register_script.side_effect = [self.allow_script, self.record_script]
+
+    def test_open_circuit_fails_fast_without_alerting(self):
+        """Test that an open circuit rejects requests before they are sent"""
+        self.allow_script.return_value = 0
+        breaker = HTTPCircuitBreaker(TEST_CONN_ID, "example.com", redis_client=self.redis_client)
+        hook = CustomHTTPHook(http_conn_id=TEST_CONN_ID, circuit_breaker=True)
+        hook._get_session_entry = unittest.mock.MagicMock(return_value={"timeout": None})
+        hook._get_resilience_guards = unittest.mock.MagicMock(return_value=(breaker, None))
+
+        with unittest.mock.patch("airflow.providers.http.hooks.http.HttpHook.run") as mock_base_run, \
+                unittest.mock.patch("backend.plugins.hooks.custom_http_hook.send_alert") as mock_send_alert:
+            with self.assertRaises(CircuitOpenError):
+                hook.run_with_advanced_retry(endpoint=TEST_ENDPOINT)
+
+        mock_base_run.assert_not_called()
+        mock_send_alert.assert_not_called()
+
+    def test_transfers_and_run_many_go_through_the_breaker(self):
+        """Test that downloads, resumable uploads and concurrent requests fail fast on an open circuit"""
+        self.allow_script.return_value = 0
+        breaker = HTTPCircuitBreaker(TEST_CONN_ID, "example.com", redis_client=self.redis_client)
+        hook = CustomHTTPHook(http_conn_id=TEST_CONN_ID, circuit_breaker=True, alert_on_error=False)
+        hook._get_resilience_guards = unittest.mock.MagicMock(return_value=(breaker, None))
+        session = unittest.mock.MagicMock()
+        hook.get_conn = unittest.mock.MagicMock(return_value=session)
+        temp_dir = tempfile.mkdtemp()
+        upload_path = os.path.join(temp_dir, "upload.bin")
+        with open(upload_path, "wb") as f:
+            f.write(b"payload")
+
+        with self.assertRaises(CircuitOpenError):
+            hook.download_file(TEST_ENDPOINT, os.path.join(temp_dir, "download.bin"))
+        with self.assertRaises(CircuitOpenError):
+            hook.upload_file_resumable(TEST_ENDPOINT, upload_path)
+        session.get.assert_not_called()
+        session.request.assert_not_called()
+
+        hook._get_session_entry = unittest.mock.MagicMock(return_value={
+            "session": requests.Session(), "base_url": BASE_URL, "extras": {}, "timeout": 5
+        })
+        with unittest.mock.patch("httpx.AsyncClient.send") as mock_send:
+            results = hook.run_many([{"endpoint": TEST_ENDPOINT}], return_exceptions=True)
+        self.assertIsInstance(results[0], CircuitOpenError)
+        mock_send.assert_not_called()
+
+    def test_outcomes_are_recorded_per_window(self):
+        """Test that probes and downstream failures are reported to the shared state"""
+        self.allow_script.return_value = 2
+        self.record_script.return_value = b"opened"
+        breaker = HTTPCircuitBreaker(TEST_CONN_ID, "example.com", redis_client=self.redis_client)
+
+        self.assertTrue(breaker.before_request())
+        self.assertEqual(breaker.record(False, probe=True), "opened")
+
+        keys = self.record_script.call_args.kwargs["keys"]
+        self.assertEqual(keys[0], f"http:circuit:{TEST_CONN_ID}:example.com")
+        self.assertTrue(keys[2].startswith(f"http:circuit:{TEST_CONN_ID}:example.com:errors:"))
+        self.assertEqual(self.record_script.call_args.kwargs["args"][:2], [0, 1])
+
+    def test_unreachable_redis_allows_requests(self):
+        """Test that the breaker and limiter fail open when Redis is down"""
+        failing_script = unittest.mock.MagicMock(side_effect=ConnectionError("redis unavailable"))
+        self.redis_client.register_script.side_effect = None
+        self.redis_client.register_script.return_value = failing_script
+
+        breaker = HTTPCircuitBreaker(TEST_CONN_ID, "example.com", redis_client=self.redis_client)
+        limiter = DistributedRateLimiter(TEST_CONN_ID, "example.com", rate=5, redis_client=self.redis_client)
+
+        self.assertFalse(breaker.before_request())
+        self.assertEqual(breaker.record(False), "closed")
+        limiter.acquire(timeout=1)
+
+
 class TestCustomHTTPHookAirflow2Compatibility(
     unittest.TestCase, Airflow2CompatibilityTestMixin
 ):
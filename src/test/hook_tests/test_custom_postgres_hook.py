@@ -249,6 +249,32 @@ class TestCustomPostgresHook(unittest.TestCase, Airflow2CompatibilityTestMixin):
         self.hook._use_persistent_connection = False
         self.hook.execute_query(TEST_SQL_QUERY)
 
+    def test_execute_query_rolls_back_autocommit_failure(self):
+        """Test that a failed autocommit query is rolled back so a kept connection stays usable"""
+        connection = MagicMock()
+        connection.cursor.return_value.execute.side_effect = Exception("division by zero")
+        self.hook._use_persistent_connection = True
+
+        with patch.object(CustomPostgresHook, 'get_conn', return_value=connection):
+            with self.assertRaises(AirflowException):
+                # Call the undecorated method so tenacity does not wait between attempts
+                CustomPostgresHook.execute_query.__wrapped__(self.hook, TEST_SQL_QUERY, autocommit=True)
+
+        connection.rollback.assert_called_once()
+        connection.close.assert_not_called()
+
+    def test_failed_rollback_keeps_original_error(self):
+        """Test that a rollback failing on a broken connection does not replace the query error"""
+        connection = MagicMock()
+        connection.cursor.return_value.execute.side_effect = Exception("division by zero")
+        connection.rollback.side_effect = Exception("connection already closed")
+
+        with patch.object(CustomPostgresHook, 'get_conn', return_value=connection):
+            with self.assertRaises(AirflowException) as raised:
+                CustomPostgresHook.execute_query.__wrapped__(self.hook, TEST_SQL_QUERY, autocommit=True)
+
+        self.assertIn("division by zero", str(raised.exception))
+
     def test_execute_values(self):
         """Test the execute_values method for batch inserts"""
         # Prepare test SQL insert statement and test values (TEST_BATCH_DATA)
@@ -249,6 +249,51 @@ class TestCustomHttpOperator(unittest.TestCase, Airflow2CompatibilityTestMixin):
             retry_limit=3, retry_delay=1.0, retry_backoff=2.0, retry_status_codes=[500, 502, 503, 504]
         )
 
+    def test_execute_paginated_to_jsonl(self):
+        """Test that paginated results are streamed to a JSONL file"""
+        self.temp_dir = tempfile.mkdtemp()
+        output_path = os.path.join(self.temp_dir, "records.jsonl")
+        self.mock_hook.paginate = mock.MagicMock(return_value=iter([[{"id": 1}, {"id": 2}], [{"id": 3}]]))
+        op = CustomHttpOperator(
+            task_id="test_http_paginated",
+            endpoint=DEFAULT_ENDPOINT,
+            pagination={"style": "cursor", "cursor_path": "meta.next"},
+            records_path="data",
+            output_path=output_path,
+        )
+        result = op.execute(context=self.test_context)
+        # Only a summary is returned to XCom
+        self.assertEqual(result["pages"], 2)
+        self.assertEqual(result["records"], 3)
+        with open(output_path) as f:
+            self.assertEqual([json.loads(line)["id"] for line in f], [1, 2, 3])
+        self.assertEqual(self.mock_hook.paginate.call_args.kwargs["records_path"], "data")
+
+    def test_execute_paginated_to_parquet_unifies_page_schemas(self):
+        """Test that Parquet output types late columns and rejects columns added after the schema is fixed"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        self.temp_dir = tempfile.mkdtemp()
+        output_path = os.path.join(self.temp_dir, "records.parquet")
+        self.mock_hook.paginate = mock.MagicMock(
+            return_value=iter([[{"id": 1, "note": None}], [{"id": 2, "note": "late"}], [{"id": 3}]])
+        )
+        op = CustomHttpOperator(
+            task_id="test_http_paginated_parquet",
+            endpoint=DEFAULT_ENDPOINT,
+            pagination={"style": "cursor", "cursor_path": "meta.next"},
+            output_path=output_path,
+            output_format="parquet",
+        )
+        self.assertEqual(op.execute(context=self.test_context)["records"], 3)
+        self.assertEqual(
+            pq.read_table(output_path).to_pylist(),
+            [{"id": 1, "note": None}, {"id": 2, "note": "late"}, {"id": 3, "note": None}]
+        )
+
+        self.mock_hook.paginate = mock.MagicMock(return_value=iter([[{"id": 1}], [{"id": 2, "extra": True}]]))
+        with self.assertRaises(AirflowException):
+            op.execute(context=self.test_context)
+
     @pytest.mark.skipif(not is_airflow2(), reason="Test requires Airflow 2.X")
     def test_airflow2_compatibility(self):
         """Test compatibility with Airflow 2.X"""
@@ -480,4 +480,43 @@ class TestCustomProviderAirflow2Migration(unittest.TestCase):
         # Test integration with Airflow 2.X core features
         print("Testing integration with Airflow 2.X core features")
         # Assert full compatibility with Airflow 2.X
-        print("Asserting full compatibility with Airflow 2.X")
\ No newline at end of file
+        print("Asserting full compatibility with Airflow 2.X")
+
+
+class TestBigQueryBytesBudget(unittest.TestCase):
+    """Tests for the dry-run bytes budget of BigQueryExecuteQueryOperator"""
+
+    @mock.patch('src.backend.providers.custom_provider.operators.bigquery_estimate_query')
+    @mock.patch('src.backend.providers.custom_provider.operators.CustomGCPHook')
+    def test_budget_check_estimates_the_executed_query(self, mock_hook_class, mock_estimate):
+        """Tests that the dry run uses the parameters and hook settings execute() runs with"""
+        from src.backend.providers.custom_provider.operators import BigQueryExecuteQueryOperator
+
+        bigquery_hook = mock_hook_class.return_value.get_bigquery_hook.return_value
+        bigquery_hook.location = None
+        bigquery_hook.use_legacy_sql = True
+        mock_estimate.return_value = {'total_bytes_processed': 100, 'estimated_cost_usd': 0.0}
+        mock_hook_class.return_value.bigquery_execute_query.return_value = [(1,)]
+
+        operator = BigQueryExecuteQueryOperator(
+            task_id='run_query',
+            sql="SELECT * FROM t WHERE day = %(day)s",
+            query_params={'day': '2024-01-01'},
+            delegate_to='svc@example.com',
+            max_bytes_scanned=1000
+        )
+        operator.execute({'ti': mock.MagicMock()})
+
+        mock_estimate.assert_called_once_with(
+            sql="SELECT * FROM t WHERE day = %(day)s",
+            query_params={'day': '2024-01-01'},
+            location=None,
+            conn_id='google_cloud_default',
+            delegate_to='svc@example.com',
+            use_legacy_sql=True
+        )
+        mock_hook_class.return_value.bigquery_execute_query.assert_called_once()
+
+        mock_estimate.return_value = {'total_bytes_processed': 5000, 'estimated_cost_usd': 0.0}
+        with self.assertRaises(Exception):
+            operator.execute({'ti': mock.MagicMock()})
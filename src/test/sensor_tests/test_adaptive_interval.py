@@ -0,0 +1,86 @@
+"""
+Unit tests for the adaptive poke interval policy shared by the custom sensors.
+Tests backoff, learned arrival windows and the opt-in behavior of the mixin.
+"""
+import unittest  # Python standard library
+from datetime import timedelta  # Python standard library
+from unittest.mock import patch  # Python standard library
+
+import pytest  # pytest v6.0+
+from airflow.utils import timezone  # airflow v2.0.0+
+
+# Internal imports
+from backend.plugins.sensors.adaptive_interval import adaptive_interval  # Interval policy under test
+from backend.plugins.sensors.custom_http_sensor import CustomHttpSensor  # Sensor using the mixin
+
+
+@pytest.mark.sensors
+class TestAdaptivePokeInterval(unittest.TestCase):
+    """
+    Tests for the adaptive poke interval policy and AdaptivePokeIntervalMixin
+    """
+
+    def test_backoff_doubles_up_to_cap(self):
+        """
+        Test that the interval doubles with the time waited and stops at max_poke_interval
+        """
+        elapsed = 0
+        intervals = []
+        for _ in range(6):
+            intervals.append(adaptive_interval(60, 600, elapsed, jitter=0))
+            # Each poke itself takes a few seconds
+            elapsed += intervals[-1] + 5
+        self.assertEqual(intervals, [60, 120, 240, 480, 600, 600])
+
+    def test_backoff_survives_reschedule(self):
+        """
+        Test that the step follows the elapsed time, not the poke count that restarts on each reschedule
+        """
+        self.assertEqual(adaptive_interval(60, 3600, 0, jitter=0), 60)
+        self.assertEqual(adaptive_interval(60, 3600, 420, jitter=0), 480)
+        self.assertEqual(adaptive_interval(60, 3600, 7200, jitter=0), 3600)
+
+    def test_arrival_window(self):
+        """
+        Test that pokes are frequent inside the window and wake up when it opens
+        """
+        window = (3600, 5400)
+        self.assertEqual(adaptive_interval(60, 3600, 4000, offset=4000, window=window, jitter=0), 60)
+        # A backed-off wait of 3600s is cut short to the 600s left before the window
+        self.assertEqual(adaptive_interval(60, 3600, 3000, offset=3000, window=window, jitter=0), 600)
+        # After the window the sensor keeps backing off
+        self.assertEqual(adaptive_interval(60, 3600, 180, offset=6000, window=window, jitter=0), 240)
+
+    def test_jitter_stays_within_bounds(self):
+        """
+        Test that jitter never exceeds the cap or drops far below poke_interval
+        """
+        for _ in range(100):
+            interval = adaptive_interval(60, 600, 6000)
+            self.assertLessEqual(interval, 600)
+            self.assertGreaterEqual(interval, 54)
+
+    def test_sensor_opt_in(self):
+        """
+        Test that sensors keep a fixed interval unless adaptive_poke_interval is set
+        """
+        fixed = CustomHttpSensor(task_id='fixed_sensor', endpoint='/api/test', poke_interval=60)
+        self.assertEqual(fixed._get_next_poke_interval(timezone.utcnow(), lambda: 0, 5), 60)
+
+        adaptive = CustomHttpSensor(
+            task_id='adaptive_sensor',
+            endpoint='/api/test',
+            poke_interval=60,
+            timeout=3600,
+            adaptive_poke_interval=True,
+            max_poke_interval=900
+        )
+        adaptive._arrival_anchor = timezone.utcnow() - timedelta(seconds=600)
+        adaptive._arrival_window = (1200, 1800)
+        with patch('backend.plugins.sensors.adaptive_interval.random.uniform', return_value=0):
+            # A reschedule-mode try pokes once (try_number 1), so the backoff comes from run_duration
+            self.assertAlmostEqual(adaptive._get_next_poke_interval(timezone.utcnow(), lambda: 420, 1), 480, delta=1)
+            # Backed off to 900s but woken when the window opens 600s from now
+            self.assertAlmostEqual(adaptive._get_next_poke_interval(timezone.utcnow(), lambda: 1000, 1), 600, delta=1)
+            # Never sleeps past the sensor timeout
+            self.assertAlmostEqual(adaptive._get_next_poke_interval(timezone.utcnow(), lambda: 3500, 5), 100, delta=1)
@@ -0,0 +1,255 @@
+"""
+Unit tests for the custom GCP sensors used with Airflow 2.X on Cloud Composer 2.
+Tests GCS and BigQuery sensing behavior with the underlying GCP clients mocked out.
+"""
+import asyncio  # Python standard library
+import unittest  # Python standard library
+from unittest.mock import AsyncMock, MagicMock  # Python standard library
+
+import pytest  # pytest v6.0+
+from airflow.exceptions import AirflowException, TaskDeferred  # airflow v2.2.0+
+
+# Internal imports
+from backend.plugins.sensors.custom_gcp_sensor import CustomBigQueryJobSensor, CustomGCSFileSensor  # Sensors under test
+from backend.plugins.triggers.custom_gcp_trigger import BigQueryJobTrigger, GCSObjectTrigger  # Triggers under test
+from backend.plugins.triggers import custom_gcp_trigger  # Shared trigger state
+
+TEST_PROJECT_ID = 'test-project'
+TEST_GCP_CONN_ID = 'test_gcp_conn'
+
+
+def create_mock_job(state: str, error_result: dict = None) -> MagicMock:
+    """
+    Create a mock BigQuery job with the given state
+    """
+    job = MagicMock()
+    job.state = state
+    job.error_result = error_result
+    return job
+
+
+@pytest.mark.sensors
+class TestCustomBigQueryJobSensor(unittest.TestCase):
+    """
+    Tests for CustomBigQueryJobSensor
+    """
+
+    def create_sensor(self, job_id) -> CustomBigQueryJobSensor:
+        """
+        Create a sensor with a mocked BigQuery client
+        """
+        sensor = CustomBigQueryJobSensor(
+            task_id='wait_for_jobs',
+            project_id=TEST_PROJECT_ID,
+            job_id=job_id,
+            gcp_conn_id=TEST_GCP_CONN_ID
+        )
+        sensor.hook = MagicMock()
+        self.client = sensor.hook.get_bigquery_client.return_value
+        return sensor
+
+    def test_waits_until_all_jobs_are_done(self):
+        """
+        Test that the sensor only succeeds once every job has finished
+        """
+        sensor = self.create_sensor(['job_1', 'job_2'])
+        self.client.get_job.side_effect = [
+            create_mock_job('DONE'), create_mock_job('RUNNING'),
+            create_mock_job('DONE')
+        ]
+
+        self.assertFalse(sensor.poke({}))
+        self.assertTrue(sensor.poke({}))
+        # job_1 is not fetched again once it has finished
+        self.assertEqual(self.client.get_job.call_count, 3)
+
+    def test_accepts_job_handles(self):
+        """
+        Test that handles returned by BigQueryClient.submit_load are accepted
+        """
+        sensor = self.create_sensor([{'job_id': 'job_1', 'project': 'other', 'location': 'EU'}])
+        self.client.get_job.return_value = create_mock_job('DONE')
+
+        self.assertTrue(sensor.poke({}))
+        self.client.get_job.assert_called_once_with(job_id='job_1', project='other', location='EU')
+
+    def test_accepts_job_handles_rendered_as_string(self):
+        """
+        Test that handles templated from XCom without native rendering are parsed back
+        """
+        rendered = str([{'job_id': 'job_1', 'project': 'other', 'location': 'EU'}, {'job_id': 'job_2'}])
+        sensor = self.create_sensor(rendered)
+
+        self.assertEqual(sensor._get_job_refs(), [
+            {'job_id': 'job_1', 'project': 'other', 'location': 'EU'},
+            {'job_id': 'job_2', 'project': TEST_PROJECT_ID, 'location': 'US'}
+        ])
+        self.assertEqual(self.create_sensor('["job_1", "job_2"]')._get_job_refs()[1]['job_id'], 'job_2')
+        with self.assertRaises(AirflowException):
+            self.create_sensor('[job_1, job_2')._get_job_refs()
+
+    def test_failed_job_raises(self):
+        """
+        Test that a failed job fails the sensor
+        """
+        sensor = self.create_sensor('job_1')
+        self.client.get_job.return_value = create_mock_job('DONE', {'reason': 'invalid'})
+
+        with self.assertRaises(AirflowException):
+            sensor.poke({})
+
+    def test_lists_running_jobs_for_many_jobs_in_a_project(self):
+        """
+        Test that a sensor waiting on many jobs in a project lists them instead of fetching each
+        """
+        sensor = self.create_sensor([f"job_{i}" for i in range(10)])
+        listed = []
+        for i in range(1, 10):
+            job = MagicMock()
+            job.job_id = f"job_{i}"
+            listed.append(job)
+        self.client.list_jobs.return_value = listed
+        self.client.get_job.return_value = create_mock_job('DONE')
+
+        self.assertFalse(sensor.poke({}))
+        self.client.list_jobs.assert_called_once_with(project=TEST_PROJECT_ID, state_filter='running')
+        # Only the job missing from the listing is fetched
+        self.client.get_job.assert_called_once_with(job_id='job_0', project=TEST_PROJECT_ID, location='US')
+
+    def test_fetches_few_jobs_without_listing(self):
+        """
+        Test that a sensor waiting on a few jobs uses jobs.get only
+        """
+        sensor = self.create_sensor(['job_1', 'job_2'])
+        self.client.get_job.return_value = create_mock_job('RUNNING')
+
+        self.assertFalse(sensor.poke({}))
+        self.client.list_jobs.assert_not_called()
+        self.assertEqual(self.client.get_job.call_count, 2)
+
+
+@pytest.mark.sensors
+class TestDeferrableGCPSensors(unittest.TestCase):
+    """
+    Tests for the deferrable mode of the GCP sensors and their triggers
+    """
+
+    def setUp(self):
+        """
+        Reset the job listings shared by job triggers
+        """
+        custom_gcp_trigger._job_sweeps.clear()
+
+    def test_defers_when_condition_not_met(self):
+        """
+        Test that a deferrable sensor hands the wait to its trigger
+        """
+        sensor = CustomGCSFileSensor(
+            task_id='wait_for_file',
+            bucket_name='test-bucket',
+            object_name='data/input.csv',
+            gcp_conn_id=TEST_GCP_CONN_ID,
+            poke_interval=30,
+            deferrable=True
+        )
+        sensor.hook = MagicMock()
+        sensor.hook.gcs_file_exists.return_value = False
+
+        with self.assertRaises(TaskDeferred) as raised:
+            sensor.execute({})
+
+        trigger = raised.exception.trigger
+        self.assertIsInstance(trigger, GCSObjectTrigger)
+        classpath, kwargs = trigger.serialize()
+        self.assertTrue(classpath.endswith('custom_gcp_trigger.GCSObjectTrigger'))
+        self.assertEqual(kwargs['poll_interval'], 30)
+
+    def test_does_not_defer_when_condition_met(self):
+        """
+        Test that no deferral happens when the first poke succeeds
+        """
+        sensor = CustomGCSFileSensor(
+            task_id='wait_for_file',
+            bucket_name='test-bucket',
+            object_name='data/input.csv',
+            deferrable=True
+        )
+        sensor.hook = MagicMock()
+        sensor.hook.gcs_file_exists.return_value = True
+
+        self.assertIsNone(sensor.execute({}))
+
+    def test_execute_complete_raises_on_error_event(self):
+        """
+        Test that an error event from the trigger fails the task
+        """
+        sensor = CustomBigQueryJobSensor(task_id='wait_for_jobs', project_id=TEST_PROJECT_ID, job_id='job_1')
+
+        with self.assertRaises(AirflowException):
+            sensor.execute_complete({}, {'status': 'error', 'message': 'job_1 failed'})
+
+    def test_job_trigger_fires_when_all_jobs_done(self):
+        """
+        Test that the job trigger keeps polling until every job has finished
+        """
+        jobs = [
+            {'job_id': 'job_1', 'project': TEST_PROJECT_ID, 'location': 'US'},
+            {'job_id': 'job_2', 'project': TEST_PROJECT_ID, 'location': 'US'}
+        ]
+        trigger = BigQueryJobTrigger(jobs=jobs, poll_interval=0)
+        trigger.get_json = AsyncMock(side_effect=[
+            # First cycle: job_2 is listed as running, job_1 is fetched
+            (200, {'jobs': [{'jobReference': {'jobId': 'job_2'}}]}),
+            (200, {'status': {'state': 'DONE'}}),
+            # Second cycle: job_2 is no longer listed
+            (200, {}),
+            (200, {'status': {'state': 'DONE'}})
+        ])
+
+        async def first_event():
+            async for event in trigger.run():
+                return event
+
+        event = asyncio.run(first_event())
+        self.assertEqual(event.payload['status'], 'success')
+        urls = [call.args[0] for call in trigger.get_json.call_args_list]
+        # job_2 is only fetched once it drops out of the listing, job_1 only once
+        self.assertEqual([url.rsplit('/', 1)[-1] for url in urls], ['jobs', 'job_1', 'jobs', 'job_2'])
+
+    def test_job_triggers_share_listing(self):
+        """
+        Test that job triggers on one event loop share a job listing per poll cycle
+        """
+        triggers = [
+            BigQueryJobTrigger(jobs=[{'job_id': f"job_{i}", 'project': TEST_PROJECT_ID, 'location': 'US'}])
+            for i in range(5)
+        ]
+        get_json = AsyncMock(return_value=(200, {'jobs': [
+            {'jobReference': {'jobId': f"job_{i}"}} for i in range(5)
+        ]}))
+        for trigger in triggers:
+            trigger.get_json = get_json
+
+        async def check_all():
+            return await asyncio.gather(*(trigger.check() for trigger in triggers))
+
+        self.assertEqual(asyncio.run(check_all()), [None] * 5)
+        get_json.assert_called_once()
+
+    def test_client_errors_end_the_wait(self):
+        """
+        Test that permission and not-found errors fail the wait while throttling and server errors are retried
+        """
+        object_trigger = GCSObjectTrigger(bucket_name='test-bucket', object_name='data/input.csv')
+        for status, expected in ((404, None), (429, None), (503, None), (403, 'error')):
+            object_trigger.get_json = AsyncMock(return_value=(status, {}))
+            payload = asyncio.run(object_trigger.check())
+            self.assertEqual(payload and payload['status'], expected, status)
+
+        job_trigger = BigQueryJobTrigger(
+            jobs=[{'job_id': 'job_1', 'project': TEST_PROJECT_ID, 'location': 'US'}], poll_interval=0
+        )
+        job_trigger.get_json = AsyncMock(side_effect=[(200, {}), (404, {})])
+        payload = asyncio.run(job_trigger.check())
+        self.assertEqual(payload['status'], 'error')
+        self.assertIn('job_1', payload['message'])
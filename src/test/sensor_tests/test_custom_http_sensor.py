@@ -2,7 +2,9 @@
 Unit tests for custom HTTP sensors to ensure compatibility with Airflow 2.X during migration from Airflow 1.10.15 to Cloud Composer 2.
 Tests functionality, error handling, and backward compatibility for HTTP-based sensors.
 """
+import asyncio  # standard library - Runs trigger coroutines in tests
 import pytest  # pytest v6.0+ - Testing framework for Python
+import unittest  # standard library - TestCase base for trigger tests
 import unittest.mock  # standard library - Mocking framework for unit tests
 import requests  # requests 2.25.0+ - HTTP library for testing response objects
 import json  # standard library - JSON parsing for HTTP response testing
@@ -10,6 +12,7 @@ from typing import Dict, Any, Callable, List, Optional  # Typing hints for bette
 
 from jsonpath_ng import parse as parse_jsonpath  # jsonpath-ng 1.5.0+ - JSONPath implementation for testing JSON sensors
 from airflow.providers.http.sensors.http import HttpSensor  # airflow.providers.http 2.0+ - Airflow 2.X HTTP sensor for compatibility testing
+from airflow.exceptions import AirflowException, TaskDeferred  # airflow v2.2.0+ - Deferral signal raised by sensors
 
 # Conditional import for Airflow 1.X HTTP sensor
 try:
@@ -19,6 +22,7 @@ except ImportError:
 
 # Internal imports
 from backend.plugins.sensors.custom_http_sensor import CustomHttpSensor, CustomHttpJsonSensor, CustomHttpStatusSensor  # Import the custom HTTP sensor for testing
+from backend.plugins.triggers.custom_http_trigger import HttpSensorTrigger, SharedResponse  # Trigger backing the deferrable mode
 from backend.plugins.hooks.custom_http_hook import CustomHTTPHook  # Import the custom HTTP hook to understand dependency behavior
 from test.fixtures.mock_hooks import MockCustomHTTPHook, create_mock_custom_http_hook  # Import mock HTTP hook for testing without real HTTP connections
 from test.fixtures.mock_sensors import MockHttpSensor, create_mock_http_sensor  # Import mock HTTP sensor for isolated testing
@@ -426,6 +430,27 @@ class TestCustomHttpSensor(Airflow2CompatibilityTestMixin):
         result = sensor.poke(self.context)
         assert result is False
 
+    def test_hook_reused_across_pokes(self):
+        """Test that one hook serves every poke and is dropped, leaving the shared session open, on kill"""
+        self.mock_http_hook.run = unittest.mock.MagicMock(return_value=requests.Response())
+        self.mock_http_hook.run.return_value.status_code = 200
+
+        sensor = CustomHttpSensor(
+            task_id=self.task_id,
+            endpoint=self.endpoint,
+            http_conn_id=TEST_HTTP_CONN_ID
+        )
+
+        with unittest.mock.patch('backend.plugins.sensors.custom_http_sensor._get_hook',
+                                 return_value=self.mock_http_hook) as get_hook:
+            for _ in range(3):
+                assert sensor.poke(self.context) is True
+            sensor.on_kill()
+
+        assert get_hook.call_count == 1
+        assert sensor.hook is None
+        self.mock_http_hook.get_conn.return_value.close.assert_not_called()
+
 
 class TestCustomHttpJsonSensor(Airflow2CompatibilityTestMixin):
     """Test class for the CustomHttpJsonSensor"""
@@ -481,6 +506,26 @@ class TestCustomHttpJsonSensor(Airflow2CompatibilityTestMixin):
         result = sensor.poke(self.context)
         assert result is False
 
+    def test_json_path_streaming(self):
+        """Test that streamed JSONPath evaluation requests a stream and stops at the first match"""
+        body = json.dumps({'jobs': [{'state': 'running'}, {'state': 'done'}, {'state': 'running'}]}).encode('utf-8')
+        response = requests.Response()
+        response.status_code = 200
+        response.iter_content = unittest.mock.MagicMock(return_value=iter([body[:20], body[20:]]))
+        self.mock_http_hook.run = unittest.mock.MagicMock(return_value=response)
+
+        sensor = CustomHttpJsonSensor(
+            task_id=self.task_id,
+            endpoint=self.endpoint,
+            http_conn_id=TEST_HTTP_CONN_ID,
+            json_path='$.jobs[*].state',
+            expected_value='done',
+            stream_response=True
+        )
+
+        assert sensor.poke(self.context) is True
+        assert self.mock_http_hook.run.call_args.kwargs['extra_options'] == {'stream': True}
+
 
 class TestCustomHttpStatusSensor(Airflow2CompatibilityTestMixin):
     """Test class for the CustomHttpStatusSensor"""
@@ -541,6 +586,161 @@ class TestCustomHttpStatusSensor(Airflow2CompatibilityTestMixin):
         assert result is True
 
 
+@pytest.mark.sensors
+class TestDeferrableHttpSensors(unittest.TestCase):
+    """Tests for the deferrable mode of the HTTP sensors and their trigger"""
+
+    def test_defers_with_json_path_trigger(self):
+        """Test that a deferrable JSON sensor hands its condition to the trigger"""
+        sensor = CustomHttpJsonSensor(
+            task_id='wait_for_ready',
+            endpoint='/api/status',
+            json_path='$.status',
+            expected_value='ready',
+            poke_interval=30,
+            deferrable=True,
+            share_requests=True
+        )
+
+        with unittest.mock.patch.object(sensor, 'poke', return_value=False):
+            with self.assertRaises(TaskDeferred) as raised:
+                sensor.execute({})
+
+        classpath, kwargs = raised.exception.trigger.serialize()
+        self.assertTrue(classpath.endswith('custom_http_trigger.HttpSensorTrigger'))
+        self.assertEqual(kwargs['json_path'], '$.status')
+        self.assertEqual(kwargs['expected_value'], 'ready')
+        self.assertEqual(kwargs['poll_interval'], 30)
+        self.assertEqual(kwargs['batch_window'], 30)
+
+    def test_custom_response_check_cannot_defer(self):
+        """Test that a callable response_check is rejected in deferrable mode"""
+        with self.assertRaises(AirflowException):
+            CustomHttpSensor(
+                task_id='wait_for_ok',
+                endpoint=TEST_ENDPOINT,
+                response_check=lambda response: True,
+                deferrable=True
+            )
+
+    def test_trigger_conditions(self):
+        """Test the trigger's status, pattern and JSONPath checks"""
+        json_trigger = HttpSensorTrigger(endpoint='/api/status', json_path='$.status', expected_value='ready')
+        self.assertTrue(json_trigger.check(SharedResponse(200, '{"status": "ready"}')))
+        self.assertFalse(json_trigger.check(SharedResponse(200, '{"status": "pending"}')))
+        self.assertFalse(json_trigger.check(SharedResponse(503, '{"status": "ready"}')))
+
+        status_trigger = HttpSensorTrigger(endpoint='/api/status', expected_status_codes=[404])
+        self.assertTrue(status_trigger.check(SharedResponse(404, 'Not Found')))
+
+        pattern_trigger = HttpSensorTrigger(endpoint=TEST_ENDPOINT, pattern='O+K')
+        self.assertTrue(pattern_trigger.check(SharedResponse(200, 'OOK')))
+
+    def test_triggers_share_one_request_per_window(self):
+        """Test that triggers polling the same request within the batch window share a response"""
+        triggers = [
+            HttpSensorTrigger(endpoint='/api/status', pattern='ready', poll_interval=0, batch_window=60)
+            for _ in range(3)
+        ]
+        request = unittest.mock.AsyncMock(return_value=SharedResponse(200, 'ready'))
+
+        async def first_events():
+            events = []
+            for trigger in triggers:
+                async for event in trigger.run():
+                    events.append(event)
+                    break
+            return events
+
+        with unittest.mock.patch.object(HttpSensorTrigger, '_request', request):
+            events = asyncio.run(first_events())
+
+        self.assertEqual([event.payload['status'] for event in events], ['success'] * 3)
+        self.assertEqual(request.call_count, 1)
+
+    def test_expired_shared_responses_are_pruned(self):
+        """Test that shared responses are dropped once their batch window has passed"""
+        from backend.plugins.triggers import custom_http_trigger
+        custom_http_trigger._shared_responses.clear()
+        request = unittest.mock.AsyncMock(return_value=SharedResponse(200, 'ready'))
+
+        async def poll_endpoints():
+            for index in range(5):
+                await HttpSensorTrigger(endpoint=f'/api/status/{index}', batch_window=0.01).fetch()
+                await asyncio.sleep(0.02)
+
+        with unittest.mock.patch.object(HttpSensorTrigger, '_request', request):
+            asyncio.run(poll_endpoints())
+
+        self.assertEqual(request.call_count, 5)
+        self.assertEqual(len(custom_http_trigger._shared_responses), 1)
+
+    def test_trigger_sends_the_same_body_as_poke_mode(self):
+        """Test that a deferred POST sends the body and Content-Type that HttpHook.run sends"""
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from backend.plugins.triggers import custom_http_trigger
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                received.append((self.headers.get('Content-Type'), body))
+                self.send_response(200)
+                self.send_header('Content-Length', '2')
+                self.end_headers()
+                self.wfile.write(b'OK')
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        connection = unittest.mock.MagicMock(
+            host='127.0.0.1', schema='http', port=server.server_port, login=None, password=None
+        )
+        connection.extra_dejson = {}
+        custom_http_trigger._connection_settings.clear()
+
+        async def deferred_request(data):
+            try:
+                return await HttpSensorTrigger(endpoint=TEST_ENDPOINT, method='POST', data=data)._request()
+            finally:
+                await custom_http_trigger.get_shared_session().close()
+
+        try:
+            with unittest.mock.patch('airflow.hooks.base.BaseHook.get_connection', return_value=connection):
+                for data in ({'batch_id': '7', 'state': 'done'}, '{"batch_id": 7}'):
+                    received.clear()
+                    CustomHTTPHook(http_conn_id=TEST_HTTP_CONN_ID, method='POST').run(endpoint=TEST_ENDPOINT, data=data)
+                    asyncio.run(deferred_request(data))
+                    self.assertEqual(received[0], received[1])
+        finally:
+            server.shutdown()
+            custom_http_trigger._connection_settings.clear()
+
+    def test_connection_settings_expire(self):
+        """Test that connection settings are re-read after SESSION_CACHE_TTL"""
+        from backend.plugins.triggers import custom_http_trigger
+        custom_http_trigger._connection_settings.clear()
+        connection = unittest.mock.MagicMock(host='api.example.com', schema='https', port=None, login=None)
+        connection.extra_dejson = {}
+
+        async def resolve():
+            return await custom_http_trigger.get_connection_settings(TEST_HTTP_CONN_ID)
+
+        with unittest.mock.patch('airflow.hooks.base.BaseHook.get_connection', return_value=connection) as mock_get:
+            asyncio.run(resolve())
+            asyncio.run(resolve())
+            self.assertEqual(mock_get.call_count, 1)
+
+            custom_http_trigger._connection_settings[TEST_HTTP_CONN_ID]['created'] -= (
+                custom_http_trigger.SESSION_CACHE_TTL + 1
+            )
+            asyncio.run(resolve())
+            self.assertEqual(mock_get.call_count, 2)
+
+
 class TestAirflow2Compatibility(Airflow2CompatibilityTestMixin):
     """Test class for validating Airflow 2.X compatibility"""
 
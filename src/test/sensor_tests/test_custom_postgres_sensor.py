@@ -4,17 +4,26 @@ This file validates the functionality of the custom PostgreSQL sensors during th
 from Airflow 1.10.15 to Airflow 2.X, ensuring proper database monitoring capabilities across environments.
 """
 
+import asyncio  # Python standard library
 import unittest  # Python standard library
 import pytest  # pytest v6.0.0+
-from unittest.mock import patch, MagicMock  # Python standard library
+from unittest.mock import patch, AsyncMock, MagicMock  # Python standard library
 
-from airflow.exceptions import AirflowException  # airflow v2.0.0+
+from airflow import DAG  # airflow v2.0.0+
+from airflow.models import Variable  # airflow v2.0.0+
+from airflow.exceptions import AirflowException, AirflowSensorTimeout, TaskDeferred  # airflow v2.2.0+
+from airflow.operators.empty import EmptyOperator  # airflow v2.3.0+
+from airflow.sensors.base import BaseSensorOperator  # airflow v2.0.0+
+from airflow.utils.state import DagRunState, TaskInstanceState  # airflow v2.2.0+
+from airflow.utils.types import DagRunType  # airflow v2.0.0+
 
 # Internal module imports
-from src.backend.plugins.sensors.custom_postgres_sensor import CustomPostgresSensor, CustomPostgresTableExistenceSensor, CustomPostgresRowCountSensor, CustomPostgresValueCheckSensor  # Main PostgreSQL sensor class to test
+from src.backend.plugins.sensors.custom_postgres_sensor import CustomPostgresSensor, CustomPostgresTableExistenceSensor, CustomPostgresRowCountSensor, CustomPostgresValueCheckSensor, CustomPostgresMultiSensor  # Main PostgreSQL sensor class to test
 from src.backend.plugins.hooks.custom_postgres_hook import CustomPostgresHook  # PostgreSQL hook used by sensors
+from src.backend.plugins.triggers.custom_postgres_trigger import PostgresNotifyTrigger, to_positional  # Trigger backing the deferrable mode
 from src.test.fixtures.mock_hooks import MockCustomPostgresHook, create_mock_custom_postgres_hook  # Mock hook for testing PostgreSQL sensors
 from src.test.fixtures.mock_sensors import create_mock_context  # Create mock Airflow context for testing sensors
+from src.test.fixtures.mock_data import DEFAULT_DATE, DEFAULT_DATE_AIRFLOW2  # Start date for test DAGs
 from src.test.utils.airflow2_compatibility_utils import is_airflow2, Airflow2CompatibilityTestMixin  # Check if running in Airflow 2.X environment
 
 # Global constants
@@ -138,7 +147,7 @@ class TestCustomPostgresSensor(Airflow2CompatibilityTestMixin, unittest.TestCase
         result = self.sensor.poke(context)
 
         # Verify hook.execute_query was called with correct SQL and parameters
-        self.mock_hook.execute_query.assert_called_once_with(sql=TEST_SQL, parameters=TEST_PARAMS)
+        self.mock_hook.execute_query.assert_called_once_with(sql=TEST_SQL, parameters=TEST_PARAMS, autocommit=True)
 
         # Verify poke returns True when records exist
         self.assertTrue(result)
@@ -155,7 +164,7 @@ class TestCustomPostgresSensor(Airflow2CompatibilityTestMixin, unittest.TestCase
         result = self.sensor.poke(context)
 
         # Verify hook.execute_query was called with correct SQL and parameters
-        self.mock_hook.execute_query.assert_called_once_with(sql=TEST_SQL, parameters=TEST_PARAMS)
+        self.mock_hook.execute_query.assert_called_once_with(sql=TEST_SQL, parameters=TEST_PARAMS, autocommit=True)
 
         # Verify poke returns False when no records exist
         self.assertFalse(result)
@@ -194,6 +203,29 @@ class TestCustomPostgresSensor(Airflow2CompatibilityTestMixin, unittest.TestCase
         # (Implementation of alert utility is not mocked here, only checking that it's called)
         pass
 
+    def test_hook_reused_across_pokes(self):
+        """Test that one hook serves every poke and is closed when the sensor is killed"""
+        context = create_mock_context()
+
+        with patch('src.backend.plugins.sensors.custom_postgres_sensor._get_hook',
+                   return_value=self.mock_hook) as get_hook:
+            for _ in range(3):
+                self.assertTrue(self.sensor.poke(context))
+            self.sensor.on_kill()
+
+        self.assertEqual(get_hook.call_count, 1)
+        # Keeping the connection open between pokes is opt-in
+        self.assertFalse(get_hook.call_args.kwargs['use_persistent_connection'])
+        self.mock_hook.close_conn.assert_called_once()
+        self.assertIsNone(self.sensor.hook)
+
+    def test_hook_closed_after_execute(self):
+        """Test that the kept connection is closed when the sensor finishes"""
+        self.sensor.execute(create_mock_context())
+
+        self.mock_hook.close_conn.assert_called_once()
+        self.assertIsNone(self.sensor.hook)
+
     @pytest.mark.skipif(not is_airflow2(), reason="requires Airflow 2.X")
     def test_airflow2_compatibility(self):
         """Test compatibility with Airflow 2.X specific features"""
@@ -296,7 +328,7 @@ class TestCustomPostgresTableExistenceSensor(Airflow2CompatibilityTestMixin, uni
                 AND    c.relkind = 'r'    
             );
         """
-        self.mock_hook.execute_query.assert_called_once_with(sql=expected_sql, parameters={})
+        self.mock_hook.execute_query.assert_called_once_with(sql=expected_sql, parameters={}, autocommit=True)
 
     def test_poke_table_does_not_exist(self):
         """Test poke returns False when table does not exist"""
@@ -436,7 +468,7 @@ class TestCustomPostgresRowCountSensor(Airflow2CompatibilityTestMixin, unittest.
 
         # Verify SQL contains WHERE clause
         expected_sql_with_where = f"SELECT COUNT(*) FROM {TEST_SCHEMA}.{self.table_name} WHERE col1 > 10"
-        self.mock_hook.execute_query.assert_called_once_with(sql=expected_sql_with_where, parameters={})
+        self.mock_hook.execute_query.assert_called_once_with(sql=expected_sql_with_where, parameters={}, autocommit=True)
 
         # Verify poke result based on filtered count
         self.assertTrue(result)
@@ -659,4 +691,295 @@ class TestCustomPostgresValueCheckSensor(Airflow2CompatibilityTestMixin, unittes
         self.assertTrue(sensor_none.poke(create_mock_context()))
 
         # Verify correct type handling and comparison
-        pass
\ No newline at end of file
+        pass
+
+
+class TestCustomPostgresMultiSensor(Airflow2CompatibilityTestMixin, unittest.TestCase):
+    """Test cases for the CustomPostgresMultiSensor"""
+
+    def setUp(self):
+        """Set up test resources before each test"""
+        self.mock_hook = create_mock_custom_postgres_hook(TEST_POSTGRES_CONN_ID, TEST_SCHEMA, {})
+        self.patcher = patch('src.backend.plugins.sensors.custom_postgres_sensor._get_hook', return_value=self.mock_hook)
+        self.patcher.start()
+        self.variable_patcher = patch('src.backend.plugins.sensors.custom_postgres_sensor.Variable')
+        self.mock_variable = self.variable_patcher.start()
+        self.mock_variable.get.return_value = None
+
+        self.conditions = {
+            'orders_loaded': {'type': 'row_count', 'table': 'orders', 'min_rows': 3},
+            'dim_exists': {'type': 'table_exists', 'table': 'dim'},
+            'batch_done': {'type': 'value', 'sql': "SELECT status FROM batches WHERE id = 1", 'expected_value': 'done'}
+        }
+
+    def tearDown(self):
+        """Clean up test resources after each test"""
+        self.variable_patcher.stop()
+        self.patcher.stop()
+
+    def test_init_rejects_invalid_conditions(self):
+        """Test that unknown condition types and branches are rejected"""
+        with self.assertRaises(AirflowException):
+            CustomPostgresMultiSensor(task_id='test_multi', conditions={'bad': {'type': 'unknown'}})
+        with self.assertRaises(AirflowException):
+            CustomPostgresMultiSensor(task_id='test_multi', conditions=self.conditions, branches={'missing': ['task']})
+
+    def test_poke_evaluates_conditions_in_one_query(self):
+        """Test that pending conditions share one query and met conditions are not queried again"""
+        sensor = CustomPostgresMultiSensor(task_id='test_multi', conditions=self.conditions)
+
+        # orders does not exist yet, so only its catalog check is sent
+        self.mock_hook.execute_query.return_value = [
+            ('table', 'orders_loaded', 'false'),
+            ('condition', 'dim_exists', 'true'),
+            ('condition', 'batch_done', 'running')
+        ]
+        self.assertFalse(sensor.poke(create_mock_context()))
+        self.assertEqual(self.mock_hook.execute_query.call_count, 1)
+        self.assertNotIn('COUNT(*)', self.mock_hook.execute_query.call_args.kwargs['sql'])
+
+        # orders appears, so its rows are counted in the same poke
+        self.mock_hook.execute_query.reset_mock()
+        self.mock_hook.execute_query.side_effect = [
+            [('table', 'orders_loaded', 'true'), ('condition', 'batch_done', 'done')],
+            [('condition', 'orders_loaded', '3')]
+        ]
+        self.assertTrue(sensor.poke(create_mock_context()))
+        self.assertEqual(self.mock_hook.execute_query.call_count, 2)
+        last_sql = self.mock_hook.execute_query.call_args.kwargs['sql']
+        self.assertIn('LIMIT 3', last_sql)
+        self.assertNotIn('UNION ALL', last_sql)
+
+    def test_timeout_skips_unmet_branches(self):
+        """Test that a timeout with skip_unmet_branches releases only the met branches"""
+        with DAG('test_multi_dag', start_date=DEFAULT_DATE, schedule_interval=None):
+            sensor = CustomPostgresMultiSensor(
+                task_id='test_multi',
+                conditions=self.conditions,
+                branches={'orders_loaded': ['load_orders'], 'dim_exists': ['load_dim']},
+                skip_unmet_branches=True
+            )
+            sensor >> [EmptyOperator(task_id='load_orders'), EmptyOperator(task_id='load_dim')]
+        sensor._met = {'orders_loaded'}
+        context = create_mock_context(custom_params={'dag_run': MagicMock()})
+
+        with patch.object(BaseSensorOperator, 'execute', side_effect=AirflowSensorTimeout('timed out')), \
+                patch.object(CustomPostgresMultiSensor, 'skip') as skip:
+            self.assertEqual(sensor.execute(context), ['orders_loaded'])
+
+        skipped_tasks = skip.call_args.args[2]
+        self.assertEqual([task.task_id for task in skipped_tasks], ['load_dim'])
+
+    def test_execute_restores_conditions_met_by_previous_try(self):
+        """Test that a new try starts from the met conditions saved by the previous one"""
+        with DAG('test_multi_dag', start_date=DEFAULT_DATE, schedule_interval=None):
+            sensor = CustomPostgresMultiSensor(
+                task_id='test_multi',
+                conditions=self.conditions,
+                branches={'orders_loaded': ['load_orders'], 'dim_exists': ['load_dim']},
+                skip_unmet_branches=True
+            )
+            sensor >> [EmptyOperator(task_id='load_orders'), EmptyOperator(task_id='load_dim')]
+        context = create_mock_context(custom_params={'dag_run': MagicMock(), 'ti': MagicMock()})
+        self.mock_variable.get.return_value = ['orders_loaded']
+
+        with patch.object(BaseSensorOperator, 'execute', side_effect=AirflowSensorTimeout('timed out')), \
+                patch.object(CustomPostgresMultiSensor, 'skip') as skip:
+            self.assertEqual(sensor.execute(context), ['orders_loaded'])
+
+        key = 'postgres_multi_sensor_met.test_multi_dag.test_run.test_multi'
+        self.mock_variable.get.assert_called_once_with(key, default_var=None, deserialize_json=True)
+        self.mock_variable.delete.assert_called_once_with(key)
+        self.assertEqual([task.task_id for task in skip.call_args.args[2]], ['load_dim'])
+
+
+class TestCustomPostgresMultiSensorReschedule(unittest.TestCase):
+    """Test that the CustomPostgresMultiSensor keeps its met conditions across real reschedules"""
+
+    def setUp(self):
+        """Set up test resources before each test"""
+        self.mock_hook = create_mock_custom_postgres_hook(TEST_POSTGRES_CONN_ID, TEST_SCHEMA, {})
+        self.patcher = patch('src.backend.plugins.sensors.custom_postgres_sensor._get_hook', return_value=self.mock_hook)
+        self.patcher.start()
+
+    def tearDown(self):
+        """Clean up test resources after each test"""
+        self.patcher.stop()
+
+    def test_met_conditions_survive_reschedule(self):
+        """Test that a condition met in one try is not queried again after Airflow clears the XComs"""
+        dag = DAG('test_multi_reschedule_dag', start_date=DEFAULT_DATE_AIRFLOW2, schedule_interval=None)
+        sensor = CustomPostgresMultiSensor(
+            task_id='test_multi',
+            conditions={
+                'dim_exists': {'type': 'table_exists', 'table': 'dim'},
+                'batch_done': {'type': 'value', 'sql': "SELECT status FROM batches WHERE id = 1",
+                               'expected_value': 'done'}
+            },
+            mode='reschedule',
+            poke_interval=60,
+            timeout=3600,
+            dag=dag
+        )
+        dag_run = dag.create_dagrun(
+            run_id='test_multi_reschedule',
+            state=DagRunState.RUNNING,
+            execution_date=DEFAULT_DATE_AIRFLOW2,
+            data_interval=(DEFAULT_DATE_AIRFLOW2, DEFAULT_DATE_AIRFLOW2),
+            run_type=DagRunType.MANUAL
+        )
+        key = 'postgres_multi_sensor_met.test_multi_reschedule_dag.test_multi_reschedule.test_multi'
+        self.mock_hook.execute_query.side_effect = [
+            # First try: only dim_exists is met
+            [('condition', 'dim_exists', 'true'), ('condition', 'batch_done', 'running')],
+            # Second try: dim_exists is no longer queried
+            [('condition', 'batch_done', 'done')]
+        ]
+
+        try:
+            ti = dag_run.get_task_instance('test_multi')
+            ti.refresh_from_task(sensor)
+            ti.run(ignore_all_deps=True)
+            self.assertEqual(ti.state, TaskInstanceState.UP_FOR_RESCHEDULE)
+            self.assertEqual(Variable.get(key, deserialize_json=True), ['dim_exists'])
+
+            # Each try executes a fresh copy of the operator, and Airflow clears its XComs first
+            ti.run(ignore_all_deps=True)
+            self.assertEqual(ti.state, TaskInstanceState.SUCCESS)
+            second_parameters = self.mock_hook.execute_query.call_args.kwargs['parameters']
+            self.assertNotIn('dim_exists', second_parameters.values())
+            # The saved state is removed once the sensor finishes
+            self.assertIsNone(Variable.get(key, default_var=None))
+        finally:
+            Variable.delete(key)
+
+
+class TestDeferrablePostgresValueCheckSensor(unittest.TestCase):
+    """Test cases for the deferrable mode of CustomPostgresValueCheckSensor and its trigger"""
+
+    def setUp(self):
+        """Set up test resources before each test"""
+        self.mock_hook = create_mock_custom_postgres_hook(TEST_POSTGRES_CONN_ID, TEST_SCHEMA, {})
+        self.patcher = patch('src.backend.plugins.sensors.custom_postgres_sensor._get_hook', return_value=self.mock_hook)
+        self.patcher.start()
+
+    def tearDown(self):
+        """Clean up test resources after each test"""
+        self.patcher.stop()
+
+    def test_defers_to_notify_trigger(self):
+        """Test that a deferrable sensor hands the wait to a LISTEN trigger after one check"""
+        self.mock_hook.execute_query.return_value = [('running',)]
+        sensor = CustomPostgresValueCheckSensor(
+            task_id='wait_for_batch',
+            sql="SELECT status FROM batches WHERE id = %(batch_id)s",
+            params={'batch_id': 7},
+            expected_value='done',
+            deferrable=True,
+            notify_channel='batch_status',
+            fallback_poll_interval=600
+        )
+
+        with self.assertRaises(TaskDeferred) as raised:
+            sensor.execute(create_mock_context())
+
+        classpath, kwargs = raised.exception.trigger.serialize()
+        self.assertTrue(classpath.endswith('custom_postgres_trigger.PostgresNotifyTrigger'))
+        self.assertEqual(kwargs['channel'], 'batch_status')
+        self.assertEqual(kwargs['poll_interval'], 600)
+        self.mock_hook.close_conn.assert_called_once()
+
+    def test_trigger_parameters_survive_serialization(self):
+        """Test that query parameters reach the triggerer as a dict"""
+        from airflow.serialization.serialized_objects import BaseSerialization  # airflow v2.2.0+
+        sensor = CustomPostgresValueCheckSensor(
+            task_id='wait_for_batch',
+            sql="SELECT status FROM batches WHERE id = %(batch_id)s",
+            params={'batch_id': 7},
+            expected_value='done',
+            deferrable=True
+        )
+
+        classpath, kwargs = sensor.build_trigger().serialize()
+        trigger = PostgresNotifyTrigger(**BaseSerialization.deserialize(BaseSerialization.serialize(kwargs)))
+
+        self.assertEqual(trigger.parameters, {'batch_id': 7})
+        self.assertEqual(to_positional(trigger.sql, trigger.parameters)[1], [7])
+
+    def test_trigger_reports_unbindable_parameters(self):
+        """Test that parameters that cannot be bound end the wait with an error event"""
+        trigger = PostgresNotifyTrigger(
+            sql="SELECT status FROM batches WHERE id = %(batch_id)s",
+            expected_value='done',
+            parameters="{'batch_id': 7}"
+        )
+
+        async def first_event():
+            async for event in trigger.run():
+                return event
+
+        with patch('src.backend.plugins.triggers.custom_postgres_trigger.get_listener', AsyncMock()) as get_listener:
+            event = asyncio.run(first_event())
+
+        self.assertEqual(event.payload['status'], 'error')
+        get_listener.assert_not_called()
+
+    def test_to_positional(self):
+        """Test conversion of pyformat placeholders to asyncpg placeholders"""
+        sql, args = to_positional(
+            "SELECT 1 FROM t WHERE a = %(a)s AND b LIKE 'x%%' AND c = %(a)s OR d = %(d)s", {'a': 1, 'd': 2}
+        )
+        self.assertEqual(sql, "SELECT 1 FROM t WHERE a = $1 AND b LIKE 'x%' AND c = $1 OR d = $2")
+        self.assertEqual(args, [1, 2])
+
+    def test_trigger_checks_on_matching_notification(self):
+        """Test that the trigger re-checks only when a matching notification arrives"""
+        trigger = PostgresNotifyTrigger(
+            sql="SELECT status FROM batches WHERE id = 7",
+            expected_value='done',
+            channel='batch_status',
+            payload_pattern='^7$',
+            poll_interval=60
+        )
+        queue = asyncio.Queue()
+        listener = MagicMock()
+        listener.subscribe = AsyncMock(return_value=queue)
+        listener.unsubscribe = AsyncMock()
+        listener.fetch_value = AsyncMock(side_effect=[(True, 'running'), (True, 'done')])
+
+        async def first_event():
+            for payload in ('8', '7'):
+                queue.put_nowait(payload)
+            async for event in trigger.run():
+                return event
+
+        with patch('src.backend.plugins.triggers.custom_postgres_trigger.get_listener', AsyncMock(return_value=listener)):
+            event = asyncio.run(first_event())
+
+        self.assertEqual(event.payload['status'], 'success')
+        self.assertIn('notify', event.payload['message'])
+        # Initial check plus one check for the matching payload
+        self.assertEqual(listener.fetch_value.call_count, 2)
+        listener.unsubscribe.assert_awaited_once_with('batch_status', queue)
+
+    def test_trigger_reconnects_only_on_connection_errors(self):
+        """Test that a lost connection is retried while a failing query ends with an error event"""
+        asyncpg = pytest.importorskip('asyncpg')
+        trigger = PostgresNotifyTrigger(sql="SELECT status FROM batches WHERE id = 7", expected_value='done')
+        listener = MagicMock(closed=False)
+        listener.fetch_value = AsyncMock(side_effect=[ConnectionResetError('reset'), (True, 'done')])
+
+        async def first_event():
+            async for event in trigger.run():
+                return event
+
+        with patch('src.backend.plugins.triggers.custom_postgres_trigger.get_listener', AsyncMock(return_value=listener)), \
+                patch('src.backend.plugins.triggers.custom_postgres_trigger.RECONNECT_DELAY', 0):
+            self.assertEqual(asyncio.run(first_event()).payload['status'], 'success')
+
+            listener.fetch_value = AsyncMock(side_effect=asyncpg.UndefinedTableError('relation "batches" does not exist'))
+            event = asyncio.run(first_event())
+
+        self.assertEqual(event.payload['status'], 'error')
+        self.assertIn('batches', event.payload['message'])
+        listener.fetch_value.assert_awaited_once()
@@ -0,0 +1,893 @@
+"""
+Unit tests for the GCP utility functions and helper classes used by the Airflow DAGs.
+Covers the local caching and transfer helpers layered on top of the Google provider hooks.
+"""
+
+import os  # Python standard library
+import shutil  # Python standard library
+import tempfile  # Python standard library
+import unittest  # Python standard library
+from unittest.mock import MagicMock, patch  # Python standard library
+
+import pytest  # pytest-6.0+
+from airflow.exceptions import AirflowException  # apache-airflow-2.0.0+
+
+# Internal imports
+from src.backend.dags.utils import gcp_utils  # Module under test
+
+TEST_BUCKET = "test-bucket"
+TEST_OBJECT = "data/input.csv"
+TEST_CONTENT = b"id,value\n1,a\n2,b\n"
+
+
+def write_bytes(content: bytes):
+    """
+    Build a download_fn that writes the given content to the requested path
+    """
+    def _download(path):
+        with open(path, 'wb') as f:
+            f.write(content)
+    return MagicMock(side_effect=_download)
+
+
+@pytest.mark.unit
+class TestGCSDownloadCache(unittest.TestCase):
+    """
+    Tests for the content-addressed GCS download cache
+    """
+
+    def setUp(self):
+        """
+        Create an isolated cache directory for each test
+        """
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = gcp_utils.GCSDownloadCache(cache_dir=self.cache_dir, max_bytes=1024)
+
+    def tearDown(self):
+        """
+        Remove the cache directory
+        """
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_second_fetch_is_served_from_cache(self):
+        """
+        Test that an unchanged object is downloaded only once
+        """
+        metadata = {'generation': 1, 'etag': 'abc', 'size': len(TEST_CONTENT)}
+        download_fn = write_bytes(TEST_CONTENT)
+
+        first = self.cache.fetch(TEST_BUCKET, TEST_OBJECT, metadata, download_fn)
+        second = self.cache.fetch(TEST_BUCKET, TEST_OBJECT, metadata, download_fn)
+
+        self.assertEqual(first, second)
+        self.assertEqual(download_fn.call_count, 1)
+        with open(second, 'rb') as f:
+            self.assertEqual(f.read(), TEST_CONTENT)
+
+    def test_changed_etag_invalidates_entry(self):
+        """
+        Test that an entry whose etag no longer matches is downloaded again
+        """
+        download_fn = write_bytes(TEST_CONTENT)
+        self.cache.fetch(TEST_BUCKET, TEST_OBJECT, {'generation': 1, 'etag': 'abc'}, download_fn)
+        self.cache.fetch(TEST_BUCKET, TEST_OBJECT, {'generation': 1, 'etag': 'def'}, download_fn)
+
+        self.assertEqual(download_fn.call_count, 2)
+
+    def test_crc32c_mismatch_raises_and_leaves_no_entry(self):
+        """
+        Test that corrupted downloads are rejected
+        """
+        metadata = {'generation': 1, 'crc32c': 'AAAAAA=='}
+
+        with patch.object(gcp_utils.GCSDownloadCache, '_file_crc32c', return_value='BBBBBB=='):
+            with self.assertRaises(AirflowException):
+                self.cache.fetch(TEST_BUCKET, TEST_OBJECT, metadata, write_bytes(TEST_CONTENT))
+
+        self.assertEqual(list(self.cache.cache_dir.glob('*.data')), [])
+
+    def test_evicts_least_recently_used_entries(self):
+        """
+        Test that the cache stays under its byte budget by dropping the oldest entries
+        """
+        payload = b"x" * 600
+        old_path = self.cache.fetch(TEST_BUCKET, "old", {'generation': 1}, write_bytes(payload))
+        os.utime(old_path, (1, 1))
+
+        new_path = self.cache.fetch(TEST_BUCKET, "new", {'generation': 1}, write_bytes(payload))
+
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.exists(new_path))
+
+
+@pytest.mark.unit
+class TestGCSDownloadFileWithCache(unittest.TestCase):
+    """
+    Tests for gcs_download_file with the download cache enabled
+    """
+
+    @patch('src.backend.dags.utils.gcp_utils.GCSHook')
+    def test_use_cache_copies_cached_object(self, mock_hook_class):
+        """
+        Test that a cached download is copied to the requested local path
+        """
+        cache_dir = tempfile.mkdtemp()
+        target_dir = tempfile.mkdtemp()
+        try:
+            blob = MagicMock(generation=7, crc32c=None, etag='etag', size=len(TEST_CONTENT))
+            blob.download_to_filename.side_effect = write_bytes(TEST_CONTENT)
+            mock_hook_class.return_value.get_conn.return_value.bucket.return_value.get_blob.return_value = blob
+
+            local_path = os.path.join(target_dir, 'input.csv')
+            for _ in range(2):
+                result = gcp_utils.gcs_download_file(
+                    TEST_BUCKET, TEST_OBJECT, local_path, use_cache=True, cache_dir=cache_dir
+                )
+
+            self.assertEqual(result, local_path)
+            self.assertEqual(blob.download_to_filename.call_count, 1)
+            mock_hook_class.return_value.download.assert_not_called()
+            with open(local_path, 'rb') as f:
+                self.assertEqual(f.read(), TEST_CONTENT)
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            shutil.rmtree(target_dir, ignore_errors=True)
+
+
+@pytest.mark.unit
+class TestStageAndLoadToBigQuery(unittest.TestCase):
+    """
+    Tests for the Parquet staging path used for BigQuery loads
+    """
+
+    def setUp(self):
+        """
+        Create a CSV file to load
+        """
+        self.work_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.work_dir, 'transformed.csv')
+        with open(self.csv_path, 'wb') as f:
+            f.write(TEST_CONTENT)
+
+    def tearDown(self):
+        """
+        Remove the working directory
+        """
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_csv_to_parquet_handles_columns_empty_at_the_top(self):
+        """
+        Test that a column empty in the first block and given column types survive later blocks
+        """
+        pa = pytest.importorskip('pyarrow')
+        pq = pytest.importorskip('pyarrow.parquet')
+        with open(self.csv_path, 'w') as f:
+            f.write("id,note,amount\n")
+            f.writelines(f"{i},,{i}\n" for i in range(1000))
+            f.write("1000,late note,unknown\n")
+        parquet_path = os.path.join(self.work_dir, 'transformed.parquet')
+
+        rows = gcp_utils.csv_to_parquet(
+            self.csv_path, parquet_path, column_types={'amount': pa.string()}, block_size=1024
+        )
+
+        table = pq.read_table(parquet_path)
+        self.assertEqual(rows, 1001)
+        self.assertEqual(table.schema.field('note').type, pa.string())
+        self.assertEqual(table.column('note')[-1].as_py(), 'late note')
+        self.assertEqual(table.column('amount')[-1].as_py(), 'unknown')
+
+    @patch('src.backend.dags.utils.gcp_utils.gcs_delete_file')
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_load_data', return_value=True)
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_create_dataset', return_value=True)
+    @patch('src.backend.dags.utils.gcp_utils.gcs_upload_file')
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_get_table')
+    def test_csv_columns_follow_destination_table_types(self, mock_get_table, mock_upload,
+                                                        mock_create_dataset, mock_load, mock_delete):
+        """
+        Test that CSV columns are parsed as the existing table's column types
+        """
+        pa = pytest.importorskip('pyarrow')
+        pq = pytest.importorskip('pyarrow.parquet')
+        from google.cloud.bigquery import SchemaField  # google-cloud-bigquery-2.0.0+
+        mock_get_table.return_value = MagicMock(schema=[SchemaField('id', 'STRING'), SchemaField('value', 'STRING')])
+        staged_schemas = []
+        mock_upload.side_effect = lambda local_file_path, **kwargs: staged_schemas.append(
+            pq.read_schema(local_file_path)
+        )
+
+        gcp_utils.stage_and_load_to_bigquery(self.csv_path, TEST_BUCKET, 'ds', 'table', if_exists='append')
+
+        self.assertEqual(staged_schemas[0].field('id').type, pa.string())
+
+    @patch('src.backend.dags.utils.gcp_utils.gcs_delete_file')
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_load_data', return_value=True)
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_create_dataset', return_value=True)
+    @patch('src.backend.dags.utils.gcp_utils.gcs_upload_file')
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_get_table', return_value=None)
+    def test_loads_staged_parquet_from_gcs(self, mock_get_table, mock_upload, mock_create_dataset,
+                                           mock_load, mock_delete):
+        """
+        Test that the CSV is staged as Parquet and loaded from its GCS URI
+        """
+        pytest.importorskip('pyarrow')
+
+        rows = gcp_utils.stage_and_load_to_bigquery(
+            self.csv_path, TEST_BUCKET, 'ds', 'table', if_exists='append'
+        )
+
+        self.assertEqual(rows, 2)
+        object_name = mock_upload.call_args.kwargs['object_name']
+        self.assertRegex(object_name, r'^staging/bigquery/ds/table/transformed-[0-9a-f]{32}\.parquet$')
+        load_kwargs = mock_load.call_args.kwargs
+        self.assertEqual(load_kwargs['source_format'], 'PARQUET')
+        self.assertEqual(load_kwargs['write_disposition'], 'WRITE_APPEND')
+        mock_delete.assert_called_once_with(
+            bucket_name=TEST_BUCKET, object_name=object_name, conn_id=gcp_utils.DEFAULT_GCP_CONN_ID
+        )
+        # The intermediate Parquet file is removed after the load
+        self.assertFalse(os.path.exists(os.path.join(self.work_dir, 'transformed.parquet')))
+
+
+@pytest.mark.unit
+class TestStorageReadApi(unittest.TestCase):
+    """
+    Tests for reading query results through the BigQuery Storage Read API
+    """
+
+    @patch('src.backend.dags.utils.gcp_utils.BigQueryHook')
+    def test_batches_from_all_streams_are_yielded(self, mock_hook_class):
+        """
+        Test that record batches from every read stream reach the consumer
+        """
+        bigquery_storage = pytest.importorskip('google.cloud.bigquery_storage')
+        pa = pytest.importorskip('pyarrow')
+
+        client = mock_hook_class.return_value.get_client.return_value
+        client.query.return_value.destination = MagicMock(
+            project='proj', dataset_id='ds', table_id='anon'
+        )
+
+        streams = [MagicMock(), MagicMock()]
+        streams[0].name, streams[1].name = 'stream-0', 'stream-1'
+
+        def _pages(stream_name):
+            batch = pa.record_batch([pa.array([stream_name])], names=['stream'])
+            reader = MagicMock()
+            reader.rows.return_value.pages = [MagicMock(to_arrow=MagicMock(return_value=batch))]
+            return reader
+
+        with patch.object(bigquery_storage, 'BigQueryReadClient') as mock_read_client_class:
+            read_client = mock_read_client_class.return_value
+            read_client.create_read_session.return_value.streams = streams
+            read_client.read_rows.side_effect = _pages
+
+            batches = list(gcp_utils.bigquery_iter_arrow_batches("SELECT 1", max_streams=2))
+
+        names = sorted(batch.column(0)[0].as_py() for batch in batches)
+        self.assertEqual(names, ['stream-0', 'stream-1'])
+        self.assertEqual(read_client.create_read_session.call_args.kwargs['max_stream_count'], 2)
+
+    @patch('src.backend.dags.utils.gcp_utils.BigQueryHook')
+    def test_storage_api_runs_same_statement_as_hook(self, mock_hook_class):
+        """
+        Test that parameters and dialect match the default get_records/get_pandas_df path
+        """
+        bigquery_storage = pytest.importorskip('google.cloud.bigquery_storage')
+
+        client = mock_hook_class.return_value.get_client.return_value
+        with patch.object(bigquery_storage, 'BigQueryReadClient') as mock_read_client_class:
+            mock_read_client_class.return_value.create_read_session.return_value.streams = []
+            list(gcp_utils.bigquery_iter_arrow_batches(
+                "SELECT * FROM t WHERE day = %(day)s", query_params={'day': '2024-01-01'}
+            ))
+
+        self.assertEqual(client.query.call_args.args[0], "SELECT * FROM t WHERE day = '2024-01-01'")
+        self.assertTrue(client.query.call_args.kwargs['job_config'].use_legacy_sql)
+
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_query_to_dataframe')
+    def test_execute_query_routes_to_storage_api(self, mock_to_dataframe):
+        """
+        Test that execute_query uses the Storage Read API when requested
+        """
+        gcp_utils.BigQueryClient().execute_query("SELECT 1", as_dataframe=True, use_storage_api=True)
+
+        mock_to_dataframe.assert_called_once()
+
+
+@pytest.mark.unit
+class TestBigQueryJobSubmission(unittest.TestCase):
+    """
+    Tests for non-blocking BigQuery job submission and polling
+    """
+
+    @patch('src.backend.dags.utils.gcp_utils.time.sleep')
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_get_job_states')
+    def test_wait_for_jobs_polls_pending_jobs_together(self, mock_get_states, mock_sleep):
+        """
+        Test that only unfinished jobs are polled on each cycle
+        """
+        handles = [{'job_id': 'job_1'}, {'job_id': 'job_2'}]
+        mock_get_states.side_effect = [
+            {'job_1': {'state': 'DONE', 'error': None}, 'job_2': {'state': 'RUNNING', 'error': None}},
+            {'job_2': {'state': 'DONE', 'error': None}}
+        ]
+
+        states = gcp_utils.bigquery_wait_for_jobs(handles, poll_interval=0)
+
+        self.assertEqual(set(states), {'job_1', 'job_2'})
+        self.assertEqual(mock_get_states.call_args_list[1].args[0], [{'job_id': 'job_2'}])
+
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_get_job_states')
+    def test_wait_for_jobs_raises_on_failure(self, mock_get_states):
+        """
+        Test that a failed job is reported after all jobs finish
+        """
+        mock_get_states.return_value = {'job_1': {'state': 'DONE', 'error': {'reason': 'invalid'}}}
+
+        with self.assertRaises(AirflowException):
+            gcp_utils.bigquery_wait_for_jobs([{'job_id': 'job_1'}])
+
+    @patch('src.backend.dags.utils.gcp_utils.BigQueryHook')
+    def test_submit_query_runs_same_statement_as_execute_query(self, mock_hook_class):
+        """
+        Test that submitted jobs render parameters and pick the dialect like bigquery_execute_query
+        """
+        client = mock_hook_class.return_value.get_client.return_value
+        client.query.return_value = MagicMock(job_id='job_1', project='p', location='US', job_type='query')
+
+        gcp_utils.bigquery_submit_query("SELECT * FROM [p:d.t] WHERE day = %(day)s", query_params={'day': '2024-01-01'})
+
+        self.assertEqual(client.query.call_args.args[0], "SELECT * FROM [p:d.t] WHERE day = '2024-01-01'")
+        job_config = client.query.call_args.kwargs['job_config']
+        self.assertTrue(job_config.use_legacy_sql)
+        self.assertFalse(job_config.query_parameters)
+
+
+@pytest.mark.unit
+class TestBigQueryEstimate(unittest.TestCase):
+    """
+    Tests for dry-run query estimation and its cache
+    """
+
+    def setUp(self):
+        """
+        Start every test with an empty dry-run cache
+        """
+        gcp_utils._dry_run_cache.clear()
+
+    def test_normalize_sql_ignores_formatting_but_keeps_literals(self):
+        """
+        Test that comments and whitespace are normalized outside string literals
+        """
+        sql = "SELECT  a -- comment\n FROM t /* block */ WHERE b = 'x  -- y';\n"
+
+        self.assertEqual(gcp_utils.normalize_sql(sql), "SELECT a FROM t WHERE b = 'x  -- y'")
+
+    @patch('src.backend.dags.utils.gcp_utils.BigQueryHook')
+    def test_estimate_is_cached_by_normalized_sql(self, mock_hook_class):
+        """
+        Test that equivalent queries share a single dry run
+        """
+        client = mock_hook_class.return_value.get_client.return_value
+        client.query.return_value = MagicMock(total_bytes_processed=2 * 1024 ** 4, referenced_tables=[])
+
+        first = gcp_utils.bigquery_estimate_query("SELECT * FROM t")
+        second = gcp_utils.bigquery_estimate_query("SELECT *\n  FROM t;")
+
+        self.assertEqual(client.query.call_count, 1)
+        self.assertFalse(first['cached'])
+        self.assertTrue(second['cached'])
+        self.assertEqual(second['total_bytes_processed'], 2 * 1024 ** 4)
+        self.assertEqual(second['estimated_cost_usd'], 2 * gcp_utils.BIGQUERY_ON_DEMAND_USD_PER_TIB)
+        self.assertTrue(client.query.call_args.kwargs['job_config'].dry_run)
+
+    @patch('src.backend.dags.utils.gcp_utils.BigQueryHook')
+    def test_estimate_dry_runs_the_rendered_query(self, mock_hook_class):
+        """
+        Test that parameters are rendered and the dialect and delegation match execution
+        """
+        client = mock_hook_class.return_value.get_client.return_value
+        client.query.return_value = MagicMock(total_bytes_processed=10, referenced_tables=[])
+
+        gcp_utils.bigquery_estimate_query(
+            "SELECT * FROM [p:d.t] WHERE day = %(day)s",
+            query_params={'day': '2024-01-01'},
+            delegate_to='svc@example.com'
+        )
+        gcp_utils.bigquery_estimate_query(
+            "SELECT * FROM [p:d.t] WHERE day = %(day)s",
+            query_params={'day': '2024-01-02'},
+            delegate_to='svc@example.com'
+        )
+
+        self.assertEqual(client.query.call_count, 2)
+        self.assertEqual(client.query.call_args.args[0], "SELECT * FROM [p:d.t] WHERE day = '2024-01-02'")
+        job_config = client.query.call_args.kwargs['job_config']
+        self.assertTrue(job_config.use_legacy_sql)
+        self.assertFalse(job_config.query_parameters)
+        self.assertEqual(mock_hook_class.call_args.kwargs['delegate_to'], 'svc@example.com')
+
+
+@pytest.mark.unit
+class TestSecretCache(unittest.TestCase):
+    """
+    Tests for the Secret Manager payload cache
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory for the on-disk cache
+        """
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Remove the on-disk cache directory
+        """
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_latest_expires_but_pinned_versions_do_not(self):
+        """
+        Test that only 'latest' entries are subject to the TTL
+        """
+        cache = gcp_utils.SecretCache(ttl=60)
+        cache.put('api_key', 'latest', 'conn', 'value-latest')
+        cache.put('api_key', '3', 'conn', 'value-3')
+
+        with patch('src.backend.dags.utils.gcp_utils.time.time', return_value=gcp_utils.time.time() + 120):
+            self.assertIsNone(cache.get('api_key', 'latest', 'conn'))
+            self.assertEqual(cache.get('api_key', '3', 'conn'), 'value-3')
+
+    def test_disk_cache_is_encrypted_and_shared(self):
+        """
+        Test that a second cache instance reads encrypted entries from disk
+        """
+        from cryptography.fernet import Fernet  # cryptography-41.0.0+
+        key = Fernet.generate_key().decode('utf-8')
+
+        gcp_utils.SecretCache(cache_dir=self.cache_dir, encryption_key=key).put(
+            'db_password', 'latest', 'conn', 's3cr3t'
+        )
+        other_process_cache = gcp_utils.SecretCache(cache_dir=self.cache_dir, encryption_key=key)
+
+        self.assertEqual(other_process_cache.get('db_password', 'latest', 'conn'), 's3cr3t')
+        for path in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, path), 'rb') as f:
+                self.assertNotIn(b's3cr3t', f.read())
+
+    def test_disk_entries_keep_their_fetch_time(self):
+        """
+        Test that a value read from disk expires when the writer's entry does, not a TTL later
+        """
+        from cryptography.fernet import Fernet  # cryptography-41.0.0+
+        key = Fernet.generate_key().decode('utf-8')
+        now = gcp_utils.time.time()
+
+        with patch('cryptography.fernet.time.time', return_value=now - 50):
+            gcp_utils.SecretCache(ttl=60, cache_dir=self.cache_dir, encryption_key=key).put(
+                'db_password', 'latest', 'conn', 's3cr3t'
+            )
+        other_process_cache = gcp_utils.SecretCache(ttl=60, cache_dir=self.cache_dir, encryption_key=key)
+        self.assertEqual(other_process_cache.get('db_password', 'latest', 'conn'), 's3cr3t')
+
+        with patch('src.backend.dags.utils.gcp_utils.time.time', return_value=now + 20), \
+                patch('cryptography.fernet.time.time', return_value=now + 20):
+            self.assertIsNone(other_process_cache.get('db_password', 'latest', 'conn'))
+
+    def test_invalidate_removes_memory_and_disk_entries(self):
+        """
+        Test that invalidation after a rotation drops every cached version
+        """
+        from cryptography.fernet import Fernet  # cryptography-41.0.0+
+        cache = gcp_utils.SecretCache(cache_dir=self.cache_dir, encryption_key=Fernet.generate_key().decode('utf-8'))
+        cache.put('db_password', 'latest', 'conn', 'old')
+        cache.put('other', 'latest', 'conn', 'keep')
+
+        cache.invalidate('db_password')
+
+        self.assertIsNone(cache.get('db_password', 'latest', 'conn'))
+        self.assertEqual(cache.get('other', 'latest', 'conn'), 'keep')
+
+    @patch('src.backend.dags.utils.gcp_utils.SecretManagerHook')
+    def test_get_secret_uses_cache(self, mock_hook_class):
+        """
+        Test that repeated get_secret calls hit Secret Manager once
+        """
+        mock_hook_class.return_value.get_secret.return_value = 'value'
+        with patch.object(gcp_utils, '_secret_cache', gcp_utils.SecretCache()):
+            gcp_utils.get_secret('api_key')
+            self.assertEqual(gcp_utils.get_secret('api_key'), 'value')
+
+        mock_hook_class.return_value.get_secret.assert_called_once()
+
+
+@pytest.mark.unit
+class TestBigQueryMetadataCache(unittest.TestCase):
+    """
+    Tests for the BigQuery dataset/table metadata cache
+    """
+
+    def test_found_and_missing_entries_use_their_own_ttl(self):
+        """
+        Test positive entries outlive negative entries
+        """
+        from google.api_core.exceptions import NotFound  # google-api-core-2.10.2+
+        cache = gcp_utils.BigQueryMetadataCache(ttl=600, negative_ttl=30)
+        fetch_table = MagicMock(return_value='table')
+        fetch_missing = MagicMock(side_effect=NotFound('missing'))
+
+        cache.get_or_fetch('p.ds.table', fetch_table)
+        self.assertIsNone(cache.get_or_fetch('p.ds.missing', fetch_missing))
+
+        with patch('src.backend.dags.utils.gcp_utils.time.time', return_value=gcp_utils.time.time() + 60):
+            self.assertEqual(cache.get_or_fetch('p.ds.table', fetch_table), 'table')
+            cache.get_or_fetch('p.ds.missing', fetch_missing)
+
+        self.assertEqual(fetch_table.call_count, 1)
+        self.assertEqual(fetch_missing.call_count, 2)
+
+    def test_invalidating_a_dataset_drops_its_tables(self):
+        """
+        Test that invalidation cascades from a dataset to its tables
+        """
+        cache = gcp_utils.BigQueryMetadataCache()
+        cache.put('p.ds', 'dataset')
+        cache.put('p.ds.table', 'table')
+        cache.put('p.ds2.table', 'other')
+
+        cache.invalidate('p.ds')
+
+        self.assertIsNone(cache.get('p.ds'))
+        self.assertIsNone(cache.get('p.ds.table'))
+        self.assertEqual(cache.get('p.ds2.table'), ('other',))
+
+    @patch('src.backend.dags.utils.gcp_utils.BigQueryHook')
+    def test_create_dataset_checks_existence_once(self, mock_hook_class):
+        """
+        Test that repeated create_dataset calls reuse the cached dataset
+        """
+        mock_hook_class.return_value.project_id = 'p'
+        client = mock_hook_class.return_value.get_client.return_value
+
+        with patch.object(gcp_utils, '_metadata_cache', gcp_utils.BigQueryMetadataCache()):
+            self.assertTrue(gcp_utils.bigquery_create_dataset('ds'))
+            self.assertTrue(gcp_utils.bigquery_create_dataset('ds'))
+
+        client.get_dataset.assert_called_once_with('p.ds')
+
+
+@pytest.mark.unit
+class TestStorageWriteApi(unittest.TestCase):
+    """
+    Tests for streaming rows with the BigQuery Storage Write API
+    """
+
+    def test_coerces_csv_strings_to_column_types(self):
+        """
+        Test conversion of CSV string values to row message values
+        """
+        self.assertEqual(gcp_utils._coerce_stream_value('INT64', '42'), 42)
+        self.assertEqual(gcp_utils._coerce_stream_value('FLOAT', '1.5'), 1.5)
+        self.assertTrue(gcp_utils._coerce_stream_value('BOOLEAN', 'true'))
+        self.assertEqual(gcp_utils._coerce_stream_value('TIMESTAMP', '1970-01-01T00:00:01Z'), 1000000)
+        self.assertEqual(gcp_utils._coerce_stream_value('DATE', '2023-01-31'), '2023-01-31')
+
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_get_table')
+    @patch('src.backend.dags.utils.gcp_utils.BigQueryHook')
+    def test_appends_batches_with_offsets_and_commits(self, mock_hook_class, mock_get_table):
+        """
+        Test that rows are appended in batches at increasing offsets and committed
+        """
+        bigquery_storage_v1 = pytest.importorskip('google.cloud.bigquery_storage_v1')
+        from google.cloud.bigquery import SchemaField  # google-cloud-bigquery-2.34.4+
+
+        mock_hook_class.return_value.project_id = 'p'
+        mock_get_table.return_value = MagicMock(schema=[SchemaField('id', 'INT64'), SchemaField('name', 'STRING')])
+        rows = ({'id': str(i), 'name': f'row{i}'} for i in range(5))
+
+        with patch.object(bigquery_storage_v1, 'BigQueryWriteClient') as mock_write_client_class, \
+                patch('google.cloud.bigquery_storage_v1.writer.AppendRowsStream') as mock_append_stream_class:
+            mock_write_client_class.return_value.batch_commit_write_streams.return_value.stream_errors = []
+            appended = gcp_utils.bigquery_stream_rows('ds.table', rows, batch_rows=2, max_inflight=2)
+
+        self.assertEqual(appended, 5)
+        requests = [call.args[0] for call in mock_append_stream_class.return_value.send.call_args_list]
+        self.assertEqual([request.offset for request in requests], [0, 2, 4])
+        mock_write_client_class.return_value.batch_commit_write_streams.assert_called_once()
+
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_get_table')
+    @patch('src.backend.dags.utils.gcp_utils.BigQueryHook')
+    def test_failed_append_raises_without_commit(self, mock_hook_class, mock_get_table):
+        """
+        Test that a failed append fails the call and leaves the pending stream uncommitted
+        """
+        bigquery_storage_v1 = pytest.importorskip('google.cloud.bigquery_storage_v1')
+        from google.cloud.bigquery import SchemaField  # google-cloud-bigquery-2.34.4+
+
+        mock_hook_class.return_value.project_id = 'p'
+        mock_get_table.return_value = MagicMock(schema=[SchemaField('id', 'INT64')])
+
+        with patch.object(bigquery_storage_v1, 'BigQueryWriteClient') as mock_write_client_class, \
+                patch('google.cloud.bigquery_storage_v1.writer.AppendRowsStream') as mock_append_stream_class:
+            mock_append_stream_class.return_value.send.return_value.result.side_effect = Exception('append failed')
+            with self.assertRaises(AirflowException):
+                gcp_utils.bigquery_stream_rows('ds.table', [{'id': '1'}])
+
+        mock_write_client_class.return_value.batch_commit_write_streams.assert_not_called()
+
+    @patch('src.backend.dags.utils.gcp_utils.bigquery_get_table')
+    @patch('src.backend.dags.utils.gcp_utils.BigQueryHook')
+    def test_truncate_streams_into_staging_table_and_replaces(self, mock_hook_class, mock_get_table):
+        """
+        Test that WRITE_TRUNCATE streams into a staging table and copies it over the destination
+        """
+        bigquery_storage_v1 = pytest.importorskip('google.cloud.bigquery_storage_v1')
+        from google.cloud.bigquery import SchemaField  # google-cloud-bigquery-2.34.4+
+
+        mock_hook_class.return_value.project_id = 'p'
+        client = mock_hook_class.return_value.get_client.return_value
+        mock_get_table.return_value = MagicMock(
+            schema=[SchemaField('id', 'INT64')], time_partitioning=None,
+            range_partitioning=None, clustering_fields=None
+        )
+
+        with patch.object(bigquery_storage_v1, 'BigQueryWriteClient') as mock_write_client_class, \
+                patch('google.cloud.bigquery_storage_v1.writer.AppendRowsStream'):
+            write_client = mock_write_client_class.return_value
+            write_client.batch_commit_write_streams.return_value.stream_errors = []
+            appended = gcp_utils.bigquery_stream_rows(
+                'ds.table', [{'id': '1'}, {'id': '2'}], write_disposition='WRITE_TRUNCATE'
+            )
+
+        self.assertEqual(appended, 2)
+        staging_id = client.create_table.call_args.args[0].table_id
+        self.assertTrue(staging_id.startswith('table_stream_'))
+        self.assertEqual(write_client.table_path.call_args.args, ('p', 'ds', staging_id))
+        source, destination = client.copy_table.call_args.args
+        self.assertEqual((source, destination), (f'p.ds.{staging_id}', 'p.ds.table'))
+        self.assertEqual(client.copy_table.call_args.kwargs['job_config'].write_disposition, 'WRITE_TRUNCATE')
+        client.delete_table.assert_called_once_with(f'p.ds.{staging_id}', not_found_ok=True)
+
+
+class FakeResponse:
+    """
+    Minimal stand-in for a requests.Response from the GCS upload endpoint
+    """
+
+    def __init__(self, status_code, headers=None, body=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body or {}
+        self.text = ''
+
+    def json(self):
+        return self._body
+
+
+@pytest.mark.unit
+class TestGCSResumableUpload(unittest.TestCase):
+    """
+    Tests for adaptive chunk sizing and resumable uploads with on-the-fly checksums
+    """
+
+    def setUp(self):
+        """
+        Create a local file to upload
+        """
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, 'upload.bin')
+        self.content = os.urandom(3 * gcp_utils.UPLOAD_CHUNK_ALIGNMENT)
+        with open(self.file_path, 'wb') as f:
+            f.write(self.content)
+        state_dir_patcher = patch.object(
+            gcp_utils, 'DEFAULT_UPLOAD_STATE_DIR', os.path.join(self.temp_dir, 'state')
+        )
+        state_dir_patcher.start()
+        self.addCleanup(state_dir_patcher.stop)
+
+    def tearDown(self):
+        """
+        Remove the local file and any upload state
+        """
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _remote_checksums(self, data):
+        import base64
+        import hashlib
+        import google_crc32c
+        crc = google_crc32c.value(data)
+        return {
+            'crc32c': base64.b64encode(crc.to_bytes(4, 'big')).decode('utf-8'),
+            'md5Hash': base64.b64encode(hashlib.md5(data).digest()).decode('utf-8')
+        }
+
+    def test_choose_upload_chunk_size(self):
+        """
+        Test that chunk sizes follow bandwidth, stay within bounds and are aligned
+        """
+        gib = 1024 ** 3
+        self.assertEqual(gcp_utils.choose_upload_chunk_size(10 * gib), gcp_utils.MAX_UPLOAD_CHUNK_SIZE)
+        self.assertEqual(gcp_utils.choose_upload_chunk_size(10 * gib, bandwidth=1024),
+                         gcp_utils.MIN_UPLOAD_CHUNK_SIZE)
+        size = gcp_utils.choose_upload_chunk_size(10 * gib, bandwidth=5 * 1024 * 1024)
+        self.assertEqual(size % gcp_utils.UPLOAD_CHUNK_ALIGNMENT, 0)
+        self.assertEqual(size, 50 * 1024 * 1024)
+        self.assertEqual(gcp_utils.choose_upload_chunk_size(1000), gcp_utils.UPLOAD_CHUNK_ALIGNMENT)
+
+    @patch('google.auth.transport.requests.AuthorizedSession')
+    def test_upload_in_chunks_verifies_checksums(self, mock_session_class):
+        """
+        Test that a chunked upload reports metrics and matches the remote checksums
+        """
+        chunk = gcp_utils.UPLOAD_CHUNK_ALIGNMENT
+        session = mock_session_class.return_value
+        session.post.return_value = FakeResponse(200, {'Location': 'https://upload/session'})
+        session.put.side_effect = [
+            FakeResponse(308, {'Range': f"bytes=0-{chunk - 1}"}),
+            FakeResponse(308, {'Range': f"bytes=0-{2 * chunk - 1}"}),
+            FakeResponse(200, body=self._remote_checksums(self.content))
+        ]
+
+        uploader = gcp_utils.GCSResumableUploader(
+            MagicMock(), TEST_BUCKET, TEST_OBJECT, self.file_path, chunk_size=chunk
+        )
+        metrics = uploader.upload()
+
+        self.assertEqual(metrics['uri'], f"gs://{TEST_BUCKET}/{TEST_OBJECT}")
+        self.assertEqual(metrics['chunks'], 3)
+        self.assertEqual(metrics['bytes_sent'], len(self.content))
+        self.assertIsNotNone(metrics['md5'])
+        self.assertFalse(os.path.exists(uploader.state_path))
+
+    @patch('google.auth.transport.requests.AuthorizedSession')
+    def test_resume_from_acknowledged_offset(self, mock_session_class):
+        """
+        Test that an interrupted upload resumes from the offset GCS acknowledged
+        """
+        chunk = gcp_utils.UPLOAD_CHUNK_ALIGNMENT
+        session = mock_session_class.return_value
+        session.post.return_value = FakeResponse(200, {'Location': 'https://upload/session'})
+        session.put.side_effect = [
+            FakeResponse(308, {'Range': f"bytes=0-{chunk - 1}"}),
+            FakeResponse(400)
+        ]
+
+        uploader = gcp_utils.GCSResumableUploader(
+            MagicMock(), TEST_BUCKET, TEST_OBJECT, self.file_path, chunk_size=chunk
+        )
+        with self.assertRaises(AirflowException):
+            uploader.upload()
+        self.assertTrue(os.path.exists(uploader.state_path))
+        # State lives in the state directory, not next to the (possibly read-only) source file
+        self.assertEqual(os.path.dirname(uploader.state_path), os.path.join(self.temp_dir, 'state'))
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['state', 'upload.bin'])
+
+        # Second attempt: GCS reports the first chunk persisted, then accepts the rest
+        session.post.reset_mock()
+        session.put.side_effect = [
+            FakeResponse(308, {'Range': f"bytes=0-{chunk - 1}"}),
+            FakeResponse(308, {'Range': f"bytes=0-{2 * chunk - 1}"}),
+            FakeResponse(200, body=self._remote_checksums(self.content))
+        ]
+        metrics = gcp_utils.GCSResumableUploader(
+            MagicMock(), TEST_BUCKET, TEST_OBJECT, self.file_path, chunk_size=chunk
+        ).upload()
+
+        session.post.assert_not_called()
+        self.assertEqual(metrics['resumed_from'], chunk)
+        self.assertEqual(metrics['bytes_sent'], 2 * chunk)
+        self.assertIsNone(metrics['md5'])
+
+
+@pytest.mark.unit
+class TestGCSObjectIndex(unittest.TestCase):
+    """
+    Tests for the notification-driven GCS object index and its listener
+    """
+
+    def setUp(self):
+        """
+        Create an index and a drop directory for notifications
+        """
+        self.temp_dir = tempfile.mkdtemp()
+        self.index = gcp_utils.GCSObjectIndex(os.path.join(self.temp_dir, 'index.db'))
+        self.drop_dir = os.path.join(self.temp_dir, 'notifications')
+
+    def tearDown(self):
+        """
+        Remove the index and drop directory
+        """
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def notify(self, event_type, object_name, generation, **extra):
+        """
+        Build notification attributes for an object event
+        """
+        attributes = {
+            'eventType': event_type,
+            'bucketId': TEST_BUCKET,
+            'objectId': object_name,
+            'objectGeneration': str(generation)
+        }
+        attributes.update(extra)
+        return attributes
+
+    def test_finalize_and_delete_respect_generations(self):
+        """
+        Test that stale and overwrite-caused events do not corrupt the index
+        """
+        self.index.apply_notification(self.notify('OBJECT_FINALIZE', TEST_OBJECT, 2))
+        # An older delete arriving late is ignored
+        self.assertFalse(self.index.apply_notification(self.notify('OBJECT_DELETE', TEST_OBJECT, 1)))
+        # A delete caused by an overwrite keeps the object
+        self.assertFalse(self.index.apply_notification(
+            self.notify('OBJECT_DELETE', TEST_OBJECT, 2, overwrittenByGeneration='3')
+        ))
+        self.assertTrue(self.index.exists(TEST_BUCKET, TEST_OBJECT))
+
+        self.assertTrue(self.index.apply_notification(self.notify('OBJECT_DELETE', TEST_OBJECT, 2)))
+        self.assertFalse(self.index.exists(TEST_BUCKET, TEST_OBJECT))
+
+    def test_list_objects_by_prefix(self):
+        """
+        Test that prefix listing matches names literally
+        """
+        for name in ['data/input.csv', 'data/other.csv', 'data_%/x.csv', 'archive/old.csv']:
+            self.index.apply_notification(self.notify('OBJECT_FINALIZE', name, 1))
+
+        self.assertEqual(self.index.list_objects(TEST_BUCKET, 'data/'), ['data/input.csv', 'data/other.csv'])
+        self.assertEqual(self.index.list_objects(TEST_BUCKET, 'data_%/'), ['data_%/x.csv'])
+
+    def test_listener_consumes_drop_directory(self):
+        """
+        Test that the file-drop listener applies notifications and marks the index live
+        """
+        import json
+        os.makedirs(self.drop_dir)
+        with open(os.path.join(self.drop_dir, '0001.json'), 'w') as f:
+            json.dump({'attributes': self.notify('OBJECT_FINALIZE', TEST_OBJECT, 1), 'data': {'size': '18'}}, f)
+
+        self.assertFalse(self.index.is_live())
+        listener = gcp_utils.GCSNotificationListener(self.index, drop_dir=self.drop_dir)
+
+        self.assertEqual(listener.poll_once(), 1)
+        self.assertTrue(self.index.exists(TEST_BUCKET, TEST_OBJECT))
+        self.assertTrue(self.index.is_live())
+        self.assertEqual(os.listdir(self.drop_dir), [])
+
+    def test_index_only_trusted_for_seeded_prefixes(self):
+        """
+        Test that a live index only answers for bucket/prefixes covered by a seed
+        """
+        self.index.seed(TEST_BUCKET, ['data/input.csv'], prefix='data/')
+        self.index.heartbeat()
+
+        self.assertTrue(self.index.is_live(bucket_name=TEST_BUCKET, prefix='data/'))
+        self.assertTrue(self.index.is_live(bucket_name=TEST_BUCKET, prefix='data/2023/'))
+        self.assertTrue(self.index.is_live(bucket_name=TEST_BUCKET, prefix='data/input.csv'))
+        self.assertFalse(self.index.is_live(bucket_name=TEST_BUCKET, prefix='archive/'))
+        self.assertFalse(self.index.is_live(bucket_name=TEST_BUCKET, prefix=''))
+        self.assertFalse(self.index.is_live(bucket_name='other-bucket', prefix='data/'))
+
+        self.index.seed(TEST_BUCKET, [])
+        self.assertTrue(self.index.is_live(bucket_name=TEST_BUCKET, prefix='archive/'))
+
+    def test_listener_retries_notification_that_fails_to_apply(self):
+        """
+        Test that a failing notification is kept for retry and holds back the heartbeat
+        """
+        import json
+        os.makedirs(self.drop_dir)
+        with open(os.path.join(self.drop_dir, '0001.json'), 'w') as f:
+            json.dump({'attributes': self.notify('OBJECT_FINALIZE', TEST_OBJECT, 1)}, f)
+        listener = gcp_utils.GCSNotificationListener(self.index, drop_dir=self.drop_dir)
+
+        with patch.object(self.index, 'apply_notification', side_effect=RuntimeError('database is locked')):
+            listener.run(idle_sleep=0, max_iterations=1)
+        self.assertEqual(os.listdir(self.drop_dir), ['0001.json'])
+        self.assertFalse(self.index.is_live())
+
+        self.assertEqual(listener.poll_once(), 1)
+        self.assertTrue(self.index.exists(TEST_BUCKET, TEST_OBJECT))
+        self.assertTrue(self.index.is_live())